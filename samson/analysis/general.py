@@ -2,11 +2,20 @@ from samson.encoding.general import bytes_to_bitstring
 from math import log, sqrt, pi
 import operator
 import json
+from collections import Counter
+from array import array
 import difflib
+import tempfile
+import sys
 import os
 
 RC4_BIAS_MAP = [163, 0, 131, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 240, 17, 18, 0, 20, 21, 22, 0, 24, 25, 26, 0, 28, 29, 0, 31, 224, 33, 0, 0, 0, 0, 38, 0, 0, 0, 0, 0, 0, 0, 0, 0, 208, 0, 0, 0]
 
+# Bias counts are stored as flat `positions x 256` matrices of unsigned 64-bit ints
+RC4_BIAS_TYPECODE   = 'Q'
+RC4_BIAS_FILE_MAGIC = b'RC4BIAS\x01'
+RC4_BIAS_BATCH_SIZE = 2**14
+
 
 def longest_subsequence(seq_a: list, seq_b: list) -> list:
     """
@@ -250,87 +259,339 @@ def num_expected_collisions(bits: int, num_inputs: int) -> float:
     return 2**(-bits)*ncr(num_inputs, 2)
 
 
-def generate_rc4_bias_map(ciphertexts):
-    bias_map = [{} for i in range(256)]
+def count_rc4_biases(ciphertexts: list, counts: array=None) -> array:
+    """
+    Counts the byte values seen at each position of `ciphertexts` into a flat `positions x 256` count matrix.
+
+    Parameters:
+        ciphertexts (list): Ciphertexts to count.
+        counts     (array): Existing count matrix to update in place (grown if necessary).
+
+    Returns:
+        array: Count matrix where `counts[pos*256 + byte]` is the number of times `byte` was seen at `pos`.
+
+    Examples:
+        >>> from samson.analysis.general import count_rc4_biases
+        >>> counts = count_rc4_biases([b'ab', b'ac', b'a'])
+        >>> len(counts) // 256, counts[ord('a')], counts[256 + ord('c')]
+        (2, 3, 1)
+
+    """
+    if counts is None:
+        counts = array(RC4_BIAS_TYPECODE)
+
+    by_length = {}
+    for ciphertext in ciphertexts:
+        by_length.setdefault(len(ciphertext), []).append(ciphertext)
+
+    for length, group in by_length.items():
+        _grow_rc4_bias_counts(counts, length)
+
+        # Columns of equal-length ciphertexts are strided slices of their concatenation
+        buffer = b''.join(bytes(c) for c in group)
+        for pos in range(length):
+            offset = pos*256
+            for byte, count in Counter(buffer[pos::length]).items():
+                counts[offset + byte] += count
+
+    return counts
+
+
 
-    for c in ciphertexts:
-        for i, byte in enumerate(c):
-            if byte in bias_map[i]:
-                bias_map[i][byte] = bias_map[i][byte] + 1
-            else:
-                bias_map[i][byte] = 1
+def _zero_rc4_bias_counts(positions: int) -> array:
+    return array(RC4_BIAS_TYPECODE, [0]) * (positions*256)
 
-    for i,_ in enumerate(bias_map):
-        bias_map[i] = sorted(bias_map[i].items(), key=lambda kv: kv[1], reverse=True)
+
+
+def _grow_rc4_bias_counts(counts: array, positions: int):
+    missing = positions - len(counts) // 256
+    if missing > 0:
+        counts.extend(_zero_rc4_bias_counts(missing))
+
+
+
+def rc4_bias_counts_to_map(counts: array) -> list:
+    """
+    Converts a count matrix into a bias map: for each position, the `(byte, count)` pairs seen sorted by descending count.
+
+    Parameters:
+        counts (array): Count matrix from `count_rc4_biases`.
+
+    Returns:
+        list: Bias map with at least 256 positions.
+    """
+    positions = len(counts) // 256
+    bias_map  = []
+
+    for pos in range(max(positions, 256)):
+        row = counts[pos*256:(pos+1)*256]
+        bias_map.append(sorted([(byte, count) for byte, count in enumerate(row) if count], key=lambda kv: kv[1], reverse=True))
 
     return bias_map
 
 
 
-def generate_random_rc4_bias_map(data=b'\x00' * 51, key_size=128, sample_size=2**20):
-    from samson.stream_ciphers.rc4 import RC4
-    ciphertexts = []
+def rc4_bias_map_to_counts(bias_map: list) -> array:
+    """
+    Converts a bias map back into a count matrix.
+
+    Parameters:
+        bias_map (list): Bias map from `rc4_bias_counts_to_map`.
+
+    Returns:
+        array: Count matrix.
+    """
+    counts = _zero_rc4_bias_counts(len(bias_map))
+
+    for pos, row in enumerate(bias_map):
+        for byte, count in row:
+            counts[pos*256 + byte] += count
+
+    return counts
+
+
+
+def generate_rc4_bias_map(ciphertexts: list) -> list:
+    """
+    Generates a bias map of the byte values seen at each position of `ciphertexts`.
+
+    Parameters:
+        ciphertexts (list): Ciphertexts to analyze.
+
+    Returns:
+        list: Bias map (see `rc4_bias_counts_to_map`).
+    """
+    return rc4_bias_counts_to_map(count_rc4_biases(ciphertexts))
+
+
+
+def _sample_rc4_biases(data: bytes, key_size: int, sample_size: int) -> array:
+    length    = len(data)
+    key_len   = key_size // 8
+    keys      = os.urandom(sample_size*key_len)
+    buffer    = bytearray(sample_size*length)
+    positions = range(256)
+    out_idx   = 0
+
+    for k_idx in range(0, len(keys), key_len):
+        key = keys[k_idx:k_idx + key_len]
+        key = (key * (256 // key_len + 1))[:256]
+
+        S = list(positions)
+        j = 0
+        for i, k in zip(positions, key):
+            j = (j + S[i] + k) & 0xFF
+            S[i], S[j] = S[j], S[i]
 
-    for _ in range(sample_size):
-        key = os.urandom(key_size // 8)
-        cipher = RC4(key)
-        ciphertexts.append(cipher.generate(len(data)) ^ data)
+        i = j = 0
+        for d in data:
+            i = (i + 1) & 0xFF
+            s_i = S[i]
+            j = (j + s_i) & 0xFF
+            s_j = S[j]
+            S[i], S[j] = s_j, s_i
+            buffer[out_idx] = S[(s_i + s_j) & 0xFF] ^ d
+            out_idx += 1
 
+    counts = _zero_rc4_bias_counts(length)
+    for pos in range(length):
+        offset = pos*256
+        for byte, count in Counter(buffer[pos::length]).items():
+            counts[offset + byte] += count
 
-    return generate_rc4_bias_map(ciphertexts)
+    return counts
+
+
+
+def sample_rc4_bias_counts(data: bytes=b'\x00' * 51, key_size: int=128, sample_size: int=2**20, counts: array=None, processes: int=1, batch_size: int=RC4_BIAS_BATCH_SIZE) -> array:
+    """
+    Encrypts `data` under `sample_size` random RC4 keys and counts the resulting ciphertext bytes.
+    Samples are counted in batches, so memory use is independent of `sample_size`.
+
+    Parameters:
+        data         (bytes): Plaintext to encrypt.
+        key_size       (int): Size of the random keys in bits.
+        sample_size    (int): Number of ciphertexts to sample.
+        counts       (array): Existing count matrix to update in place.
+        processes      (int): Number of worker processes. Requires the "fork" start method; otherwise runs in-process.
+        batch_size     (int): Number of samples per batch.
+
+    Returns:
+        array: Count matrix (see `count_rc4_biases`).
+
+    Examples:
+        >>> from samson.analysis.general import sample_rc4_bias_counts
+        >>> counts = sample_rc4_bias_counts(bytes(2), sample_size=2**10)
+        >>> sum(counts[:256]), sum(counts[256:])
+        (1024, 1024)
+
+    """
+    if counts is None:
+        counts = array(RC4_BIAS_TYPECODE)
 
+    _grow_rc4_bias_counts(counts, len(data))
+    batches = [batch_size] * (sample_size // batch_size) + ([sample_size % batch_size] if sample_size % batch_size else [])
 
+    def merge(batch_counts):
+        for idx, count in enumerate(batch_counts):
+            if count:
+                counts[idx] += count
 
-def incremental_rc4_bias_map_gen(filepath, start_idx=0, data=b'\x00' * 51, key_size=128, sample_size=2**30, chunk_size=2**24):
-    if sample_size % chunk_size > 0:
-        iteration_mod = 1
+
+    import multiprocessing
+
+    if processes == 1 or 'fork' not in multiprocessing.get_all_start_methods():
+        for batch in batches:
+            merge(_sample_rc4_biases(data, key_size, batch))
     else:
-        iteration_mod = 0
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=processes, mp_context=multiprocessing.get_context('fork')) as executor:
+            for batch_counts in executor.map(_sample_rc4_biases, [data]*len(batches), [key_size]*len(batches), batches):
+                merge(batch_counts)
+
+    return counts
+
+
+
+def generate_random_rc4_bias_map(data: bytes=b'\x00' * 51, key_size: int=128, sample_size: int=2**20, processes: int=1) -> list:
+    """
+    Generates a bias map of `data` encrypted under `sample_size` random RC4 keys.
+
+    Parameters:
+        data         (bytes): Plaintext to encrypt.
+        key_size       (int): Size of the random keys in bits.
+        sample_size    (int): Number of ciphertexts to sample.
+        processes      (int): Number of worker processes.
+
+    Returns:
+        list: Bias map (see `rc4_bias_counts_to_map`).
+    """
+    return rc4_bias_counts_to_map(sample_rc4_bias_counts(data, key_size, sample_size, processes=processes))
+
+
 
+def save_rc4_bias_counts(filepath: str, counts: array):
+    """
+    Atomically writes a count matrix as a binary file of little-endian 64-bit counts.
+
+    Parameters:
+        filepath (str): Path to write to.
+        counts (array): Count matrix.
+    """
+    if sys.byteorder == 'big':
+        counts = array(RC4_BIAS_TYPECODE, counts)
+        counts.byteswap()
+
+    with tempfile.NamedTemporaryFile('wb', dir=os.path.dirname(os.path.abspath(filepath)), delete=False) as f:
+        f.write(RC4_BIAS_FILE_MAGIC)
+        counts.tofile(f)
+
+    os.replace(f.name, filepath)
+
+
+
+def load_rc4_bias_counts(filepath: str) -> array:
+    """
+    Loads a count matrix written by `save_rc4_bias_counts`. Legacy JSON bias maps are converted.
+
+    Parameters:
+        filepath (str): Path to read from.
+
+    Returns:
+        array: Count matrix.
+    """
+    with open(filepath, 'rb') as f:
+        magic = f.read(len(RC4_BIAS_FILE_MAGIC))
 
-    iterations = sample_size // chunk_size + iteration_mod
+        if magic != RC4_BIAS_FILE_MAGIC:
+            f.seek(0)
+            return rc4_bias_map_to_counts(json.loads(f.read()))
+
+        counts = array(RC4_BIAS_TYPECODE, f.read())
+
+    if sys.byteorder == 'big':
+        counts.byteswap()
+
+    return counts
+
+
+
+def incremental_rc4_bias_map_gen(filepath: str, start_idx: int=0, data: bytes=b'\x00' * 51, key_size: int=128, sample_size: int=2**30, chunk_size: int=2**24, processes: int=1):
+    """
+    Samples RC4 biases in chunks, saving each chunk's count matrix to `filepath.{chunk_idx}`.
+    Generation can be resumed by setting `start_idx` to the first missing chunk.
+
+    Parameters:
+        filepath       (str): Base path of the chunk files.
+        start_idx      (int): Index of the first chunk to generate.
+        data         (bytes): Plaintext to encrypt.
+        key_size       (int): Size of the random keys in bits.
+        sample_size    (int): Total number of ciphertexts to sample.
+        chunk_size     (int): Number of ciphertexts per chunk.
+        processes      (int): Number of worker processes.
+    """
+    iterations = (sample_size + chunk_size - 1) // chunk_size
 
     for i in range(start_idx, iterations):
-        if i == iterations - 1 and iteration_mod == 1:
-            mod_sample_size = sample_size % chunk_size
-        else:
-            mod_sample_size = chunk_size
+        mod_sample_size = min(chunk_size, sample_size - i*chunk_size)
+        counts = sample_rc4_bias_counts(data, key_size, mod_sample_size, processes=processes)
+        save_rc4_bias_counts(f"{filepath}.{i}", counts)
 
-        bias_map = generate_random_rc4_bias_map(data, key_size, mod_sample_size)
 
 
-        with open(filepath + ".{}".format(i), "w+") as f:
-            f.write(json.dumps(bias_map))
+def merge_rc4_bias_counts(counts_list: list) -> array:
+    """
+    Sums count matrices.
 
-        del bias_map
+    Parameters:
+        counts_list (list): Count matrices.
 
+    Returns:
+        array: Merged count matrix.
+    """
+    merged = array(RC4_BIAS_TYPECODE)
 
+    for counts in counts_list:
+        _grow_rc4_bias_counts(merged, len(counts) // 256)
 
-def merge_rc4_bias_map_files(base_path, num):
-    bias_maps = []
+        for idx, count in enumerate(counts):
+            if count:
+                merged[idx] += count
 
-    for i in range(num):
-        with open("{}.{}".format(base_path, i)) as f:
-            content = f.read()
+    return merged
+
+
+
+def merge_rc4_bias_map_files(base_path: str, num: int) -> list:
+    """
+    Merges the chunk files written by `incremental_rc4_bias_map_gen` into a single bias map.
+    Chunks are loaded one at a time.
+
+    Parameters:
+        base_path (str): Base path of the chunk files.
+        num       (int): Number of chunks.
 
-        bias_maps.append(json.loads(content))
+    Returns:
+        list: Bias map (see `rc4_bias_counts_to_map`).
+    """
+    merged = array(RC4_BIAS_TYPECODE)
 
-    return merge_rc4_bias_maps(bias_maps)
+    for i in range(num):
+        merged = merge_rc4_bias_counts([merged, load_rc4_bias_counts(f"{base_path}.{i}")])
 
+    return rc4_bias_counts_to_map(merged)
 
 
-def merge_rc4_bias_maps(bias_maps):
-    merged_map = [{} for i in range(256)]
 
-    for bias_map in bias_maps:
-        for i,_ in enumerate(bias_map):
-            for k,v in bias_map[i]:
-                if k in merged_map[i]:
-                    merged_map[i][k] += v
-                else:
-                    merged_map[i][k] = v
+def merge_rc4_bias_maps(bias_maps: list) -> list:
+    """
+    Merges bias maps.
 
-    for i,_ in enumerate(merged_map):
-        merged_map[i] = sorted(merged_map[i].items(), key=lambda kv: kv[1], reverse=True)
+    Parameters:
+        bias_maps (list): Bias maps.
 
-    return merged_map
+    Returns:
+        list: Merged bias map.
+    """
+    return rc4_bias_counts_to_map(merge_rc4_bias_counts([rc4_bias_map_to_counts(bias_map) for bias_map in bias_maps]))
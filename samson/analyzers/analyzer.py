@@ -23,15 +23,35 @@ class Analyzer(object):
         raise NotImplementedError("The `analyze` method must be implemented by a subclass.")
 
 
-    def select_highest_scores(self, in_list: list, num: int=1) -> list:
+    def analyze_batch(self, in_list: list) -> list:
         """
-        Analyzes a list `in_list`, sorts the list, and returns the top `num` scores.
+        Scores many bytes-like objects at once. Subclasses may override this with a cheaper approximation of
+        `analyze` for ranking large candidate sets.
 
         Parameters:
             in_list (list): The list of byte-like objects to be analyzed.
-            num      (int): Number of results to return.
+
+        Returns:
+            list: Scores in the same order as `in_list`.
+        """
+        return [self.analyze(item) for item in in_list]
+
+
+
+    def select_highest_scores(self, in_list: list, num: int=1, prefilter: int=None) -> list:
+        """
+        Analyzes a list `in_list`, sorts the list, and returns the top `num` scores.
+
+        Parameters:
+            in_list  (list): The list of byte-like objects to be analyzed.
+            num       (int): Number of results to return.
+            prefilter (int): If set, only the best `prefilter` items according to `analyze_batch` are fully analyzed.
 
         Returns:
             list: `in_list` sorted and truncated.
         """
+        if prefilter and prefilter < len(in_list):
+            scores  = self.analyze_batch(in_list)
+            in_list = [in_list[idx] for idx in sorted(range(len(in_list)), key=scores.__getitem__, reverse=True)[:prefilter]]
+
         return sorted(in_list, key=lambda item: self.analyze(item), reverse=True)[:num]
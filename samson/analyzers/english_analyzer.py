@@ -6,6 +6,7 @@ from samson.auxiliary.english_data import CRACKLIB_WORDLIST, FIRST_LETTER_FREQUE
 from collections import Counter
 import string
 import re
+import os
 
 TOP_50K = [k.encode('utf-8') for k,v in ENGLISH_ONE_GRAMS.items()][:50000]
 
@@ -32,8 +33,58 @@ def key_count(in_bytes, key):
     return (key, in_bytes.count(key))
 
 
-TOKENIZER = Tokenizer([word for word, _ in WORDLIST.items() if len(word) > 2], TokenListHandler, delimiter=' ')
-TOKENIZE  = TOKENIZER.tokenize
+def _byte_table(weights: dict) -> bytes:
+    # Scales `weights` into a 256-entry translation table so a sum over translated bytes runs at C speed
+    max_weight = max(weights.values())
+    return bytes(round(255 * weights.get(byte, 0) / max_weight) for byte in range(256))
+
+
+def _delete_all_but(keep: object) -> bytes:
+    return bytes(byte for byte in range(256) if byte not in keep)
+
+
+# Precompiled tables for `EnglishAnalyzer.analyze_batch`
+CHAR_WEIGHT_TABLE = _byte_table({k if type(k) is int else ord(k): v for k,v in CHAR_FREQ.items()})
+NON_ALPHABET      = _delete_all_but(bytes(string.ascii_letters, 'utf-8'))
+NON_ASCII         = _delete_all_but(ASCII_RANGE)
+BIGRAM_WEIGHTS    = [(bytes(k, 'utf-8') if type(k) is str else bytes(k), v) for k,v in MOST_COMMON_BIGRAMS.items()]
+
+
+# Built on first use by `get_tokenizer`
+_TOKENIZER = None
+
+
+def tokenizer_cache_path() -> str:
+    """
+    Finds where the compiled English tokenizer is cached. `SAMSON_CACHE_DIR` takes precedence, then
+    `XDG_CACHE_HOME/samson`, then `~/.cache/samson`. Setting `SAMSON_CACHE_DIR` to an empty string disables the cache.
+
+    Returns:
+        str: Path of the cache file, or None if caching is disabled.
+    """
+    cache_dir = os.environ.get('SAMSON_CACHE_DIR')
+
+    if cache_dir is None:
+        cache_dir = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'), 'samson')
+
+    return os.path.join(cache_dir, 'english_tokenizer.json') if cache_dir else None
+
+
+
+def get_tokenizer() -> Tokenizer:
+    """
+    Returns the English wordlist tokenizer, loading it from (or compiling it to) `tokenizer_cache_path` on first use.
+
+    Returns:
+        Tokenizer: Shared tokenizer.
+    """
+    global _TOKENIZER
+
+    if _TOKENIZER is None:
+        _TOKENIZER = Tokenizer([word for word, _ in WORDLIST.items() if len(word) > 2], TokenListHandler, delimiter=' ', filepath=tokenizer_cache_path())
+
+    return _TOKENIZER
+
 
 class EnglishAnalyzer(Analyzer):
     """
@@ -67,6 +118,34 @@ class EnglishAnalyzer(Analyzer):
 
 
 
+    def analyze_batch(self, in_list: list) -> list:
+        """
+        Scores many bytes-like objects with precompiled byte-weight and bigram tables. This skips the word-level
+        analysis of `analyze`, so it's much cheaper but less precise; use it to rank large candidate sets and
+        `analyze` (e.g. `select_highest_scores(..., prefilter=k)`) to order the top `k`.
+
+        Parameters:
+            in_list (list): The list of byte-like objects to be analyzed.
+
+        Returns:
+            list: Relative scores in the same order as `in_list`.
+        """
+        scores = []
+        for in_bytes in in_list:
+            bytes_lower = bytes(in_bytes).lower()
+            byte_len    = len(bytes_lower) or 1
+
+            char_score     = sum(bytes_lower.translate(CHAR_WEIGHT_TABLE)) / (255 * byte_len)
+            alphabet_ratio = len(bytes_lower.translate(None, NON_ALPHABET)) / byte_len
+            ascii_ratio    = len(bytes_lower.translate(None, NON_ASCII)) / byte_len
+            bigram_score   = sum([weight * bytes_lower.count(bigram) for bigram, weight in BIGRAM_WEIGHTS]) / byte_len
+
+            scores.append((char_score + 0.1) * ((alphabet_ratio + 0.6) ** 9) * ((ascii_ratio + 0.3) ** 5) * (bigram_score * 25 + 1))
+
+        return scores
+
+
+
     def preprocess(self, in_bytes: bytes, in_ciphers: bytes=None) -> dict:
         """
         Takes in a bytes-like object and returns the processed feature-space used in scoring.
@@ -92,7 +171,7 @@ class EnglishAnalyzer(Analyzer):
         bigram_score      = weighted_token_ratio(bytes_lower, MOST_COMMON_BIGRAMS, byte_len)
         first_letter_freq = _num_common_first_letters(delimited_words)
 
-        found_words  = TOKENIZE([bytes_lower.decode('latin-1')])
+        found_words  = get_tokenizer().tokenize([bytes_lower.decode('latin-1')])
         common_words = len([word for word in found_words if word in MOST_COMMON_WORDS])
 
         # We divide it by the `length*2` to normalize it since I empirically found that the chisquared of
@@ -1,13 +1,21 @@
 from samson.utilities.bytes import Bytes
 from samson.oracles.padding_oracle import PaddingOracle
 from samson.utilities.runtime import RUNTIME
+from samson.auxiliary.progress import Progress
 from samson.ace.decorators import define_exploit
 from samson.ace.consequence import Consequence, Requirement, Manipulation
+from samson.utilities.exceptions import SearchspaceExhaustedException
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
 import struct
 
 import logging
 log = logging.getLogger(__name__)
 
+# Plaintext bytes roughly in order of frequency in English text, followed by every other byte value
+FREQUENCY_ORDER  = list(b' etaoinsrhldcumfpgwybvkxjqzETAOINSRHLDCUMFPGWYBVKXJQZ0123456789.,\'"-\n\r!?:;()/')
+FREQUENCY_ORDER += [byte for byte in range(256) if byte not in FREQUENCY_ORDER]
+
 # https://grymoire.wordpress.com/2014/12/05/cbc-padding-oracle-attacks-simplified-key-concepts-and-pitfalls/
 # @define_exploit(consequence=Consequence.PLAINTEXT_RECOVERY, requirements=[Requirement.EVENTUALLY_DECRYPTS, Consequence.PLAINTEXT_MANIPULATION])
 @define_exploit(consequence=Consequence.ENCRYPTION_BYPASS, requirements=[Requirement.EVENTUALLY_DECRYPTS, Manipulation.PT_BIT_LEVEL])
@@ -15,7 +23,10 @@ class CBCPaddingOracleAttack(object):
     """
     Performs a CBC padding oracle attack.
 
-    Currently only works with PKCS7.
+    Currently only works with PKCS7. Every block only depends on its predecessor, so all blocks are cracked
+    concurrently, and candidate bytes are tried in order of plaintext frequency. The oracle may be a plain function
+    (run on a thread pool, so it must be thread-safe when `max_concurrency` > 1) or a coroutine function; at most
+    `max_concurrency` requests are in flight at once.
 
     Conditions:
         * CBC is being used
@@ -23,7 +34,7 @@ class CBCPaddingOracleAttack(object):
         * The user has access to an oracle that attempts to decrypt arbitrary ciphertext
     """
 
-    def __init__(self, oracle: PaddingOracle, iv: bytes, block_size: int=16, alphabet=[byte for byte in range(256)], batch_requests: bool=False):
+    def __init__(self, oracle: PaddingOracle, iv: bytes, block_size: int=16, alphabet: list=FREQUENCY_ORDER, batch_requests: bool=False, max_concurrency: int=1):
         """
         Parameters:
             oracle (PaddingOracle): An oracle that takes in a bytes-like object and returns a boolean
@@ -31,12 +42,16 @@ class CBCPaddingOracleAttack(object):
             iv             (bytes): Initialization vector (or previous ciphertext block) of the ciphertext
                                     to crack.
             block_size       (int): Block size of the block cipher being used.
+            alphabet        (list): Candidate plaintext byte values in the order they should be tried.
+            batch_requests  (bool): Whether the oracle takes a list of ciphertexts and returns the one with valid padding.
+            max_concurrency  (int): Maximum number of oracle requests in flight at once.
         """
-        self.oracle     = oracle
-        self.iv         = Bytes.wrap(iv)
-        self.block_size = block_size
-        self.alphabet   = alphabet
-        self.batch_requests = batch_requests
+        self.oracle          = oracle
+        self.iv              = Bytes.wrap(iv)
+        self.block_size      = block_size
+        self.alphabet        = alphabet
+        self.batch_requests  = batch_requests
+        self.max_concurrency = max_concurrency
 
 
     @RUNTIME.report
@@ -50,6 +65,132 @@ class CBCPaddingOracleAttack(object):
         Returns:
             Bytes: Plaintext corresponding to the inputted ciphertext.
         """
+        if self.batch_requests:
+            return self._execute_batch(ciphertext)
+
+        progress  = RUNTIME.report_progress(None, total=len(ciphertext), desc='Bytes cracked', unit='bytes')
+        coroutine = self._crack(ciphertext, progress)
+
+        # This thread may already be running an event loop (e.g. Jupyter), so the attack gets its own on a helper thread
+        if asyncio.events._get_running_loop() is not None:
+            with ThreadPoolExecutor(max_workers=1) as runner:
+                return runner.submit(_run_coroutine, coroutine).result()
+
+        return _run_coroutine(coroutine)
+
+
+
+    async def execute_async(self, ciphertext: bytes) -> Bytes:
+        """
+        Executes the attack inside a running event loop. Use this instead of `execute` from async code.
+
+        Parameters:
+            ciphertext (bytes): Bytes-like ciphertext to be decrypted.
+
+        Returns:
+            Bytes: Plaintext corresponding to the inputted ciphertext.
+        """
+        return await self._crack(ciphertext, Progress(None))
+
+
+
+    async def _crack(self, ciphertext: bytes, progress: Progress) -> Bytes:
+        blocks    = Bytes.wrap(ciphertext).chunk(self.block_size)
+        preceding = [self.iv] + blocks[:-1]
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        executor  = None
+
+        # Spread the concurrency budget over the blocks; leftover budget goes to trying several candidates at once
+        window = max(1, self.max_concurrency // max(1, len(blocks)))
+
+        if not asyncio.iscoroutinefunction(self.oracle.check_padding):
+            executor = ThreadPoolExecutor(max_workers=self.max_concurrency)
+
+        async def query(payload: bytes) -> bool:
+            async with semaphore:
+                if executor:
+                    return await asyncio.get_event_loop().run_in_executor(executor, self.oracle.check_padding, payload)
+                else:
+                    return await self.oracle.check_padding(payload)
+
+        try:
+            plaintexts = await asyncio.gather(*[self._crack_block(query, prev, block, window, i == len(blocks) - 1, progress) for i, (prev, block) in enumerate(zip(preceding, blocks))])
+        finally:
+            if executor:
+                executor.shutdown()
+
+        return Bytes(b''.join(plaintexts))
+
+
+
+    def _candidates(self, known: bytes, is_last: bool) -> list:
+        likely = []
+
+        # The final block most likely ends in PKCS7 padding
+        if is_last:
+            if not known:
+                likely = list(range(1, self.block_size + 1))
+            elif len(set(known)) == 1 and len(known) < known[0] <= self.block_size:
+                likely = [known[0]]
+
+        alphabet = set(self.alphabet)
+        likely   = [byte for byte in likely if byte in alphabet]
+        tried    = set(likely)
+        return likely + [byte for byte in self.alphabet if byte not in tried]
+
+
+
+    async def _crack_block(self, query: object, preceding_block: bytes, block: bytes, window: int, is_last: bool, progress: Progress) -> Bytes:
+        block_size   = self.block_size
+        preceding    = bytes(preceding_block)
+        block        = bytes(block)
+        intermediate = bytearray(block_size)
+        plaintext    = bytearray(block_size)
+
+        for pos in reversed(range(block_size)):
+            pad        = block_size - pos
+            forged     = bytearray(preceding[:pos + 1]) + bytes([byte ^ pad for byte in intermediate[pos + 1:]])
+            candidates = self._candidates(plaintext[pos + 1:], is_last)
+            found      = None
+
+            for start in range(0, len(candidates), window):
+                guesses  = candidates[start:start + window]
+                payloads = []
+
+                for guess in guesses:
+                    forged[pos] = guess ^ preceding[pos] ^ pad
+                    payloads.append(bytes(forged) + block)
+
+                results = await asyncio.gather(*[query(payload) for payload in payloads])
+
+                for guess, payload, is_valid in zip(guesses, payloads, results):
+                    # A single byte of padding can also be valid by accident (e.g. the plaintext already ends in \x02\x02).
+                    # Changing the byte before it rules that out.
+                    if is_valid and pad == 1 and pos > 0:
+                        tweaked = bytearray(payload)
+                        tweaked[pos - 1] ^= 0xFF
+                        is_valid = await query(bytes(tweaked))
+
+                    if is_valid:
+                        found = guess
+                        break
+
+                if found is not None:
+                    break
+
+            if found is None:
+                raise SearchspaceExhaustedException(f"No candidate byte produced valid padding at position {pos}")
+
+            plaintext[pos]    = found
+            intermediate[pos] = found ^ preceding[pos]
+            progress.update(1)
+
+        log.debug(f"Cracked block: {bytes(plaintext)}")
+        return Bytes(plaintext)
+
+
+
+    def _execute_batch(self, ciphertext: bytes) -> Bytes:
         blocks = Bytes.wrap(ciphertext).chunk(self.block_size)
         reversed_blocks = blocks[::-1]
 
@@ -65,11 +206,11 @@ class CBCPaddingOracleAttack(object):
                 preceding_block = reversed_blocks[i + 1]
 
             for _ in RUNTIME.report_progress(range(len(block)), desc='Bytes cracked', unit='bytes'):
-                last_working_char = None
-                exploit_blocks    = {}
+                exploit_blocks = {}
 
-                # Generate candidate blocks
-                for possible_char in self.alphabet:
+                # Generate candidate blocks. Batch oracles typically return the last valid candidate, and ascending
+                # order makes that the real padding byte rather than an accidental match
+                for possible_char in sorted(self.alphabet):
                     test_byte = struct.pack('B', possible_char)
                     payload   = test_byte + plaintext
                     prefix    = b'\x00' * (self.block_size - len(payload))
@@ -82,23 +223,20 @@ class CBCPaddingOracleAttack(object):
 
                     exploit_blocks[new_cipher] = test_byte
 
-
-                if self.batch_requests:
-                    best_block = self.oracle.check_padding([k for k,v in exploit_blocks.items()])
-                    last_working_char = exploit_blocks[best_block]
-                    log.debug("Found working byte: {}".format(last_working_char))
-                else:
-                    # Oracle can't handle batch requests. Feed blocks into it.
-                    for exploit_block, byte in exploit_blocks.items():
-                        if self.oracle.check_padding(exploit_block):
-                            log.debug("Found working byte: {}".format(byte))
-                            last_working_char = byte
-
-                        # Early out optimization. Note, we're being careful about PKCS7 padding here.
-                        if last_working_char and ord(byte) >= self.block_size:
-                            break
+                best_block = self.oracle.check_padding([k for k,v in exploit_blocks.items()])
+                last_working_char = exploit_blocks[best_block]
+                log.debug("Found working byte: {}".format(last_working_char))
 
                 plaintext = last_working_char + plaintext
 
             plaintexts.append(plaintext)
         return Bytes(b''.join(plaintexts[::-1]))
+
+
+
+def _run_coroutine(coroutine: object) -> object:
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
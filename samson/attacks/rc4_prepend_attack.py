@@ -1,4 +1,4 @@
-from samson.analysis.general import generate_rc4_bias_map, RC4_BIAS_MAP
+from samson.analysis.general import count_rc4_biases, rc4_bias_counts_to_map, RC4_BIAS_MAP
 from samson.oracles.chosen_plaintext_oracle import ChosenPlaintextOracle
 from samson.utilities.runtime import RUNTIME
 from samson.utilities.bytes import Bytes
@@ -80,14 +80,18 @@ class RC4PrependAttack(object):
             num_chunks = math.ceil(sample_size / chunk_size)
 
             log.debug(f"Sampling {sample_size} ciphertexts")
-            flattened_list = []
+            counts = None
             for i in range(math.ceil(num_chunks / cpu_count)):
                 random_ciphertexts = [pool.apply_async(self._encrypt_chunk, (payload, chunk_size)) for i in range(min(num_chunks - (i*cpu_count), cpu_count))]
-                flattened_list.extend([result for result_list in random_ciphertexts for result in result_list.get()])
+
+                # Count each chunk as it arrives so only `cpu_count` chunks are ever held in memory
+                for result_list in random_ciphertexts:
+                    counts = count_rc4_biases(result_list.get(), counts)
+
                 gc.collect()
 
             log.debug("Generating bias map")
-            bias_map = generate_rc4_bias_map(flattened_list)
+            bias_map = rc4_bias_counts_to_map(counts)
 
             for bias_idx in active_biases:
                 cracked_indices[bias_idx - padding_len].add(RC4_BIAS_MAP[bias_idx] ^ bias_map[bias_idx][0][0])
@@ -21,12 +21,17 @@ class XORTranspositionAttack(object):
         * The user has collected more than one ciphertext using the same keystream.
     """
 
-    def __init__(self, analyzer: Analyzer):
+    def __init__(self, analyzer: Analyzer, prefilter: int=None):
         """
         Parameters:
             analyzer (Analyzer): Analyzer that correctly scores the underlying plaintext.
+            prefilter     (int): (Optional) Number of best candidate bytes (according to the analyzer's `analyze_batch`)
+                                 that get a full analysis. Defaults to analyzing all 256. Cutting this down (e.g. to 16)
+                                 is much faster, but if the cheap batch score misranks the right byte below the cut, that
+                                 position is recovered wrong, so it's an accuracy-time trade-off.
         """
-        self.analyzer = analyzer
+        self.analyzer  = analyzer
+        self.prefilter = prefilter
 
 
     @RUNTIME.report
@@ -52,13 +57,8 @@ class XORTranspositionAttack(object):
         # Transposition analysis first (transposition)
         transposed_plaintexts = []
         for cipher in RUNTIME.report_progress(transposed_ciphers, desc='Transposition analysis', unit='ciphers'):
-            all_chars = {}
-            for char in range(256):
-                plaintext = Bytes(struct.pack('B', char)).stretch(len(cipher)) ^ cipher
-
-                all_chars[char] = (self.analyzer.analyze(plaintext), plaintext)
-
-            transposed_plaintexts.append(sorted(all_chars.items(), key=lambda kv: kv[1][0], reverse=True)[0][1][1])
+            plaintexts = [Bytes(struct.pack('B', char)).stretch(len(cipher)) ^ cipher for char in range(256)]
+            transposed_plaintexts.append(self.analyzer.select_highest_scores(plaintexts, prefilter=self.prefilter)[0])
 
 
         retransposed_plaintexts = [bytearray(transposed) for transposed in zip(*transposed_plaintexts)]
@@ -71,20 +71,23 @@ class XORTranspositionAttack(object):
             differential_mask = bytearray()
 
             for i in RUNTIME.report_progress(range(min_size), desc='Building differential mask', unit='bytes'):
-                all_chars = {}
+                candidates = {}
 
                 for char in range(256):
-                    full_text_analyses = []
+                    candidates[char] = []
 
                     for curr_cipher in retransposed_plaintexts:
-                        cipher_copy = bytearray([_ for _ in curr_cipher])
-                        cipher_copy[i] = ord(Bytes(struct.pack('B', char)) ^ struct.pack('B', curr_cipher[i]))
-
-                        full_text_analyses.append(self.analyzer.analyze(cipher_copy))
+                        cipher_copy     = bytearray(curr_cipher)
+                        cipher_copy[i] ^= char
+                        candidates[char].append(cipher_copy)
 
-                    all_chars[char] = (sum(full_text_analyses), char)
+                # Cheaply narrow down the bytes before running the full analysis on every text
+                chars = range(256)
+                if self.prefilter:
+                    batch_scores = {char: sum(self.analyzer.analyze_batch(texts)) for char, texts in candidates.items()}
+                    chars        = sorted(sorted(chars, key=batch_scores.get, reverse=True)[:self.prefilter])
 
-                best_char = sorted(all_chars.items(), key=lambda kv: kv[1][0], reverse=True)[0][1][1]
+                best_char = max(chars, key=lambda char: sum([self.analyzer.analyze(text) for text in candidates[char]]))
                 differential_mask += struct.pack('B', best_char)
 
             retransposed_plaintexts = [Bytes.wrap(cipher) ^ differential_mask for cipher in retransposed_plaintexts]
@@ -0,0 +1,178 @@
+from types import FunctionType
+import itertools
+import string
+
+# Hashcat-style mask charsets
+MASK_CHARSETS = {
+    'l': string.ascii_lowercase.encode('utf-8'),
+    'u': string.ascii_uppercase.encode('utf-8'),
+    'd': string.digits.encode('utf-8'),
+    's': (' ' + string.punctuation).encode('utf-8'),
+    'h': b'0123456789abcdef',
+    'H': b'0123456789ABCDEF'
+}
+
+MASK_CHARSETS['a'] = MASK_CHARSETS['l'] + MASK_CHARSETS['u'] + MASK_CHARSETS['d'] + MASK_CHARSETS['s']
+
+
+def parse_mask(mask: str, custom_charsets: dict=None) -> list:
+    """
+    Parses a hashcat-style mask into the bytes allowed at each position. '?l', '?u', '?d', '?s', '?h', '?H',
+    and '?a' are builtin charsets, '?1' through '?9' refer to `custom_charsets`, '??' is a literal '?', and
+    anything else is literal.
+
+    Parameters:
+        mask             (str): Mask.
+        custom_charsets (dict): Mapping of digit characters to bytes.
+
+    Returns:
+        list: Allowed bytes for each position.
+
+    Examples:
+        >>> from samson.auxiliary.candidate_generator import parse_mask
+        >>> parse_mask('a?d', {'1': b'xy'})[1]
+        b'0123456789'
+
+    """
+    charsets  = {**MASK_CHARSETS, **{str(k): bytes(v) for k, v in (custom_charsets or {}).items()}}
+    positions = []
+    chars     = iter(mask)
+
+    for char in chars:
+        if char == '?':
+            selector = next(chars, None)
+            if selector == '?':
+                positions.append(b'?')
+            elif selector in charsets:
+                positions.append(charsets[selector])
+            else:
+                raise ValueError(f"Unknown mask charset '?{selector}'")
+        else:
+            positions.append(char.encode('utf-8'))
+
+    return positions
+
+
+
+def mask_candidates(mask: str, custom_charsets: dict=None) -> bytes:
+    """
+    Generates every candidate matching a hashcat-style mask.
+
+    Parameters:
+        mask             (str): Mask (see `parse_mask`).
+        custom_charsets (dict): Mapping of digit characters to bytes.
+
+    Returns:
+        generator: Candidates as bytes.
+
+    Examples:
+        >>> from samson.auxiliary.candidate_generator import mask_candidates
+        >>> list(mask_candidates('a?1', {'1': b'xy'}))
+        [b'ax', b'ay']
+
+    """
+    for candidate in itertools.product(*[[bytes([c]) for c in position] for position in parse_mask(mask, custom_charsets)]):
+        yield b''.join(candidate)
+
+
+
+def wordlist_candidates(wordlist: object, transforms: list=None) -> bytes:
+    """
+    Generates candidates from a wordlist, one word per line. The file is read lazily.
+
+    Parameters:
+        wordlist (str/iterable): Path to a wordlist or an iterable of words.
+        transforms       (list): Functions of signature (word: bytes) -> bytes. Each word is also yielded with each transform applied.
+
+    Returns:
+        generator: Candidates as bytes.
+
+    Examples:
+        >>> from samson.auxiliary.candidate_generator import wordlist_candidates
+        >>> list(wordlist_candidates([b'pass', b'word'], [bytes.upper]))
+        [b'pass', b'PASS', b'word', b'WORD']
+
+    """
+    if type(wordlist) is str:
+        with open(wordlist, 'rb') as f:
+            yield from wordlist_candidates(f, transforms)
+        return
+
+    for word in wordlist:
+        if type(word) is str:
+            word = word.encode('utf-8')
+
+        word = word.rstrip(b'\r\n')
+        yield word
+
+        for transform in transforms or []:
+            yield transform(word)
+
+
+
+def chunk_candidates(candidates: object, chunk_size: int) -> list:
+    """
+    Groups candidates into lists of `chunk_size`.
+
+    Parameters:
+        candidates (iterable): Candidates.
+        chunk_size      (int): Maximum chunk size.
+
+    Returns:
+        generator: Lists of candidates.
+
+    Examples:
+        >>> from samson.auxiliary.candidate_generator import chunk_candidates
+        >>> list(chunk_candidates(range(5), 2))
+        [[0, 1], [2, 3], [4]]
+
+    """
+    candidates = iter(candidates)
+    while True:
+        chunk = list(itertools.islice(candidates, chunk_size))
+        if not chunk:
+            return
+
+        yield chunk
+
+
+
+def batch_crack(hash_func: object, targets: list, candidates: object, chunk_size: int=4096, transform: FunctionType=None) -> dict:
+    """
+    Hashes `candidates` in chunks until every target is found or the candidates run out. Uses the hash's
+    `hash_many` when available so short candidates are compressed together.
+
+    Parameters:
+        hash_func    (Hash): Hash object (e.g. MD5, NTLM).
+        targets      (list): Digests to find.
+        candidates (iterable): Candidate preimages (see `mask_candidates` and `wordlist_candidates`).
+        chunk_size    (int): Number of candidates hashed per batch.
+        transform    (func): Optional function of signature (digest: bytes) -> bytes applied before comparison (e.g. truncation).
+
+    Returns:
+        dict: Found targets (as bytes) mapped to their preimages.
+
+    Examples:
+        >>> from samson.auxiliary.candidate_generator import batch_crack, mask_candidates
+        >>> from samson.hashes.md5 import MD5
+        >>> target = MD5().hash(b'ab7')
+        >>> list(batch_crack(MD5(), [target], mask_candidates('?l?l?d')).values())
+        [b'ab7']
+
+    """
+    remaining = set(bytes(target) for target in targets)
+    found     = {}
+    hash_many = getattr(hash_func, 'hash_many', None) or (lambda messages: [hash_func.hash(message) for message in messages])
+
+    for chunk in chunk_candidates(candidates, chunk_size):
+        for candidate, digest in zip(chunk, hash_many(chunk)):
+            digest = bytes(transform(digest) if transform else digest)
+
+            if digest in remaining:
+                found[digest] = candidate
+                remaining.remove(digest)
+
+        if not remaining:
+            break
+
+    return found
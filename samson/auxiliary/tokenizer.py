@@ -4,36 +4,194 @@
 # Must grab the longest string possible
 from samson.auxiliary.token_list_handler import TokenListHandler
 from samson.auxiliary.tokenizer_handler import TokenizerHandler
+import tempfile
+import hashlib
+import json
+import os
+
+# Bumped whenever the saved automaton's layout changes so stale caches get rebuilt
+TOKENIZER_FORMAT_VERSION = 1
 
 class Tokenizer(object):
     """
     Splits a string into the longest 'tokens' parameterized bt the `token_list`. Works for delimited
     and non-delimited inputs.
+
+    Tokens are matched with an Aho-Corasick automaton over the reversed tokens. Scanning a part backwards once gives
+    the longest token starting at every position, so tokenization is linear in the input and never rolls back.
+
+    Examples:
+        >>> from samson.auxiliary.tokenizer import Tokenizer
+        >>> Tokenizer(['abc', 'hello', 'adam', 'hiya']).tokenize(['adabcadam helloxhiya'])
+        ['abc', 'adam', 'hello', 'hiya']
+
     """
 
-    def __init__(self, token_list: list, token_handler: TokenizerHandler=TokenListHandler, delimiter: str=' '):
+    def __init__(self, token_list: list, token_handler: TokenizerHandler=TokenListHandler, delimiter: str=' ', filepath: str=None):
         """
         Parameters:
             token_list                (list): List of possible tokens, e.g. wordlist.
             token_handler (TokenizerHandler): Instantiable class.
             delimiter                  (str): (Optional) Delimiter to split samples apart.
+            filepath                   (str): (Optional) Path of a cached automaton. It's loaded if it was built from
+                                              the same `token_list` and (re)written otherwise.
         """
         self.token_list = token_list
         self.token_handler = token_handler
         self.delimiter = delimiter
 
-        self.processed_tokens = {}
+        if not (filepath and self.load(filepath)):
+            self.build()
+
+            if filepath:
+                try:
+                    self.save(filepath)
+                except OSError:
+                    pass
+
+
+
+    def fingerprint(self) -> str:
+        """
+        Identifies the token list and serialization format.
+
+        Returns:
+            str: Fingerprint.
+        """
+        return f"{TOKENIZER_FORMAT_VERSION}:" + hashlib.sha256('\0'.join(self.token_list).encode('utf-8', 'surrogatepass')).hexdigest()
+
+
+
+    def build(self):
+        """
+        Compiles `token_list` into the automaton.
+        """
+        # `goto[state]` maps characters to states, `fail[state]` is the failure link, and `longest[state]` is the
+        # length of the longest (reversed) token that is a suffix of the state's string
+        goto     = [{}]
+        depth    = [0]
+        terminal = [False]
 
         for token in self.token_list:
-            curr_dict = self.processed_tokens
+            state = 0
+            for char in reversed(token):
+                next_state = goto[state].get(char)
+
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][char] = next_state
+                    goto.append({})
+                    depth.append(depth[state] + 1)
+                    terminal.append(False)
 
-            for char in token:
-                if char not in curr_dict:
-                    curr_dict[char] = {}
-                curr_dict = curr_dict[char]
+                state = next_state
 
-            # '$$' is the flag for end of string
-            curr_dict['$$'] = None
+            if state:
+                terminal[state] = True
+
+        fail    = [0] * len(goto)
+        longest = [0] * len(goto)
+        queue   = list(goto[0].values())
+
+        for state in queue:
+            longest[state] = depth[state] if terminal[state] else 0
+
+        # Breadth-first, so every failure link points to a state that's already finished
+        for state in queue:
+            for char, next_state in goto[state].items():
+                link = fail[state]
+                while link and char not in goto[link]:
+                    link = fail[link]
+
+                fail[next_state]    = goto[link].get(char, 0) if state else 0
+                longest[next_state] = depth[next_state] if terminal[next_state] else longest[fail[next_state]]
+                queue.append(next_state)
+
+        self.goto    = goto
+        self.fail    = fail
+        self.longest = longest
+
+
+
+    def save(self, filepath: str):
+        """
+        Writes the automaton to `filepath` as JSON.
+
+        Parameters:
+            filepath (str): Path to write to.
+        """
+        directory = os.path.dirname(os.path.abspath(filepath))
+        os.makedirs(directory, exist_ok=True)
+
+        # Write to a unique file and swap it in so concurrent writers never see or clobber a partial file
+        with tempfile.NamedTemporaryFile('w', dir=directory, delete=False) as f:
+            json.dump({'fingerprint': self.fingerprint(), 'goto': self.goto, 'fail': self.fail, 'longest': self.longest}, f)
+
+        os.replace(f.name, filepath)
+
+
+
+    def load(self, filepath: str) -> bool:
+        """
+        Loads the automaton from `filepath` if it exists and was built from the same token list.
+
+        Parameters:
+            filepath (str): Path to read from.
+
+        Returns:
+            bool: Whether the automaton was loaded.
+        """
+        if not os.path.exists(filepath):
+            return False
+
+        with open(filepath) as f:
+            try:
+                params = json.load(f)
+            except ValueError:
+                return False
+
+        if params.get('fingerprint') != self.fingerprint():
+            return False
+
+        self.goto    = params['goto']
+        self.fail    = params['fail']
+        self.longest = params['longest']
+        return True
+
+
+
+    def longest_matches(self, part: str) -> list:
+        """
+        Finds the length of the longest token starting at each position of `part`.
+
+        Parameters:
+            part (str): String to search.
+
+        Returns:
+            list: Lengths (0 where no token starts).
+
+        Examples:
+            >>> from samson.auxiliary.tokenizer import Tokenizer
+            >>> Tokenizer(['abc', 'ab', 'bcd']).longest_matches('abcd')
+            [3, 3, 0, 0]
+
+        """
+        goto, fail, longest = self.goto, self.fail, self.longest
+        lengths = [0] * len(part)
+        state   = 0
+
+        for i in range(len(part) - 1, -1, -1):
+            char       = part[i]
+            next_state = goto[state].get(char)
+
+            while next_state is None and state:
+                state      = fail[state]
+                next_state = goto[state].get(char)
+
+            state      = next_state or 0
+            lengths[i] = longest[state]
+
+        return lengths
 
 
 
@@ -47,10 +205,6 @@ class Tokenizer(object):
         Returns:
             object: The finalized return of the `token_handler`.
         """
-        ################
-        #    STEP 1    #
-        # Create chain #
-        ################
         token_handler = self.token_handler()
 
         for sample in samples:
@@ -58,58 +212,18 @@ class Tokenizer(object):
             token_handler.reset()
 
             for part in parts:
-                token = ''
-                last_largest_substring = ''
-                curr_token_chain = self.processed_tokens
-                part_len = len(part)
-
-                # We'll use a while loop, so we have more control over the counter
-                char_counter = 0
-
-                while char_counter < part_len:
-                    char = part[char_counter]
+                lengths = self.longest_matches(part)
+                i       = 0
 
-                    if char in curr_token_chain:
-                        token += char
-                        curr_token_chain = curr_token_chain[char]
+                # Greedily take the longest token at each position and skip over it
+                while i < len(part):
+                    length = lengths[i]
 
-                        # This is a valid substring, and there's only an end-of-token flag left
-                        # OR
-                        # This is a valid substring, and we've reached the end of the part
-                        if curr_token_chain == {'$$': None} or ('$$' in curr_token_chain and char_counter + 1 == part_len):
-                            token_handler.handle_token(token)
-
-                            token = ''
-                            last_largest_substring = ''
-                            curr_token_chain = self.processed_tokens
-
-                        # This is a valid substring, but it may not be the whole string.
-                        # We'll keep track of it in case it is.
-                        elif '$$' in curr_token_chain:
-                            last_largest_substring = token
-
-
-                    # It's not a valid token; we'll need to rollback.
-                    # Example:
-
-                    # tokenizer = Tokenizer(['abc', 'hello', 'adam', 'hiya'])
-                    # chain = tokenizer.generate_chain(['adabcadam'])
-                    # For 'adabcadam', we'll get to 'ada', but 'b' will not be a valid state.
-                    # We then must rollback to 'd'.
+                    if length:
+                        token_handler.handle_token(part[i:i + length])
+                        i += length
                     else:
-                        # The entire thing isn't a valid token, but a substring is.
-                        substring_mod = 0
-                        if last_largest_substring != '':
-                            token_handler.handle_token(last_largest_substring)
-                            substring_mod = len(last_largest_substring) - 1
-
-
-                        char_counter -= len(token) - substring_mod
-                        token = ''
-                        last_largest_substring = ''
-                        curr_token_chain = self.processed_tokens
-
-                    char_counter += 1
+                        i += 1
 
 
         return token_handler.finalize()
@@ -1,32 +1,66 @@
 from samson.auxiliary.english_data import ENGLISH_ONE_GRAMS, ENGLISH_TWO_GRAMS
+from array import array
 from math import log10
 
+# Trie edges are keyed by `node * TRIE_RADIX + ord(char)`, so every code point gets its own slot
+TRIE_RADIX = 0x110000
+
+# Bigram keys are `prev_id << BIGRAM_SHIFT | word_id`
+BIGRAM_SHIFT = 32
+
+_CONTEXT = None
+
 # http://practicalcryptography.com/cryptanalysis/text-characterisation/word-statistics-fitness-measure/
 class ViterbiDecoder(object):
     """
     Statistical model that decodes non-delimited English text into tokens using maximum likelihood metrics.
+
+    Words are mapped to integer IDs. Their log probabilities live in flat tables indexed by ID (unigrams) or by hashed
+    ID pairs (bigrams), and candidate words are found by walking a trie over the text instead of slicing every substring.
     """
 
-    def __init__(self):
-        self.Pw = {}
+    def __init__(self, one_grams: dict=None, two_grams: dict=None):
+        """
+        Parameters:
+            one_grams (dict): (Optional) Word counts. Defaults to English.
+            two_grams (dict): (Optional) Counts of space-separated word pairs. Defaults to English.
+        """
+        one_grams = ENGLISH_ONE_GRAMS if one_grams is None else one_grams
+        two_grams = ENGLISH_TWO_GRAMS if two_grams is None else two_grams
+
         self.N = 1024908267229 ## Number of tokens
 
+        self.word_ids = {}
+        self.unigrams = []
+        self.bigrams  = {}
+        self.edges    = {}
+        self.node_ids = array('i', [-1])
+
         # Calculate first order log probabilities
-        for key in ENGLISH_ONE_GRAMS.keys():
-            self.Pw[key.upper()] = log10(float(ENGLISH_ONE_GRAMS[key]) / self.N)
+        for key, count in one_grams.items():
+            self.unigrams[self._add_word(key.upper())] = log10(float(count) / self.N)
+
+
+        # Calculate second order log probabilities. Pairs whose second word has no first order probability are
+        # never used since `cPw` falls back to the unseen probability
+        for key, count in two_grams.items():
+            words = key.upper().split(' ')
+            if len(words) != 2:
+                continue
 
+            word1, word2 = words
+            word_id      = self.word_ids.get(word2)
 
-        # Get second order word model
-        self.Pw2 = {}
+            if word_id is None or self.unigrams[word_id] is None:
+                continue
 
-        # Calculate second order log probabilities
-        for key in ENGLISH_TWO_GRAMS.keys():
-            word1 = key.split()[0].upper()
+            prev_id = self._add_word(word1)
+            prob    = log10(float(count) / self.N)
 
-            if word1 not in self.Pw:
-                self.Pw2[key.upper()] = log10(float(ENGLISH_TWO_GRAMS[key]) / self.N)
-            else:
-                self.Pw2[key.upper()] = log10(float(ENGLISH_TWO_GRAMS[key]) / self.N) - self.Pw[word1]
+            if self.unigrams[prev_id] is not None:
+                prob -= self.unigrams[prev_id]
+
+            self.bigrams[prev_id << BIGRAM_SHIFT | word_id] = prob
 
 
         # Precalculate the probabilities we assign to words not in our dict, L is length of word
@@ -34,6 +68,31 @@ class ViterbiDecoder(object):
 
 
 
+    def _add_word(self, word: str) -> int:
+        word_id = self.word_ids.get(word)
+
+        if word_id is None:
+            word_id = len(self.unigrams)
+            self.word_ids[word] = word_id
+            self.unigrams.append(None)
+
+            node = 0
+            for char in word:
+                key       = node * TRIE_RADIX + ord(char)
+                next_node = self.edges.get(key)
+
+                if next_node is None:
+                    next_node = len(self.node_ids)
+                    self.edges[key] = next_node
+                    self.node_ids.append(-1)
+
+                node = next_node
+
+            self.node_ids[node] = word_id
+
+        return word_id
+
+
 
     def cPw(self, word: str, prev: str='<UNK>') -> float:
         """
@@ -42,51 +101,152 @@ class ViterbiDecoder(object):
         Parameters:
             word (str): Current word.
             prev (str): Previous word.
-        
+
         Returns:
             float: Log probability of `word` based on `prev`.
         """
-        second_order_word = (prev + ' ' + word)
+        word_id = self.word_ids.get(word)
 
-        if word not in self.Pw:
+        if word_id is None or self.unigrams[word_id] is None:
             return self.unseen[len(word)]
 
-        elif second_order_word not in self.Pw2:
-            return self.Pw[word]
+        prev_id = self.word_ids.get(prev)
 
-        else:
-            return self.Pw2[second_order_word]
+        if prev_id is None:
+            return self.unigrams[word_id]
 
+        return self.bigrams.get(prev_id << BIGRAM_SHIFT | word_id, self.unigrams[word_id])
 
 
 
-    def score(self, text: str, max_word_len=20) -> (float, list):
+    def score(self, text: str, max_word_len: int=20) -> (float, list):
         """
         Scores and tokenizes the text according to the maximum likelihood.
 
         Parameters:
             text         (str): Text to tokenize/decode.
             max_word_len (int): Maximum token length.
-        
+
         Returns:
             (float, list): Most probable decoding as (score, token_list).
         """
         text = text.upper()
+        n    = len(text)
+        L    = max_word_len
+
+        if not n:
+            return (-99e99, [])
+
+        edges, node_ids, unigrams, bigrams, unseen = self.edges, self.node_ids, self.unigrams, self.bigrams, self.unseen
+
+        # State `e*L + l-1` is the best decoding of `text[:e+1]` whose last word has length `l`.
+        # Only the previous word's length is kept as a back-pointer
+        word_ids = array('i', [-1]) * (n * L)
+        prob     = [-99e99] * (n * L)
+        back     = bytearray(n * L) if L < 256 else array('H', [0]) * (n * L)
+
+        # Find the dictionary words starting at each position
+        codes = [ord(char) for char in text]
+        for start in range(n):
+            node = 0
+            for length in range(min(L, n - start)):
+                node = edges.get(node * TRIE_RADIX + codes[start + length])
+                if node is None:
+                    break
+
+                word_ids[(start + length) * L + length] = node_ids[node]
+
+
+        start_id = self.word_ids.get('<UNK>', -1)
+        best_end = []
+        best_len = []
+
+        for end in range(n):
+            row = end * L
+
+            for length in range(1, min(L, end + 1) + 1):
+                state   = row + length - 1
+                word_id = word_ids[state]
+                uni     = unigrams[word_id] if word_id >= 0 else None
+                prev    = end - length
+
+                if prev < 0:
+                    if uni is None:
+                        prob[state] = unseen[length]
+                    else:
+                        prob[state] = bigrams.get(start_id << BIGRAM_SHIFT | word_id, uni) if start_id >= 0 else uni
+
+                # Unknown words score the same after any previous word
+                elif uni is None:
+                    prob[state] = best_end[prev] + unseen[length]
+                    back[state] = best_len[prev]
+
+                else:
+                    prev_row     = prev * L
+                    best, best_k = -99e99, 0
+
+                    for k in range(1, min(L, prev + 1) + 1):
+                        prev_state = prev_row + k - 1
+                        prev_id    = word_ids[prev_state]
+                        candidate  = prob[prev_state] + (bigrams.get(prev_id << BIGRAM_SHIFT | word_id, uni) if prev_id >= 0 else uni)
+
+                        if candidate > best:
+                            best, best_k = candidate, k
+
+                    prob[state] = best
+                    back[state] = best_k
+
+
+            end_probs = prob[row:row + min(L, end + 1)]
+            best      = max(end_probs)
+            best_end.append(best)
+            best_len.append(end_probs.index(best) + 1)
+
+
+        # Walk the back-pointers from the best final state
+        tokens = []
+        end    = n - 1
+        length = best_len[end]
+
+        while end >= 0:
+            tokens.append(text[end - length + 1:end + 1])
+            end, length = end - length, back[end * L + length - 1]
+
+        return best_end[n - 1], tokens[::-1]
+
+
+
+    def score_batch(self, texts: list, max_word_len: int=20, processes: int=1) -> list:
+        """
+        Scores and tokenizes many texts, e.g. every candidate decryption of a classical cipher.
+
+        Parameters:
+            texts        (list): Texts to tokenize/decode.
+            max_word_len  (int): Maximum token length.
+            processes     (int): Number of worker processes. Workers share the model through `fork`; without it, runs
+                                 in-process.
+
+        Returns:
+            list: Most probable decoding of each text as (score, token_list).
+        """
+        import multiprocessing
+
+        if processes == 1 or len(texts) < 2 or 'fork' not in multiprocessing.get_all_start_methods():
+            return [self.score(text, max_word_len) for text in texts]
+
+        from concurrent.futures import ProcessPoolExecutor
+
+        chunk_size = max(1, len(texts) // (processes * 4))
+
+        with ProcessPoolExecutor(max_workers=processes, mp_context=multiprocessing.get_context('fork'), initializer=_init_worker, initargs=(self,)) as executor:
+            return list(executor.map(_score_text, texts, [max_word_len] * len(texts), chunksize=chunk_size))
 
-        prob = [[-99e99] * max_word_len for _ in range(len(text))]
-        strs = [[''] * max_word_len for _ in range(len(text))]
 
-        for j in range(max_word_len):
-            prob[0][j] = self.cPw(text[:j+1])
-            strs[0][j] = [text[:j+1]]
 
-        for i in range(1,len(text)):
-            for j in range(max_word_len):
-                if i+j+1 > len(text): break
-                candidates = [(prob[i-k-1][k] + self.cPw(text[i: i+j+1], strs[i-k-1][k][-1]),
-                               strs[i-k-1][k] + [text[i: i+j+1]]) for k in range(min(i, max_word_len))]
+def _init_worker(decoder: ViterbiDecoder):
+    global _CONTEXT
+    _CONTEXT = decoder
 
-                prob[i][j], strs[i][j] = max(candidates)
 
-        ends = [(prob[-i-1][i], strs[-i-1][i]) for i in range(min(len(text), max_word_len))]
-        return max(ends)
+def _score_text(text: str, max_word_len: int) -> (float, list):
+    return _CONTEXT.score(text, max_word_len)
@@ -0,0 +1,183 @@
+from samson.block_ciphers.rijndael import SBOX, INV_SBOX, RCON
+from functools import lru_cache
+import struct
+
+# T-table AES for 128-bit blocks and 128/192/256-bit keys. Each table entry combines SubBytes and one column of
+# MixColumns, so a round is sixteen lookups and XORs on 32-bit integers.
+# https://csrc.nist.gov/csrc/media/projects/cryptographic-standards-and-guidelines/documents/aes-development/rijndael-ammended.pdf (section 5.2.1)
+
+KEY_SCHEDULE_CACHE_SIZE = 256
+AES_ROUNDS = {16: 10, 24: 12, 32: 14}
+
+
+def _xtime(a: int) -> int:
+    a <<= 1
+    return (a ^ 0x11B) if a & 0x100 else a
+
+
+def _gmul(a: int, b: int) -> int:
+    p = 0
+    while b:
+        if b & 1:
+            p ^= a
+
+        a  = _xtime(a)
+        b >>= 1
+
+    return p
+
+
+def _ror(word: int, amount: int) -> int:
+    return ((word >> amount) | (word << (32 - amount))) & 0xFFFFFFFF
+
+
+def _build_tables(sbox: list, coeffs: tuple) -> list:
+    c0, c1, c2, c3 = coeffs
+    T0 = [(_gmul(s, c0) << 24) | (_gmul(s, c1) << 16) | (_gmul(s, c2) << 8) | _gmul(s, c3) for s in sbox]
+    return [T0] + [[_ror(t, 8*i) for t in T0] for i in range(1, 4)]
+
+
+TE0, TE1, TE2, TE3 = _build_tables(SBOX, (2, 1, 1, 3))
+TD0, TD1, TD2, TD3 = _build_tables(INV_SBOX, (14, 9, 13, 11))
+
+SBOX_1 = [s << 8 for s in SBOX]
+SBOX_2 = [s << 16 for s in SBOX]
+SBOX_3 = [s << 24 for s in SBOX]
+
+INV_SBOX_1 = [s << 8 for s in INV_SBOX]
+INV_SBOX_2 = [s << 16 for s in INV_SBOX]
+INV_SBOX_3 = [s << 24 for s in INV_SBOX]
+
+
+
+def _sub_word(word: int) -> int:
+    return SBOX_3[word >> 24] | SBOX_2[(word >> 16) & 0xFF] | SBOX_1[(word >> 8) & 0xFF] | SBOX[word & 0xFF]
+
+
+def _inv_mix_word(word: int) -> int:
+    return TD0[SBOX[word >> 24]] ^ TD1[SBOX[(word >> 16) & 0xFF]] ^ TD2[SBOX[(word >> 8) & 0xFF]] ^ TD3[SBOX[word & 0xFF]]
+
+
+@lru_cache(maxsize=KEY_SCHEDULE_CACHE_SIZE)
+def expand_key(key: bytes) -> (tuple, tuple):
+    """
+    Expands an AES key into encryption and (equivalent inverse cipher) decryption round keys. Results are cached
+    by key in an LRU of `KEY_SCHEDULE_CACHE_SIZE` entries.
+
+    Parameters:
+        key (bytes): 16, 24, or 32-byte key.
+
+    Returns:
+        (tuple, tuple): Encryption and decryption round keys as 32-bit words.
+
+    Examples:
+        >>> from samson.block_ciphers.aes_ttable import expand_key
+        >>> hex(expand_key(bytes(range(16)))[0][-4])
+        '0x13111d7f'
+
+    """
+    Nk = len(key) // 4
+    Nr = AES_ROUNDS[len(key)]
+    w  = list(struct.unpack(f'>{Nk}I', key))
+
+    for i in range(Nk, 4 * (Nr + 1)):
+        t = w[i - 1]
+        if i % Nk == 0:
+            t = _sub_word(((t << 8) | (t >> 24)) & 0xFFFFFFFF) ^ (RCON[i // Nk - 1] << 24)
+        elif Nk > 6 and i % Nk == 4:
+            t = _sub_word(t)
+
+        w.append(w[i - Nk] ^ t)
+
+    # Decryption uses the round keys in reverse with InvMixColumns applied to the inner rounds
+    dw = []
+    for r in range(Nr, -1, -1):
+        words = w[4*r:4*r + 4]
+        if 0 < r < Nr:
+            words = [_inv_mix_word(word) for word in words]
+
+        dw.extend(words)
+
+    return tuple(w), tuple(dw)
+
+
+
+def encrypt_block(round_keys: tuple, block: bytes) -> bytes:
+    """
+    Encrypts a single 16-byte block.
+
+    Parameters:
+        round_keys (tuple): Encryption round keys from `expand_key`.
+        block      (bytes): Plaintext block.
+
+    Returns:
+        bytes: Ciphertext block.
+
+    Examples:
+        >>> from samson.block_ciphers.aes_ttable import expand_key, encrypt_block
+        >>> encrypt_block(expand_key(bytes(range(16)))[0], bytes.fromhex('00112233445566778899aabbccddeeff')).hex()
+        '69c4e0d86a7b0430d8cdb78070b4c55a'
+
+    """
+    rk = round_keys
+    s0, s1, s2, s3 = struct.unpack('>4I', block)
+    s0 ^= rk[0]
+    s1 ^= rk[1]
+    s2 ^= rk[2]
+    s3 ^= rk[3]
+
+    for k in range(4, len(rk) - 4, 4):
+        t0 = TE0[s0 >> 24] ^ TE1[(s1 >> 16) & 0xFF] ^ TE2[(s2 >> 8) & 0xFF] ^ TE3[s3 & 0xFF] ^ rk[k]
+        t1 = TE0[s1 >> 24] ^ TE1[(s2 >> 16) & 0xFF] ^ TE2[(s3 >> 8) & 0xFF] ^ TE3[s0 & 0xFF] ^ rk[k + 1]
+        t2 = TE0[s2 >> 24] ^ TE1[(s3 >> 16) & 0xFF] ^ TE2[(s0 >> 8) & 0xFF] ^ TE3[s1 & 0xFF] ^ rk[k + 2]
+        t3 = TE0[s3 >> 24] ^ TE1[(s0 >> 16) & 0xFF] ^ TE2[(s1 >> 8) & 0xFF] ^ TE3[s2 & 0xFF] ^ rk[k + 3]
+        s0, s1, s2, s3 = t0, t1, t2, t3
+
+    k = len(rk) - 4
+    return struct.pack('>4I',
+        SBOX_3[s0 >> 24] ^ SBOX_2[(s1 >> 16) & 0xFF] ^ SBOX_1[(s2 >> 8) & 0xFF] ^ SBOX[s3 & 0xFF] ^ rk[k],
+        SBOX_3[s1 >> 24] ^ SBOX_2[(s2 >> 16) & 0xFF] ^ SBOX_1[(s3 >> 8) & 0xFF] ^ SBOX[s0 & 0xFF] ^ rk[k + 1],
+        SBOX_3[s2 >> 24] ^ SBOX_2[(s3 >> 16) & 0xFF] ^ SBOX_1[(s0 >> 8) & 0xFF] ^ SBOX[s1 & 0xFF] ^ rk[k + 2],
+        SBOX_3[s3 >> 24] ^ SBOX_2[(s0 >> 16) & 0xFF] ^ SBOX_1[(s1 >> 8) & 0xFF] ^ SBOX[s2 & 0xFF] ^ rk[k + 3]
+    )
+
+
+
+def decrypt_block(round_keys: tuple, block: bytes) -> bytes:
+    """
+    Decrypts a single 16-byte block.
+
+    Parameters:
+        round_keys (tuple): Decryption round keys from `expand_key`.
+        block      (bytes): Ciphertext block.
+
+    Returns:
+        bytes: Plaintext block.
+
+    Examples:
+        >>> from samson.block_ciphers.aes_ttable import expand_key, decrypt_block
+        >>> decrypt_block(expand_key(bytes(range(16)))[1], bytes.fromhex('69c4e0d86a7b0430d8cdb78070b4c55a')).hex()
+        '00112233445566778899aabbccddeeff'
+
+    """
+    rk = round_keys
+    s0, s1, s2, s3 = struct.unpack('>4I', block)
+    s0 ^= rk[0]
+    s1 ^= rk[1]
+    s2 ^= rk[2]
+    s3 ^= rk[3]
+
+    for k in range(4, len(rk) - 4, 4):
+        t0 = TD0[s0 >> 24] ^ TD1[(s3 >> 16) & 0xFF] ^ TD2[(s2 >> 8) & 0xFF] ^ TD3[s1 & 0xFF] ^ rk[k]
+        t1 = TD0[s1 >> 24] ^ TD1[(s0 >> 16) & 0xFF] ^ TD2[(s3 >> 8) & 0xFF] ^ TD3[s2 & 0xFF] ^ rk[k + 1]
+        t2 = TD0[s2 >> 24] ^ TD1[(s1 >> 16) & 0xFF] ^ TD2[(s0 >> 8) & 0xFF] ^ TD3[s3 & 0xFF] ^ rk[k + 2]
+        t3 = TD0[s3 >> 24] ^ TD1[(s2 >> 16) & 0xFF] ^ TD2[(s1 >> 8) & 0xFF] ^ TD3[s0 & 0xFF] ^ rk[k + 3]
+        s0, s1, s2, s3 = t0, t1, t2, t3
+
+    k = len(rk) - 4
+    return struct.pack('>4I',
+        INV_SBOX_3[s0 >> 24] ^ INV_SBOX_2[(s3 >> 16) & 0xFF] ^ INV_SBOX_1[(s2 >> 8) & 0xFF] ^ INV_SBOX[s1 & 0xFF] ^ rk[k],
+        INV_SBOX_3[s1 >> 24] ^ INV_SBOX_2[(s0 >> 16) & 0xFF] ^ INV_SBOX_1[(s3 >> 8) & 0xFF] ^ INV_SBOX[s2 & 0xFF] ^ rk[k + 1],
+        INV_SBOX_3[s2 >> 24] ^ INV_SBOX_2[(s1 >> 16) & 0xFF] ^ INV_SBOX_1[(s0 >> 8) & 0xFF] ^ INV_SBOX[s3 & 0xFF] ^ rk[k + 2],
+        INV_SBOX_3[s3 >> 24] ^ INV_SBOX_2[(s2 >> 16) & 0xFF] ^ INV_SBOX_1[(s1 >> 8) & 0xFF] ^ INV_SBOX[s0 & 0xFF] ^ rk[k + 3]
+    )
@@ -1,14 +1,13 @@
-from samson.utilities.manipulation import get_blocks
 from samson.utilities.bytes import Bytes
 from samson.padding.pkcs7 import PKCS7
 from samson.ace.decorators import has_exploit, register_primitive
 from samson.attacks.cbc_padding_oracle_attack import CBCPaddingOracleAttack
-from samson.core.primitives import EncryptionAlg, BlockCipherMode, Primitive
+from samson.core.primitives import EncryptionAlg, BlockCipherMode, BulkProcessingMixin, Primitive
 from samson.core.metadata import EphemeralType, EphemeralSpec, SizeType, SizeSpec, FrequencyType
 
 @has_exploit(CBCPaddingOracleAttack)
 @register_primitive()
-class CBC(BlockCipherMode):
+class CBC(BulkProcessingMixin, BlockCipherMode):
     """Cipherblock chaining block cipher mode."""
 
     EPHEMERAL       = EphemeralSpec(ephemeral_type=EphemeralType.IV, size=SizeSpec(size_type=SizeType.DEPENDENT, selector=lambda block_mode: block_mode.cipher.BLOCK_SIZE))
@@ -53,15 +52,9 @@ class CBC(BlockCipherMode):
         if len(plaintext) % self.cipher.block_size != 0:
             raise Exception("Plaintext is not a multiple of the block size")
 
-        ciphertext = Bytes(b'')
-        last_block = self.iv
-
-        for block in get_blocks(plaintext, self.cipher.block_size):
-            enc_block = self.cipher.encrypt(bytes(last_block ^ block))
-            ciphertext += enc_block
-            last_block = enc_block
-
-        return ciphertext
+        out = bytearray(len(plaintext))
+        self._process_blocks(memoryview(plaintext), memoryview(out), self._initial_state(), True)
+        return Bytes(out)
 
 
     def decrypt(self, ciphertext: bytes, unpad: bool=True) -> Bytes:
@@ -75,19 +68,40 @@ class CBC(BlockCipherMode):
         Returns:
             Bytes: Resulting plaintext.
         """
-        plaintext = b''
-        ciphertext = Bytes.wrap(ciphertext)
-
         if len(ciphertext) % self.cipher.block_size != 0:
             raise Exception("Ciphertext is not a multiple of the block size")
 
-        last_block = self.iv
-        for block in get_blocks(ciphertext, self.cipher.block_size):
-            enc_block = last_block ^ Bytes.wrap(self.cipher.decrypt(block))
-            plaintext += enc_block
-            last_block = block
+        out = bytearray(len(ciphertext))
+        self._process_blocks(memoryview(ciphertext), memoryview(out), self._initial_state(), False)
+        plaintext = Bytes(out)
 
         if unpad:
             plaintext = self.padder.unpad(plaintext)
 
         return plaintext
+
+
+    def _initial_state(self) -> int:
+        return int.from_bytes(self.iv, 'big')
+
+
+    def _process_blocks(self, data: memoryview, out: memoryview, state: int, encrypt: bool) -> int:
+        block_size = self.cipher.block_size
+        if len(data) % block_size:
+            raise Exception("Input is not a multiple of the block size")
+
+        # The chaining value is kept as an int so each XOR is a single operation
+        last_block = state
+        for i in range(0, len(data), block_size):
+            block = data[i:i + block_size]
+
+            if encrypt:
+                enc_block  = self.cipher.encrypt((int.from_bytes(block, 'big') ^ last_block).to_bytes(block_size, 'big'))
+                last_block = int.from_bytes(enc_block, 'big')
+                out[i:i + block_size] = enc_block
+            else:
+                dec_block  = int.from_bytes(self.cipher.decrypt(bytes(block)), 'big') ^ last_block
+                last_block = int.from_bytes(block, 'big')
+                out[i:i + block_size] = dec_block.to_bytes(block_size, 'big')
+
+        return last_block
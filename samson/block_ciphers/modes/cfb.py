@@ -1,11 +1,10 @@
-from samson.utilities.manipulation import get_blocks
 from samson.utilities.bytes import Bytes
-from samson.core.primitives import EncryptionAlg, StreamingBlockCipherMode, Primitive
+from samson.core.primitives import EncryptionAlg, StreamingBlockCipherMode, StreamingBulkProcessingMixin, Primitive
 from samson.core.metadata import EphemeralType, EphemeralSpec, SizeType, SizeSpec
 from samson.ace.decorators import register_primitive
 
 @register_primitive()
-class CFB(StreamingBlockCipherMode):
+class CFB(StreamingBulkProcessingMixin, StreamingBlockCipherMode):
     """Cipher feedback block cipher mode."""
 
     EPHEMERAL = EphemeralSpec(ephemeral_type=EphemeralType.NONCE, size=SizeSpec(size_type=SizeType.DEPENDENT, selector=lambda block_mode: block_mode.cipher.BLOCK_SIZE, typical=[128]))
@@ -39,17 +38,9 @@ class CFB(StreamingBlockCipherMode):
         Returns:
             Bytes: Resulting ciphertext.
         """
-        ciphertext = b''
-        plaintext  = Bytes.wrap(plaintext)
-
-        last_block = self.iv
-
-        for block in get_blocks(plaintext, self.cipher.block_size, allow_partials=True):
-            enc_block   = self.cipher.encrypt(bytes(last_block))[:len(block)] ^ block
-            ciphertext += enc_block
-            last_block  = enc_block
-
-        return ciphertext
+        out = bytearray(len(plaintext))
+        self._process_blocks(memoryview(plaintext), memoryview(out), self._initial_state(), True)
+        return Bytes(out)
 
 
 
@@ -63,14 +54,18 @@ class CFB(StreamingBlockCipherMode):
         Returns:
             Bytes: Resulting plaintext.
         """
-        plaintext  = b''
-        ciphertext = Bytes.wrap(ciphertext)
+        out = bytearray(len(ciphertext))
+        self._process_blocks(memoryview(ciphertext), memoryview(out), self._initial_state(), False)
+        return Bytes(out)
+
+
+    def _initial_state(self) -> bytes:
+        return bytes(self.iv)
+
 
-        last_block = self.iv
+    def _start_block(self, last_ciphertext: bytes) -> bytes:
+        return self.cipher.encrypt(last_ciphertext)
 
-        for block in get_blocks(ciphertext, self.cipher.block_size, allow_partials=True):
-            enc_block  = self.cipher.encrypt(bytes(last_block))[:len(block)] ^ block
-            plaintext += enc_block
-            last_block = block
 
-        return plaintext
+    def _end_block(self, last_ciphertext: bytes, keystream: bytes, ciphertext: bytes) -> bytes:
+        return bytes(ciphertext)
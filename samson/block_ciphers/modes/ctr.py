@@ -1,11 +1,21 @@
 from samson.utilities.bytes import Bytes
-from samson.core.primitives import EncryptionAlg, StreamingBlockCipherMode, Primitive
+from samson.core.primitives import EncryptionAlg, StreamingBlockCipherMode, StreamingBulkProcessingMixin, Primitive
 from samson.core.metadata import EphemeralType, EphemeralSpec, SizeType, SizeSpec, FrequencyType
 from samson.ace.decorators import register_primitive
+from concurrent.futures import ProcessPoolExecutor
 from math import ceil
+import multiprocessing
+
+# Number of keystream blocks generated per bulk XOR
+CTR_WINDOW_BLOCKS = 4096
+
+# Messages shorter than this finish faster in-process than it takes to spin up worker processes
+CTR_POOL_MIN_BLOCKS = 16384
+
+_MODE = None
 
 @register_primitive()
-class CTR(StreamingBlockCipherMode):
+class CTR(StreamingBulkProcessingMixin, StreamingBlockCipherMode):
     """Counter block cipher mode."""
 
     # TODO: This nonce is a RANGE that is DEPENDENT on BLOCK_SIZE
@@ -33,36 +43,166 @@ class CTR(StreamingBlockCipherMode):
 
 
 
-    def encrypt(self, plaintext: bytes) -> Bytes:
+    def encrypt(self, plaintext: bytes, processes: int=1) -> Bytes:
         """
         Encrypts `plaintext`.
 
         Parameters:
             plaintext (bytes): Bytes-like object to be encrypted.
+            processes   (int): Number of worker processes for messages of at least `CTR_POOL_MIN_BLOCKS` blocks.
         
         Returns:
             Bytes: Resulting ciphertext.
         """
-        keystream = Bytes(b'')
-        plaintext = Bytes.wrap(plaintext)
-
-        num_blocks = ceil(len(plaintext) / self.cipher.block_size)
-        for _ in range(num_blocks):
-            keystream += self.cipher.encrypt(self.nonce + self.counter.to_bytes(self.cipher.block_size - len(self.nonce), self.byteorder))
-            self.counter += 1
-
-        return keystream[:len(plaintext)] ^ plaintext
+        out, self.counter = self._xor_keystream(plaintext, self.counter, processes)
+        return Bytes(out)
 
 
 
-    def decrypt(self, ciphertext: bytes) -> Bytes:
+    def decrypt(self, ciphertext: bytes, processes: int=1) -> Bytes:
         """
         Decrypts `ciphertext`.
 
         Parameters:
             ciphertext (bytes): Bytes-like object to be decrypted.
+            processes    (int): Number of worker processes for messages of at least `CTR_POOL_MIN_BLOCKS` blocks.
         
         Returns:
             Bytes: Resulting plaintext.
         """
-        return self.encrypt(ciphertext)
+        return self.encrypt(ciphertext, processes)
+
+
+
+    def encrypt_at(self, plaintext: bytes, offset: int, processes: int=1) -> Bytes:
+        """
+        Encrypts `plaintext` as if it started `offset` bytes into the stream beginning at the current counter.
+        Seeks directly to the right counter block and does not advance the counter.
+
+        Parameters:
+            plaintext (bytes): Bytes-like object to be encrypted.
+            offset      (int): Byte offset into the stream.
+            processes   (int): Number of worker processes for messages of at least `CTR_POOL_MIN_BLOCKS` blocks.
+
+        Returns:
+            Bytes: Resulting ciphertext.
+
+        Examples:
+            >>> from samson.block_ciphers.modes.ctr import CTR
+            >>> from samson.block_ciphers.rijndael import Rijndael
+            >>> ctr = CTR(Rijndael(b'k'*16), b'n'*8)
+            >>> ciphertext = ctr.encrypt(b'attack at dawn, retreat at dusk')
+            >>> ctr.counter = 0
+            >>> ctr.decrypt_at(ciphertext[20:], 20)
+            <Bytes: b'eat at dusk', byteorder=big>
+
+        """
+        block_size = self.cipher.block_size
+        skip       = offset % block_size
+        out, _     = self._xor_keystream(bytes(skip) + bytes(plaintext), self.counter + offset // block_size, processes)
+        return Bytes(out[skip:])
+
+
+
+    def decrypt_at(self, ciphertext: bytes, offset: int, processes: int=1) -> Bytes:
+        """
+        Decrypts `ciphertext` as if it started `offset` bytes into the stream beginning at the current counter.
+        Seeks directly to the right counter block and does not advance the counter.
+
+        Parameters:
+            ciphertext (bytes): Bytes-like object to be decrypted.
+            offset       (int): Byte offset into the stream.
+            processes    (int): Number of worker processes for messages of at least `CTR_POOL_MIN_BLOCKS` blocks.
+
+        Returns:
+            Bytes: Resulting plaintext.
+        """
+        return self.encrypt_at(ciphertext, offset, processes)
+
+
+
+    def keystream(self, length: int, offset: int=0, processes: int=1) -> Bytes:
+        """
+        Generates `length` bytes of keystream starting `offset` bytes into the stream beginning at the current
+        counter. Does not advance the counter.
+
+        Parameters:
+            length    (int): Number of bytes.
+            offset    (int): Byte offset into the stream.
+            processes (int): Number of worker processes for messages of at least `CTR_POOL_MIN_BLOCKS` blocks.
+
+        Returns:
+            Bytes: Keystream.
+        """
+        return self.encrypt_at(bytes(length), offset, processes)
+
+
+
+    def _xor_keystream(self, data: bytes, counter: int, processes: int) -> (bytearray, int):
+        block_size = self.cipher.block_size
+        num_blocks = ceil(len(data) / block_size)
+        out        = bytearray(len(data))
+
+        if processes > 1 and num_blocks >= CTR_POOL_MIN_BLOCKS and 'fork' in multiprocessing.get_all_start_methods():
+            # Counter blocks are independent, so each worker seeks straight to the start of its slice
+            chunk_size = -(-num_blocks // processes) * block_size
+            starts     = range(0, len(data), chunk_size)
+            slices     = [(counter + start // block_size, bytes(data[start:start + chunk_size])) for start in starts]
+
+            with ProcessPoolExecutor(max_workers=processes, mp_context=multiprocessing.get_context('fork'), initializer=_init_worker, initargs=(self,)) as executor:
+                for start, result in zip(starts, executor.map(_xor_worker, slices)):
+                    out[start:start + len(result)] = result
+
+            return out, counter + num_blocks
+
+        return out, self._process_blocks(memoryview(data), memoryview(out), counter, True)
+
+
+    def _initial_state(self) -> int:
+        return self.counter
+
+
+    def _set_state(self, counter: int):
+        self.counter = counter
+
+
+    def _start_block(self, counter: int) -> bytes:
+        return self.cipher.encrypt(self.nonce + counter.to_bytes(self.cipher.block_size - len(self.nonce), self.byteorder))
+
+
+    def _end_block(self, counter: int, keystream: bytes, ciphertext: bytes) -> int:
+        return counter + 1
+
+
+    def _process_blocks(self, data: memoryview, out: memoryview, counter: int, encrypt: bool) -> int:
+        block_size = self.cipher.block_size
+        nonce      = bytes(self.nonce)
+        ctr_size   = block_size - len(nonce)
+
+        # Generate keystream a window at a time and XOR it in as one big integer
+        window = block_size * CTR_WINDOW_BLOCKS
+        for start in range(0, len(data), window):
+            chunk     = data[start:start + window]
+            keystream = bytearray()
+
+            for _ in range(ceil(len(chunk) / block_size)):
+                keystream += self.cipher.encrypt(nonce + counter.to_bytes(ctr_size, self.byteorder))
+                counter   += 1
+
+            out[start:start + len(chunk)] = (int.from_bytes(keystream[:len(chunk)], 'big') ^ int.from_bytes(chunk, 'big')).to_bytes(len(chunk), 'big')
+
+        return counter
+
+
+
+def _init_worker(mode: CTR):
+    global _MODE
+    _MODE = mode
+
+
+
+def _xor_worker(args: tuple) -> bytes:
+    counter, chunk = args
+    out = bytearray(len(chunk))
+    _MODE._process_blocks(memoryview(chunk), memoryview(out), counter, True)
+    return bytes(out)
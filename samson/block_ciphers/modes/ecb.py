@@ -1,11 +1,10 @@
-from samson.utilities.manipulation import get_blocks
 from samson.utilities.bytes import Bytes
 from samson.padding.pkcs7 import PKCS7
-from samson.core.primitives import EncryptionAlg, BlockCipherMode, Primitive
+from samson.core.primitives import EncryptionAlg, BlockCipherMode, BulkProcessingMixin, Primitive
 from samson.ace.decorators import register_primitive
 
 @register_primitive()
-class ECB(BlockCipherMode):
+class ECB(BulkProcessingMixin, BlockCipherMode):
     """Electronic codebook block cipher mode."""
 
     def __init__(self, cipher: EncryptionAlg):
@@ -41,11 +40,9 @@ class ECB(BlockCipherMode):
         if pad:
             plaintext = self.padder.pad(plaintext)
 
-        ciphertext = Bytes(b'')
-        for block in get_blocks(plaintext, self.cipher.block_size):
-            ciphertext += self.cipher.encrypt(block)
-
-        return ciphertext
+        out = bytearray(len(plaintext))
+        self._process_blocks(memoryview(plaintext), memoryview(out), None, True)
+        return Bytes(out)
 
 
 
@@ -60,13 +57,25 @@ class ECB(BlockCipherMode):
         Returns:
             Bytes: Resulting plaintext.
         """
-        ciphertext = Bytes.wrap(ciphertext)
-
-        plaintext = Bytes(b'')
-        for block in get_blocks(ciphertext, self.cipher.block_size):
-            plaintext += self.cipher.decrypt(block)
+        out = bytearray(len(ciphertext))
+        self._process_blocks(memoryview(ciphertext), memoryview(out), None, False)
+        plaintext = Bytes(out)
 
         if unpad:
             plaintext = self.padder.unpad(plaintext)
 
         return plaintext
+
+
+    def _initial_state(self) -> None:
+        return None
+
+
+    def _process_blocks(self, data: memoryview, out: memoryview, state: None, encrypt: bool) -> None:
+        block_size = self.cipher.block_size
+        if len(data) % block_size:
+            raise Exception("Input is not a multiple of the block size")
+
+        func = self.cipher.encrypt if encrypt else self.cipher.decrypt
+        for i in range(0, len(data), block_size):
+            out[i:i + block_size] = func(bytes(data[i:i + block_size]))
@@ -0,0 +1,140 @@
+from samson.core.primitives import BulkProcessingMixin, StreamingBulkProcessingMixin
+from samson.utilities.bytes import Bytes
+
+
+class Encryptor(object):
+    """
+    Streaming encryptor/decryptor for block cipher modes. Accepts chunks of any size and keeps the chaining state
+    and any partial block between calls.
+
+    Examples:
+        >>> from samson.block_ciphers.rijndael import Rijndael
+        >>> from samson.block_ciphers.modes.cbc import CBC
+        >>> cbc = CBC(Rijndael(b'k'*16), b'i'*16)
+        >>> encryptor = cbc.encryptor()
+        >>> ciphertext = encryptor.update(b'hello ') + encryptor.update(b'world' * 10) + encryptor.finalize()
+        >>> ciphertext == cbc.encrypt(b'hello ' + b'world' * 10)
+        True
+
+    """
+
+    def __init__(self, mode: BulkProcessingMixin, encrypt: bool=True, pad: bool=True):
+        """
+        Parameters:
+            mode (BulkProcessingMixin): Mode implementing the bulk processing hooks.
+            encrypt             (bool): Whether to encrypt or decrypt.
+            pad                 (bool): Whether to pad/unpad on `finalize`. Ignored for streaming modes.
+        """
+        self.mode       = mode
+        self.encrypt    = encrypt
+        self.pad        = pad
+        self.block_size = mode.cipher.block_size
+        self.streaming  = isinstance(mode, StreamingBulkProcessingMixin)
+        self.state      = mode._initial_state()
+
+        # Block modes buffer unprocessed input; streaming modes keep the current keystream block and its input
+        self.buffer     = b''
+        self.keystream  = None
+        self.feedback   = bytearray()
+
+
+    def __repr__(self):
+        return f"<Encryptor: mode={self.mode}, encrypt={self.encrypt}, pad={self.pad}>"
+
+    def __str__(self):
+        return self.__repr__()
+
+
+    def update(self, data: bytes) -> Bytes:
+        """
+        Processes the next chunk.
+
+        Parameters:
+            data (bytes): Chunk of plaintext (or ciphertext when decrypting).
+
+        Returns:
+            Bytes: Output available so far.
+        """
+        if self.streaming:
+            return Bytes(self._update_streaming(memoryview(data)))
+
+        data   = self.buffer + bytes(data)
+        length = len(data) - len(data) % self.block_size
+
+        # Hold back the final block so `finalize` can unpad it
+        if not self.encrypt and self.pad and length == len(data) and length:
+            length -= self.block_size
+
+        out = bytearray(length)
+        self.state  = self.mode._process_blocks(memoryview(data)[:length], memoryview(out), self.state, self.encrypt)
+        self.buffer = data[length:]
+        return Bytes(out)
+
+
+    def finalize(self) -> Bytes:
+        """
+        Processes any buffered input, padding or unpadding as configured.
+
+        Returns:
+            Bytes: Remaining output.
+        """
+        if self.streaming:
+            return Bytes(b'')
+
+        data, self.buffer = self.buffer, b''
+
+        if self.encrypt and self.pad:
+            data = bytes(self.mode.padder.pad(Bytes(data)))
+
+        if len(data) % self.block_size:
+            raise Exception("Input is not a multiple of the block size")
+
+        out = bytearray(len(data))
+        self.state = self.mode._process_blocks(memoryview(data), memoryview(out), self.state, self.encrypt)
+        out = Bytes(out)
+
+        if not self.encrypt and self.pad:
+            out = self.mode.padder.unpad(out)
+
+        return out
+
+
+    def _xor(self, keystream: bytes, data: bytes) -> bytes:
+        return (int.from_bytes(keystream, 'big') ^ int.from_bytes(data, 'big')).to_bytes(len(data), 'big')
+
+
+    def _finish_partial(self, data: memoryview, out: bytearray) -> memoryview:
+        used   = len(self.feedback)
+        needed = self.block_size - used
+        chunk  = data[:needed]
+        result = self._xor(self.keystream[used:used + len(chunk)], chunk)
+        out   += result
+        self.feedback += result if self.encrypt else chunk
+
+        if len(self.feedback) == self.block_size:
+            self.state     = self.mode._end_block(self.state, self.keystream, bytes(self.feedback))
+            self.keystream = None
+            self.feedback  = bytearray()
+
+        return data[len(chunk):]
+
+
+    def _update_streaming(self, data: memoryview) -> bytearray:
+        out = bytearray()
+
+        if self.keystream is not None:
+            data = self._finish_partial(data, out)
+
+        # Whole blocks go through the mode's bulk path
+        length = len(data) - len(data) % self.block_size
+        if length:
+            bulk = bytearray(length)
+            self.state = self.mode._process_blocks(data[:length], memoryview(bulk), self.state, self.encrypt)
+            out  += bulk
+            data  = data[length:]
+
+        if len(data):
+            self.keystream = self.mode._start_block(self.state)
+            data = self._finish_partial(data, out)
+
+        return out
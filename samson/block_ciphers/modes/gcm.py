@@ -3,17 +3,164 @@ from samson.utilities.bytes import Bytes
 from samson.core.primitives import EncryptionAlg, StreamingBlockCipherMode, Primitive
 from samson.core.metadata import EphemeralType, EphemeralSpec, SizeType, SizeSpec, FrequencyType
 from samson.ace.decorators import register_primitive
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
 
-# Reference
+# Blocks are processed as big-endian integers where the most significant bit is the coefficient of x^0, so
+# multiplying by x is a right shift. GHASH multiplies by H a byte at a time (Shoup's 8-bit method): one table of
+# H times every byte value and one table reducing the eight bits shifted out.
 # https://github.com/tomato42/tlslite-ng/blob/master/tlslite/utils/aesgcm.py
-GCM_REDUCTION_TABLE = [
-    0x0000, 0x1c20, 0x3840, 0x2460, 0x7080, 0x6ca0, 0x48c0, 0x54e0,
-    0xe100, 0xfd20, 0xd940, 0xc560, 0x9180, 0x8da0, 0xa9c0, 0xb5e0,
-]
+# http://luca-giuzzi.unibs.it/corsi/Support/papers-cryptography/gcm-spec.pdf (section 4.1)
 
+# Messages shorter than this are hashed faster in-process than it takes to spin up worker processes
+GHASH_POOL_MIN_BLOCKS = 16384
+
+
+def gcm_shift(x: int) -> int:
+    """
+    Multiplies `x` by the polynomial x in GF(2^128).
+
+    Parameters:
+        x (int): Field element.
+
+    Returns:
+        int: Product.
+    """
+    high_bit_set = x & 1
+    x >>= 1
+
+    if high_bit_set:
+        x ^= 0xe1 << (128 - 8)
+
+    return x
+
+
+def _shift8(x: int) -> int:
+    for _ in range(8):
+        x = gcm_shift(x)
+
+    return x
+
+
+GCM_REDUCTION_TABLE = [_shift8(i) for i in range(256)]
+
+
+def build_product_table(h: int) -> list:
+    """
+    Builds the table of `h` times every byte value in the most significant byte position.
+
+    Parameters:
+        h (int): Field element.
+
+    Returns:
+        list: 256 products.
+    """
+    table = [0] * 256
+    for i in range(8):
+        table[0x80 >> i] = h
+        h = gcm_shift(h)
+
+    for i in range(1, 256):
+        if i & (i - 1):
+            table[i] = table[i & (i - 1)] ^ table[i & -i]
+
+    return table
+
+
+def table_mul(table: list, y: int) -> int:
+    """
+    Multiplies `y` by the element `table` was built from.
+
+    Parameters:
+        table (list): Product table from `build_product_table`.
+        y      (int): Field element.
+
+    Returns:
+        int: Product.
+    """
+    ret = 0
+    for _ in range(16):
+        ret = (ret >> 8) ^ GCM_REDUCTION_TABLE[ret & 0xFF] ^ table[y & 0xFF]
+        y >>= 8
+
+    return ret
+
+
+def gf128_mul(x: int, y: int) -> int:
+    """
+    Multiplies two arbitrary elements of GHASH's field. Slower than `table_mul`; use it when no table exists.
+
+    Parameters:
+        x (int): Field element.
+        y (int): Field element.
+
+    Returns:
+        int: Product.
+
+    Examples:
+        >>> from samson.block_ciphers.modes.gcm import gf128_mul, table_mul, build_product_table
+        >>> x, y = 0x66e94bd4ef8a2c3b884cfa59ca342b2e, 0x0388dace60b6a392f328c2b971b2fe78
+        >>> gf128_mul(x, y) == table_mul(build_product_table(x), y)
+        True
+
+    """
+    z = 0
+    for i in range(127, -1, -1):
+        if (y >> i) & 1:
+            z ^= x
+
+        x = gcm_shift(x)
+
+    return z
+
+
+def gf128_pow(x: int, e: int) -> int:
+    """
+    Raises `x` to the `e`-th power in GHASH's field.
+
+    Parameters:
+        x (int): Field element.
+        e (int): Nonnegative exponent.
+
+    Returns:
+        int: Power.
+    """
+    result = 1 << 127
+    while e:
+        if e & 1:
+            result = gf128_mul(result, x)
+
+        x   = gf128_mul(x, x)
+        e >>= 1
+
+    return result
+
+
+def ghash_blocks(table: list, y: int, data: bytes) -> int:
+    """
+    Runs GHASH over `data` zero-padded to a multiple of 16 bytes.
+
+    Parameters:
+        table (list): Product table for H.
+        y      (int): Initial GHASH state.
+        data (bytes): Data to hash.
+
+    Returns:
+        int: Resulting GHASH state.
+    """
+    data = bytes(data)
+    if len(data) % 16:
+        data += bytes(16 - len(data) % 16)
+
+    for i in range(0, len(data), 16):
+        y = table_mul(table, y ^ int.from_bytes(data[i:i + 16], 'big'))
+
+    return y
+
+
+def _ghash_worker(h: int, data: bytes) -> int:
+    return ghash_blocks(build_product_table(h), 0, data)
 
-def reverse_bits(int32: int) -> int:
-    return int(bin(int32)[2:].zfill(4)[::-1], 2)
 
 
 @register_primitive()
@@ -35,12 +182,7 @@ class GCM(StreamingBlockCipherMode):
         self.ctr    = CTR(self.cipher, b'\x00' * 8)
 
         # Precompute the product table
-        self.product_table = [0] * 16
-        self.product_table[reverse_bits(1)] = self.H
-
-        for i in range(2, 16, 2):
-            self.product_table[reverse_bits(i)]     = self.gcm_shift(self.product_table[reverse_bits(i // 2)])
-            self.product_table[reverse_bits(i + 1)] = self.product_table[reverse_bits(i)] ^ self.H
+        self.product_table = build_product_table(self.H)
 
 
     def __repr__(self):
@@ -65,7 +207,7 @@ class GCM(StreamingBlockCipherMode):
 
 
 
-    def encrypt(self, nonce: bytes, plaintext: bytes, data: bytes=b'') -> Bytes:
+    def encrypt(self, nonce: bytes, plaintext: bytes, data: bytes=b'', processes: int=1) -> Bytes:
         """
         Encrypts `plaintext`.
 
@@ -73,6 +215,7 @@ class GCM(StreamingBlockCipherMode):
             nonce     (bytes): Bytes-like nonce.
             plaintext (bytes): Bytes-like object to be encrypted.
             data      (bytes): Bytes-like additional data to be authenticated but not encrypted.
+            processes   (int): Number of worker processes for large messages (see `CTR.encrypt` and `update`).
         
         Returns:
             Bytes: Resulting ciphertext.
@@ -80,14 +223,14 @@ class GCM(StreamingBlockCipherMode):
         tag_mask = self.clock_ctr(nonce)
         data     = Bytes.wrap(data)
 
-        ciphertext = self.ctr.encrypt(plaintext)
-        tag        = self.auth(ciphertext, data, tag_mask)
+        ciphertext = self.ctr.encrypt(plaintext, processes)
+        tag        = self.auth(ciphertext, data, tag_mask, processes)
 
         return ciphertext + tag
 
 
 
-    def decrypt(self, nonce: bytes, authed_ciphertext: bytes, data: bytes=b'') -> Bytes:
+    def decrypt(self, nonce: bytes, authed_ciphertext: bytes, data: bytes=b'', processes: int=1) -> Bytes:
         """
         Decrypts `ciphertext`.
 
@@ -95,6 +238,7 @@ class GCM(StreamingBlockCipherMode):
             nonce             (bytes): Bytes-like nonce.
             authed_ciphertext (bytes): Bytes-like object to be decrypted.
             data              (bytes): Bytes-like additional data to be authenticated.
+            processes           (int): Number of worker processes for large messages (see `CTR.decrypt` and `update`).
         
         Returns:
             Bytes: Resulting plaintext.
@@ -106,41 +250,53 @@ class GCM(StreamingBlockCipherMode):
 
         tag_mask = self.clock_ctr(nonce)
         data     = Bytes.wrap(data)
-        tag      = self.auth(ciphertext, data, tag_mask)
+        tag      = self.auth(ciphertext, data, tag_mask, processes)
 
         if not RUNTIME.compare_bytes(tag, orig_tag):
             raise Exception('Tag mismatch: authentication failed!')
 
-        return self.ctr.decrypt(ciphertext)
+        return self.ctr.decrypt(ciphertext, processes)
 
 
-    def gcm_shift(self, x: int) -> int:
-        high_bit_set = x & 1
-        x >>= 1
 
-        if high_bit_set:
-            x ^= 0xe1 << (128 - 8)
+    def decrypt_at(self, nonce: bytes, ciphertext: bytes, offset: int) -> Bytes:
+        """
+        Decrypts a slice of ciphertext (without the tag) that starts `offset` bytes into the message. The slice is
+        NOT authenticated; verify the whole message with `decrypt` before trusting the result.
+
+        Parameters:
+            nonce      (bytes): Bytes-like nonce.
+            ciphertext (bytes): Bytes-like ciphertext slice.
+            offset       (int): Byte offset of the slice into the ciphertext.
+
+        Returns:
+            Bytes: Resulting plaintext.
+
+        Examples:
+            >>> from samson.block_ciphers.modes.gcm import GCM
+            >>> from samson.block_ciphers.rijndael import Rijndael
+            >>> gcm = GCM(Rijndael(b'k'*16))
+            >>> authed_ciphertext = gcm.encrypt(b'n'*12, b'attack at dawn, retreat at dusk')
+            >>> gcm.decrypt_at(b'n'*12, authed_ciphertext[20:-16], 20)
+            <Bytes: b'eat at dusk', byteorder=big>
 
-        return x
+        """
+        self.clock_ctr(nonce)
+        return self.ctr.decrypt_at(ciphertext, offset)
 
 
-    def mul(self, y):
-        ret = 0
+    def gcm_shift(self, x: int) -> int:
+        return gcm_shift(x)
 
-        for _ in range(0, 128, 4):
-            high_bit = ret & 0xF
-            ret >>= 4
-            ret  ^= GCM_REDUCTION_TABLE[high_bit] << (128 - 16)
-            ret  ^= self.product_table[y & 0xF]
-            y   >>= 4
 
-        return ret
+    def mul(self, y: int) -> int:
+        return table_mul(self.product_table, y)
 
 
-    def auth(self, ciphertext: Bytes, ad: Bytes, tag_mask: Bytes) -> Bytes:
+    def auth(self, ciphertext: Bytes, ad: Bytes, tag_mask: Bytes, processes: int=1) -> Bytes:
         y  = 0
         y  = self.update(y, ad)
-        y  = self.update(y, ciphertext)
+        y  = self.update(y, ciphertext, processes)
         y ^= (len(ad) << (3 + 64)) | (len(ciphertext) << 3)
         y  = self.mul(y)
         y ^= tag_mask.int()
@@ -148,16 +304,39 @@ class GCM(StreamingBlockCipherMode):
 
 
 
-    def update(self, y: int, data: Bytes) -> int:
-        for chunk in data.chunk(16):
-            y ^= chunk.int()
-            y  = self.mul(y)
+    def update(self, y: int, data: Bytes, processes: int=1) -> int:
+        """
+        Absorbs `data`, zero-padded to a multiple of 16 bytes, into the GHASH state `y`. With `processes` > 1, at
+        least `GHASH_POOL_MIN_BLOCKS` blocks and `fork` available, the data is split into contiguous chunks that are
+        hashed independently and recombined with powers of H:
+
+            GHASH(y, C_1 || ... || C_k) = y*H^n + sum(GHASH(0, C_i) * H^(blocks after C_i))
+
+        Parameters:
+            y           (int): Current GHASH state.
+            data      (bytes): Data to absorb.
+            processes   (int): Number of worker processes.
+
+        Returns:
+            int: Resulting GHASH state.
+        """
+        num_blocks = -(-len(data) // 16)
+        if processes <= 1 or num_blocks < GHASH_POOL_MIN_BLOCKS or 'fork' not in multiprocessing.get_all_start_methods():
+            return ghash_blocks(self.product_table, y, data)
+
+        data       = bytes(data) + bytes(num_blocks * 16 - len(data))
+        chunk_size = -(-num_blocks // processes) * 16
+        chunks     = [data[i:i + chunk_size] for i in range(0, len(data), chunk_size)]
+
+        with ProcessPoolExecutor(max_workers=processes, mp_context=multiprocessing.get_context('fork')) as executor:
+            partials = list(executor.map(_ghash_worker, [self.H] * len(chunks), chunks))
+
+        # Chunk i is followed by (k - 2 - i) full chunks and the possibly shorter last chunk
+        H_chunk = gf128_pow(self.H, chunk_size // 16)
+        H_last  = gf128_pow(self.H, len(chunks[-1]) // 16)
 
-        extra = len(data) % 16
+        y = gf128_mul(y, gf128_mul(gf128_pow(H_chunk, len(chunks) - 1), H_last))
+        for i, partial in enumerate(partials[:-1]):
+            y ^= gf128_mul(partial, gf128_mul(gf128_pow(H_chunk, len(chunks) - 2 - i), H_last))
 
-        if extra != 0:
-            block = bytearray(16)
-            block[:extra] = data[-extra:]
-            y ^= int.from_bytes(block, 'big')
-            y  = self.mul(y)
-        return y
+        return y ^ partials[-1]
@@ -1,12 +1,11 @@
 from samson.block_ciphers.modes.cbc import CBC
-from samson.core.primitives import EncryptionAlg, StreamingBlockCipherMode, Primitive
+from samson.core.primitives import EncryptionAlg, StreamingBlockCipherMode, StreamingBulkProcessingMixin, Primitive
 from samson.core.metadata import EphemeralType, EphemeralSpec, SizeType, SizeSpec
 from samson.ace.decorators import register_primitive
 from samson.utilities.bytes import Bytes
-from math import ceil
 
 @register_primitive()
-class OFB(StreamingBlockCipherMode):
+class OFB(StreamingBulkProcessingMixin, StreamingBlockCipherMode):
     """Output feedback block cipher mode."""
 
     EPHEMERAL = EphemeralSpec(ephemeral_type=EphemeralType.NONCE, size=SizeSpec(size_type=SizeType.DEPENDENT, selector=lambda block_mode: block_mode.cipher.BLOCK_SIZE))
@@ -40,12 +39,9 @@ class OFB(StreamingBlockCipherMode):
         Returns:
             Bytes: Resulting ciphertext.
         """
-        plaintext  = Bytes.wrap(plaintext)
-
-        num_blocks = ceil(len(plaintext) / self.cipher.block_size)
-        keystream  = self.cbc.encrypt(b'\x00' * self.cipher.block_size * num_blocks, False)
-
-        return keystream[:len(plaintext)] ^ plaintext
+        out = bytearray(len(plaintext))
+        self._process_blocks(memoryview(plaintext), memoryview(out), self._initial_state(), True)
+        return Bytes(out)
 
 
     def decrypt(self, ciphertext: bytes) -> Bytes:
@@ -59,3 +55,15 @@ class OFB(StreamingBlockCipherMode):
             Bytes: Resulting plaintext.
         """
         return self.encrypt(ciphertext)
+
+
+    def _initial_state(self) -> bytes:
+        return bytes(self.iv)
+
+
+    def _start_block(self, last_output: bytes) -> bytes:
+        return self.cipher.encrypt(last_output)
+
+
+    def _end_block(self, last_output: bytes, keystream: bytes, ciphertext: bytes) -> bytes:
+        return bytes(keystream)
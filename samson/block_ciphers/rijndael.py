@@ -99,13 +99,18 @@ class Rijndael(BlockCipher):
         self.block_size = block_size
 
         self._chunk_size = self.block_size // 4
-        round_keys = self.key_schedule()
-        self.round_keys = [Bytes(b''.join(round_keys[i:i + self._chunk_size])) for i in range(0, len(round_keys), self._chunk_size)]
+        self._round_keys = None
 
         Nk = len(self.key) // 4
         Nb = self._chunk_size
         self.num_rounds = NUM_ROUNDS[(Nk - 4) // 2][(Nb - 4) // 2] + 1
 
+        # AES parameters use the T-table engine; everything else goes through the reference implementation
+        self._aes_keys = None
+        if block_size == 16 and len(key) in (16, 24, 32):
+            from samson.block_ciphers.aes_ttable import expand_key
+            self._aes_keys = expand_key(bytes(key))
+
 
     def __repr__(self):
         return f"<Rijndael: key={self.key}, key_size={len(self.key)}, block_size={self.block_size}>"
@@ -114,6 +119,15 @@ class Rijndael(BlockCipher):
         return self.__repr__()
 
 
+    @property
+    def round_keys(self) -> list:
+        if self._round_keys is None:
+            round_keys = self.key_schedule()
+            self._round_keys = [Bytes(b''.join(round_keys[i:i + self._chunk_size])) for i in range(0, len(round_keys), self._chunk_size)]
+
+        return self._round_keys
+
+
     # https://en.wikipedia.org/wiki/Rijndael_key_schedule
     def key_schedule(self):
         N = len(self.key) // 4
@@ -168,6 +182,10 @@ class Rijndael(BlockCipher):
         Returns:
             Bytes: Resulting ciphertext.
         """
+        if self._aes_keys and len(plaintext) == 16:
+            from samson.block_ciphers.aes_ttable import encrypt_block
+            return Bytes(encrypt_block(self._aes_keys[0], plaintext))
+
         return list(self.yield_encrypt(plaintext))[-1]
 
 
@@ -205,6 +223,10 @@ class Rijndael(BlockCipher):
         Returns:
             Bytes: Resulting plaintext.
         """
+        if self._aes_keys and len(ciphertext) == 16:
+            from samson.block_ciphers.aes_ttable import decrypt_block
+            return Bytes(decrypt_block(self._aes_keys[1], ciphertext))
+
         return list(self.yield_decrypt(ciphertext))[-1]
 
 
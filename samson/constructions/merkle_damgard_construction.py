@@ -3,7 +3,7 @@ from samson.utilities.bytes import Bytes
 from samson.core.metadata import ConstructionType
 from samson.core.primitives import Hash
 from types import FunctionType
-from copy import deepcopy
+from copy import copy
 
 
 def md_pad(msg: bytes, fakeLen: int=None, byteorder: str='little', bit_size: int=64, encoded_size_length: int=None) -> bytes:
@@ -28,6 +28,18 @@ class MerkleDamgardConstruction(Hash):
     """
     An iterative construction for building collision-resistant cryptographic hash functions from collision-resistant
     one-way compression functions. Used in MD4, MD5, SHA1, SHA2, RIPEMD, and more.
+
+    Besides `hash`, supports hashlib-style streaming with `update`, `digest`, `hexdigest`, and `copy`. Only the
+    chaining value and a partial block are kept, so arbitrarily long inputs hash in constant memory.
+
+    Examples:
+        >>> from samson.hashes.sha2 import SHA256
+        >>> sha256 = SHA256()
+        >>> sha256.update(b'hello ')
+        >>> sha256.update(b'world')
+        >>> sha256.digest() == SHA256().hash(b'hello world')
+        True
+
     """
 
     CONSTRUCTION_TYPES = [ConstructionType.MERKLE_DAMGARD]
@@ -54,7 +66,7 @@ class MerkleDamgardConstruction(Hash):
         self.block_size          = block_size
         self.endianness          = endianness
         self.encoded_size_length = encoded_size_length
-
+        self.reset()
 
 
     def __repr__(self):
@@ -104,11 +116,139 @@ class MerkleDamgardConstruction(Hash):
         Returns:
             Bytes: Fully-hashed state.
         """
-        final_state = list(self.yield_state(message))[-1]
+        for final_state in self.yield_state(message):
+            pass
+
         return final_state
 
 
 
+    def hash_many(self, messages: list) -> list:
+        """
+        Hashes each message in `messages`. Subclasses with a batched compression function hash short messages
+        together.
+
+        Parameters:
+            messages (list): Messages to be hashed.
+
+        Returns:
+            list: Digests in the same order.
+        """
+        return [self.hash(message) for message in messages]
+
+
+    def batch_compressor(self) -> FunctionType:
+        """
+        Returns the batched compression function over lane-packed 32-bit words (see `samson.hashes.batch`), if the
+        hash has one.
+
+        Returns:
+            func: Batched compression function or None.
+        """
+        return None
+
+
+    def state_words(self) -> list:
+        """
+        Returns the streaming chaining value as 32-bit integer words in the hash's endianness.
+
+        Returns:
+            list: State words.
+        """
+        state = self._state
+        return [int.from_bytes(state[i:i + 4], self.endianness) for i in range(0, len(state), 4)]
+
+
+    def _batch_hash(self, messages: list, compress: object, iv: list) -> list:
+        from samson.hashes.batch import batch_hash, MAX_MESSAGE_LENGTH
+
+        # Only single-block messages fit the batch; longer ones are hashed on their own
+        short   = [message for message in messages if len(message) <= MAX_MESSAGE_LENGTH]
+        batched = iter(batch_hash(short, compress, iv, self.endianness))
+
+        return [next(batched)[:self.digest_size] if len(message) <= MAX_MESSAGE_LENGTH else self.hash(message) for message in messages]
+
+
+
+    def reset(self):
+        """
+        Resets the streaming state to `initial_state`.
+        """
+        self.load_state(self.initial_state, 0)
+
+
+    def load_state(self, state: bytes, length: int):
+        """
+        Sets the streaming state as if `length` bytes had already been hashed into `state`. `length` should be a
+        multiple of the block size.
+
+        Parameters:
+            state (bytes): Chaining value.
+            length  (int): Number of bytes already processed (including any padding).
+        """
+        self._state  = Bytes.wrap(state)
+        self._buffer = b''
+        self._length = length
+
+
+    def update(self, message: bytes):
+        """
+        Hashes `message` into the streaming state.
+
+        Parameters:
+            message (bytes): Next chunk of the message.
+        """
+        block_size = self.block_size
+        buffer     = self._buffer + bytes(message)
+        end        = len(buffer) - len(buffer) % block_size
+        state      = self._state
+
+        for i in range(0, end, block_size):
+            state = self.compression_func(Bytes(buffer[i:i + block_size]), state)
+
+        self._state   = state
+        self._buffer  = buffer[end:]
+        self._length += len(message)
+
+
+    def digest(self) -> Bytes:
+        """
+        Returns the digest of everything passed to `update` so far. Doesn't alter the streaming state.
+
+        Returns:
+            Bytes: Digest.
+        """
+        state = self._state
+        tail  = md_pad(Bytes(self._buffer), self._length, self.endianness, bit_size=self.block_size, encoded_size_length=self.encoded_size_length)
+
+        for block in get_blocks(tail, self.block_size):
+            state = self.compression_func(block, state)
+
+        return state[:self.digest_size]
+
+
+    def hexdigest(self) -> str:
+        """
+        Returns the digest of everything passed to `update` so far as a hex string.
+
+        Returns:
+            str: Hex digest.
+        """
+        return bytes(self.digest()).hex()
+
+
+    def copy(self) -> 'MerkleDamgardConstruction':
+        """
+        Returns a copy of the hash object including its streaming state. Useful for hashing many messages that
+        share a prefix.
+
+        Returns:
+            MerkleDamgardConstruction: Copy.
+        """
+        return copy(self)
+
+
+
     def length_extension(self, observed_output: bytes, message: bytes, bytes_to_append: bytes, secret_len: int) -> (Bytes, Bytes):
         """
         Performs a length-extension attack.
@@ -126,12 +266,10 @@ class MerkleDamgardConstruction(Hash):
         Returns:
             (Bytes, Bytes): Result formatted as (crafted input, forged hash).
         """
-        glue = md_pad(message, len(message) + secret_len, self.endianness, bit_size=self.block_size)[len(message):]
-
-        fake_len = secret_len + len(message) + len(glue) + len(bytes_to_append)
+        glue = md_pad(message, len(message) + secret_len, self.endianness, bit_size=self.block_size, encoded_size_length=self.encoded_size_length)[len(message):]
 
-        new_hash_obj = deepcopy(self)
-        new_hash_obj.initial_state = observed_output
-        new_hash_obj.pad_func = lambda msg: md_pad(msg, fake_len, self.endianness, bit_size=self.block_size)
+        forger = self.copy()
+        forger.load_state(observed_output, secret_len + len(message) + len(glue))
+        forger.update(bytes_to_append)
 
-        return Bytes(message + glue + bytes_to_append), new_hash_obj.hash(bytes_to_append)
+        return Bytes(message + glue + bytes_to_append), forger.digest()
@@ -1,11 +1,14 @@
 from math import ceil
 from samson.utilities.bytes import Bytes
 from types import FunctionType
+from copy import copy
 
 class SpongeConstruction(object):
     """
     "The sponge construction is a mode of operation, based on a fixed-length permutation (or transformation) and on a padding rule, which builds a function mapping variable-length input to variable-length output"
     https://keccak.team/sponge_duplex.html
+
+    `update` absorbs input incrementally without padding; subclasses finish with `digest`.
     """
 
     def __init__(self, perm_func: FunctionType, pad_func: FunctionType, r: int, c: int):
@@ -25,6 +28,7 @@ class SpongeConstruction(object):
         self.block_size = (self.r + 7) // 8
 
         self.S = [[0] * 5 for _ in range(5)]
+        self._buffer = b''
 
 
     def __repr__(self):
@@ -39,6 +43,21 @@ class SpongeConstruction(object):
         Resets the sponge to its initial state.
         """
         self.S = [[0] * 5 for _ in range(5)]
+        self._buffer = b''
+
+
+    def absorb_block(self, block: bytes):
+        """
+        XORs a single rate-sized block into the state and applies the permutation.
+
+        Parameters:
+            block (bytes): Block to absorb.
+        """
+        S = self.S
+        for i in range((len(block) + 7) // 8):
+            S[i % 5][i // 5] ^= int.from_bytes(block[i*8:i*8 + 8], 'little')
+
+        self.S = self.perm_func(S)
 
 
 
@@ -52,13 +71,39 @@ class SpongeConstruction(object):
         padded = self.pad_func(in_bytes)
 
         for block in padded.chunk(self.block_size):
-            curr = 0
-            for y in range(5):
-                for x in range(5):
-                    self.S[x][y] ^= sum([byte << i * 8 for i, byte in enumerate(block[curr:curr + 8])])
-                    curr += 8
+            self.absorb_block(block)
 
-            self.S = self.perm_func(self.S)
+
+
+    def update(self, in_bytes: bytes):
+        """
+        Absorbs bytes into the sponge without padding. Trailing bytes short of a block are buffered until the next
+        call.
+
+        Parameters:
+            in_bytes (bytes): Bytes to absorb.
+        """
+        block_size = self.block_size
+        buffer     = self._buffer + bytes(in_bytes)
+        end        = len(buffer) - len(buffer) % block_size
+
+        for i in range(0, end, block_size):
+            self.absorb_block(buffer[i:i + block_size])
+
+        self._buffer = buffer[end:]
+
+
+
+    def copy(self) -> 'SpongeConstruction':
+        """
+        Returns a copy of the sponge including its state.
+
+        Returns:
+            SpongeConstruction: Copy.
+        """
+        sponge   = copy(self)
+        sponge.S = [list(lane) for lane in self.S]
+        return sponge
 
 
 
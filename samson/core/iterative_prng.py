@@ -1,4 +1,5 @@
 from z3 import BitVecs, Solver, LShR, Bool, Implies, sat, RotateLeft
+from samson.math.gf2 import GF2Matrix, SymbolicBits
 from inspect import isclass
 import random
 
@@ -56,3 +57,54 @@ class IterativePRNG(object):
             return prng
         else:
             raise RuntimeError('Model not satisfiable.')
+
+
+
+    def crack_linear(self, outputs: list, masks: list=None) -> object:
+        """
+        Cracks the PRNG's internal state from any set of known output bits by tracing `gen_func` over GF(2) and
+        solving the resulting linear system. Unlike `crack`, outputs can be truncated or skipped entirely. For
+        generators whose output is a sum (the "+" variants), only the least significant bit of each output is
+        linear, so one known bit per output is used.
+
+        Parameters:
+            outputs (list): Observed, sequential outputs. Use None for outputs that weren't observed.
+            masks   (list): Known bits of each output. Defaults to all of them.
+
+        Returns:
+            IterativePRNG: Cracked IterativePRNG of the subclass' class positioned after the last output.
+
+        Examples:
+            >>> from samson.prngs.xorshift import Xorshift128Plus
+            >>> from samson.core.iterative_prng import IterativePRNG
+            >>> xs = Xorshift128Plus([0x1234567890ABCDEF, 0xFEDCBA0987654321])
+            >>> outputs = [xs.generate() & 1 for _ in range(160)]
+            >>> cracked = IterativePRNG.crack_linear(Xorshift128Plus, outputs, [1] * 160)
+            >>> cracked.generate() == xs.generate()
+            True
+
+        """
+        cls        = self if isclass(self) else self.__class__
+        masks      = masks or [2**cls.NATIVE_BITS - 1] * len(outputs)
+        sym_states = [SymbolicBits.variables(cls.NATIVE_BITS, i * cls.NATIVE_BITS) for i in range(cls.STATE_SIZE)]
+
+        equations = []
+        values    = []
+
+        for output, mask in zip(outputs, masks):
+            sym_states, calc = cls.gen_func(*sym_states)
+
+            if output is None:
+                continue
+
+            for bit in range(cls.NATIVE_BITS):
+                if (mask >> bit) & 1 and calc[bit] is not None:
+                    equations.append(calc[bit])
+                    values.append((output >> bit) & 1)
+
+        solution = GF2Matrix(equations, cls.NATIVE_BITS * cls.STATE_SIZE).solve(values)
+        params   = [(solution >> (i * cls.NATIVE_BITS)) & (2**cls.NATIVE_BITS - 1) for i in range(cls.STATE_SIZE)]
+
+        prng = cls(params)
+        [prng.generate() for _ in outputs]
+        return prng
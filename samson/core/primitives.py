@@ -180,3 +180,112 @@ class BlockCipherMode(EncryptionAlg):
 class StreamingBlockCipherMode(BlockCipherMode):
     CIPHER_TYPE = CipherType.STREAM_CIPHER
     BLOCK_SIZE  = SizeSpec(size_type=SizeType.SINGLE, sizes=8)
+
+
+
+class BulkProcessingMixin(object):
+    """
+    Bulk processing for block cipher modes. Modes mixing it in implement `_initial_state` and `_process_blocks`
+    and get `encrypt_into`, `decrypt_into`, `encryptor`, and `decryptor`.
+    """
+
+    def _initial_state(self) -> object:
+        raise NotImplementedError(f"{self.__class__.__name__} doesn't support bulk processing")
+
+
+    def _process_blocks(self, data: memoryview, out: memoryview, state: object, encrypt: bool) -> object:
+        raise NotImplementedError(f"{self.__class__.__name__} doesn't support bulk processing")
+
+
+    def _set_state(self, state: object):
+        # Modes that carry state between calls (e.g. CTR's counter) persist it here
+        pass
+
+
+    def encrypt_into(self, plaintext: bytes, out: bytearray) -> memoryview:
+        """
+        Encrypts `plaintext` into the preallocated buffer `out` without padding.
+
+        Parameters:
+            plaintext (bytes): Bytes-like object to be encrypted.
+            out   (bytearray): Writable buffer at least as long as `plaintext`.
+
+        Returns:
+            memoryview: View of the written part of `out`.
+        """
+        out = memoryview(out)[:len(plaintext)]
+        self._set_state(self._process_blocks(memoryview(plaintext), out, self._initial_state(), True))
+        return out
+
+
+    def decrypt_into(self, ciphertext: bytes, out: bytearray) -> memoryview:
+        """
+        Decrypts `ciphertext` into the preallocated buffer `out` without unpadding.
+
+        Parameters:
+            ciphertext (bytes): Bytes-like object to be decrypted.
+            out    (bytearray): Writable buffer at least as long as `ciphertext`.
+
+        Returns:
+            memoryview: View of the written part of `out`.
+        """
+        out = memoryview(out)[:len(ciphertext)]
+        self._set_state(self._process_blocks(memoryview(ciphertext), out, self._initial_state(), False))
+        return out
+
+
+    def encryptor(self, pad: bool=True) -> object:
+        """
+        Returns a streaming encryptor that accepts chunks of any size.
+
+        Parameters:
+            pad (bool): Whether to pad on `finalize` (block modes only).
+
+        Returns:
+            Encryptor: Streaming encryptor.
+        """
+        from samson.block_ciphers.modes.encryptor import Encryptor
+        return Encryptor(self, encrypt=True, pad=pad)
+
+
+    def decryptor(self, unpad: bool=True) -> object:
+        """
+        Returns a streaming decryptor that accepts chunks of any size.
+
+        Parameters:
+            unpad (bool): Whether to unpad on `finalize` (block modes only).
+
+        Returns:
+            Encryptor: Streaming decryptor.
+        """
+        from samson.block_ciphers.modes.encryptor import Encryptor
+        return Encryptor(self, encrypt=False, pad=unpad)
+
+
+
+class StreamingBulkProcessingMixin(BulkProcessingMixin):
+    """
+    Bulk processing for streaming block cipher modes. Modes mixing it in describe each block with a keystream block
+    derived from the state (`_start_block`) and a state update once the block's ciphertext is known (`_end_block`).
+    """
+
+    def _start_block(self, state: object) -> bytes:
+        raise NotImplementedError(f"{self.__class__.__name__} doesn't support bulk processing")
+
+
+    def _end_block(self, state: object, keystream: bytes, ciphertext: bytes) -> object:
+        raise NotImplementedError(f"{self.__class__.__name__} doesn't support bulk processing")
+
+
+    def _process_blocks(self, data: memoryview, out: memoryview, state: object, encrypt: bool) -> object:
+        block_size = self.cipher.block_size
+
+        for i in range(0, len(data), block_size):
+            block     = data[i:i + block_size]
+            keystream = self._start_block(state)[:len(block)]
+            result    = (int.from_bytes(keystream, 'big') ^ int.from_bytes(block, 'big')).to_bytes(len(block), 'big')
+
+            out[i:i + len(block)] = result
+            state = self._end_block(state, keystream, result if encrypt else bytes(block))
+
+        return state
@@ -0,0 +1,274 @@
+from samson.utilities.bytes import Bytes
+from array import array
+import sys
+
+# Batched compression for brute-force workloads. Each 32-bit word of N independent single-block messages is
+# packed into one Python integer at a 64-bit stride ("lanes"), so every step of a round is a single big integer
+# operation over the whole batch. The upper 32 bits of each lane act as guard bits: sums carry into them and are
+# masked off, and rotations/shifts that spill into a neighboring lane land in those guard bits too.
+
+MAX_MESSAGE_LENGTH = 55
+
+
+def pack_blocks(messages: list, byteorder: str, prefix_length: int=0) -> list:
+    """
+    Pads single-block messages with Merkle-Damgard padding and transposes them into sixteen lane-packed words.
+
+    Parameters:
+        messages     (list): Messages of at most `MAX_MESSAGE_LENGTH` bytes.
+        byteorder     (str): Word and length endianness ('little' or 'big').
+        prefix_length (int): Number of bytes already hashed before these blocks (e.g. an HMAC key block).
+
+    Returns:
+        list: Sixteen lane-packed message words.
+    """
+    blocks = bytearray()
+    for message in messages:
+        if len(message) > MAX_MESSAGE_LENGTH:
+            raise ValueError(f"Messages must be at most {MAX_MESSAGE_LENGTH} bytes to fit in a single block")
+
+        blocks += message
+        blocks += b'\x80'
+        blocks += bytes(MAX_MESSAGE_LENGTH - len(message))
+        blocks += ((len(message) + prefix_length) * 8).to_bytes(8, byteorder)
+
+    words = array('I')
+    words.frombytes(blocks)
+
+    if byteorder != sys.byteorder:
+        words.byteswap()
+
+    return [_to_lanes(words[i::16]) for i in range(16)]
+
+
+
+def unpack_digests(state: list, num_messages: int, byteorder: str) -> list:
+    """
+    Transposes lane-packed state words back into per-message digests.
+
+    Parameters:
+        state        (list): Lane-packed state words.
+        num_messages  (int): Number of messages in the batch.
+        byteorder     (str): Word endianness of the digest.
+
+    Returns:
+        list: Digests as Bytes.
+    """
+    num_words = len(state)
+    out       = array('I', bytes(4 * num_words * num_messages))
+
+    for i, word in enumerate(state):
+        out[i::num_words] = _from_lanes(word, num_messages)
+
+    if byteorder != sys.byteorder:
+        out.byteswap()
+
+    buf  = out.tobytes()
+    size = 4 * num_words
+    return [Bytes(buf[i:i + size]) for i in range(0, len(buf), size)]
+
+
+
+def _to_lanes(values: array) -> int:
+    wide = array('Q', values)
+    if sys.byteorder == 'big':
+        wide.byteswap()
+
+    return int.from_bytes(wide.tobytes(), 'little')
+
+
+def _from_lanes(lanes: int, num_messages: int) -> array:
+    wide = array('Q')
+    wide.frombytes(lanes.to_bytes(8 * num_messages, 'little'))
+    if sys.byteorder == 'big':
+        wide.byteswap()
+
+    return array('I', wide)
+
+
+def _lane_constants(num_messages: int) -> (int, int):
+    ones = int.from_bytes(b'\x01\x00\x00\x00\x00\x00\x00\x00' * num_messages, 'little')
+    return ones, ones * 0xFFFFFFFF
+
+
+def _rotl(x: int, s: int, M: int) -> int:
+    return ((x << s) | (x >> (32 - s))) & M
+
+
+def _rotr(x: int, s: int, M: int) -> int:
+    return ((x >> s) | (x << (32 - s))) & M
+
+
+
+def md4_compress(X: list, iv: list, num_messages: int) -> list:
+    """
+    Batched MD4 compression.
+
+    Parameters:
+        X            (list): Sixteen lane-packed message words.
+        iv           (list): Initial state as four integers.
+        num_messages  (int): Number of messages in the batch.
+
+    Returns:
+        list: Lane-packed output state.
+    """
+    ones, M = _lane_constants(num_messages)
+    h  = [v * ones for v in iv]
+    K2 = 0x5a827999 * ones
+    K3 = 0x6ed9eba1 * ones
+
+    s = (3, 7, 11, 19)
+    for r in range(16):
+        i    = (16 - r) % 4
+        b, c, d = h[(i+1) % 4], h[(i+2) % 4], h[(i+3) % 4]
+        h[i] = _rotl((h[i] + (d ^ (b & (c ^ d))) + X[r]) & M, s[r % 4], M)
+
+    s = (3, 5, 9, 13)
+    for r in range(16):
+        i    = (16 - r) % 4
+        b, c, d = h[(i+1) % 4], h[(i+2) % 4], h[(i+3) % 4]
+        h[i] = _rotl((h[i] + ((b & c) | (b & d) | (c & d)) + X[4*(r % 4) + r//4] + K2) & M, s[r % 4], M)
+
+    s = (3, 9, 11, 15)
+    k = (0, 8, 4, 12, 2, 10, 6, 14, 1, 9, 5, 13, 3, 11, 7, 15)
+    for r in range(16):
+        i    = (16 - r) % 4
+        b, c, d = h[(i+1) % 4], h[(i+2) % 4], h[(i+3) % 4]
+        h[i] = _rotl((h[i] + (b ^ c ^ d) + X[k[r]] + K3) & M, s[r % 4], M)
+
+    return [(h_i + v * ones) & M for h_i, v in zip(h, iv)]
+
+
+
+def md5_compress(X: list, iv: list, num_messages: int) -> list:
+    """
+    Batched MD5 compression.
+
+    Parameters:
+        X            (list): Sixteen lane-packed message words.
+        iv           (list): Initial state as four integers.
+        num_messages  (int): Number of messages in the batch.
+
+    Returns:
+        list: Lane-packed output state.
+    """
+    from samson.hashes.md5 import constants, rotate_amounts, index_functions
+
+    ones, M    = _lane_constants(num_messages)
+    a, b, c, d = [v * ones for v in iv]
+
+    for i in range(64):
+        if i < 16:
+            f = d ^ (b & (c ^ d))
+        elif i < 32:
+            f = c ^ (d & (b ^ c))
+        elif i < 48:
+            f = b ^ c ^ d
+        else:
+            f = c ^ (b | (d ^ M))
+
+        to_rotate  = (a + f + constants[i] * ones + X[index_functions[i](i)]) & M
+        a, b, c, d = d, (b + _rotl(to_rotate, rotate_amounts[i], M)) & M, b, c
+
+    return [(h_i + v * ones) & M for h_i, v in zip([a, b, c, d], iv)]
+
+
+
+def sha1_compress(X: list, iv: list, num_messages: int) -> list:
+    """
+    Batched SHA1 compression.
+
+    Parameters:
+        X            (list): Sixteen lane-packed message words.
+        iv           (list): Initial state as five integers.
+        num_messages  (int): Number of messages in the batch.
+
+    Returns:
+        list: Lane-packed output state.
+    """
+    ones, M = _lane_constants(num_messages)
+    w = list(X)
+    for i in range(16, 80):
+        w.append(_rotl(w[i-3] ^ w[i-8] ^ w[i-14] ^ w[i-16], 1, M))
+
+    a, b, c, d, e = [v * ones for v in iv]
+    K = [k * ones for k in (0x5A827999, 0x6ED9EBA1, 0x8F1BBCDC, 0xCA62C1D6)]
+
+    for i in range(80):
+        if i < 20:
+            f = d ^ (b & (c ^ d))
+        elif i < 40 or i >= 60:
+            f = b ^ c ^ d
+        else:
+            f = (b & c) | (b & d) | (c & d)
+
+        a, b, c, d, e = (_rotl(a, 5, M) + f + e + K[i // 20] + w[i]) & M, a, _rotl(b, 30, M), c, d
+
+    return [(h_i + v * ones) & M for h_i, v in zip([a, b, c, d, e], iv)]
+
+
+
+def sha256_compress(X: list, iv: list, num_messages: int) -> list:
+    """
+    Batched SHA-256 (and SHA-224) compression.
+
+    Parameters:
+        X            (list): Sixteen lane-packed message words.
+        iv           (list): Initial state as eight integers.
+        num_messages  (int): Number of messages in the batch.
+
+    Returns:
+        list: Lane-packed output state.
+    """
+    from samson.hashes.sha2 import K_256
+
+    ones, M = _lane_constants(num_messages)
+    w = list(X)
+    for i in range(16, 64):
+        x, y = w[i-15], w[i-2]
+        s0   = _rotr(x, 7, M) ^ _rotr(x, 18, M) ^ (x >> 3) & M
+        s1   = _rotr(y, 17, M) ^ _rotr(y, 19, M) ^ (y >> 10) & M
+        w.append((w[i-16] + s0 + w[i-7] + s1) & M)
+
+    a, b, c, d, e, f, g, h = [v * ones for v in iv]
+
+    for i in range(64):
+        S1    = _rotr(e, 6, M) ^ _rotr(e, 11, M) ^ _rotr(e, 25, M)
+        ch    = g ^ (e & (f ^ g))
+        temp1 = h + S1 + ch + K_256[i] * ones + w[i]
+        S0    = _rotr(a, 2, M) ^ _rotr(a, 13, M) ^ _rotr(a, 22, M)
+        maj   = (a & b) ^ (a & c) ^ (b & c)
+
+        h, g, f, e, d, c, b, a = g, f, e, (d + temp1) & M, c, b, a, (temp1 + S0 + maj) & M
+
+    return [(h_i + v * ones) & M for h_i, v in zip([a, b, c, d, e, f, g, h], iv)]
+
+
+
+def batch_hash(messages: list, compress: object, iv: list, byteorder: str, prefix_length: int=0) -> list:
+    """
+    Hashes single-block messages together with a batched compression function.
+
+    Parameters:
+        messages     (list): Messages of at most `MAX_MESSAGE_LENGTH` bytes.
+        compress     (func): Batched compression function (e.g. `md5_compress`).
+        iv           (list): Initial state as integers.
+        byteorder     (str): Endianness of the hash.
+        prefix_length (int): Number of bytes already hashed into `iv`.
+
+    Returns:
+        list: Digests.
+
+    Examples:
+        >>> from samson.hashes.batch import batch_hash, md5_compress
+        >>> import hashlib
+        >>> digests = batch_hash([b'abc', b'samson'], md5_compress, [0x67452301, 0xefcdab89, 0x98badcfe, 0x10325476], 'little')
+        >>> digests == [hashlib.md5(b'abc').digest(), hashlib.md5(b'samson').digest()]
+        True
+
+    """
+    if not messages:
+        return []
+
+    X = pack_blocks(messages, byteorder, prefix_length)
+    return unpack_digests(compress(X, iv, len(messages)), len(messages), byteorder)
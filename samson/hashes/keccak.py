@@ -119,8 +119,44 @@ class Keccak(SpongeConstruction, Hash):
         Returns:
             Bytes: The hash digest.
         """
+        sponge = self
+
+        # Hash on a fresh copy so pending `update` state survives
         if self.auto_reset_state:
-            self.reset()
+            sponge = self.copy()
+            sponge.reset()
+
+        sponge.absorb(Bytes.wrap(message))
+        return sum(sponge.squeeze(self.digest_size))[:self.digest_size]
+
+
+
+    def digest(self) -> Bytes:
+        """
+        Returns the digest of everything passed to `update` so far. Doesn't alter the sponge's state.
+
+        Returns:
+            Bytes: The hash digest.
 
-        self.absorb(Bytes.wrap(message))
-        return sum(self.squeeze(self.digest_size))[:self.digest_size]
+        Examples:
+            >>> from samson.hashes.sha3 import SHA3_256
+            >>> sha3 = SHA3_256()
+            >>> sha3.update(b'hello ')
+            >>> sha3.update(b'world')
+            >>> sha3.digest() == SHA3_256().hash(b'hello world')
+            True
+
+        """
+        sponge = self.copy()
+        sponge.absorb(Bytes.wrap(self._buffer))
+        return sum(sponge.squeeze(self.digest_size))[:self.digest_size]
+
+
+    def hexdigest(self) -> str:
+        """
+        Returns the digest of everything passed to `update` so far as a hex string.
+
+        Returns:
+            str: Hex digest.
+        """
+        return bytes(self.digest()).hex()
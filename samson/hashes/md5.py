@@ -4,6 +4,7 @@ from samson.utilities.bytes import Bytes
 from samson.core.primitives import Primitive
 from samson.core.metadata import SizeSpec, SizeType, FrequencyType
 from samson.ace.decorators import register_primitive
+from types import FunctionType
 import math
 
 # https://rosettacode.org/wiki/MD5/Implementation#Python
@@ -89,3 +90,29 @@ class MD5(MerkleDamgardConstruction):
 
     def __str__(self):
         return self.__repr__()
+
+
+    def hash_many(self, messages: list) -> list:
+        """
+        Hashes `messages`. Batches of messages that fit in a single block are compressed together.
+
+        Parameters:
+            messages (list): Messages to be hashed.
+
+        Returns:
+            list: Digests in the same order.
+        """
+        from samson.hashes.batch import md5_compress
+        return self._batch_hash(messages, md5_compress, bytes_to_state(self.initial_state))
+
+
+
+    def batch_compressor(self) -> FunctionType:
+        """
+        Returns the batched compression function.
+
+        Returns:
+            func: `md5_compress`.
+        """
+        from samson.hashes.batch import md5_compress
+        return md5_compress
@@ -24,3 +24,16 @@ class NTLM(object):
             Bytes: NTLM hash.
         """
         return self.md4.hash(message.decode().encode('utf-16le'))
+
+
+    def hash_many(self, messages: list) -> list:
+        """
+        Hashes each message in `messages` with NTLM. Passwords of up to 27 characters are hashed as a batch.
+
+        Parameters:
+            messages (list): Messages to be hashed.
+
+        Returns:
+            list: NTLM hashes in the same order.
+        """
+        return self.md4.hash_many([message.decode().encode('utf-16le') for message in messages])
@@ -6,6 +6,7 @@ from samson.constructions.merkle_damgard_construction import MerkleDamgardConstr
 from samson.core.primitives import Primitive
 from samson.core.metadata import SizeSpec, SizeType, FrequencyType
 from samson.ace.decorators import register_primitive
+from types import FunctionType
 
 
 def compression_func(chunk, state):
@@ -102,3 +103,29 @@ class SHA1(MerkleDamgardConstruction):
 
     def __str__(self):
         return self.__repr__()
+
+
+    def hash_many(self, messages: list) -> list:
+        """
+        Hashes `messages`. Batches of messages that fit in a single block are compressed together.
+
+        Parameters:
+            messages (list): Messages to be hashed.
+
+        Returns:
+            list: Digests in the same order.
+        """
+        from samson.hashes.batch import sha1_compress
+        return self._batch_hash(messages, sha1_compress, bytes_to_state(self.initial_state))
+
+
+
+    def batch_compressor(self) -> FunctionType:
+        """
+        Returns the batched compression function.
+
+        Returns:
+            func: `sha1_compress`.
+        """
+        from samson.hashes.batch import sha1_compress
+        return sha1_compress
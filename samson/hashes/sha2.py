@@ -4,6 +4,7 @@ from samson.utilities.manipulation import right_rotate, get_blocks
 from samson.core.primitives import Primitive
 from samson.core.metadata import ConstructionType, SizeSpec, SizeType, FrequencyType
 from samson.ace.decorators import register_primitive
+from types import FunctionType
 import math
 
 # https://en.wikipedia.org/wiki/SHA-2
@@ -96,6 +97,40 @@ class SHA2(MerkleDamgardConstruction):
 
 
 
+    def hash_many(self, messages: list) -> list:
+        """
+        Hashes `messages`. For SHA-224 and SHA-256, batches of messages that fit in a single block are compressed
+        together.
+
+        Parameters:
+            messages (list): Messages to be hashed.
+
+        Returns:
+            list: Digests in the same order.
+        """
+        if self.state_size != 4:
+            return super().hash_many(messages)
+
+        from samson.hashes.batch import sha256_compress
+        return self._batch_hash(messages, sha256_compress, [chunk.int() for chunk in self.initial_state.chunk(4)])
+
+
+
+    def batch_compressor(self) -> FunctionType:
+        """
+        Returns the batched compression function for SHA-224 and SHA-256.
+
+        Returns:
+            func: `sha256_compress` or None.
+        """
+        if self.state_size != 4:
+            return None
+
+        from samson.hashes.batch import sha256_compress
+        return sha256_compress
+
+
+
     def __repr__(self):
         return "<SHA2: initial_state={}, block_size={}, digest_size={}>".format(self.initial_state, self.block_size, self.digest_size)
 
@@ -270,3 +305,13 @@ class SHA512(SHA2):
         """
         final_state = super().hash(message)
         return final_state[:math.ceil((self.trunc or 512) / 8)]
+
+
+    def digest(self) -> Bytes:
+        """
+        Returns the digest of everything passed to `update` so far.
+
+        Returns:
+            Bytes: Digest.
+        """
+        return super().digest()[:math.ceil((self.trunc or 512) / 8)]
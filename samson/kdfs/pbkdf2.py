@@ -2,17 +2,45 @@ from math import ceil
 from samson.utilities.bytes import Bytes
 from types import FunctionType
 
+_CONTEXT = None
+
 class PBKDF2(object):
-    def __init__(self, hash_fn: FunctionType, desired_len: int, num_iters: int):
+    """
+    Password-Based Key Derivation Function 2 (PBKDF2).
+
+    If `hash_obj` is given, `hash_fn` is HMAC over it. HMAC's key pads are then compressed only once per password, and
+    for hashes with a batched compression function (MD4, MD5, SHA1, SHA-224, SHA-256), the iterations run on raw integer
+    state words with every output block in its own lane. Blocks can also be split across processes.
+
+    Examples:
+        >>> from samson.kdfs.pbkdf2 import PBKDF2
+        >>> from samson.hashes.sha2 import SHA256
+        >>> import hashlib
+        >>> PBKDF2(None, 40, 1000, hash_obj=SHA256()).derive(b'password', b'salt') == hashlib.pbkdf2_hmac('sha256', b'password', b'salt', 1000, 40)
+        True
+
+    """
+
+    def __init__(self, hash_fn: FunctionType, desired_len: int, num_iters: int, hash_obj: object=None, processes: int=1):
         """
         Parameters:
-            hash_fn    (func): Function that takes in a key and input bytes and returns them hashed.
+            hash_fn    (func): Function that takes in a key and input bytes and returns them hashed. May be None if
+                               `hash_obj` is given.
             desired_len (int): Desired output length.
             num_iters   (int): Number of iterations to perform.
+            hash_obj (object): (Optional) Hash object to use HMAC over. Enables the fast path.
+            processes   (int): Number of processes to derive output blocks in. Requires the "fork" start method;
+                               otherwise runs in-process.
         """
+        if hash_fn is None:
+            from samson.macs.hmac import HMAC
+            hash_fn = lambda key, message: HMAC(key, hash_obj).generate(message)
+
         self.hash_fn     = hash_fn
         self.desired_len = desired_len
         self.num_iters   = num_iters
+        self.hash_obj    = hash_obj
+        self.processes   = processes
 
 
     def __repr__(self):
@@ -29,10 +57,13 @@ class PBKDF2(object):
         Parameters:
             password (bytes): Bytes-like object to key the internal state.
             salt     (bytes): Salt to tweak the output.
-        
+
         Returns:
             Bytes: Derived key.
         """
+        if self.hash_obj is not None:
+            return self._derive_hmac(password, salt)
+
         hash_len   = len(self.hash_fn(b'', b''))
         num_blocks = ceil(self.desired_len / hash_len)
 
@@ -48,3 +79,93 @@ class PBKDF2(object):
             output += xor_sum
 
         return output[:self.desired_len]
+
+
+
+    def _derive_hmac(self, password: bytes, salt: bytes) -> Bytes:
+        from samson.macs.hmac import HMAC
+
+        hmac       = HMAC(password, self.hash_obj)
+        hash_len   = len(hmac.generate(b''))
+        num_blocks = ceil(self.desired_len / hash_len)
+        indices    = list(range(1, num_blocks + 1))
+        processes  = min(self.processes, num_blocks)
+
+        context    = (hmac, Bytes.wrap(salt), self.num_iters)
+        _init_worker(context)
+
+        import multiprocessing
+
+        if processes == 1 or 'fork' not in multiprocessing.get_all_start_methods():
+            blocks = _derive_blocks(indices)
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+
+            groups = [indices[i::processes] for i in range(processes)]
+
+            with ProcessPoolExecutor(max_workers=processes, mp_context=multiprocessing.get_context('fork'), initializer=_init_worker, initargs=(context,)) as executor:
+                results = list(executor.map(_derive_blocks, groups))
+
+            # Undo the striping
+            blocks = [results[i % processes][i // processes] for i in range(num_blocks)]
+
+        return Bytes(b''.join(blocks))[:self.desired_len]
+
+
+
+def _init_worker(context: tuple):
+    global _CONTEXT
+    _CONTEXT = context
+
+
+
+def _derive_blocks(indices: list) -> list:
+    hmac, salt, num_iters = _CONTEXT
+
+    last     = [hmac.generate(salt + Bytes(i).zfill(4)) for i in indices]
+    xor_sums = list(last)
+    compress = hmac.inner_state.batch_compressor() if hmac.inner_state is not None else None
+
+    if compress is None:
+        for _ in range(num_iters - 1):
+            last     = [hmac.generate(block) for block in last]
+            xor_sums = [xor_sum ^ block for xor_sum, block in zip(xor_sums, last)]
+
+        return [bytes(xor_sum) for xor_sum in xor_sums]
+
+    return _iterate_words(hmac, compress, last, num_iters - 1)
+
+
+
+# Runs the remaining iterations on lane-packed state words, one lane per output block. Each iteration is exactly two
+# compressions: the inner and outer states with a single block holding the previous output
+def _iterate_words(hmac: object, compress: FunctionType, first: list, num_iters: int) -> list:
+    from samson.constructions.merkle_damgard_construction import md_pad
+    from samson.hashes.batch import unpack_digests
+
+    hash_obj   = hmac.inner_state
+    endianness = hash_obj.endianness
+    digest_len = len(first[0])
+    num_words  = digest_len // 4
+    num_lanes  = len(first)
+
+    # Both the inner and outer messages are a key pad block followed by one digest
+    tail  = md_pad(bytes(digest_len), hash_obj.block_size + digest_len, endianness, bit_size=hash_obj.block_size, encoded_size_length=hash_obj.encoded_size_length)[digest_len:]
+    tail  = [_pack_lanes([int.from_bytes(tail[i:i + 4], endianness)] * num_lanes) for i in range(0, len(tail), 4)]
+    inner = hmac.inner_state.state_words()
+    outer = hmac.outer_state.state_words()
+
+    last     = [_pack_lanes([int.from_bytes(block[i:i + 4], endianness) for block in first]) for i in range(0, digest_len, 4)]
+    xor_sums = list(last)
+
+    for _ in range(num_iters):
+        last     = compress(last + tail, inner, num_lanes)[:num_words]
+        last     = compress(last + tail, outer, num_lanes)[:num_words]
+        xor_sums = [xor_sum ^ word for xor_sum, word in zip(xor_sums, last)]
+
+    return [bytes(block) for block in unpack_digests(xor_sums, num_lanes, endianness)]
+
+
+
+def _pack_lanes(values: list) -> int:
+    return int.from_bytes(b''.join(value.to_bytes(8, 'little') for value in values), 'little')
@@ -1,3 +1,4 @@
+from samson.constructions.merkle_damgard_construction import MerkleDamgardConstruction
 from samson.utilities.bytes import Bytes
 from samson.core.primitives import MAC, Primitive
 from samson.core.metadata import FrequencyType
@@ -8,6 +9,17 @@ from samson.ace.decorators import register_primitive
 class HMAC(MAC):
     """
     Hash-based message authentication code using a generic interface to hash functions.
+
+    For Merkle-Damgard hashes, the key pads are compressed once and the resulting states are reused by every call
+    to `generate`.
+
+    Examples:
+        >>> from samson.macs.hmac import HMAC
+        >>> from samson.hashes.sha2 import SHA256
+        >>> import hmac, hashlib
+        >>> HMAC(b'key', SHA256()).generate(b'message') == hmac.new(b'key', b'message', hashlib.sha256).digest()
+        True
+
     """
 
     USAGE_FREQUENCY = FrequencyType.PROLIFIC
@@ -31,6 +43,14 @@ class HMAC(MAC):
         self.outer_key_pad = self.key_prime ^ Bytes(b'\x5c').stretch(self.hash_obj.block_size)
         self.inner_key_pad = self.key_prime ^ Bytes(b'\x36').stretch(self.hash_obj.block_size)
 
+        # Hash objects that have absorbed the pads
+        self.inner_state = None
+        self.outer_state = None
+
+        if isinstance(self.hash_obj, MerkleDamgardConstruction):
+            self.inner_state = self._absorb(self.inner_key_pad)
+            self.outer_state = self._absorb(self.outer_key_pad)
+
 
     def __repr__(self):
         return f"<HMAC: key={self.key}, key_prime={self.key_prime}, outer_key_pad={self.outer_key_pad}, inner_key_pad={self.inner_key_pad}>"
@@ -39,6 +59,13 @@ class HMAC(MAC):
         return self.__repr__()
 
 
+    def _absorb(self, key_pad: bytes) -> MerkleDamgardConstruction:
+        state = self.hash_obj.copy()
+        state.reset()
+        state.update(key_pad)
+        return state
+
+
     def generate(self, message: bytes) -> Bytes:
         """
         Generates a keyed MAC for `message`.
@@ -49,4 +76,12 @@ class HMAC(MAC):
         Returns:
             Bytes: The MAC.
         """
-        return self.hash_obj.hash(self.outer_key_pad + self.hash_obj.hash(self.inner_key_pad + Bytes.wrap(message)))
+        if self.inner_state is None:
+            return self.hash_obj.hash(self.outer_key_pad + self.hash_obj.hash(self.inner_key_pad + Bytes.wrap(message)))
+
+        inner = self.inner_state.copy()
+        inner.update(message)
+
+        outer = self.outer_state.copy()
+        outer.update(inner.digest())
+        return outer.digest()
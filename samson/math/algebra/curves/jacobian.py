@@ -0,0 +1,518 @@
+from samson.math.general import mod_inv
+
+# Jacobian coordinates (X, Y, Z) represent the affine point (X/Z**2, Y/Z**3). Z == 0 is the point at infinity.
+JACOBIAN_INFINITY = (1, 1, 0)
+
+
+def jacobian_double(P: tuple, a: int, p: int) -> tuple:
+    """
+    Doubles a point in Jacobian coordinates.
+
+    Parameters:
+        P (tuple): Point as (X, Y, Z).
+        a   (int): Curve's `a` coefficient.
+        p   (int): Field modulus.
+
+    Returns:
+        tuple: 2*P in Jacobian coordinates.
+
+    Examples:
+        >>> from samson.math.algebra.curves.jacobian import jacobian_double, to_affine
+        >>> to_affine(jacobian_double((3, 6, 1), 2, 97), 97)
+        (80, 10)
+
+    References:
+        https://hyperelliptic.org/EFD/g1p/auto-shortw-jacobian.html#doubling-dbl-1998-cmo-2
+    """
+    X, Y, Z = P
+    if not Z or not Y:
+        return JACOBIAN_INFINITY
+
+    YY = Y*Y % p
+    ZZ = Z*Z % p
+    S  = 4*X*YY % p
+
+    if a == p - 3:
+        M = 3*(X - ZZ)*(X + ZZ) % p
+    else:
+        M = (3*X*X + a*ZZ*ZZ) % p
+
+    X3 = (M*M - 2*S) % p
+    Y3 = (M*(S - X3) - 8*YY*YY) % p
+    Z3 = 2*Y*Z % p
+    return X3, Y3, Z3
+
+
+
+def jacobian_add_affine(P: tuple, Q: tuple, a: int, p: int) -> tuple:
+    """
+    Adds an affine point to a point in Jacobian coordinates (mixed addition).
+
+    Parameters:
+        P (tuple): Point as (X, Y, Z).
+        Q (tuple): Affine point as (x, y). Must not be the point at infinity.
+        a   (int): Curve's `a` coefficient.
+        p   (int): Field modulus.
+
+    Returns:
+        tuple: P + Q in Jacobian coordinates.
+
+    Examples:
+        >>> from samson.math.algebra.curves.jacobian import jacobian_add_affine, to_affine
+        >>> to_affine(jacobian_add_affine((3, 6, 1), (80, 10), 2, 97), 97)
+        (80, 87)
+
+    References:
+        https://hyperelliptic.org/EFD/g1p/auto-shortw-jacobian.html#addition-madd-2004-hmv
+    """
+    X1, Y1, Z1 = P
+    x2, y2     = Q
+
+    if not Z1:
+        return x2, y2, 1
+
+    Z1Z1 = Z1*Z1 % p
+    H    = (x2*Z1Z1 - X1) % p
+    r    = (y2*Z1*Z1Z1 - Y1) % p
+
+    if not H:
+        if not r:
+            return jacobian_double(P, a, p)
+        return JACOBIAN_INFINITY
+
+    HH  = H*H % p
+    HHH = H*HH % p
+    V   = X1*HH % p
+
+    X3 = (r*r - HHH - 2*V) % p
+    Y3 = (r*(V - X3) - Y1*HHH) % p
+    Z3 = Z1*H % p
+    return X3, Y3, Z3
+
+
+
+def jacobian_add(P: tuple, Q: tuple, a: int, p: int) -> tuple:
+    """
+    Adds two points in Jacobian coordinates.
+
+    Parameters:
+        P (tuple): Point as (X, Y, Z).
+        Q (tuple): Point as (X, Y, Z).
+        a   (int): Curve's `a` coefficient.
+        p   (int): Field modulus.
+
+    Returns:
+        tuple: P + Q in Jacobian coordinates.
+
+    Examples:
+        >>> from samson.math.algebra.curves.jacobian import jacobian_add, to_affine
+        >>> to_affine(jacobian_add((3, 6, 1), (80, 10, 1), 2, 97), 97)
+        (80, 87)
+
+    References:
+        https://hyperelliptic.org/EFD/g1p/auto-shortw-jacobian.html#addition-add-1998-cmo-2
+    """
+    X1, Y1, Z1 = P
+    X2, Y2, Z2 = Q
+
+    if not Z1:
+        return Q
+
+    if not Z2:
+        return P
+
+    Z1Z1 = Z1*Z1 % p
+    Z2Z2 = Z2*Z2 % p
+    U1   = X1*Z2Z2 % p
+    S1   = Y1*Z2*Z2Z2 % p
+    H    = (X2*Z1Z1 - U1) % p
+    r    = (Y2*Z1*Z1Z1 - S1) % p
+
+    if not H:
+        if not r:
+            return jacobian_double(P, a, p)
+        return JACOBIAN_INFINITY
+
+    HH  = H*H % p
+    HHH = H*HH % p
+    V   = U1*HH % p
+
+    X3 = (r*r - HHH - 2*V) % p
+    Y3 = (r*(V - X3) - S1*HHH) % p
+    Z3 = Z1*Z2*H % p
+    return X3, Y3, Z3
+
+
+
+def to_affine(P: tuple, p: int) -> tuple:
+    """
+    Converts a point in Jacobian coordinates to affine coordinates. The point at infinity is returned as (0, 0).
+
+    Parameters:
+        P (tuple): Point as (X, Y, Z).
+        p   (int): Field modulus.
+
+    Returns:
+        tuple: Affine point as (x, y).
+
+    Examples:
+        >>> from samson.math.algebra.curves.jacobian import to_affine
+        >>> to_affine((12, 48, 2), 97)
+        (3, 6)
+
+    """
+    X, Y, Z = P
+    if not Z:
+        return 0, 0
+
+    Z_inv  = mod_inv(Z, p)
+    Z_inv2 = Z_inv*Z_inv % p
+    return X*Z_inv2 % p, Y*Z_inv2*Z_inv % p
+
+
+
+def batch_to_affine(points: list, p: int) -> list:
+    """
+    Converts several points in Jacobian coordinates to affine coordinates using a single inversion (Montgomery's trick).
+
+    Parameters:
+        points (list): Points as (X, Y, Z). None of them may be the point at infinity.
+        p       (int): Field modulus.
+
+    Returns:
+        list: Affine points as (x, y).
+
+    Examples:
+        >>> from samson.math.algebra.curves.jacobian import batch_to_affine
+        >>> batch_to_affine([(12, 48, 2), (3, 6, 1)], 97)
+        [(3, 6), (3, 6)]
+
+    """
+    prefixes = []
+    acc      = 1
+    for _, _, Z in points:
+        acc = acc*Z % p
+        prefixes.append(acc)
+
+    inv    = mod_inv(acc, p)
+    affine = [None]*len(points)
+
+    for i in reversed(range(len(points))):
+        X, Y, Z = points[i]
+        Z_inv   = inv*prefixes[i-1] % p if i else inv
+        inv     = inv*Z % p
+        Z_inv2  = Z_inv*Z_inv % p
+        affine[i] = (X*Z_inv2 % p, Y*Z_inv2*Z_inv % p)
+
+    return affine
+
+
+
+def wnaf(k: int, w: int) -> list:
+    """
+    Computes the width-`w` non-adjacent form of a non-negative scalar.
+
+    Parameters:
+        k (int): Scalar.
+        w (int): Window width (>= 2).
+
+    Returns:
+        list: Signed odd digits (or zero), least significant first.
+
+    Examples:
+        >>> from samson.math.algebra.curves.jacobian import wnaf
+        >>> wnaf(7, 2)
+        [-1, 0, 0, 1]
+
+        >>> wnaf(1234567, 4)
+        [7, 0, 0, 0, 0, 0, 0, -3, 0, 0, 0, -5, 0, 0, 0, 0, 3, 0, 0, 0, 1]
+
+    """
+    digits = []
+    window = 1 << w
+    half   = window >> 1
+
+    while k:
+        if k & 1:
+            d = k & (window - 1)
+            if d >= half:
+                d -= window
+            k -= d
+        else:
+            d = 0
+
+        digits.append(d)
+        k >>= 1
+
+    return digits
+
+
+
+def wnaf_width(bits: int) -> int:
+    """
+    Chooses the wNAF window width for a scalar of `bits` bits.
+
+    Parameters:
+        bits (int): Bit length of the scalar.
+
+    Returns:
+        int: Window width.
+    """
+    if bits <= 16:
+        return 2
+    elif bits <= 96:
+        return 3
+    elif bits <= 320:
+        return 4
+    else:
+        return 5
+
+
+
+def wnaf_table(P: tuple, w: int, a: int, p: int) -> list:
+    """
+    Precomputes the odd multiples `P, 3P, ..., (2**(w-1) - 1)P` in affine coordinates.
+
+    Parameters:
+        P (tuple): Affine point as (x, y).
+        w   (int): Window width.
+        a   (int): Curve's `a` coefficient.
+        p   (int): Field modulus.
+
+    Returns:
+        list: Affine points. If an intermediate multiple is the point at infinity, returns None.
+    """
+    size = 1 << (w - 2)
+    if size == 1:
+        return [P]
+
+    P2 = jacobian_double((P[0], P[1], 1), a, p)
+    if not P2[2]:
+        return None
+
+    P2    = to_affine(P2, p)
+    table = [(P[0], P[1], 1)]
+
+    for _ in range(size - 1):
+        table.append(jacobian_add_affine(table[-1], P2, a, p))
+        if not table[-1][2]:
+            return None
+
+    return batch_to_affine(table, p)
+
+
+
+def scalar_mul(P: tuple, k: int, a: int, p: int) -> tuple:
+    """
+    Computes `k*P` with wNAF recoding while staying in Jacobian coordinates.
+
+    Parameters:
+        P (tuple): Affine point as (x, y). (0, 0) represents the point at infinity.
+        k   (int): Scalar.
+        a   (int): Curve's `a` coefficient.
+        p   (int): Field modulus.
+
+    Returns:
+        tuple: Affine point as (x, y).
+
+    Examples:
+        >>> from samson.math.algebra.curves.jacobian import scalar_mul
+        >>> scalar_mul((3, 6), 4, 2, 97)
+        (3, 91)
+
+        >>> scalar_mul((3, 6), 5, 2, 97)
+        (0, 0)
+
+    """
+    if k < 0:
+        k = -k
+        P = (P[0], -P[1] % p)
+
+    if not k or P == (0, 0):
+        return 0, 0
+
+    w = wnaf_width(k.bit_length())
+    return wnaf_mul(P, wnaf(k, w), w, a, p)
+
+
+
+def wnaf_mul(P: tuple, digits: list, w: int, a: int, p: int) -> tuple:
+    """
+    Computes the multiple of `P` given by a precomputed wNAF recoding. Recoding a fixed scalar once lets it be
+    applied to many points.
+
+    Parameters:
+        P     (tuple): Affine point as (x, y).
+        digits (list): wNAF digits of the scalar (least significant first) as returned by `wnaf`.
+        w       (int): Window width the digits were recoded with.
+        a       (int): Curve's `a` coefficient.
+        p       (int): Field modulus.
+
+    Returns:
+        tuple: Affine point as (x, y).
+
+    Examples:
+        >>> from samson.math.algebra.curves.jacobian import wnaf_mul, wnaf
+        >>> wnaf_mul((3, 6), wnaf(4, 3), 3, 2, 97)
+        (3, 91)
+
+    """
+    if P == (0, 0):
+        return 0, 0
+
+    table = wnaf_table(P, w, a, p)
+
+    # A small multiple of `P` hit infinity; NAF only needs `P` itself
+    if table is None:
+        digits = wnaf(sum(d << i for i, d in enumerate(digits)), 2)
+        table  = [P]
+
+    neg_table = [(x, -y % p) for x, y in table]
+    Q = JACOBIAN_INFINITY
+
+    for d in reversed(digits):
+        Q = jacobian_double(Q, a, p)
+
+        if d > 0:
+            Q = jacobian_add_affine(Q, table[d >> 1], a, p)
+        elif d < 0:
+            Q = jacobian_add_affine(Q, neg_table[-d >> 1], a, p)
+
+    return to_affine(Q, p)
+
+
+
+# Straus' interleaving only uses mixed additions, so bucketing needs many points to pay for its full additions
+PIPPENGER_THRESHOLD = 128
+
+def straus(points: list, scalars: list, a: int, p: int) -> tuple:
+    """
+    Computes `sum(k*P)` by interleaving the wNAF expansions of every scalar so all terms share the doublings
+    (Straus/Shamir's trick).
+
+    Parameters:
+        points  (list): Affine points as (x, y). None of them may be the point at infinity.
+        scalars (list): Non-negative scalars.
+        a        (int): Curve's `a` coefficient.
+        p        (int): Field modulus.
+
+    Returns:
+        tuple: Point in Jacobian coordinates.
+
+    Examples:
+        >>> from samson.math.algebra.curves.jacobian import straus, to_affine
+        >>> to_affine(straus([(3, 6), (80, 10)], [2, 1], 2, 97), 97)
+        (3, 91)
+
+    """
+    entries = []
+    for P, k in zip(points, scalars):
+        w     = wnaf_width(k.bit_length())
+        table = wnaf_table(P, w, a, p)
+
+        if table is None:
+            w     = 2
+            table = [P]
+
+        entries.append((wnaf(k, w), table, [(x, -y % p) for x, y in table]))
+
+    Q = JACOBIAN_INFINITY
+    for i in reversed(range(max([len(digits) for digits, _, _ in entries]))):
+        Q = jacobian_double(Q, a, p)
+
+        for digits, table, neg_table in entries:
+            if i < len(digits):
+                d = digits[i]
+                if d > 0:
+                    Q = jacobian_add_affine(Q, table[d >> 1], a, p)
+                elif d < 0:
+                    Q = jacobian_add_affine(Q, neg_table[-d >> 1], a, p)
+
+    return Q
+
+
+
+def pippenger(points: list, scalars: list, a: int, p: int) -> tuple:
+    """
+    Computes `sum(k*P)` with Pippenger's bucket method. For each window, points are added into the bucket
+    of their digit, and the buckets are combined with a running sum.
+
+    Parameters:
+        points  (list): Affine points as (x, y). None of them may be the point at infinity.
+        scalars (list): Non-negative scalars.
+        a        (int): Curve's `a` coefficient.
+        p        (int): Field modulus.
+
+    Returns:
+        tuple: Point in Jacobian coordinates.
+
+    Examples:
+        >>> from samson.math.algebra.curves.jacobian import pippenger, to_affine
+        >>> to_affine(pippenger([(3, 6), (80, 10)], [2, 1], 2, 97), 97)
+        (3, 91)
+
+    """
+    c    = max(2, len(points).bit_length() - 4)
+    mask = (1 << c) - 1
+    bits = max([k.bit_length() for k in scalars])
+    Q    = JACOBIAN_INFINITY
+
+    for shift in reversed(range(0, bits, c)):
+        for _ in range(c):
+            Q = jacobian_double(Q, a, p)
+
+        buckets = [JACOBIAN_INFINITY] * (mask + 1)
+        for P, k in zip(points, scalars):
+            d = (k >> shift) & mask
+            if d:
+                buckets[d] = jacobian_add_affine(buckets[d], P, a, p)
+
+        running = total = JACOBIAN_INFINITY
+        for bucket in reversed(buckets[1:]):
+            running = jacobian_add(running, bucket, a, p)
+            total   = jacobian_add(total, running, a, p)
+
+        Q = jacobian_add(Q, total, a, p)
+
+    return Q
+
+
+
+def multi_scalar_mul(points: list, scalars: list, a: int, p: int) -> tuple:
+    """
+    Computes `sum(k*P)` for affine points, choosing between Straus' and Pippenger's method by the number of terms.
+
+    Parameters:
+        points  (list): Affine points as (x, y). (0, 0) represents the point at infinity.
+        scalars (list): Scalars.
+        a        (int): Curve's `a` coefficient.
+        p        (int): Field modulus.
+
+    Returns:
+        tuple: Affine point as (x, y).
+
+    Examples:
+        >>> from samson.math.algebra.curves.jacobian import multi_scalar_mul
+        >>> multi_scalar_mul([(3, 6), (80, 10)], [4, -1], 2, 97)
+        (80, 10)
+
+    """
+    terms = []
+    for P, k in zip(points, scalars):
+        if k < 0:
+            k = -k
+            P = (P[0], -P[1] % p)
+
+        if k and P != (0, 0):
+            terms.append((P, k))
+
+    if not terms:
+        return 0, 0
+
+    points, scalars = zip(*terms)
+    if len(terms) < PIPPENGER_THRESHOLD:
+        Q = straus(points, scalars, a, p)
+    else:
+        Q = pippenger(points, scalars, a, p)
+
+    return to_affine(Q, p)
@@ -152,6 +152,7 @@ for name, params in _curve_params.items():
 
     curve.oid  = params['oid']
     curve.name = name
+    curve.precompute_G_on_use = True
     all_curves[name] = curve
 
 
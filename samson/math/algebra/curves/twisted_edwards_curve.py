@@ -215,8 +215,12 @@ class TwistedEdwardsPoint(RingElement):
         return self.x == other.x and self.y == other.y and self.curve == other.curve
 
 
+    def __int__(self) -> int:
+        return int(self.y)
+
+
     def __neg__(self) -> object:
-        return TwistedEdwardsPoint(self.x, -self.y, self.curve)
+        return TwistedEdwardsPoint(-self.x, self.y, self.curve)
 
 
     def __add__(self, other: object) -> object:
@@ -1,7 +1,8 @@
 from samson.math.algebra.rings.ring import Ring, RingElement, left_expression_intercept
 from samson.math.polynomial import Polynomial
 from samson.math.algebra.curves.util import EllipticCurveCardAlg
-from samson.math.general import random_int_between, tonelli
+from samson.math.algebra.curves.jacobian import scalar_mul
+from samson.math.general import random_int_between, tonelli, fast_mul, mod_inv
 
 
 class WeierstrassPoint(RingElement):
@@ -80,6 +81,33 @@ class WeierstrassPoint(RingElement):
 
     @left_expression_intercept
     def __add__(self, P2: object) -> object:
+        curve  = self.curve
+        params = curve.int_params
+
+        if params and type(P2) is WeierstrassPoint and (P2.curve is curve or P2.curve == curve):
+            a, p   = params
+            x1, y1 = self.x.val.val, self.y.val.val
+            x2, y2 = P2.x.val.val, P2.y.val.val
+
+            if not (x1 or y1):
+                return P2
+
+            if not (x2 or y2):
+                return self
+
+            if x1 == x2 and (y1 + y2) % p == 0:
+                return curve.POINT_AT_INFINITY
+
+            if x1 == x2 and y1 == y2:
+                m = (3*x1*x1 + a) * mod_inv(2*y1, p)
+            else:
+                m = (y2 - y1) * mod_inv(x2 - x1, p)
+
+            x = (m*m - x1 - x2) % p
+            y = (m*(x1 - x) - y1) % p
+            return WeierstrassPoint(x, y, curve)
+
+
         if self == self.curve.POINT_AT_INFINITY:
             return P2
 
@@ -103,6 +131,42 @@ class WeierstrassPoint(RingElement):
     def __radd__(self, P2: object) -> object:
         return self.__add__(P2)
 
+
+    def __mul__(self, other: int) -> object:
+        """
+        Scalar multiplication. Over integer quotient rings, uses wNAF recoding in Jacobian coordinates and only
+        converts back to affine coordinates at the end. Multiples of the curve's generator use its fixed-base
+        table if one has been built (see `WeierstrassCurve.precompute_G`).
+
+        Parameters:
+            other (int): Scalar.
+
+        Returns:
+            WeierstrassPoint: `other`*`self`.
+
+        Examples:
+            >>> from samson.math.algebra.curves.named import P256
+            >>> P256.G * 3 == P256.G + P256.G + P256.G
+            True
+
+        """
+        curve  = self.curve
+        params = curve.int_params
+
+        if params and type(other) is int:
+            if self is curve.G_cache:
+                if not curve.G_table and curve.precompute_G_on_use:
+                    curve.precompute_G()
+
+                if curve.G_table and curve.G_table.covers(other):
+                    return curve.G_table * other
+
+            a, p = params
+            x, y = scalar_mul((self.x.val.val, self.y.val.val), other, a, p)
+            return WeierstrassPoint(x, y, self.curve)
+
+        return fast_mul(self, other)
+
     @left_expression_intercept
     def __sub__(self, P2: object) -> object:
         return self + (-P2)
@@ -143,6 +207,10 @@ class WeierstrassCurve(Ring):
         self.b  = b
         self.ring = ring or self.a.ring
 
+        # Integer quotient rings get the integer/Jacobian fast paths
+        modulus = getattr(self.ring, 'modulus', None)
+        self.int_params = (int(a) % modulus, modulus) if type(modulus) is int else None
+
         if check_singularity:
             if (4 * a**3 - 27 * b**2) == self.ring.zero():
                 raise ValueError("Elliptic curve can't be singular")
@@ -151,7 +219,11 @@ class WeierstrassCurve(Ring):
             base_tuple = WeierstrassPoint(*base_tuple, self)
 
         self.G_cache     = base_tuple
+        self.G_table     = None
         self.PAF_cache   = None
+
+        # Named curves build their generator's fixed-base table the first time it's multiplied
+        self.precompute_G_on_use = False
         self.dpoly_cache = {}
 
         self.cardinality_cache = cardinality
@@ -272,6 +344,32 @@ class WeierstrassCurve(Ring):
         return self.G_cache
 
 
+    def precompute_G(self, width: int=4, filepath: str=None) -> object:
+        """
+        Builds a fixed-base table for the generator `G`. Afterwards, `G` * k uses the table for any `k` in range.
+
+        Parameters:
+            width    (int): Window width in bits. The table holds about `bits/width * 2**width` points.
+            filepath (str): If given, the table is loaded from this file when it matches, and written to it otherwise.
+
+        Returns:
+            WeierstrassFixedBaseTable: Table.
+
+        Examples:
+            >>> from samson.math.algebra.curves.named import P256
+            >>> table = P256.precompute_G()
+            >>> P256.G * 12345 == P256.G * 12344 + P256.G
+            True
+
+        """
+        from samson.math.fixed_base_table import WeierstrassFixedBaseTable
+
+        # By Hasse's theorem, the curve has fewer than 2*p points
+        bits = self.cardinality_cache.bit_length() if self.cardinality_cache else self.p.bit_length() + 1
+        self.G_table = WeierstrassFixedBaseTable(self.G, bits, width, filepath)
+        return self.G_table
+
+
     @property
     def POINT_AT_INFINITY(self) -> WeierstrassPoint:
         if not self.PAF_cache:
@@ -1,5 +1,7 @@
 from samson.math.algebra.rings.ring import Ring, RingElement, left_expression_intercept
-from samson.math.general import mod_inv
+from samson.math.algebra.rings.integer_ring import IntegerElement
+from samson.math.general import mod_inv, square_and_mul, gcd
+from samson.utilities.exceptions import NotInvertibleException
 
 class QuotientElement(RingElement):
     """
@@ -13,7 +15,7 @@ class QuotientElement(RingElement):
             ring       (Ring): Parent ring.
         """
         self.ring = ring
-        self.val  = val % self.ring.quotient
+        self.val  = self.ring.reduce(val)
 
 
     def __repr__(self):
@@ -36,31 +38,61 @@ class QuotientElement(RingElement):
 
     @left_expression_intercept
     def __add__(self, other: object) -> object:
+        other_val = self.ring.peel(other)
+        if other_val is not None:
+            return self.ring.from_int(self.val.val + other_val)
+
         other = self.ring.coerce(other)
-        return QuotientElement((self.val + other.val) % self.ring.quotient, self.ring)
+        return QuotientElement(self.val + other.val, self.ring)
 
 
     @left_expression_intercept
     def __sub__(self, other: object) -> object:
+        other_val = self.ring.peel(other)
+        if other_val is not None:
+            return self.ring.from_int(self.val.val - other_val)
+
         other = self.ring.coerce(other)
-        return QuotientElement((self.val - other.val) % self.ring.quotient, self.ring)
+        return QuotientElement(self.val - other.val, self.ring)
 
 
     def __mul__(self, other: object) -> object:
+        other_val = self.ring.peel(other)
+        if other_val is not None:
+            return self.ring.from_int(self.val.val * other_val)
+
         gmul = self.ground_mul(other)
         if gmul:
             return gmul
 
         other = self.ring.coerce(other)
-        return QuotientElement((self.val * other.val) % self.ring.quotient, self.ring)
+        return QuotientElement(self.val * other.val, self.ring)
+
+
+    def __pow__(self, exponent: int) -> object:
+        modulus = self.ring.modulus
+        if modulus is not None and type(exponent) is int:
+            try:
+                return self.ring.from_int(pow(self.val.val, exponent, modulus))
+            except ValueError:
+                raise NotInvertibleException("'a' is not invertible", parameters={'a': self.val, 'n': self.ring.quotient})
+
+        return square_and_mul(self, exponent)
 
 
     @left_expression_intercept
     def __mod__(self, other: object) -> object:
         other = self.ring.coerce(other)
-        return QuotientElement((self.val % other.val) % self.ring.quotient, self.ring)
+        return QuotientElement(self.val % other.val, self.ring)
 
     def __invert__(self) -> object:
+        modulus = self.ring.modulus
+        if modulus is not None:
+            try:
+                return self.ring.from_int(mod_inv(self.val.val, modulus))
+            except NotInvertibleException:
+                raise NotInvertibleException("'a' is not invertible", parameters={'a': self.val, 'n': self.ring.quotient})
+
         return QuotientElement(mod_inv(self.val, self.ring.quotient), self.ring)
 
 
@@ -73,10 +105,13 @@ class QuotientElement(RingElement):
     @left_expression_intercept
     def __floordiv__(self, other: object) -> object:
         other = self.ring.coerce(other)
-        return QuotientElement((self.val // other.val) % self.ring.quotient, self.ring)
+        return QuotientElement(self.val // other.val, self.ring)
 
     def __neg__(self) -> object:
-        return QuotientElement((-self.val) % self.ring.quotient, self.ring)
+        if self.ring.modulus is not None:
+            return self.ring.from_int(-self.val.val)
+
+        return QuotientElement(-self.val, self.ring)
 
 
     def __eq__(self, other: object) -> bool:
@@ -119,9 +154,15 @@ class QuotientRing(Ring):
             quotient (RingElement): Element from the underlying ring.
             ring            (Ring): Underlying ring.
         """
+        from samson.math.polynomial import Polynomial, Modulus
+
         assert(quotient.ring == ring)
         self.ring     = ring
         self.quotient = quotient
+        self.reducer  = Modulus(quotient) if type(quotient) is Polynomial else None
+
+        # Integer quotients are handled directly on Python ints
+        self.modulus  = quotient.val if type(quotient) is IntegerElement else None
 
 
     def __repr__(self):
@@ -170,6 +211,214 @@ class QuotientRing(Ring):
             raise NotImplementedError
 
 
+    def reduce(self, val: RingElement) -> RingElement:
+        """
+        Reduces `val` by the quotient. `Polynomial` quotients reuse a precomputed `Modulus`.
+
+        Parameters:
+            val (RingElement): Element of the underlying ring.
+
+        Returns:
+            RingElement: `val` % `self.quotient`.
+        """
+        if self.modulus is not None and type(val) is IntegerElement:
+            return IntegerElement(val.val % self.modulus, val.ring)
+
+        if self.reducer and type(val) is type(self.quotient):
+            return self.reducer.reduce(val)
+
+        return val % self.quotient
+
+
+    def peel(self, other: object) -> int:
+        """
+        Returns the integer residue of `other` if the fast integer path applies, i.e. the quotient is an integer and
+        `other` is an `int` or an element of this ring.
+
+        Parameters:
+            other (object): Operand.
+
+        Returns:
+            int: Integer residue or None.
+        """
+        if self.modulus is None:
+            return None
+
+        type_o = type(other)
+        if type_o is int:
+            return other
+
+        elif type_o is QuotientElement and (other.ring is self or other.ring == self):
+            return other.val.val
+
+        return None
+
+
+    def from_int(self, val: int) -> QuotientElement:
+        """
+        Builds an element of an integer quotient ring directly from a Python int.
+
+        Parameters:
+            val (int): Integer (reduced automatically).
+
+        Returns:
+            QuotientElement: Element.
+        """
+        return QuotientElement(IntegerElement(val, self.ring), self)
+
+
+    def residues(self, elements: list) -> list:
+        """
+        Converts elements (or ints) of an integer quotient ring into a list of reduced Python ints.
+
+        Parameters:
+            elements (list): Elements or ints.
+
+        Returns:
+            list: Reduced residues.
+
+        Examples:
+            >>> from samson.math.algebra.all import ZZ
+            >>> R = ZZ/ZZ(7)
+            >>> R.residues([R(3), 10, -1])
+            [3, 3, 6]
+
+        """
+        modulus = self._require_modulus()
+        return [(elem if type(elem) is int else self(elem).val.val) % modulus for elem in elements]
+
+
+    def from_residues(self, residues: list) -> list:
+        """
+        Converts a list of Python ints into elements of the ring.
+
+        Parameters:
+            residues (list): Integers.
+
+        Returns:
+            list: Elements.
+        """
+        return [self.from_int(residue) for residue in residues]
+
+
+    def _require_modulus(self) -> int:
+        if self.modulus is None:
+            raise NotImplementedError("Batch operations require an integer quotient")
+
+        return self.modulus
+
+
+    def vector_add(self, a: list, b: list) -> list:
+        """
+        Adds two lists of residues element-wise.
+
+        Parameters:
+            a (list): Residues (ints or elements).
+            b (list): Residues (ints or elements).
+
+        Returns:
+            list: Sums as reduced ints.
+
+        Examples:
+            >>> from samson.math.algebra.all import ZZ
+            >>> R = ZZ/ZZ(7)
+            >>> R.vector_add([1, 2, 3], [R(6), 6, 6])
+            [0, 1, 2]
+
+        """
+        modulus = self._require_modulus()
+        return [(x + y) % modulus for x, y in zip(self.residues(a), self.residues(b))]
+
+
+    def vector_sub(self, a: list, b: list) -> list:
+        """
+        Subtracts two lists of residues element-wise.
+
+        Parameters:
+            a (list): Residues (ints or elements).
+            b (list): Residues (ints or elements).
+
+        Returns:
+            list: Differences as reduced ints.
+
+        Examples:
+            >>> from samson.math.algebra.all import ZZ
+            >>> R = ZZ/ZZ(7)
+            >>> R.vector_sub([1, 2, 3], [6, 6, 6])
+            [2, 3, 4]
+
+        """
+        modulus = self._require_modulus()
+        return [(x - y) % modulus for x, y in zip(self.residues(a), self.residues(b))]
+
+
+    def vector_mul(self, a: list, b: list) -> list:
+        """
+        Multiplies two lists of residues element-wise.
+
+        Parameters:
+            a (list): Residues (ints or elements).
+            b (list): Residues (ints or elements).
+
+        Returns:
+            list: Products as reduced ints.
+
+        Examples:
+            >>> from samson.math.algebra.all import ZZ
+            >>> R = ZZ/ZZ(7)
+            >>> R.vector_mul([1, 2, 3], [R(4), 5, 6])
+            [4, 3, 4]
+
+        """
+        modulus = self._require_modulus()
+        return [(x * y) % modulus for x, y in zip(self.residues(a), self.residues(b))]
+
+
+    def batch_inverse(self, elements: list) -> list:
+        """
+        Inverts a list of residues with a single modular inversion using Montgomery's trick.
+
+        Parameters:
+            elements (list): Residues (ints or elements).
+
+        Returns:
+            list: Inverses as reduced ints.
+
+        Examples:
+            >>> from samson.math.algebra.all import ZZ
+            >>> R = ZZ/ZZ(7)
+            >>> R.batch_inverse([1, 2, R(3), 6])
+            [1, 4, 5, 6]
+
+        References:
+            "Speeding the Pollard and Elliptic Curve Methods of Factorization" (Montgomery)
+        """
+        modulus  = self._require_modulus()
+        residues = self.residues(elements)
+
+        if not residues:
+            return []
+
+        # Prefix products
+        prefixes = [residues[0]]
+        for residue in residues[1:]:
+            prefixes.append(prefixes[-1] * residue % modulus)
+
+        try:
+            inv = mod_inv(prefixes[-1], modulus)
+        except NotInvertibleException:
+            bad = [elem for elem in residues if gcd(elem, modulus) != 1][0]
+            raise NotInvertibleException("'a' is not invertible", parameters={'a': bad, 'n': modulus})
+
+        inverses = [0]*len(residues)
+        for i in reversed(range(1, len(residues))):
+            inverses[i] = inv * prefixes[i-1] % modulus
+            inv         = inv * residues[i] % modulus
+
+        inverses[0] = inv
+        return inverses
+
+
     def zero(self) -> QuotientElement:
         """
         Returns:
@@ -201,6 +450,10 @@ class QuotientRing(Ring):
             QuotientElement: Coerced element.
         """
         is_int  = type(other) is int
+
+        if is_int and self.modulus is not None:
+            return self.from_int(other)
+
         is_elem = issubclass(type(other), RingElement)
 
         if is_int or not is_elem or other.ring != self:
@@ -25,17 +25,19 @@ def left_expression_intercept(func: FunctionType) -> object:
     """
     from samson.math.polynomial import Polynomial
 
+    name = '__r' + func.__name__[2:]
+
     def poly_build(*args, **kwargs):
-        try:
-            name = func.__name__
-            name = '__r' + name[2:]
-            poly_res = try_poly_first(*args, **kwargs, func=getattr(Polynomial, name))
+        # Only Polynomial operands can take precedence, so skip the lookup for everything else
+        if len(args) > 1 and issubclass(type(args[1]), Polynomial):
+            try:
+                poly_res = try_poly_first(*args, **kwargs, func=getattr(Polynomial, name))
 
-            if poly_res is not None:
-                return poly_res
+                if poly_res is not None:
+                    return poly_res
 
-        except Exception:
-            pass
+            except Exception:
+                pass
 
         return func(*args, **kwargs)
 
@@ -0,0 +1,528 @@
+from samson.math.sparse_vector import SparseVector
+
+KARATSUBA_THRESHOLD     = 32
+NTT_THRESHOLD           = 1024
+FAST_DIVISION_THRESHOLD = 512
+DENSE_MIN_LENGTH        = 64
+DENSE_RATIO             = 8
+
+
+def dense_modulus(ring: object) -> (bool, int):
+    """
+    Determines whether elements of `ring` can be stored as plain integers.
+
+    Parameters:
+        ring (Ring): Coefficient ring.
+
+    Returns:
+        (bool, int): Formatted as (supported, modulus). `modulus` is None for ZZ.
+
+    Examples:
+        >>> from samson.math.algebra.all import ZZ, FF
+        >>> from samson.math.dense_int_vector import dense_modulus
+        >>> dense_modulus(ZZ/ZZ(7))
+        (True, 7)
+
+        >>> dense_modulus(ZZ)
+        (True, None)
+
+        >>> dense_modulus(FF(2, 8))
+        (False, None)
+
+    """
+    from samson.math.algebra.rings.integer_ring import IntegerRing
+    from samson.math.algebra.rings.quotient_ring import QuotientRing
+
+    type_r = type(ring)
+    if type_r is IntegerRing:
+        return True, None
+
+    elif type_r is QuotientRing and type(ring.ring) is IntegerRing:
+        return True, ring.quotient.val
+
+    return False, None
+
+
+
+def schoolbook_mul(v1: list, v2: list) -> list:
+    """
+    Multiplies two integer coefficient lists using the quadratic algorithm.
+
+    Parameters:
+        v1 (list): Coefficients of increasing degree.
+        v2 (list): Coefficients of increasing degree.
+
+    Returns:
+        list: Product coefficients.
+
+    Examples:
+        >>> from samson.math.dense_int_vector import schoolbook_mul
+        >>> schoolbook_mul([1, 2], [3, 4, 5])
+        [3, 10, 13, 10]
+
+    """
+    if not v1 or not v2:
+        return []
+
+    result = [0]*(len(v1) + len(v2) - 1)
+    for i, a in enumerate(v1):
+        if a:
+            for j, b in enumerate(v2, i):
+                result[j] += a*b
+
+    return result
+
+
+
+def _add_into(result: list, vec: list, offset: int, sign: int=1):
+    for i, val in enumerate(vec, offset):
+        result[i] += sign*val
+
+
+def karatsuba_mul(v1: list, v2: list) -> list:
+    """
+    Multiplies two integer coefficient lists using Karatsuba's algorithm.
+
+    Parameters:
+        v1 (list): Coefficients of increasing degree.
+        v2 (list): Coefficients of increasing degree.
+
+    Returns:
+        list: Product coefficients.
+
+    Examples:
+        >>> from samson.math.dense_int_vector import karatsuba_mul, schoolbook_mul
+        >>> v1, v2 = list(range(100)), list(range(50, 120))
+        >>> karatsuba_mul(v1, v2) == schoolbook_mul(v1, v2)
+        True
+
+    """
+    if len(v1) < len(v2):
+        v1, v2 = v2, v1
+
+    v1_len, v2_len = len(v1), len(v2)
+
+    if v2_len < KARATSUBA_THRESHOLD:
+        return schoolbook_mul(v1, v2)
+
+    # Split unbalanced operands into chunks the size of the shorter one
+    if v1_len >= v2_len*2:
+        result = [0]*(v1_len + v2_len - 1)
+        for offset in range(0, v1_len, v2_len):
+            _add_into(result, karatsuba_mul(v1[offset:offset + v2_len], v2), offset)
+
+        return result
+
+    half = v1_len // 2
+    lo1, hi1 = v1[:half], v1[half:]
+    lo2, hi2 = v2[:half], v2[half:]
+
+    z0 = karatsuba_mul(lo1, lo2)
+    z2 = karatsuba_mul(hi1, hi2)
+
+    sum1 = [a + b for a, b in zip(lo1, hi1)] + hi1[half:]
+    sum2 = [a + b for a, b in zip(lo2, hi2)] + lo2[len(hi2):] + hi2[half:]
+    z1   = karatsuba_mul(sum1, sum2)
+
+    _add_into(z1, z0, 0, -1)
+    _add_into(z1, z2, 0, -1)
+
+    result = [0]*(v1_len + v2_len - 1)
+    _add_into(result, z0, 0)
+    _add_into(result, z1[:len(result) - half], half)
+    _add_into(result, z2, half*2)
+    return result
+
+
+
+def dense_mul(v1: list, v2: list, modulus: int=None) -> list:
+    """
+    Multiplies two integer coefficient lists, choosing schoolbook, Karatsuba or NTT multiplication by size.
+
+    Parameters:
+        v1      (list): Coefficients of increasing degree.
+        v2      (list): Coefficients of increasing degree.
+        modulus  (int): Modulus to reduce the product by (None for no reduction).
+
+    Returns:
+        list: Product coefficients with trailing zeros removed.
+
+    Examples:
+        >>> from samson.math.dense_int_vector import dense_mul
+        >>> dense_mul([1, 2], [3, 4, 5], 7)
+        [3, 3, 6, 3]
+
+    """
+    from samson.math.dft import convolve
+
+    min_len = min(len(v1), len(v2))
+
+    if min_len < KARATSUBA_THRESHOLD:
+        result = schoolbook_mul(v1, v2)
+
+    elif min_len < NTT_THRESHOLD:
+        result = karatsuba_mul(v1, v2)
+
+    else:
+        result = convolve(v1, v2)
+
+    if modulus:
+        result = [val % modulus for val in result]
+
+    return trim(result)
+
+
+
+def trim(values: list) -> list:
+    """
+    Removes trailing zeros in place.
+
+    Parameters:
+        values (list): Coefficients.
+
+    Returns:
+        list: `values`.
+    """
+    while values and not values[-1]:
+        values.pop()
+
+    return values
+
+
+
+class DenseIntVector(object):
+    """
+    Dense coefficient vector over ZZ or ZZ/ZZ(n) that stores plain integers. Implements the same
+    interface as `SparseVector` so `Polynomial` can use either interchangeably.
+    """
+
+    def __init__(self, values: list, ring: object, modulus: int=None):
+        """
+        Parameters:
+            values (list): Integers of increasing index. Trailing zeros are removed.
+            ring   (Ring): Ring the integers represent (ZZ or ZZ/ZZ(n)).
+            modulus (int): Modulus of `ring` (None for ZZ).
+        """
+        if modulus:
+            values = [val % modulus for val in values]
+
+        self.values  = trim(values)
+        self.ring    = ring
+        self.modulus = modulus
+        self.zero    = ring.zero()
+
+
+    def __repr__(self):
+        return f'<DenseIntVector: values={self.values}, ring={self.ring}>'
+
+    def __str__(self):
+        return self.__repr__()
+
+
+    @staticmethod
+    def from_sparse(sparse: SparseVector, ring: object, modulus: int=None) -> object:
+        """
+        Builds a `DenseIntVector` from a `SparseVector`.
+
+        Parameters:
+            sparse (SparseVector): Sparse vector of `ring` elements.
+            ring           (Ring): Ring of the elements.
+            modulus         (int): Modulus of `ring` (None for ZZ).
+
+        Returns:
+            DenseIntVector: Dense representation.
+        """
+        values = []
+        if len(sparse.values):
+            values = [0]*sparse.len()
+            for idx, coeff in sparse:
+                values[idx] = elem_to_int(coeff)
+
+        return DenseIntVector(values, ring, modulus)
+
+
+    def to_sparse(self) -> SparseVector:
+        """
+        Returns the `SparseVector` representation.
+
+        Returns:
+            SparseVector: Sparse representation.
+        """
+        return SparseVector(list(iter(self)), self.zero)
+
+
+    def nnz(self) -> int:
+        """
+        Returns the number of nonzero entries.
+
+        Returns:
+            int: Number of nonzero entries.
+        """
+        return len(self.values) - self.values.count(0)
+
+
+    def _wrap(self, val: int) -> object:
+        return self.ring(val)
+
+
+    def __hash__(self) -> int:
+        return hash(tuple(self))
+
+
+    def last(self) -> int:
+        """
+        Returns the index of the last element.
+
+        Returns:
+            int: Index of last element.
+        """
+        if not self.values:
+            raise IndexError('DenseIntVector is empty')
+
+        return len(self.values) - 1
+
+
+    def __iter__(self):
+        wrap = self._wrap
+        for idx, val in enumerate(self.values):
+            if val:
+                yield idx, wrap(val)
+
+
+    def __getitem__(self, idx: int) -> object:
+        if type(idx) is slice:
+            if idx.start is not None and idx.start < 0 or idx.stop is not None and idx.stop < 0:
+                raise Exception("Negative slices not supported for DenseIntVectors")
+
+            start = idx.start or 0
+            return DenseIntVector([0]*start + self.values[start:idx.stop:idx.step], self.ring, self.modulus)
+
+        if idx < 0:
+            idx += len(self.values)
+
+        if 0 <= idx < len(self.values):
+            return self._wrap(self.values[idx])
+
+        return self.zero
+
+
+    def __setitem__(self, idx: int, obj: object):
+        val = obj if type(obj) is int else elem_to_int(obj)
+        if self.modulus:
+            val %= self.modulus
+
+        values = self.values
+        if idx >= len(values):
+            if not val:
+                return
+
+            values.extend([0]*(idx - len(values) + 1))
+
+        values[idx] = val
+        trim(values)
+
+
+    def __contains__(self, item: object):
+        return type(item) is int and 0 <= item < len(self.values) and self.values[item] != 0
+
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is DenseIntVector:
+            return self.values == other.values and self.ring == other.ring
+
+        return list(iter(self)) == list(iter(other))
+
+
+    def __len__(self) -> int:
+        return self.len()
+
+
+    def len(self) -> int:
+        """
+        Calculate the length of the `DenseIntVector`.
+        """
+        return self.last() + 1
+
+
+
+def elem_to_int(elem: object) -> int:
+    """
+    Peels an element of ZZ or ZZ/ZZ(n) down to a plain integer.
+
+    Parameters:
+        elem (RingElement): Element.
+
+    Returns:
+        int: Integer value.
+    """
+    while type(elem) is not int:
+        elem = elem.val
+
+    return elem
+
+
+
+def dense_divmod(v1: list, v2: list, modulus: int=None) -> (list, list):
+    """
+    Divides integer coefficient lists using long division. The leading coefficient of `v2` must be
+    invertible modulo `modulus` or, if `modulus` is None, be 1 or -1.
+
+    Parameters:
+        v1      (list): Dividend coefficients of increasing degree.
+        v2      (list): Divisor coefficients of increasing degree.
+        modulus  (int): Modulus of the coefficients (None for ZZ).
+
+    Returns:
+        (list, list): Formatted as (quotient, remainder).
+
+    Examples:
+        >>> from samson.math.dense_int_vector import dense_divmod
+        >>> dense_divmod([1, 2, 3, 4], [1, 1], 7)
+        ([3, 6, 4], [5])
+
+    """
+    from samson.math.general import mod_inv
+
+    n = len(v2) - 1
+    if len(v1) <= n:
+        return [], list(v1)
+
+    lc_inv    = mod_inv(v2[-1], modulus) if modulus else v2[-1]
+    remainder = list(v1)
+    quotient  = [0]*(len(v1) - n)
+
+    for k in reversed(range(len(quotient))):
+        coeff = remainder[k+n] * lc_inv
+        if modulus:
+            coeff %= modulus
+
+        quotient[k] = coeff
+
+        if coeff:
+            for j, div_coeff in enumerate(v2[:n], k):
+                remainder[j] -= coeff * div_coeff
+
+            if modulus:
+                for j in range(k, k+n):
+                    remainder[j] %= modulus
+
+    remainder = remainder[:n]
+    return trim(quotient), trim(remainder)
+
+
+
+def is_dense_divisible(v2: list, modulus: int=None) -> bool:
+    """
+    Determines whether `dense_divmod` can divide by `v2`.
+
+    Parameters:
+        v2     (list): Divisor coefficients of increasing degree.
+        modulus (int): Modulus of the coefficients (None for ZZ).
+
+    Returns:
+        bool: Whether the leading coefficient is a unit.
+    """
+    from samson.math.general import gcd
+
+    if not v2:
+        return False
+
+    if modulus:
+        return gcd(v2[-1], modulus) == 1
+
+    return v2[-1] in (1, -1)
+
+
+
+def prefer_dense(nnz: int, length: int) -> bool:
+    """
+    Heuristic for choosing the dense representation over the sparse one.
+
+    Parameters:
+        nnz    (int): Number of nonzero entries.
+        length (int): Length of the vector (degree + 1).
+
+    Returns:
+        bool: Whether to use the dense representation.
+    """
+    return length <= DENSE_MIN_LENGTH or nnz*DENSE_RATIO >= length
+
+
+
+def dense_inverse_series(v: list, length: int, modulus: int=None) -> list:
+    """
+    Computes the inverse of `v` as a power series modulo `x**length` using Newton iteration. The
+    constant coefficient of `v` must be invertible modulo `modulus` or, if `modulus` is None, be 1 or -1.
+
+    Parameters:
+        v       (list): Coefficients of increasing degree.
+        length   (int): Precision of the inverse.
+        modulus  (int): Modulus of the coefficients (None for ZZ).
+
+    Returns:
+        list: Coefficients of the inverse.
+
+    Examples:
+        >>> from samson.math.dense_int_vector import dense_inverse_series, dense_mul
+        >>> inv = dense_inverse_series([1, 2, 3], 8, 101)
+        >>> dense_mul([1, 2, 3], inv, 101)[:8]
+        [1, 0, 0, 0, 0, 0, 0, 0]
+
+    """
+    from samson.math.general import mod_inv
+
+    inverse   = [mod_inv(v[0], modulus) if modulus else v[0]]
+    precision = 1
+
+    # g_{2k} = g_k * (2 - v*g_k) mod x**2k
+    while precision < length:
+        precision = min(precision*2, length)
+        error     = [-coeff for coeff in dense_mul(v[:precision], inverse, modulus)[:precision]] or [0]
+        error[0] += 2
+        inverse   = dense_mul(inverse, error, modulus)[:precision]
+
+    return inverse
+
+
+
+def dense_fast_divmod(v1: list, v2: list, modulus: int=None, rev_inverse: list=None) -> (list, list):
+    """
+    Divides integer coefficient lists by multiplying with the power series inverse of the reversed
+    divisor. Has the same requirements as `dense_divmod`.
+
+    Parameters:
+        v1          (list): Dividend coefficients of increasing degree.
+        v2          (list): Divisor coefficients of increasing degree.
+        modulus      (int): Modulus of the coefficients (None for ZZ).
+        rev_inverse (list): Precomputed inverse of reversed `v2` with precision of at least `len(v1) - len(v2) + 1`.
+
+    Returns:
+        (list, list): Formatted as (quotient, remainder).
+
+    Examples:
+        >>> from samson.math.dense_int_vector import dense_fast_divmod
+        >>> dense_fast_divmod([1, 2, 3, 4], [1, 1], 7)
+        ([3, 6, 4], [5])
+
+    """
+    n = len(v2) - 1
+    k = len(v1) - n
+
+    if k <= 0:
+        return [], list(v1)
+
+    if rev_inverse is None:
+        rev_inverse = dense_inverse_series(v2[::-1], k, modulus)
+
+    rev_quotient  = dense_mul(v1[::-1][:k], rev_inverse[:k], modulus)[:k]
+    rev_quotient += [0]*(k - len(rev_quotient))
+    quotient      = trim(rev_quotient[::-1])
+
+    product    = dense_mul(quotient, v2, modulus)[:n]
+    product   += [0]*(n - len(product))
+    remainder  = [a - b for a, b in zip(v1[:n], product)]
+
+    if modulus:
+        remainder = [coeff % modulus for coeff in remainder]
+
+    return quotient, trim(remainder)
@@ -1,5 +1,6 @@
-from samson.math.general import mod_inv, is_prime, factor
+from samson.math.general import mod_inv, is_prime
 from samson.math.symbols import oo
+from collections import OrderedDict
 from itertools import chain, count
 from enum import Enum
 import math
@@ -15,31 +16,188 @@ class ArbitraryFFTOp(Enum):
     DECONVOLVE = lambda a, b: a // b
 
 
-def generate_ntt_params(v1, v2):
-    vec_len   = len(v1)
-    max_value = max(chain(v1, v2))
-    min_mod   = max_value**2 * vec_len + 1
+class NTTPlan(object):
+    """
+    Precomputed parameters for an iterative, in-place number-theoretic transform of a fixed length.
+    """
 
-    # Find a modulus
-    for offset in count(max(1, min_mod + vec_len - 2)):
-        modulus = offset * vec_len + 1
+    def __init__(self, length: int, modulus: int, root: int):
+        """
+        Parameters:
+            length  (int): Length of the transform. Must be a power of two.
+            modulus (int): Prime modulus such that `length` divides `modulus - 1`.
+            root    (int): Primitive `length`-th root of unity modulo `modulus`.
+        """
+        self.length   = length
+        self.modulus  = modulus
+        self.root     = root
+        self.inv_root = mod_inv(root, modulus)
+        self.scaler   = mod_inv(length, modulus)
 
-        if is_prime(modulus):
-            break
+        # Pairs of indices to swap for the bit-reversal permutation
+        bits = length.bit_length() - 1
+        self.bit_reversal = []
 
-    totient = modulus - 1
+        for i in range(length):
+            j = int(bin(i)[2:].zfill(bits)[::-1], 2) if bits else 0
+            if i < j:
+                self.bit_reversal.append((i, j))
 
-    # Find a generator
-    factors = [f for f,_ in factor(totient).items()]
+        self.twiddle_factors  = self._generate_twiddles(self.root)
+        self.inv_twid_factors = self._generate_twiddles(self.inv_root)
 
-    for possible_gen in range(1, modulus):
-        if pow(possible_gen, totient, modulus) == 1 and all([pow(possible_gen, totient // f, modulus) != 1 for f in factors]):
-            gen = possible_gen
-            break
+        self.stage_twiddles     = self._generate_stage_twiddles(self.twiddle_factors)
+        self.inv_stage_twiddles = self._generate_stage_twiddles(self.inv_twid_factors)
+
+
+    def __repr__(self):
+        return f"<NTTPlan: length={self.length}, modulus={self.modulus}, root={self.root}>"
+
+    def __str__(self):
+        return self.__repr__()
+
+
+    def _generate_twiddles(self, root: int) -> list:
+        twiddles = []
+        twiddle  = 1
+        for _ in range(self.length // 2):
+            twiddles.append(twiddle)
+            twiddle = (twiddle * root) % self.modulus
+
+        return twiddles
+
+
+    def _generate_stage_twiddles(self, twiddles: list) -> list:
+        stages = []
+        half   = 1
+        while half < self.length:
+            stages.append(twiddles[::self.length // (half*2)])
+            half *= 2
+
+        return stages
+
+
+    def transform(self, buffer: list, inverse: bool=False) -> list:
+        """
+        Performs the transform in place.
+
+        Parameters:
+            buffer  (list): List of integers of length `self.length`. Will be overwritten.
+            inverse (bool): Whether to perform the inverse transform.
+
+        Returns:
+            list: `buffer`.
+
+        Examples:
+            >>> from samson.math.dft import get_ntt_plan
+            >>> plan = get_ntt_plan(4, 100)
+            >>> plan.transform(plan.transform([1, 2, 3, 4]), inverse=True)
+            [1, 2, 3, 4]
+
+        """
+        mod = self.modulus
+
+        for i, j in self.bit_reversal:
+            buffer[i], buffer[j] = buffer[j], buffer[i]
+
+        half = 1
+        for stage in (self.inv_stage_twiddles if inverse else self.stage_twiddles):
+            size = half*2
+            for k, twiddle in enumerate(stage):
+                for lo in range(k, self.length, size):
+                    hi = lo + half
+                    e  = buffer[lo]
+                    o  = buffer[hi] * twiddle
+
+                    buffer[lo] = (e + o) % mod
+                    buffer[hi] = (e - o) % mod
+
+            half = size
+
+        if inverse:
+            scaler = self.scaler
+            for i, val in enumerate(buffer):
+                buffer[i] = val * scaler % mod
+
+        return buffer
+
+
+
+# Maximum number of `NTTPlan`s kept. The least recently used plan is evicted first
+NTT_PLAN_CACHE_SIZE = 64
+
+_NTT_PLAN_CACHE = OrderedDict()
+
+def get_ntt_plan(length: int, bound: int) -> NTTPlan:
+    """
+    Retrieves an `NTTPlan` for a transform of size `length` with a modulus of at least `bound`.
+    Plans are cached by (`length`, bit length of `bound`), so repeated transforms of the same size
+    skip prime search and root finding. At most `NTT_PLAN_CACHE_SIZE` plans are kept.
+
+    Parameters:
+        length (int): Length of the transform. Must be a power of two.
+        bound  (int): Minimum modulus.
+
+    Returns:
+        NTTPlan: Cached or newly generated plan.
+
+    Examples:
+        >>> from samson.math.dft import get_ntt_plan
+        >>> plan = get_ntt_plan(8, 1000)
+        >>> (plan.modulus - 1) % 8, plan.modulus >= 1000, pow(plan.root, 8, plan.modulus)
+        (0, True, 1)
+
+        >>> get_ntt_plan(8, 1000) is plan
+        True
+
+    """
+    key = (length, bound.bit_length())
+    if key in _NTT_PLAN_CACHE:
+        _NTT_PLAN_CACHE.move_to_end(key)
+    else:
+        min_mod = 2**key[1]
+
+        # Find a modulus
+        for offset in count(max(1, (min_mod - 1) // length)):
+            modulus = offset * length + 1
+
+            if modulus >= min_mod and is_prime(modulus):
+                break
+
+        totient = modulus - 1
+
+        # Any quadratic non-residue raised to `totient // length` has order exactly `length`.
+        # This avoids factoring `totient`, which is infeasible for large bounds.
+        for possible_gen in count(2):
+            if pow(possible_gen, totient // 2, modulus) == totient:
+                break
+
+        root = pow(possible_gen, totient // length, modulus)
+        _NTT_PLAN_CACHE[key] = NTTPlan(length, modulus, root)
+
+        if len(_NTT_PLAN_CACHE) > NTT_PLAN_CACHE_SIZE:
+            _NTT_PLAN_CACHE.popitem(last=False)
 
-    # Find a primitive root
-    root = pow(gen, totient // vec_len, modulus)
-    return root, modulus
+    return _NTT_PLAN_CACHE[key]
+
+
+
+def clear_ntt_plan_cache():
+    """
+    Clears all cached `NTTPlan`s.
+    """
+    _NTT_PLAN_CACHE.clear()
+
+
+
+def _ntt_bound(v1: list, v2: list, vec_len: int) -> int:
+    max_value = max((abs(val) for val in chain(v1, v2)), default=0)
+    return max(max_value**2 * vec_len + 1, 2)
+
+
+def generate_ntt_params(v1, v2):
+    plan = get_ntt_plan(len(v1), _ntt_bound(v1, v2, len(v1)))
+    return plan.root, plan.modulus
 
 
 
@@ -63,39 +221,53 @@ def ntt_inv(vec_t: list, root: int, modulus: int):
 
 
 
+def _padded_length(v1_len: int, v2_len: int) -> int:
+    return 1 << (max(v1_len, v2_len)*2 - 1).bit_length()
+
+
 def prepare_fft(v1, v2):
     v1_len = len(v1)
     v2_len = len(v2)
 
     # Pad vectors for radix-2 FFT
-    max_len = max(v1_len, v2_len)
-    vec_len = 2**math.ceil(math.log(max_len*2, 2))
+    vec_len = _padded_length(v1_len, v2_len)
     v1 = v1 + [0]*(vec_len - v1_len)
     v2 = v2 + [0]*(vec_len - v2_len)
 
     # Prepare NTT twiddle factors
-    root, modulus    = generate_ntt_params(v1, v2)
-    twiddle_factors  = []
-    inv_twid_factors = []
-
-    twiddle  = 1
-    inv_twid = 1
-    inv_root = mod_inv(root, modulus)
-
-    for _ in range(vec_len // 2):
-        twiddle_factors.append(twiddle)
-        twiddle = (twiddle * root) % modulus
-
-        inv_twid_factors.append(inv_twid)
-        inv_twid = (inv_twid * inv_root) % modulus
+    plan = get_ntt_plan(vec_len, _ntt_bound(v1, v2, vec_len))
 
-    return (v1, v2), root, modulus, twiddle_factors, inv_twid_factors
+    return (v1, v2), plan.root, plan.modulus, plan.twiddle_factors, plan.inv_twid_factors
 
 
 
 def fft(vec, modulus, twiddle_factors):
     vec_len = len(vec)
-    vec_t   = fft_recurse(vec, twiddle_factors, modulus, vec_len, vec_len)
+    vec_t   = list(vec)
+    bits    = vec_len.bit_length() - 1
+
+    # Iterative Cooley-Tukey over a bit-reversed copy
+    for i in range(vec_len):
+        j = int(bin(i)[2:].zfill(bits)[::-1], 2) if bits else 0
+        if i < j:
+            vec_t[i], vec_t[j] = vec_t[j], vec_t[i]
+
+    half = 1
+    while half < vec_len:
+        size = half*2
+        step = vec_len // size
+        for k in range(half):
+            twiddle = twiddle_factors[k*step]
+            for lo in range(k, vec_len, size):
+                hi = lo + half
+                e  = vec_t[lo]
+                o  = vec_t[hi] * twiddle
+
+                vec_t[lo] = (e + o) % modulus
+                vec_t[hi] = (e - o) % modulus
+
+        half = size
+
     return vec_t
 
 
@@ -121,14 +293,79 @@ def fft_recurse(vec, t_factors, mod, n, N):
 
 
 def fft_op(v1, v2, operation: FFTOp=FFTOp.CONVOLVE):
-    (v1, v2), _root, modulus, twiddle_factors, inv_twid_factors = prepare_fft(v1, v2)
-    v1_t = fft(v1, modulus, twiddle_factors)
-    v2_t = fft(v2, modulus, twiddle_factors)
-
-    v3_t   = [operation(a, b, modulus) for a,b in zip(v1_t, v2_t)]
-    v3     = fft(v3_t, modulus, inv_twid_factors)
-    scaler = mod_inv(len(v1), modulus)
-    return [val * scaler % modulus for val in v3]
+    """
+    Performs `operation` on the NTTs of `v1` and `v2` and returns the inverse transform.
+
+    Parameters:
+        v1             (list): First vector of integers.
+        v2             (list): Second vector of integers.
+        operation (FFTOp): Pointwise operation to perform.
+
+    Returns:
+        list: Result of length `2**ceil(log2(2*max(len(v1), len(v2))))`.
+
+    Examples:
+        >>> from samson.math.dft import fft_op
+        >>> fft_op([1, 2, 3], [4, 5])
+        [4, 13, 22, 15, 0, 0, 0, 0]
+
+    """
+    v1_len  = len(v1)
+    v2_len  = len(v2)
+    vec_len = _padded_length(v1_len, v2_len)
+    plan    = get_ntt_plan(vec_len, _ntt_bound(v1, v2, vec_len))
+    modulus = plan.modulus
+
+    v1_t = plan.transform(v1 + [0]*(vec_len - v1_len))
+    v2_t = plan.transform(v2 + [0]*(vec_len - v2_len))
+
+    for i, b in enumerate(v2_t):
+        v1_t[i] = operation(v1_t[i], b, modulus)
+
+    return plan.transform(v1_t, inverse=True)
+
+
+
+def convolve(v1: list, v2: list) -> list:
+    """
+    Computes the linear convolution of two integer vectors using a cached NTT plan.
+
+    Parameters:
+        v1 (list): First vector of integers.
+        v2 (list): Second vector of integers.
+
+    Returns:
+        list: Convolution of length `len(v1) + len(v2) - 1`.
+
+    Examples:
+        >>> from samson.math.dft import convolve
+        >>> convolve([1, 2, 3], [4, 5])
+        [4, 13, 22, 15]
+
+        >>> convolve([-1, 2], [3, -4])
+        [-3, 10, -8]
+
+    """
+    if not v1 or not v2:
+        return []
+
+    v1_len  = len(v1)
+    v2_len  = len(v2)
+    vec_len = _padded_length(v1_len, v2_len)
+
+    # Double the bound so negative coefficients can be recovered
+    plan    = get_ntt_plan(vec_len, _ntt_bound(v1, v2, vec_len)*2)
+    modulus = plan.modulus
+    half    = modulus // 2
+
+    v1_t = plan.transform([val % modulus for val in v1] + [0]*(vec_len - v1_len))
+    v2_t = plan.transform([val % modulus for val in v2] + [0]*(vec_len - v2_len))
+
+    for i, b in enumerate(v2_t):
+        v1_t[i] = v1_t[i] * b % modulus
+
+    result = plan.transform(v1_t, inverse=True)
+    return [val - modulus if val > half else val for val in result[:v1_len + v2_len - 1]]
 
 
 
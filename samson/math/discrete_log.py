@@ -0,0 +1,373 @@
+from samson.math.general import gcd, mod_inv, random_int, kth_root
+from samson.utilities.exceptions import ProbabilisticFailureException
+from samson.utilities.general import load_checkpoint, save_checkpoint
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+import hashlib
+
+# Number of precomputed steps in the r-adding walk (Teske recommends r >= 16)
+RHO_PARTITIONS = 20
+
+# Collisions with a non-invertible coefficient difference leave this many candidates at most
+MAX_LINEAR_CANDIDATES = 2**16
+
+MASK64 = 2**64 - 1
+
+# Worker state. Group elements don't survive pickling in general, so they reach forked workers by inheritance.
+_CONTEXT = None
+
+
+def element_key(elem: object) -> int:
+    """
+    Deterministically maps a group element to a 64-bit key. Keys are stable across processes and runs so
+    distinguished points can be exchanged and checkpointed.
+
+    Parameters:
+        elem (object): Group element.
+
+    Returns:
+        int: 64-bit key.
+
+    Examples:
+        >>> from samson.math.discrete_log import element_key
+        >>> from samson.math.algebra.all import ZZ
+        >>> element_key((ZZ/ZZ(53))(5)) == element_key((ZZ/ZZ(53))(5))
+        True
+
+    """
+    try:
+        k = int(elem)
+    except (TypeError, ValueError, AttributeError, NotImplementedError):
+        k = int.from_bytes(hashlib.sha256(repr(elem).encode('utf-8')).digest()[:8], 'big')
+
+    # splitmix64 finalizer so low-entropy elements still spread over partitions
+    k  = (k ^ (k >> 64) ^ 0x9E3779B97F4A7C15) & MASK64
+    k  = ((k ^ (k >> 30)) * 0xBF58476D1CE4E5B9) & MASK64
+    k  = ((k ^ (k >> 27)) * 0x94D049BB133111EB) & MASK64
+    return k ^ (k >> 31)
+
+
+
+def solve_linear_congruence(c: int, r: int, n: int) -> list:
+    """
+    Solves `c*x == r (mod n)`.
+
+    Parameters:
+        c (int): Coefficient.
+        r (int): Right-hand side.
+        n (int): Modulus.
+
+    Returns:
+        list: Solutions in [0, `n`). Empty if there are none or more than `MAX_LINEAR_CANDIDATES`.
+
+    Examples:
+        >>> from samson.math.discrete_log import solve_linear_congruence
+        >>> solve_linear_congruence(4, 2, 6)
+        [2, 5]
+
+    """
+    c, r = c % n, r % n
+    d    = gcd(c, n)
+
+    if not c or r % d or d > MAX_LINEAR_CANDIDATES:
+        return []
+
+    m  = n // d
+    x0 = (r // d) * mod_inv(c // d, m) % m
+    return [x0 + k*m for k in range(d)]
+
+
+
+def _default_dp_bits(space: int, walkers: int) -> int:
+    # Keep each walk between distinguished points well under the expected total work
+    return max(0, (kth_root(space, 2) // (16 * walkers)).bit_length() - 1)
+
+
+
+def _init_worker(context: dict):
+    global _CONTEXT
+    _CONTEXT = context
+
+
+
+def _run_rounds(context: dict, walk_func: object, walkers: list, steps: int, processes: int, handle_results: object):
+    """
+    Runs `walk_func` over chunks of `walkers` until `handle_results` returns something other than None.
+    """
+    _init_worker(context)
+    executor = None
+
+    if processes > 1 and 'fork' in multiprocessing.get_all_start_methods():
+        executor = ProcessPoolExecutor(max_workers=processes, mp_context=multiprocessing.get_context('fork'), initializer=_init_worker, initargs=(context,))
+
+    try:
+        while True:
+            chunk_size = max(1, -(-len(walkers) // processes))
+            chunks     = [(i, walkers[i:i + chunk_size]) for i in range(0, len(walkers), chunk_size)]
+
+            if executor:
+                results = list(executor.map(walk_func, chunks, [steps]*len(chunks)))
+            else:
+                results = [walk_func(chunk, steps) for chunk in chunks]
+
+            walkers = [walker for new_walkers, _ in results for walker in new_walkers]
+            result  = handle_results(walkers, [dp for _, dps in results for dp in dps])
+
+            if result is not None:
+                return result
+    finally:
+        # `executor.map` cancels any of its unfinished futures when interrupted
+        if executor:
+            executor.shutdown(wait=False)
+
+
+
+def _rho_walk(chunk: tuple, steps: int) -> (list, list):
+    _, walkers = chunk
+    g, h, n, M, coeffs, dp_mask, max_walk = [_CONTEXT[k] for k in ['g', 'h', 'n', 'M', 'coeffs', 'dp_mask', 'max_walk']]
+    r   = len(M)
+    dps = []
+    out = []
+
+    for a, b, length in walkers:
+        X = g*a + h*b
+        for _ in range(steps):
+            k = element_key(X)
+
+            # Start over at a random point after a distinguished point or a suspiciously long (cycling) walk
+            if not k & dp_mask or length > max_walk:
+                if not k & dp_mask:
+                    dps.append((k, a, b))
+
+                a, b, length = random_int(n), random_int(n), 0
+                X = g*a + h*b
+                continue
+
+            i       = (k >> 32) % r
+            c, d    = coeffs[i]
+            X      += M[i]
+            a       = (a + c) % n
+            b       = (b + d) % n
+            length += 1
+
+        out.append((a, b, length))
+
+    return out, dps
+
+
+
+def pollards_rho_log(g: object, h: object, n: int, processes: int=1, walkers: int=None, dp_bits: int=None, checkpoint: str=None) -> int:
+    """
+    Finds `x` such that `g*x == h` with Pollard's rho using an r-adding walk and distinguished points. Walks only
+    report distinguished points, so memory is proportional to `sqrt(n) / 2**dp_bits` and walkers can run in
+    parallel across processes (van Oorschot-Wiener).
+
+    Parameters:
+        g      (object): Base element of order `n`.
+        h      (object): Element to find the discrete logarithm of.
+        n         (int): Order of `g` (ideally prime).
+        processes (int): Number of worker processes. Requires the "fork" start method; otherwise runs in-process.
+        walkers   (int): Number of concurrent walks. Defaults to 4 per process.
+        dp_bits   (int): Number of zero bits marking a distinguished point.
+        checkpoint(str): Path of a JSON checkpoint. Progress is saved after every round and resumed if it matches.
+
+    Returns:
+        int: Discrete logarithm.
+
+    Examples:
+        >>> from samson.math.discrete_log import pollards_rho_log
+        >>> from samson.math.algebra.all import ZZ
+        >>> R = (ZZ/ZZ(1000003)).mul_group()
+        >>> g = R(2)
+        >>> n = 500001
+        >>> x = pollards_rho_log(g, g*123456, n)
+        >>> g*x == g*123456
+        True
+
+    References:
+        https://people.scs.carleton.ca/~paulv/papers/JoC97.pdf
+        "On random walks for Pollard's rho method" (Teske)
+    """
+    processes = max(1, processes)
+    walkers   = walkers or 4 * processes
+    dp_bits   = _default_dp_bits(n, walkers) if dp_bits is None else dp_bits
+
+    fingerprint = ['rho', str(element_key(g)), str(element_key(h)), str(n), dp_bits]
+    state       = load_checkpoint(checkpoint, fingerprint)
+
+    if state:
+        coeffs = [tuple(c) for c in state['coeffs']]
+        table  = {int(k): tuple(v) for k, v in state['table'].items()}
+        walks  = [tuple(w) for w in state['walkers']]
+    else:
+        coeffs = [(random_int(n), random_int(n)) for _ in range(RHO_PARTITIONS)]
+        table  = {}
+        walks  = [(random_int(n), random_int(n), 0) for _ in range(walkers)]
+
+    context = {
+        'g': g,
+        'h': h,
+        'n': n,
+        'M': [g*c + h*d for c, d in coeffs],
+        'coeffs': coeffs,
+        'dp_mask': (1 << dp_bits) - 1,
+        'max_walk': 20 << dp_bits
+    }
+
+
+    def solve(a1, b1, a2, b2):
+        # a1*g + b1*h == +-(a2*g + b2*h)
+        for sign in [1, -1]:
+            for x in solve_linear_congruence(sign*b2 - b1, a1 - sign*a2, n):
+                if g*x == h:
+                    return x
+
+        return None
+
+
+    def handle_results(walks, dps):
+        for k, a, b in dps:
+            if k in table and table[k] != (a, b):
+                x = solve(a, b, *table[k])
+                if x is not None:
+                    return x
+            else:
+                table[k] = (a, b)
+
+        if checkpoint:
+            save_checkpoint(checkpoint, {'fingerprint': fingerprint, 'coeffs': coeffs, 'table': table, 'walkers': walks})
+
+        return None
+
+
+    steps = max(1024, min(1 << 20, 4 << dp_bits))
+    return _run_rounds(context, _rho_walk, walks, steps, processes, handle_results)
+
+
+
+TAME, WILD = 0, 1
+
+def _kangaroo_walk(chunk: tuple, steps: int) -> (list, list):
+    offset, herd = chunk
+    g, y, jumps, dp_mask = [_CONTEXT[k] for k in ['g', 'y', 'jumps', 'dp_mask']]
+    r   = len(jumps)
+    dps = []
+    out = []
+
+    for idx, (kind, d) in enumerate(herd):
+        X = g*d if kind == TAME else y + g*d
+        for _ in range(steps):
+            k = element_key(X)
+            if not k & dp_mask:
+                dps.append((k, kind, d, offset + idx))
+
+            s, J = jumps[(k >> 32) % r]
+            X   += J
+            d   += s
+
+        out.append((kind, d))
+
+    return out, dps
+
+
+
+def parallel_kangaroo(g: object, y: object, a: int, b: int, processes: int=1, kangaroos: int=None, dp_bits: int=None, checkpoint: str=None, max_steps: int=None) -> int:
+    """
+    Finds `x` in [`a`, `b`] such that `g*x == y` with Pollard's kangaroo (lambda) method using herds of tame and
+    wild kangaroos and distinguished points (van Oorschot-Wiener).
+
+    Parameters:
+        g      (object): Base element.
+        y      (object): Element to find the discrete logarithm of.
+        a         (int): Interval start.
+        b         (int): Interval end.
+        processes (int): Number of worker processes. Requires the "fork" start method; otherwise runs in-process.
+        kangaroos (int): Total number of kangaroos, split evenly into tame and wild. Defaults to 4 per process.
+        dp_bits   (int): Number of zero bits marking a distinguished point.
+        checkpoint(str): Path of a JSON checkpoint. Progress is saved after every round and resumed if it matches.
+        max_steps (int): Total jumps before giving up. Defaults to 64 times the expected amount.
+
+    Returns:
+        int: Discrete logarithm.
+
+    Examples:
+        >>> from samson.math.discrete_log import parallel_kangaroo
+        >>> from samson.math.algebra.all import ZZ
+        >>> from samson.math.general import find_prime
+        >>> p = find_prime(128)
+        >>> g = (ZZ/ZZ(p)).mul_group()(5)
+        >>> parallel_kangaroo(g, g*(2**40 + 12345), 2**40, 2**40 + 2**20)
+        1099511640121
+
+    References:
+        https://people.scs.carleton.ca/~paulv/papers/JoC97.pdf
+    """
+    processes = max(1, processes)
+    kangaroos = max(2, kangaroos or 4 * processes)
+    width     = b - a
+    root      = kth_root(width, 2) + 1
+    dp_bits   = _default_dp_bits(width, kangaroos) if dp_bits is None else dp_bits
+    max_steps = max_steps or 64 * (2*root + (kangaroos << dp_bits))
+
+    # Powers of two with a mean jump of about (number of kangaroos) * sqrt(width) / 4
+    mean_jump = max(1, kangaroos * root // 4)
+    num_jumps = 1
+    while (2**num_jumps - 1) // num_jumps < mean_jump:
+        num_jumps += 1
+
+    spacing = max(1, mean_jump // kangaroos)
+    y_a     = y - g*a
+
+    fingerprint = ['kangaroo', str(element_key(g)), str(element_key(y)), str(a), str(b), dp_bits, kangaroos]
+    state       = load_checkpoint(checkpoint, fingerprint)
+
+    if state:
+        table = {int(k): tuple(v) for k, v in state['table'].items()}
+        herd  = [tuple(k) for k in state['herd']]
+        steps_taken = state['steps']
+    else:
+        num_tame = kangaroos // 2
+        table = {}
+        herd  = [(TAME, width // 2 + i*spacing) for i in range(num_tame)] + [(WILD, i*spacing) for i in range(kangaroos - num_tame)]
+        steps_taken = 0
+
+    context = {
+        'g': g,
+        'y': y_a,
+        'jumps': [(2**i, g*2**i) for i in range(num_jumps)],
+        'dp_mask': (1 << dp_bits) - 1
+    }
+
+    steps = max(1024, min(1 << 20, 4 << dp_bits))
+
+    def handle_results(new_herd, dps):
+        nonlocal steps_taken
+        herd[:] = new_herd
+
+        for k, kind, d, idx in dps:
+            if k in table:
+                other_kind, other_d = table[k]
+
+                if kind != other_kind:
+                    tame_d, wild_d = (d, other_d) if kind == TAME else (other_d, d)
+                    x = tame_d - wild_d + a
+
+                    if g*x == y:
+                        return x
+
+                elif d != other_d:
+                    # Two kangaroos of the same herd merged; nudge this one onto a fresh path
+                    herd[idx] = (kind, herd[idx][1] + random_int(spacing) + 1)
+            else:
+                table[k] = (kind, d)
+
+        steps_taken += steps * len(herd)
+        if steps_taken > max_steps:
+            raise ProbabilisticFailureException("Discrete logarithm not found")
+
+        if checkpoint:
+            save_checkpoint(checkpoint, {'fingerprint': fingerprint, 'table': table, 'herd': herd, 'steps': steps_taken})
+
+        return None
+
+    return _run_rounds(context, _kangaroo_walk, herd, steps, processes, handle_results)
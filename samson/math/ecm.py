@@ -0,0 +1,400 @@
+from samson.math.general import gcd, random_int_between, mod_inv
+from samson.utilities.exceptions import ProbabilisticFailureException
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+import multiprocessing
+import os
+
+# (B1, number of curves) tuned for factors of roughly 15, 20, 25, 30 and 35 digits.
+# Stage 2 bounds default to `B2_MULTIPLIER`*B1.
+ECM_LEVELS = [
+    (2000, 25),
+    (11000, 90),
+    (50000, 300),
+    (250000, 700),
+    (1000000, 1800)
+]
+
+B2_MULTIPLIER = 100
+
+# Cheap levels finish faster in-process than it takes to spin up worker processes
+POOL_MIN_B1 = 11000
+
+_SIEVE = None
+
+
+def prime_sieve(limit: int) -> bytearray:
+    """
+    Sieves the primes up to and including `limit`.
+
+    Parameters:
+        limit (int): Upper bound.
+
+    Returns:
+        bytearray: `sieve[i]` is 1 iff `i` is prime.
+
+    Examples:
+        >>> from samson.math.ecm import prime_sieve
+        >>> [i for i, is_prime in enumerate(prime_sieve(30)) if is_prime]
+        [2, 3, 5, 7, 11, 13, 17, 19, 23, 29]
+
+    """
+    sieve = bytearray([1]) * (limit + 1)
+    sieve[0:2] = b'\x00\x00'
+
+    for i in range(2, int(limit**0.5) + 1):
+        if sieve[i]:
+            sieve[i*i::i] = bytes(len(range(i*i, limit + 1, i)))
+
+    return sieve
+
+
+
+def montgomery_double(P: tuple, a24: int, n: int) -> tuple:
+    """
+    Doubles a point (X:Z) on a Montgomery curve.
+
+    Parameters:
+        P (tuple): Point as (X, Z).
+        a24 (int): (A + 2)/4 for the curve's `A` coefficient.
+        n   (int): Modulus.
+
+    Returns:
+        tuple: 2*P as (X, Z).
+    """
+    X, Z = P
+    s  = (X + Z) * (X + Z) % n
+    d  = (X - Z) * (X - Z) % n
+    t  = s - d
+    return s * d % n, t * (d + a24 * t) % n
+
+
+
+def montgomery_add(P: tuple, Q: tuple, diff: tuple, n: int) -> tuple:
+    """
+    Differential addition of points (X:Z) on a Montgomery curve.
+
+    Parameters:
+        P    (tuple): Point as (X, Z).
+        Q    (tuple): Point as (X, Z).
+        diff (tuple): P - Q as (X, Z).
+        n      (int): Modulus.
+
+    Returns:
+        tuple: P + Q as (X, Z).
+    """
+    u = (P[0] - P[1]) * (Q[0] + Q[1])
+    v = (P[0] + P[1]) * (Q[0] - Q[1])
+    return diff[1] * (u + v) * (u + v) % n, diff[0] * (u - v) * (u - v) % n
+
+
+
+def montgomery_ladder(P: tuple, k: int, a24: int, n: int) -> tuple:
+    """
+    Computes `k*P` on a Montgomery curve with the Montgomery ladder.
+
+    Parameters:
+        P (tuple): Point as (X, Z).
+        k   (int): Positive scalar.
+        a24 (int): (A + 2)/4 for the curve's `A` coefficient.
+        n   (int): Modulus.
+
+    Returns:
+        tuple: k*P as (X, Z).
+    """
+    R0, R1 = P, montgomery_double(P, a24, n)
+
+    for bit in bin(k)[3:]:
+        if bit == '1':
+            R0 = montgomery_add(R1, R0, P, n)
+            R1 = montgomery_double(R1, a24, n)
+        else:
+            R1 = montgomery_add(R1, R0, P, n)
+            R0 = montgomery_double(R0, a24, n)
+
+    return R0
+
+
+
+def suyama_curve(sigma: int, n: int) -> (tuple, int):
+    """
+    Generates a Montgomery curve with torsion of order 12 and a point on it via Suyama's parameterization.
+
+    Parameters:
+        sigma (int): Curve parameter (not in {0, 1, 3, 5}, up to sign).
+        n     (int): Modulus.
+
+    Returns:
+        (tuple, int): Point as (X, Z) and (A + 2)/4 of the curve. If setting up the curve requires inverting a
+        nontrivial divisor of `n`, returns (None, divisor) instead.
+
+    References:
+        https://members.loria.fr/PZimmermann/papers/ecm-submitted.pdf
+    """
+    u = (sigma*sigma - 5) % n
+    v = 4*sigma % n
+
+    denom = 16 * pow(u, 3, n) * v % n
+    g     = gcd(denom, n)
+    if g != 1:
+        return None, g
+
+    a24 = pow(v - u, 3, n) * (3*u + v) * mod_inv(denom, n) % n
+    return (pow(u, 3, n), pow(v, 3, n)), a24
+
+
+
+def stage2_width(B2: int) -> int:
+    """
+    Returns the giant step size `D` stage 2 uses for `B2`.
+
+    Parameters:
+        B2 (int): Stage 2 bound.
+
+    Returns:
+        int: Giant step size.
+    """
+    return 2310 if B2 > 10**7 else 210
+
+
+
+def ecm_sieve(B2: int) -> bytearray:
+    """
+    Sieves enough primes for both stages with bound `B2`. Giant steps test `m*D +- j` for `m*D` up to `B2 + D`
+    and `j < D/2`, so the sieve covers `B2 + 2*D`.
+
+    Parameters:
+        B2 (int): Stage 2 bound.
+
+    Returns:
+        bytearray: Prime sieve.
+    """
+    return prime_sieve(B2 + 2*stage2_width(B2))
+
+
+
+def ecm_stage1(P: tuple, a24: int, n: int, B1: int, sieve: bytearray) -> tuple:
+    """
+    Multiplies `P` by every prime power up to `B1`.
+
+    Parameters:
+        P     (tuple): Point as (X, Z).
+        a24     (int): (A + 2)/4 for the curve's `A` coefficient.
+        n       (int): Modulus.
+        B1      (int): Stage 1 bound.
+        sieve (bytearray): Prime sieve covering at least `B1`.
+
+    Returns:
+        tuple: Resulting point as (X, Z).
+    """
+    k = 1
+    for p in range(2, B1 + 1):
+        if sieve[p]:
+            pk = p
+            while pk * p <= B1:
+                pk *= p
+
+            k *= pk
+
+    return montgomery_ladder(P, k, a24, n)
+
+
+
+def ecm_stage2(Q: tuple, a24: int, n: int, B1: int, B2: int, sieve: bytearray) -> int:
+    """
+    Baby-step/giant-step stage 2. Catches a single prime `q` in (`B1`, `B2`] dividing the group order by writing
+    it as `q = m*D +- j` and testing whether `m*D*Q` and `j*Q` share an x-coordinate modulo a factor of `n`.
+
+    Parameters:
+        Q       (tuple): Stage 1 output as (X, Z).
+        a24       (int): (A + 2)/4 for the curve's `A` coefficient.
+        n         (int): Modulus.
+        B1        (int): Stage 1 bound.
+        B2        (int): Stage 2 bound.
+        sieve (bytearray): Prime sieve from `ecm_sieve`.
+
+    Returns:
+        int: gcd of the accumulated product and `n`.
+    """
+    D = stage2_width(B2)
+
+    # Baby steps j*Q for odd j < D/2 coprime to D
+    baby = {1: Q}
+    Q2   = montgomery_double(Q, a24, n)
+    prev, curr = Q, montgomery_add(Q2, Q, Q, n)
+
+    for j in range(3, D // 2, 2):
+        baby[j]    = curr
+        prev, curr = curr, montgomery_add(curr, Q2, prev, n)
+
+    baby = {j: P for j, P in baby.items() if gcd(j, D) == 1}
+
+    # Normalize baby steps to x-coordinates with a single inversion
+    js     = list(baby)
+    prefix = [1]
+    for j in js:
+        prefix.append(prefix[-1] * baby[j][1] % n)
+
+    g = gcd(prefix[-1], n)
+    if g != 1:
+        return g
+
+    inv = mod_inv(prefix[-1], n)
+    xs  = {}
+    for idx in reversed(range(len(js))):
+        j       = js[idx]
+        xs[j]   = baby[j][0] * inv * prefix[idx] % n
+        inv     = inv * baby[j][1] % n
+
+    # Giant steps m*D*Q
+    DQ   = montgomery_ladder(Q, D, a24, n)
+    m    = max(1, (B1 + D // 2) // D)
+    R    = montgomery_ladder(Q, m*D, a24, n)
+    Rm1  = montgomery_ladder(Q, (m - 1)*D, a24, n) if m > 1 else None
+    acc  = 1
+
+    while (m - 1)*D < B2:
+        X, Z = R
+        base = m*D
+        for j, x_j in xs.items():
+            if sieve[base - j] or sieve[base + j]:
+                acc = acc * (X - x_j * Z) % n
+
+        R_next   = montgomery_add(R, DQ, Rm1, n) if Rm1 else montgomery_double(R, a24, n)
+        Rm1, R   = R, R_next
+        m       += 1
+
+    return gcd(acc, n)
+
+
+
+def ecm_curve(n: int, sigma: int, B1: int, B2: int, sieve: bytearray=None) -> int:
+    """
+    Runs both stages of ECM on a single Suyama curve.
+
+    Parameters:
+        n       (int): Integer to factor.
+        sigma   (int): Curve parameter.
+        B1      (int): Stage 1 bound.
+        B2      (int): Stage 2 bound.
+        sieve (bytearray): (Optional) Prime sieve from `ecm_sieve`. Pass one in when running many curves.
+
+    Returns:
+        int: Nontrivial factor of `n` or None.
+
+    Examples:
+        >>> from samson.math.ecm import ecm_curve
+        >>> n = 1000000007 * 998244353
+        >>> any([ecm_curve(n, sigma, 2000, 200000) in (1000000007, 998244353) for sigma in range(6, 56)])
+        True
+
+    """
+    sieve  = sieve or ecm_sieve(B2)
+    P, a24 = suyama_curve(sigma, n)
+
+    if P is None:
+        g = a24
+    else:
+        Q = ecm_stage1(P, a24, n, B1, sieve)
+        g = gcd(Q[1], n)
+
+        if g == 1:
+            g = ecm_stage2(Q, a24, n, B1, B2, sieve)
+
+    return g if 1 < g < n else None
+
+
+
+def _init_worker(sieve: bytearray):
+    global _SIEVE
+    _SIEVE = sieve
+
+
+def _ecm_worker(n: int, sigmas: list, B1: int, B2: int) -> int:
+    for sigma in sigmas:
+        g = ecm_curve(n, sigma, B1, B2, _SIEVE)
+        if g:
+            return g
+
+    return None
+
+
+
+def run_ecm(n: int, attempts: int=None, B1: int=None, B2: int=None, processes: int=None) -> int:
+    """
+    Lenstra's elliptic curve factorization on Montgomery curves. Without an explicit `B1`, works through
+    `ECM_LEVELS`. Each level sieves its primes once and shares them between all of its curves. Levels with
+    `B1` >= `POOL_MIN_B1` dispatch curves across a process pool (where `fork` is available) and cancel the
+    remaining work once any worker finds a factor.
+
+    Parameters:
+        n         (int): Integer to factor.
+        attempts  (int): Maximum number of curves. Defaults to the curve counts of `ECM_LEVELS`.
+        B1        (int): Stage 1 bound.
+        B2        (int): Stage 2 bound. Defaults to `B2_MULTIPLIER`*`B1`.
+        processes (int): Number of worker processes. Defaults to `os.cpu_count()`.
+
+    Returns:
+        int: Nontrivial factor of `n`.
+    """
+    if not n % 2:
+        return 2
+
+    if B1:
+        # Use as many curves as the first level at least as expensive
+        curves = next((curves for level_B1, curves in ECM_LEVELS if level_B1 >= B1), ECM_LEVELS[-1][1])
+        levels = [(B1, attempts or curves)]
+    else:
+        levels = ECM_LEVELS
+
+    remaining = attempts or sum([curves for _, curves in levels])
+    processes = processes or os.cpu_count() or 1
+
+    for level_B1, curves in levels:
+        curves = min(curves, remaining)
+        if curves <= 0:
+            break
+
+        remaining -= curves
+        level_B2   = B2 or level_B1 * B2_MULTIPLIER
+        sigmas     = [random_int_between(6, n - 1) for _ in range(curves)]
+
+        _init_worker(ecm_sieve(level_B2))
+
+        try:
+            if processes > 1 and level_B1 >= POOL_MIN_B1 and 'fork' in multiprocessing.get_all_start_methods():
+                g = _run_pool(n, sigmas, level_B1, level_B2, processes)
+            else:
+                g = _ecm_worker(n, sigmas, level_B1, level_B2)
+        finally:
+            _init_worker(None)
+
+        if g:
+            return g
+
+    raise ProbabilisticFailureException("Factor not found")
+
+
+
+def _run_pool(n: int, sigmas: list, B1: int, B2: int, processes: int) -> int:
+    # Small chunks so a found factor cancels most of the queued work
+    chunk_size = max(1, len(sigmas) // (processes * 4))
+    chunks     = [sigmas[i:i + chunk_size] for i in range(0, len(sigmas), chunk_size)]
+    # Forked workers inherit `_SIEVE` instead of rebuilding it
+    executor   = ProcessPoolExecutor(max_workers=processes, mp_context=multiprocessing.get_context('fork'))
+    pending    = set()
+
+    try:
+        pending = {executor.submit(_ecm_worker, n, chunk, B1, B2) for chunk in chunks}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                g = future.result()
+                if g:
+                    return g
+    finally:
+        for future in pending:
+            future.cancel()
+
+        executor.shutdown(wait=False)
+
+    return None
@@ -0,0 +1,305 @@
+from samson.math.algebra.rings.ring import RingElement
+from samson.math.algebra.curves.jacobian import JACOBIAN_INFINITY, jacobian_add_affine, batch_to_affine, to_affine
+from types import FunctionType
+import json
+import os
+
+
+class FixedBaseTable(object):
+    """
+    Fixed-base windowed precomputation. For the `i`-th `width`-bit window of the multiplier, the table holds
+    `j * 2**(width*i)` applications of `operation` to `element` for every digit `j`. Calculating only needs
+    one operation per nonzero window and no doublings.
+
+    Examples:
+        >>> from samson.math.fixed_base_table import FixedBaseTable
+        >>> table = FixedBaseTable(3, 0, lambda a, b: a + b, 16)
+        >>> table * 1000
+        3000
+
+    """
+
+    def __init__(self, element: RingElement, start: RingElement, operation: FunctionType, bits: int, width: int=4, filepath: str=None):
+        """
+        Parameters:
+            element (RingElement): Fixed base.
+            start   (RingElement): Identity of `operation`.
+            operation      (func): Operation to precompute.
+            bits            (int): Maximum bit length of multipliers.
+            width           (int): Window width in bits.
+            filepath        (str): If given, the table is loaded from this file when it matches, and written to it otherwise.
+        """
+        self.element   = element
+        self.start     = start
+        self.operation = operation
+        self.bits      = bits
+        self.width     = width
+        self.table     = None
+
+        if not (filepath and self.load(filepath)):
+            self.rebuild_table()
+
+            if filepath:
+                self.save(filepath)
+
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__}: element={self.element}, bits={self.bits}, width={self.width}>'
+
+    def __str__(self):
+        return self.__repr__()
+
+
+    def __mul__(self, other: int):
+        return self.calculate(other)
+
+    def __rmul__(self, other: int):
+        return self.calculate(other)
+
+    def __pow__(self, other: int):
+        return self.calculate(other)
+
+    def __rpow__(self, other: int):
+        return self.calculate(other)
+
+
+    @property
+    def num_windows(self) -> int:
+        return (self.bits + self.width - 1) // self.width
+
+
+    def covers(self, multiplier: int) -> bool:
+        """
+        Determines whether `multiplier` can be calculated with the table.
+
+        Parameters:
+            multiplier (int): Multiplier.
+
+        Returns:
+            bool: Whether it's in range.
+        """
+        return 0 <= multiplier and multiplier.bit_length() <= self.bits
+
+
+    def rebuild_table(self):
+        """
+        Rebuilds the internal table.
+        """
+        op    = self.operation
+        base  = self.element
+        table = []
+
+        for _ in range(self.num_windows):
+            row = [self.start, base]
+            for _ in range(2, 1 << self.width):
+                row.append(op(row[-1], base))
+
+            table.append(row)
+            base = op(row[-1], base)
+
+        self.table = table
+
+
+    def calculate(self, multiplier: int) -> RingElement:
+        """
+        Calculates the result using the table.
+
+        Parameters:
+            multiplier (int): Multiplier in [0, 2**`bits`).
+
+        Returns:
+            RingElement: Result.
+        """
+        if not self.covers(multiplier):
+            raise ValueError(f"Multiplier must be non-negative and at most {self.bits} bits")
+
+        mask   = (1 << self.width) - 1
+        width  = self.width
+        op     = self.operation
+        result = self.start
+
+        for row in self.table:
+            digit = multiplier & mask
+            if digit:
+                result = op(result, row[digit])
+
+            multiplier >>= width
+
+        return result
+
+
+    def fingerprint(self) -> object:
+        """
+        Identifies the base and group for serialization. Subclasses return JSON-serializable values.
+
+        Returns:
+            object: Fingerprint.
+        """
+        return repr(self.element)
+
+
+    def save(self, filepath: str):
+        """
+        Writes the table to `filepath` as JSON. Only tables of JSON-serializable values can be saved.
+
+        Parameters:
+            filepath (str): Path to write to.
+        """
+        with open(filepath, 'w') as f:
+            json.dump({'fingerprint': self.fingerprint(), 'bits': self.bits, 'width': self.width, 'table': self.table}, f)
+
+
+    def load(self, filepath: str) -> bool:
+        """
+        Loads the table from `filepath` if it exists and was built for the same base, bits, and width.
+
+        Parameters:
+            filepath (str): Path to read from.
+
+        Returns:
+            bool: Whether the table was loaded.
+        """
+        if not os.path.exists(filepath):
+            return False
+
+        with open(filepath) as f:
+            try:
+                params = json.load(f)
+            except ValueError:
+                return False
+
+        if params.get('fingerprint') != self.fingerprint() or params.get('bits') != self.bits or params.get('width') != self.width:
+            return False
+
+        self.table = params['table']
+        return True
+
+
+
+class ModularFixedBaseTable(FixedBaseTable):
+    """
+    Fixed-base table for exponentiating an integer base modulo `modulus`.
+
+    Examples:
+        >>> from samson.math.fixed_base_table import ModularFixedBaseTable
+        >>> table = ModularFixedBaseTable(2, 1000003, 20)
+        >>> table ** 123456 == pow(2, 123456, 1000003)
+        True
+
+    """
+
+    def __init__(self, element: int, modulus: int, bits: int, width: int=4, filepath: str=None):
+        """
+        Parameters:
+            element  (int): Base.
+            modulus  (int): Modulus.
+            bits     (int): Maximum bit length of exponents.
+            width    (int): Window width in bits.
+            filepath (str): Optional path to load/save the table.
+        """
+        self.modulus = modulus
+        super().__init__(element % modulus, 1, lambda a, b: a * b % modulus, bits, width, filepath)
+
+
+    def fingerprint(self) -> object:
+        return [self.element, self.modulus]
+
+
+    def calculate(self, multiplier: int) -> int:
+        if not self.covers(multiplier):
+            raise ValueError(f"Exponent must be non-negative and at most {self.bits} bits")
+
+        mask   = (1 << self.width) - 1
+        width  = self.width
+        p      = self.modulus
+        result = 1
+
+        for row in self.table:
+            digit = multiplier & mask
+            if digit:
+                result = result * row[digit] % p
+
+            multiplier >>= width
+
+        return result
+
+
+
+class WeierstrassFixedBaseTable(FixedBaseTable):
+    """
+    Fixed-base table for a point on a Weierstrass curve over an integer quotient ring. Entries are stored as
+    affine integer pairs and accumulated with mixed Jacobian addition.
+
+    Examples:
+        >>> from samson.math.fixed_base_table import WeierstrassFixedBaseTable
+        >>> from samson.math.algebra.curves.named import P256
+        >>> table = WeierstrassFixedBaseTable(P256.G, 256)
+        >>> table * 12345 == P256.G * 12345
+        True
+
+    """
+
+    def __init__(self, element: object, bits: int, width: int=4, filepath: str=None):
+        """
+        Parameters:
+            element (WeierstrassPoint): Base point. Its curve must have `int_params`.
+            bits                 (int): Maximum bit length of scalars.
+            width                (int): Window width in bits.
+            filepath             (str): Optional path to load/save the table.
+        """
+        if not element.curve.int_params:
+            raise ValueError("Curve must be defined over an integer quotient ring")
+
+        self.curve = element.curve
+        super().__init__(element, element.curve.POINT_AT_INFINITY, element.__class__.__add__, bits, width, filepath)
+
+
+    def fingerprint(self) -> object:
+        return [int(self.element.x), int(self.element.y), *self.curve.int_params]
+
+
+    def rebuild_table(self):
+        a, p  = self.curve.int_params
+        base  = (int(self.element.x), int(self.element.y))
+        table = []
+
+        for _ in range(self.num_windows):
+            # Multiples 1..2**width of `base`; the last one is the next window's base
+            row = [(base[0], base[1], 1)]
+            for _ in range(1, 1 << self.width):
+                row.append(jacobian_add_affine(row[-1], base, a, p))
+
+            finite = [point for point in row if point[2]]
+            affine = iter(batch_to_affine(finite, p)) if finite else iter([])
+            row    = [next(affine) if point[2] else None for point in row]
+
+            table.append([None] + row[:-1])
+
+            # The base's order divides 2**(width*i); every later entry is infinity
+            if row[-1] is None:
+                table.extend([[None]*(1 << self.width) for _ in range(self.num_windows - len(table))])
+                break
+
+            base = row[-1]
+
+        self.table = table
+
+
+    def calculate(self, multiplier: int) -> object:
+        if not self.covers(multiplier):
+            raise ValueError(f"Scalar must be non-negative and at most {self.bits} bits")
+
+        a, p   = self.curve.int_params
+        mask   = (1 << self.width) - 1
+        width  = self.width
+        result = JACOBIAN_INFINITY
+
+        for row in self.table:
+            digit = multiplier & mask
+            if digit and row[digit]:
+                result = jacobian_add_affine(result, row[digit], a, p)
+
+            multiplier >>= width
+
+        x, y = to_affine(result, p)
+        return self.element.__class__(x, y, self.curve)
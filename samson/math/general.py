@@ -78,6 +78,7 @@ def frobenius_monomial_base(poly: object) -> list:
     References:
         https://github.com/sympy/sympy/blob/d1301c58be7ee4cd12fd28f1c5cd0b26322ed277/sympy/polys/galoistools.py
     """
+    from samson.math.polynomial import Modulus
     from samson.math.symbols import oo
 
     n = poly.degree()
@@ -90,8 +91,9 @@ def frobenius_monomial_base(poly: object) -> list:
     bases[0] = P.one()
 
     if q < n:
+        modulus = Modulus(poly)
         for i in range(1, n):
-            bases[i] = (bases[i-1] << q) % poly
+            bases[i] = (bases[i-1] << q) % modulus
 
     elif n > 1:
         R = P/poly
@@ -288,6 +290,22 @@ def mod_inv(a: int, n: int) -> int:
     """
     from samson.math.algebra.rings.integer_ring import ZZ
 
+    # Plain integers run the extended Euclidean algorithm directly instead of through the ring
+    if type(a) is int and type(n) is int:
+        r, next_r = a % n, n
+        x, next_x = 1, 0
+
+        while next_r:
+            q         = r // next_r
+            r, next_r = next_r, r - q*next_r
+            x, next_x = next_x, x - q*next_x
+
+        if r != 1:
+            raise NotInvertibleException("'a' is not invertible", parameters={'a': a, 'n': n})
+
+        return x % n
+
+
     # For convenience
     peel_ring = False
     if type(a) is int:
@@ -390,6 +408,153 @@ def fast_mul(a: int, b: int, s: int=None) -> int:
     return s
 
 
+# Beyond this many terms, Shamir's subset table (2**n entries) is larger than Pippenger's buckets
+SHAMIR_MAX_TERMS = 4
+
+def _shamir(terms: list, op: FunctionType) -> object:
+    table = [None] * (1 << len(terms))
+    for i, (elem, _) in enumerate(terms):
+        idx        = 1 << i
+        table[idx] = elem
+        for mask in range(1, idx):
+            table[mask | idx] = op(table[mask], elem)
+
+    result = None
+    for bit in reversed(range(max([k.bit_length() for _, k in terms]))):
+        if result is not None:
+            result = op(result, result)
+
+        idx = 0
+        for i, (_, k) in enumerate(terms):
+            idx |= ((k >> bit) & 1) << i
+
+        if idx:
+            result = table[idx] if result is None else op(result, table[idx])
+
+    return result
+
+
+def _pippenger(terms: list, op: FunctionType) -> object:
+    c      = max(2, len(terms).bit_length() - 2)
+    mask   = (1 << c) - 1
+    bits   = max([k.bit_length() for _, k in terms])
+    result = None
+
+    for shift in reversed(range(0, bits, c)):
+        if result is not None:
+            for _ in range(c):
+                result = op(result, result)
+
+        buckets = [None] * (mask + 1)
+        for elem, k in terms:
+            d = (k >> shift) & mask
+            if d:
+                buckets[d] = elem if buckets[d] is None else op(buckets[d], elem)
+
+        running = total = None
+        for bucket in reversed(buckets[1:]):
+            if bucket is not None:
+                running = bucket if running is None else op(running, bucket)
+
+            if running is not None:
+                total = running if total is None else op(total, running)
+
+        if total is not None:
+            result = total if result is None else op(result, total)
+
+    return result
+
+
+def _multi_op(elements: list, multipliers: list, op: FunctionType, invert: FunctionType) -> object:
+    terms = []
+    for elem, k in zip(elements, multipliers):
+        if k < 0:
+            elem, k = invert(elem), -k
+
+        if k:
+            terms.append((elem, k))
+
+    if not terms:
+        return None
+
+    if len(terms) <= SHAMIR_MAX_TERMS:
+        return _shamir(terms, op)
+    else:
+        return _pippenger(terms, op)
+
+
+
+def multi_scalar_mul(points: list, scalars: list, s: object=None) -> object:
+    """
+    Computes `sum(k*P)` over arbitrary additive groups. Uses Shamir's trick for up to `SHAMIR_MAX_TERMS` terms
+    and Pippenger's bucket method beyond that. Points on a Weierstrass curve over an integer quotient ring are
+    computed in Jacobian coordinates.
+
+    Parameters:
+        points  (list): Group elements.
+        scalars (list): Integer multipliers.
+        s     (object): The 'zero' value of the group.
+
+    Returns:
+        object: Sum of multiples.
+
+    Examples:
+        >>> from samson.math.general import multi_scalar_mul
+        >>> multi_scalar_mul([3, 5, 7], [10, -4, 2], 0)
+        24
+
+        >>> from samson.math.algebra.curves.named import P256
+        >>> multi_scalar_mul([P256.G, P256.G * 2], [5, 7]) == P256.G * 19
+        True
+
+    References:
+        https://cr.yp.to/papers/pippenger.pdf
+    """
+    points, scalars = list(points), list(scalars)
+    curve = getattr(points[0], 'curve', None) if points else None
+
+    if getattr(curve, 'int_params', None) and all([getattr(P, 'curve', None) is curve for P in points]):
+        from samson.math.algebra.curves.jacobian import multi_scalar_mul as jacobian_multi_scalar_mul
+        a, p = curve.int_params
+        x, y = jacobian_multi_scalar_mul([(int(P.x), int(P.y)) for P in points], [int(k) for k in scalars], a, p)
+        return points[0].__class__(x, y, curve)
+
+    if s is None:
+        s = points[0].ring.zero()
+
+    result = _multi_op(points, scalars, lambda a, b: a + b, lambda a: -a)
+    return s if result is None else s + result
+
+
+
+def multi_pow(bases: list, exponents: list, s: object=None) -> object:
+    """
+    Computes `product(g**u)` over arbitrary multiplicative groups with the same methods as `multi_scalar_mul`.
+
+    Parameters:
+        bases     (list): Group elements.
+        exponents (list): Integer exponents.
+        s       (object): The 'one' value of the group.
+
+    Returns:
+        object: Product of powers.
+
+    Examples:
+        >>> from samson.math.general import multi_pow
+        >>> from samson.math.algebra.all import ZZ
+        >>> Zp = ZZ/ZZ(1000003)
+        >>> multi_pow([Zp(2), Zp(3)], [1000, 2000]) == Zp(2)**1000 * Zp(3)**2000
+        True
+
+    """
+    bases, exponents = list(bases), list(exponents)
+    if s is None:
+        s = bases[0].ring.one()
+
+    result = _multi_op(bases, exponents, lambda a, b: a * b, lambda a: ~a)
+    return s if result is None else s * result
+
+
 def kth_root(n: int, k: int) -> int:
     """
     Calculates the `k`-th integer root of `n`.
@@ -810,16 +975,21 @@ def gram_schmidt(matrix: object, normalize: bool=True) -> object:
 
 
 
-def lll(in_basis: list, delta: float=0.75) -> object:
+def lll(in_basis: object, delta: float=0.75, use_fp: bool=True, progress_func: FunctionType=None) -> object:
     """
     Performs the Lenstra–Lenstra–Lovász lattice basis reduction algorithm.
 
+    The basis is scaled to integers and reduced with an exact integral LLL. Bases with small entries are first
+    reduced with an incremental floating-point LLL (see `samson.math.lattice_reduction`).
+
     Parameters:
-        in_basis (list): List of Matrix objects representing the original basis.
-        delta   (float): Minimum optimality of the reduced basis.
+        in_basis     (Matrix): Matrix of row vectors over ZZ or QQ, or a list of integer rows.
+        delta         (float): Minimum optimality of the reduced basis.
+        use_fp         (bool): Whether or not to try floating-point arithmetic before the exact algorithm.
+        progress_func  (func): (Optional) Called with `(k, n)` after each iteration.
 
     Returns:
-        Matrix: Reduced basis.
+        Matrix: Reduced basis. If `in_basis` is a list, returns a list of integer rows.
 
     Examples:
         >>> from samson.math.general import lll
@@ -831,63 +1001,46 @@ def lll(in_basis: list, delta: float=0.75) -> object:
         [ Frac(ZZ)(ZZ(3)/ZZ(1)),  Frac(ZZ)(ZZ(2)/ZZ(1)),  Frac(ZZ)(ZZ(1)/ZZ(1)),  Frac(ZZ)(ZZ(0)/ZZ(1))]
         [Frac(ZZ)(ZZ(-2)/ZZ(1)),  Frac(ZZ)(ZZ(0)/ZZ(1)),  Frac(ZZ)(ZZ(2)/ZZ(1)),  Frac(ZZ)(ZZ(4)/ZZ(1))]>
 
+        >>> lll([[1, 2, 3, 4], [5, 6, 7, 8]])
+        [[3, 2, 1, 0], [-2, 0, 2, 4]]
+
     References:
-        https://github.com/orisano/olll/blob/master/olll.py
+        "A Course in Computational Algebraic Number Theory" (Cohen), Algorithm 2.6.7
+        "Floating-Point LLL Revisited" (Nguyen, Stehlé)
         https://en.wikipedia.org/wiki/Lenstra%E2%80%93Lenstra%E2%80%93Lov%C3%A1sz_lattice_basis_reduction_algorithm
     """
-    from samson.utilities.exceptions import CoercionException
-    from samson.math.matrix import Matrix
-    from samson.math.dense_vector import DenseVector
-    from samson.math.algebra.fields.fraction_field import FractionField
-
-    def matrix_to_vecs(matrix):
-        return [DenseVector(row) for row in matrix.rows]
+    from samson.math.lattice_reduction import lll_reduce, reduce_basis
 
-    def vecs_to_matrix(vecs):
-        return Matrix([vec.values for vec in vecs])
+    return reduce_basis(in_basis, lambda basis: lll_reduce(basis, delta, use_fp, progress_func))
 
 
 
-    if type(in_basis.coeff_ring) is not FractionField:
-        R = FractionField(in_basis.coeff_ring)
-        in_basis = Matrix([[R(elem) for elem in row] for row in in_basis.rows], coeff_ring=R)
-
-    R     = in_basis.coeff_ring
-    basis = deepcopy(in_basis)
-    n     = len(basis)
-    basis = matrix_to_vecs(basis)
-    ortho = gram_schmidt(in_basis, False)
-    ortho = matrix_to_vecs(ortho)
-
-    def mu(i, j):
-        return float(ortho[j].dot(basis[i]) / ortho[j].dot(ortho[j]))
+def bkz(in_basis: object, block_size: int=10, delta: float=0.99, max_tours: int=None, progress_func: FunctionType=None) -> object:
+    """
+    Performs Block Korkine-Zolotarev lattice basis reduction. Produces shorter bases than `lll` at the cost of
+    enumerating each block of `block_size` vectors.
 
-    k = 1
-    while k < n:
-        for j in reversed(range(k)):
-            mu_kj = mu(k, j)
-            if abs(mu_kj) > 0.5:
-                scalar = round(mu_kj)
+    Parameters:
+        in_basis     (Matrix): Matrix of row vectors over ZZ or QQ, or a list of integer rows.
+        block_size      (int): Size of the blocks to enumerate.
+        delta         (float): Minimum optimality of the reduced basis.
+        max_tours       (int): (Optional) Maximum number of passes over the basis.
+        progress_func  (func): (Optional) Called with `(k, n)` after each block.
 
-                # Attempt coercion for ring-specific speed-ups
-                try:
-                    scalar = R(scalar)
-                except CoercionException:
-                    pass
+    Returns:
+        Matrix: Reduced basis. If `in_basis` is a list, returns a list of integer rows.
 
-                basis[k] -= basis[j] * scalar
-                ortho = gram_schmidt(vecs_to_matrix(basis), False)
-                ortho = matrix_to_vecs(ortho)
+    Examples:
+        >>> from samson.math.general import bkz
+        >>> bkz([[1, 0, 0, 1345], [0, 1, 0, 35], [0, 0, 1, 154]], block_size=3)
+        [[1, 1, -9, -6], [0, 9, -2, 7], [1, -3, -8, 8]]
 
-        if ortho[k].dot(ortho[k]) >= (delta - mu(k, k - 1)**2) * (ortho[k - 1].dot(ortho[k - 1])):
-            k += 1
-        else:
-            basis[k], basis[k - 1] = deepcopy(basis[k - 1]), deepcopy(basis[k])
-            ortho = gram_schmidt(vecs_to_matrix(basis), False)
-            ortho = matrix_to_vecs(ortho)
-            k = max(k - 1, 1)
+    References:
+        "Lattice Basis Reduction: Improved Practical Algorithms and Solving Subset Sum Problems" (Schnorr, Euchner)
+    """
+    from samson.math.lattice_reduction import bkz_reduce, reduce_basis
 
-    return vecs_to_matrix(basis)
+    return reduce_basis(in_basis, lambda basis: bkz_reduce(basis, block_size, delta, max_tours, progress_func))
 
 
 def generate_superincreasing_seq(length: int, max_diff: int, starting: int=0) -> list:
@@ -1542,24 +1695,38 @@ def bsgs(g: object, h: object, end: int, e: object=None, start: int=0) -> int:
         24
 
     """
+    from samson.math.discrete_log import element_key
+
     search_range = end - start
-    table        = {}
     m            = kth_root(search_range, 2)
 
     if not e:
         e = g.ring.zero()
 
+    # Only store 64-bit keys and indices; elements can be recomputed to rule out key collisions
+    e0       = e
+    table    = {}
+    overflow = {}
+
     for i in range(m):
-        table[e] = i
+        key = element_key(e)
+        if key in table:
+            overflow.setdefault(key, []).append(i)
+        else:
+            table[key] = i
+
         e += g
 
     factor = g * m
     o = g * start
     e = h
     for i in range(m):
-        e = h - o
-        if e in table:
-            return i*m + table[e] + start
+        e   = h - o
+        key = element_key(e)
+        if key in table:
+            for j in [table[key]] + overflow.get(key, []):
+                if e0 + g*j == e:
+                    return i*m + j + start
 
         o += factor
 
@@ -1567,15 +1734,20 @@ def bsgs(g: object, h: object, end: int, e: object=None, start: int=0) -> int:
 
 
 
-def pohlig_hellman(g: object, h: object, n: int, factors: dict=None) -> int:
+# Largest prime subgroup order (in bits) `pohlig_hellman` solves with BSGS
+BSGS_MAX_BITS = 32
+
+def pohlig_hellman(g: object, h: object, n: int, factors: dict=None, processes: int=1) -> int:
     """
-    Computes the discrete logarithm for finite abelian groups with a smooth order.
+    Computes the discrete logarithm for finite abelian groups with a smooth order. Prime-order subgroups larger
+    than `BSGS_MAX_BITS` bits are solved with distinguished-point Pollard's rho instead of BSGS.
 
     Parameters:
-        g     (object): Generator element.
-        h     (object): Result to find discrete logarithm of.
-        n        (int): Order of the group.
-        factors (dict): `n`'s factorization.
+        g       (object): Generator element.
+        h       (object): Result to find discrete logarithm of.
+        n          (int): Order of the group.
+        factors   (dict): `n`'s factorization. Found with ECM enabled if not given.
+        processes  (int): Number of worker processes for subgroups solved with Pollard's rho.
 
     Returns:
         int: The discrete logarithm of `h` given `g`.
@@ -1612,8 +1784,11 @@ def pohlig_hellman(g: object, h: object, n: int, factors: dict=None) -> int:
     References:
         https://en.wikipedia.org/wiki/Pohlig%E2%80%93Hellman_algorithm
     """
+    from samson.math.discrete_log import pollards_rho_log
+
+    # Group orders often have 40-60 bit cofactors that rho alone is slow on
     if not factors:
-        factors = factor(n)
+        factors = factor(n, use_ecm=True)
 
     x = [0] * len(factors)
 
@@ -1622,7 +1797,12 @@ def pohlig_hellman(g: object, h: object, n: int, factors: dict=None) -> int:
         for k in range(e):
             g_k   = g * x[i]
             h_k   = (h + -g_k) * (n // p**(k+1))
-            d_k   = bsgs(gamma, h_k, p)
+
+            if p.bit_length() > BSGS_MAX_BITS:
+                d_k = pollards_rho_log(gamma, h_k, p, processes=processes)
+            else:
+                d_k = bsgs(gamma, h_k, p)
+
             x[i] += d_k * p**k
 
     return crt(list(zip(x, [p**e for p, e in  factors.items()])))[0]
@@ -1932,12 +2112,13 @@ def is_prime(n: int) -> bool:
     return miller_rabin(n, bases=[2]) and is_strong_lucas_pseudoprime(n)
 
 
-def pollards_rho(n: int) -> int:
+def pollards_rho(n: int, iterations: int=None) -> int:
     """
     Uses Pollard's rho to find a factor of `n`.
 
     Parameters:
-        n (int): Integer to factor.
+        n          (int): Integer to factor.
+        iterations (int): (Optional) Maximum number of iterations before raising `ProbabilisticFailureException`.
     
     Returns:
         int: Factor of `n`.
@@ -1957,6 +2138,12 @@ def pollards_rho(n: int) -> int:
     mod = 1
 
     while factor == 1:
+        if iterations is not None:
+            if iterations <= 0:
+                raise ProbabilisticFailureException("Factor not found")
+
+            iterations -= cycle_size
+
         count = 1
         while count <= cycle_size and factor <= 1:
             x = (x*x + mod) % n
@@ -1974,13 +2161,18 @@ def pollards_rho(n: int) -> int:
     return factor
 
 
-def ecm(n: int, attempts: int=None) -> int:
+def ecm(n: int, attempts: int=None, B1: int=None, B2: int=None, processes: int=None) -> int:
     """
-    Uses Lenstra's Elliptic Curve Method to probabilistically find a factor of `n`.
+    Uses Lenstra's Elliptic Curve Method to probabilistically find a factor of `n`. Curves are Montgomery curves
+    from Suyama's parameterization in projective (X:Z) coordinates, and each runs a baby-step/giant-step stage 2
+    up to `B2`. See `samson.math.ecm`.
 
     Parameters:
-        n        (int): Integer to factor.
-        attempts (int): Number of attempts to perform.
+        n         (int): Integer to factor.
+        attempts  (int): Maximum number of curves to try.
+        B1        (int): Stage 1 bound. Defaults to increasing levels from `samson.math.ecm.ECM_LEVELS`.
+        B2        (int): Stage 2 bound. Defaults to 100*`B1`.
+        processes (int): Number of worker processes for expensive levels. Defaults to `os.cpu_count()`.
     
     Returns:
         int: Factor of `n`.
@@ -1990,40 +2182,17 @@ def ecm(n: int, attempts: int=None) -> int:
         >>> ecm(26515460203326943826)
         2
 
-    """
-    from samson.math.algebra.rings.integer_ring import ZZ
-    from samson.math.algebra.curves.weierstrass_curve import WeierstrassCurve
-
-    if not attempts:
-        attempts = max(kth_root(n, 4), 10)
-
-    ring = ZZ/ZZ(n)
-    for a in range(attempts):
-        while True:
-            x = random_int(n)
-            y = random_int(n)
-            a = random_int(n)
-            b = (y**2 - x**3 - (a * x)) % n
-
-            g = gcd(4 * a**3 - 27 * b**2, n)
-            if g != n:
-                break
-
-        # Free factor!
-        if g > 1:
-            return g
+        >>> ecm(1000000007 * 998244353) in [1000000007, 998244353]
+        True
 
-        curve = WeierstrassCurve(a=a, b=b, ring=ring, base_tuple=(x, y))
-        curr  = curve.G
-        for fac in range(2, 64):
-            try:
-                curr *= fac
-            except NotInvertibleException as e:
-                return int(gcd(e.parameters['a'], n))
+    """
+    from samson.math.ecm import run_ecm
+    return run_ecm(n, attempts=attempts, B1=B1, B2=B2, processes=processes)
 
-    raise ProbabilisticFailureException("Factor not found")
 
 
+# Pollard's rho finds small factors cheaply but stalls on large ones, where ECM takes over
+RHO_ITERATIONS_BEFORE_ECM = 2**16
 
 def factor(n: int, use_trial: bool=True, use_rho: bool=True, use_ecm: bool=False, ecm_attempts: int=None, limit: int=1000, visual: bool=False) -> list:
     """
@@ -2034,7 +2203,7 @@ def factor(n: int, use_trial: bool=True, use_rho: bool=True, use_ecm: bool=False
         use_trial   (bool): Whether or not to use trial division.
         use_rho     (bool): Whether or not to use Pollard's rho factorization.
         use_ecm     (bool): Whether or not to use ECM factorization.
-        ecm_attempts (int): Maximum number of ECM attempts before giving up. Defaults to kth_root(n, 4).
+        ecm_attempts (int): Maximum number of ECM curves before giving up. Defaults to the levels in `samson.math.ecm.ECM_LEVELS`.
         limit        (int): Upper limit of factors tried in trial division.
         visual      (bool): Whether or not to display progress bar.
 
@@ -2093,14 +2262,22 @@ def factor(n: int, use_trial: bool=True, use_rho: bool=True, use_ecm: bool=False
 
         if use_rho and not (n == 1 or is_prime(n)):
             # Pollard's rho
+            rho_iterations = RHO_ITERATIONS_BEFORE_ECM if use_ecm else None
             while not is_prime(n):
-                n_fac = pollards_rho(n)
+                try:
+                    n_fac = pollards_rho(n, iterations=rho_iterations)
+                except ProbabilisticFailureException:
+                    break
+
                 if n_fac == n:
                     break
 
-                add_or_increment(factors, n_fac)
-                progress_update(n_fac)
-                n //= n_fac
+                # Rho's factor isn't necessarily prime either
+                for fac, exp in factor(n_fac, use_trial=False, use_ecm=use_ecm).items():
+                    for _ in range(exp):
+                        add_or_increment(factors, fac)
+                        progress_update(fac)
+                        n //= fac
 
         if use_ecm and not (n == 1 or is_prime(n)):
             # Lenstra's ECM
@@ -2109,10 +2286,11 @@ def factor(n: int, use_trial: bool=True, use_rho: bool=True, use_ecm: bool=False
                     n_fac = ecm(n, attempts=ecm_attempts)
 
                     # ECM will give a factor, but not necessarily a prime
-                    for fac in factor(n_fac):
-                        add_or_increment(factors, fac)
-                        progress_update(fac)
-                        n //= fac
+                    for fac, exp in factor(n_fac, use_trial=False, use_ecm=use_ecm, ecm_attempts=ecm_attempts).items():
+                        for _ in range(exp):
+                            add_or_increment(factors, fac)
+                            progress_update(fac)
+                            n //= fac
                 except ProbabilisticFailureException:
                     break
 
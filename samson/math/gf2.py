@@ -0,0 +1,533 @@
+# Linear algebra and polynomial arithmetic over GF(2) on Python integers. A polynomial is an int whose bit `i` is
+# the coefficient of x^i, and a linear equation is an int whose bit `i` is the coefficient of variable `i`.
+from types import FunctionType
+
+
+def popcount(a: int) -> int:
+    """
+    Counts the set bits of `a`. Stands in for `int.bit_count`, which needs Python 3.10.
+
+    Parameters:
+        a (int): Nonnegative integer.
+
+    Returns:
+        int: Number of set bits.
+
+    Examples:
+        >>> from samson.math.gf2 import popcount
+        >>> popcount(0b1011)
+        3
+
+    """
+    return bin(a).count('1')
+
+
+
+def poly_square(a: int) -> int:
+    """
+    Squares a GF(2) polynomial by spreading its bits apart.
+
+    Parameters:
+        a (int): Polynomial.
+
+    Returns:
+        int: `a`^2.
+
+    Examples:
+        >>> from samson.math.gf2 import poly_square
+        >>> bin(poly_square(0b1011))
+        '0b1000101'
+
+    """
+    return int('0'.join(bin(a)[2:]), 2) if a else 0
+
+
+
+def poly_mul(a: int, b: int) -> int:
+    """
+    Multiplies two GF(2) polynomials.
+
+    Parameters:
+        a (int): Polynomial.
+        b (int): Polynomial.
+
+    Returns:
+        int: Product.
+
+    Examples:
+        >>> from samson.math.gf2 import poly_mul
+        >>> bin(poly_mul(0b11, 0b101))
+        '0b1111'
+
+    """
+    if popcount(a) < popcount(b):
+        a, b = b, a
+
+    result = 0
+    while b:
+        low     = b & -b
+        result ^= a << (low.bit_length() - 1)
+        b      ^= low
+
+    return result
+
+
+
+def poly_mod(a: int, f: int) -> int:
+    """
+    Reduces the GF(2) polynomial `a` modulo `f`. Folds whole blocks of high coefficients back at once, so sparse
+    moduli (e.g. trinomials or the characteristic polynomials of twisted GFSRs) reduce in a few passes.
+
+    Parameters:
+        a (int): Polynomial.
+        f (int): Nonzero modulus.
+
+    Returns:
+        int: `a` mod `f`.
+
+    Examples:
+        >>> from samson.math.gf2 import poly_mod
+        >>> bin(poly_mod(0b100000, 0b1011))
+        '0b111'
+
+    """
+    degree = f.bit_length() - 1
+    mask   = (1 << degree) - 1
+    low    = f & mask
+    terms  = []
+
+    while low:
+        term   = low & -low
+        terms.append(term.bit_length() - 1)
+        low   ^= term
+
+    while a.bit_length() > degree:
+        high = a >> degree
+        a   &= mask
+
+        for term in terms:
+            a ^= high << term
+
+    return a
+
+
+
+def poly_powmod(a: int, e: int, f: int) -> int:
+    """
+    Raises the GF(2) polynomial `a` to the `e`-th power modulo `f`.
+
+    Parameters:
+        a (int): Polynomial.
+        e (int): Nonnegative exponent.
+        f (int): Modulus.
+
+    Returns:
+        int: `a`^`e` mod `f`.
+
+    Examples:
+        >>> from samson.math.gf2 import poly_powmod
+        >>> # x has order 7 modulo the primitive polynomial x^3 + x + 1
+        >>> poly_powmod(0b10, 7, 0b1011)
+        1
+
+    """
+    result = poly_mod(1, f)
+    a      = poly_mod(a, f)
+
+    for bit in bin(e)[2:]:
+        result = poly_mod(poly_square(result), f)
+
+        if bit == '1':
+            result = poly_mod(result << 1, f) if a == 2 else poly_mod(poly_mul(result, a), f)
+
+    return result
+
+
+
+def berlekamp_massey(bits: list) -> int:
+    """
+    Finds the minimal polynomial of a binary linear recurrence.
+
+    Parameters:
+        bits (list): Sequence of 0s and 1s. Needs at least twice the linear complexity to be exact.
+
+    Returns:
+        int: Minimal polynomial `f` such that every element is determined by the `f.bit_length() - 1` before it.
+
+    Examples:
+        >>> from samson.math.gf2 import berlekamp_massey
+        >>> bits = [1, 0, 0]
+        >>> for _ in range(20):
+        ...     bits.append(bits[-3] ^ bits[-2])
+        >>> bin(berlekamp_massey(bits))
+        '0b1011'
+
+    References:
+        https://en.wikipedia.org/wiki/Berlekamp%E2%80%93Massey_algorithm
+    """
+    # `C` is the connection polynomial; `S` holds the sequence reversed so bit k is the element k steps back
+    C, B = 1, 1
+    L, m = 0, 1
+    S    = 0
+
+    for i, bit in enumerate(bits):
+        S = (S << 1) | bit
+
+        if popcount(C & S) & 1:
+            if 2*L <= i:
+                C, B = C ^ (B << m), C
+                L, m = i + 1 - L, 1
+            else:
+                C ^= B << m
+                m += 1
+        else:
+            m += 1
+
+    # The minimal polynomial is the reciprocal of the connection polynomial
+    return int(bin(C)[2:].zfill(L + 1)[::-1], 2)
+
+
+
+def solve(equations: list, values: list) -> int:
+    """
+    Solves a linear system over GF(2). Free variables are set to zero. Equations are reduced one at a time as they
+    arrive, which keeps sparse systems (e.g. MT19937's) sparse; dense systems are better served by `GF2Matrix.solve`.
+
+    Parameters:
+        equations (list): Equations as ints whose bit `i` is the coefficient of variable `i`.
+        values    (list): Right-hand side bits.
+
+    Returns:
+        int: Solution whose bit `i` is the value of variable `i`.
+
+    Examples:
+        >>> from samson.math.gf2 import solve
+        >>> # x0 ^ x1 = 1, x1 = 1, x1 ^ x2 = 0
+        >>> bin(solve([0b011, 0b010, 0b110], [1, 1, 0]))
+        '0b110'
+
+    """
+    # Augment each equation with its value in bit 0 and reduce to echelon form by leading bit
+    pivots = {}
+    for equation, value in zip(equations, values):
+        row = (equation << 1) | value
+
+        while row > 1:
+            leading = row.bit_length() - 1
+            pivot   = pivots.get(leading)
+
+            if pivot is None:
+                pivots[leading] = row
+                break
+
+            row ^= pivot
+
+        if row == 1:
+            raise ValueError("System of equations is inconsistent")
+
+    # Every pivot row only involves variables below its leading one, so solve from the bottom up
+    solution = 0
+    for leading in sorted(pivots):
+        row = pivots[leading]
+        if (popcount(row & solution) ^ row) & 1:
+            solution |= 1 << leading
+
+    return solution >> 1
+
+
+
+class GF2Matrix(object):
+    """
+    Bit-packed matrix over GF(2). Each row is an int whose bit `i` is the entry in column `i`.
+    """
+
+    def __init__(self, rows: list, num_cols: int):
+        """
+        Parameters:
+            rows     (list): Rows as ints.
+            num_cols  (int): Number of columns.
+        """
+        self.rows     = list(rows)
+        self.num_cols = num_cols
+
+
+    def __repr__(self):
+        return f"<GF2Matrix: num_rows={len(self.rows)}, num_cols={self.num_cols}>"
+
+    def __str__(self):
+        return '\n'.join(bin(row)[2:].zfill(self.num_cols)[::-1] for row in self.rows)
+
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+
+    def __getitem__(self, idx: int) -> int:
+        return self.rows[idx]
+
+
+    def __eq__(self, other: 'GF2Matrix') -> bool:
+        return type(self) == type(other) and self.num_cols == other.num_cols and self.rows == other.rows
+
+
+    def __mul__(self, vector: int) -> int:
+        """
+        Multiplies the matrix by the column vector `vector`.
+        """
+        result = 0
+        for i, row in enumerate(self.rows):
+            result |= (popcount(row & vector) & 1) << i
+
+        return result
+
+
+
+    def rref(self, k: int=None, reduced: bool=True) -> ('GF2Matrix', list):
+        """
+        Computes the reduced row echelon form using the Method of Four Russians (M4RI). Columns are processed in
+        strips of `k`; the strip's pivot rows are combined into a table of all their 2^`k` sums, so every other row
+        is cleared of the whole strip with a single lookup and XOR.
+
+        Parameters:
+            k        (int): Strip width. Defaults to roughly 3/4 of log2 of the number of rows.
+            reduced (bool): Whether to also clear pivot columns above each pivot. If False, stops at row echelon form.
+
+        Returns:
+            (GF2Matrix, list): The nonzero rows in (R)REF and their pivot columns (highest column first).
+
+        Examples:
+            >>> from samson.math.gf2 import GF2Matrix
+            >>> reduced, pivots = GF2Matrix([0b110, 0b011, 0b101], 3).rref()
+            >>> [bin(row) for row in reduced.rows], pivots
+            (['0b101', '0b11'], [2, 1])
+
+        References:
+            "Efficient Multiplication of Dense Matrices over GF(2)" (https://arxiv.org/abs/0811.1714)
+        """
+        rows = [row for row in self.rows if row]
+        k    = k or max(1, min(8, len(rows).bit_length() * 3 // 4))
+
+        done_rows   = []
+        done_pivots = []
+        top         = self.num_cols
+
+        while top > 0 and rows:
+            low        = max(top - k, 0)
+            strip_mask = (1 << (top - low)) - 1
+
+            # Find a basis for the strip using only the small strip slices. Rows whose slice is already spanned are
+            # left untouched; they'll be cleared by the table below.
+            basis  = {}
+            pieces = {}
+            others = []
+            for row in rows:
+                piece = (row >> low) & strip_mask
+                while piece and piece.bit_length() - 1 in pieces:
+                    piece ^= pieces[piece.bit_length() - 1]
+
+                if piece:
+                    # New pivot: reduce the full row the same way. This happens at most `k` times per strip.
+                    lead = ((row >> low) & strip_mask).bit_length() - 1
+                    while lead in basis:
+                        row ^= basis[lead]
+                        lead = ((row >> low) & strip_mask).bit_length() - 1
+
+                    basis[lead]  = row
+                    pieces[lead] = (row >> low) & strip_mask
+                else:
+                    others.append(row)
+
+            # Back-substitute so each pivot row is zero in every other pivot column of the strip
+            leads = sorted(basis, reverse=True)
+            for lead in leads:
+                for other in leads:
+                    if other != lead and (basis[other] >> (lead + low)) & 1:
+                        basis[other] ^= basis[lead]
+
+            # Build every combination of pivot rows keyed by which pivot columns it sets
+            table = {0: 0}
+            for lead in leads:
+                bit = 1 << lead
+                for key, combo in list(table.items()):
+                    table[key | bit] = combo ^ basis[lead]
+
+            pivot_mask = sum(1 << lead for lead in leads)
+            if reduced:
+                done_rows = [row ^ table[(row >> low) & pivot_mask] for row in done_rows]
+
+            rows       = [row for row in (row ^ table[(row >> low) & pivot_mask] for row in others) if row]
+
+            done_rows   += [basis[lead] for lead in leads]
+            done_pivots += [lead + low for lead in leads]
+            top          = low
+
+        return GF2Matrix(done_rows, self.num_cols), done_pivots
+
+
+
+    def rank(self) -> int:
+        """
+        Returns:
+            int: Rank of the matrix.
+
+        Examples:
+            >>> from samson.math.gf2 import GF2Matrix
+            >>> GF2Matrix([0b110, 0b011, 0b101], 3).rank()
+            2
+
+        """
+        return len(self.rref()[1])
+
+
+
+    def solve(self, values: list) -> int:
+        """
+        Solves `self` * x = `values`. Free variables are set to zero.
+
+        Parameters:
+            values (list): Right-hand side bits (one per row).
+
+        Returns:
+            int: Solution whose bit `i` is the value of variable `i`.
+
+        Examples:
+            >>> from samson.math.gf2 import GF2Matrix
+            >>> # x0 ^ x1 = 1, x1 = 1, x1 ^ x2 = 0
+            >>> bin(GF2Matrix([0b011, 0b010, 0b110], 3).solve([1, 1, 0]))
+            '0b110'
+
+        """
+        # Augment each row with its value in column 0
+        augmented      = GF2Matrix([(row << 1) | value for row, value in zip(self.rows, values)], self.num_cols + 1)
+        echelon, leads = augmented.rref(reduced=False)
+
+        if leads and not leads[-1]:
+            raise ValueError("System of equations is inconsistent")
+
+        # Each row only involves columns below its pivot, so solve from the last row up
+        solution = 0
+        for row, lead in zip(echelon.rows[::-1], leads[::-1]):
+            if (popcount(row & solution) ^ row) & 1:
+                solution |= 1 << lead
+
+        return solution >> 1
+
+
+
+class SymbolicBits(object):
+    """
+    Word whose bits are linear equations over GF(2) in a set of variables (see `GF2Matrix`). Supports the shifts,
+    rotates, masks and XORs linear PRNGs are built from, so running a generator on `SymbolicBits` traces its outputs
+    as functions of its state. Bits that stop being linear (e.g. the carries of `+`) become None.
+
+    Examples:
+        >>> from samson.math.gf2 import SymbolicBits
+        >>> x = SymbolicBits.variables(8)
+        >>> y = x ^ ((x << 3) & 0xFF)
+        >>> [bin(eq) for eq in y.bits[:4]]
+        ['0b1', '0b10', '0b100', '0b1001']
+        >>> y.evaluate(0b10110101) == 0b10110101 ^ ((0b10110101 << 3) & 0xFF)
+        True
+
+    """
+
+    def __init__(self, bits: list):
+        """
+        Parameters:
+            bits (list): Equation of each bit (least significant first), or None if it isn't linear.
+        """
+        self.bits = bits
+
+
+    def __repr__(self):
+        return f"<SymbolicBits: width={len(self.bits)}>"
+
+    def __str__(self):
+        return self.__repr__()
+
+
+    def __len__(self) -> int:
+        return len(self.bits)
+
+
+    def __getitem__(self, idx: int) -> int:
+        return self.bits[idx] if idx < len(self.bits) else 0
+
+
+    @staticmethod
+    def variables(width: int, offset: int=0) -> 'SymbolicBits':
+        """
+        Creates a word of fresh variables.
+
+        Parameters:
+            width  (int): Number of bits.
+            offset (int): Index of the variable of the least significant bit.
+
+        Returns:
+            SymbolicBits: Word whose bit `i` is variable `offset + i`.
+        """
+        return SymbolicBits([1 << (offset + i) for i in range(width)])
+
+
+    def evaluate(self, assignment: int) -> int:
+        """
+        Evaluates the word given the variables' values.
+
+        Parameters:
+            assignment (int): Bit `i` is the value of variable `i`.
+
+        Returns:
+            int: Value of the word. Nonlinear bits are zero.
+        """
+        result = 0
+        for i, eq in enumerate(self.bits):
+            if eq is not None:
+                result |= (popcount(eq & assignment) & 1) << i
+
+        return result
+
+
+    def _combine(self, other: 'SymbolicBits', func: FunctionType) -> 'SymbolicBits':
+        if type(other) is int:
+            if other:
+                raise ValueError("Only linear operations are supported; XOR with a nonzero constant is affine")
+
+            return self
+
+        width = max(len(self.bits), len(other.bits))
+        return SymbolicBits([func(self[i], other[i]) for i in range(width)])
+
+
+    def __xor__(self, other: 'SymbolicBits') -> 'SymbolicBits':
+        return self._combine(other, lambda a, b: None if a is None or b is None else a ^ b)
+
+    __rxor__ = __xor__
+
+
+    def __or__(self, other: 'SymbolicBits') -> 'SymbolicBits':
+        # OR is only linear where at most one side can be set, e.g. the halves of a rotate
+        return self._combine(other, lambda a, b: b if a == 0 else a if b == 0 else None)
+
+    __ror__ = __or__
+
+
+    def __and__(self, mask: int) -> 'SymbolicBits':
+        return SymbolicBits([eq if (mask >> i) & 1 else 0 for i, eq in enumerate(self.bits[:mask.bit_length()])])
+
+    __rand__ = __and__
+
+
+    def __add__(self, other: 'SymbolicBits') -> 'SymbolicBits':
+        # Only the least significant bit of a sum is free of carries
+        result = self ^ other
+        return SymbolicBits(result.bits[:1] + [None] * len(result.bits))
+
+    __radd__ = __add__
+
+
+    def __lshift__(self, amount: int) -> 'SymbolicBits':
+        return SymbolicBits([0] * amount + self.bits)
+
+
+    def __rshift__(self, amount: int) -> 'SymbolicBits':
+        return SymbolicBits(self.bits[amount:])
@@ -0,0 +1,567 @@
+from fractions import Fraction
+from types import FunctionType
+
+FP_ETA            = 0.51
+FP_MAX_REDUCTIONS = 64
+FP_MAX_BITS       = 32
+
+
+def dot(v1: list, v2: list) -> int:
+    """
+    Computes the inner product of two integer vectors.
+
+    Parameters:
+        v1 (list): First vector.
+        v2 (list): Second vector.
+
+    Returns:
+        int: Inner product.
+
+    Examples:
+        >>> from samson.math.lattice_reduction import dot
+        >>> dot([1, 2, 3], [4, 5, 6])
+        32
+
+    """
+    return sum([a*b for a, b in zip(v1, v2)])
+
+
+
+def integral_lll(basis: list, delta: float=0.75, progress_func: FunctionType=None) -> list:
+    """
+    Performs exact LLL reduction using only integer arithmetic.
+    The Gram-Schmidt data is kept as the integers `d_i` and `lambda_ij` and updated in place on each reduction and swap.
+
+    Parameters:
+        basis          (list): List of linearly independent integer row vectors.
+        delta         (float): Lovász constant in (1/4, 1].
+        progress_func  (func): (Optional) Called with `(k, n)` after each iteration.
+
+    Returns:
+        list: Reduced basis.
+
+    Examples:
+        >>> from samson.math.lattice_reduction import integral_lll
+        >>> integral_lll([[1, 2, 3, 4], [5, 6, 7, 8]])
+        [[3, 2, 1, 0], [-2, 0, 2, 4]]
+
+    References:
+        "A Course in Computational Algebraic Number Theory" (Cohen), Algorithm 2.6.7
+    """
+    b     = [list(row) for row in basis]
+    n     = len(b)
+    delta = Fraction(str(delta))
+    num   = delta.numerator
+    den   = delta.denominator
+
+    # `d[i+1]` is the Gram determinant of the first `i+1` vectors
+    d   = [1] + [0]*n
+    lam = [[0]*n for _ in range(n)]
+
+    for i in range(n):
+        for j in range(i+1):
+            u = dot(b[i], b[j])
+            for l in range(j):
+                u = (d[l+1]*u - lam[i][l]*lam[j][l]) // d[l]
+
+            if j < i:
+                lam[i][j] = u
+            else:
+                if not u:
+                    raise ValueError("Basis vectors must be linearly independent")
+                d[i+1] = u
+
+
+    def reduce(k, l):
+        if 2*abs(lam[k][l]) > d[l+1]:
+            q    = (2*lam[k][l] + d[l+1]) // (2*d[l+1])
+            b[k] = [x - q*y for x, y in zip(b[k], b[l])]
+            lam[k][l] -= q*d[l+1]
+
+            for i in range(l):
+                lam[k][i] -= q*lam[l][i]
+
+
+    def swap(k):
+        b[k], b[k-1] = b[k-1], b[k]
+
+        for j in range(k-1):
+            lam[k][j], lam[k-1][j] = lam[k-1][j], lam[k][j]
+
+        l = lam[k][k-1]
+        B = (d[k-1]*d[k+1] + l*l) // d[k]
+
+        for i in range(k+1, n):
+            t = lam[i][k]
+            lam[i][k]   = (d[k+1]*lam[i][k-1] - l*t) // d[k]
+            lam[i][k-1] = (B*t + l*lam[i][k]) // d[k+1]
+
+        d[k] = B
+
+
+    k = 1
+    while k < n:
+        reduce(k, k-1)
+
+        if den*d[k+1]*d[k-1] < num*d[k]**2 - den*lam[k][k-1]**2:
+            swap(k)
+            k = max(k-1, 1)
+        else:
+            for l in reversed(range(k-1)):
+                reduce(k, l)
+            k += 1
+
+        if progress_func:
+            progress_func(k, n)
+
+    return b
+
+
+
+def fp_lll(basis: list, delta: float=0.75, progress_func: FunctionType=None) -> list:
+    """
+    Performs LLL reduction using floating-point Gram-Schmidt coefficients over an exact integer Gram matrix.
+    Only the row of coefficients for the current vector is recomputed on each step.
+
+    The result is heuristic; raises `FloatingPointError` when precision is visibly lost and `OverflowError`
+    when the entries do not fit in a float. Use `lll_reduce` for a verified result.
+
+    Parameters:
+        basis          (list): List of linearly independent integer row vectors.
+        delta         (float): Lovász constant in (1/4, 1).
+        progress_func  (func): (Optional) Called with `(k, n)` after each iteration.
+
+    Returns:
+        list: Reduced basis.
+
+    Examples:
+        >>> from samson.math.lattice_reduction import fp_lll
+        >>> fp_lll([[1, 2, 3, 4], [5, 6, 7, 8]])
+        [[3, 2, 1, 0], [-2, 0, 2, 4]]
+
+    References:
+        "Floating-Point LLL Revisited" (Nguyen, Stehlé)
+        "Lattice Basis Reduction: Improved Practical Algorithms and Solving Subset Sum Problems" (Schnorr, Euchner)
+    """
+    b     = [list(row) for row in basis]
+    n     = len(b)
+    delta = float(delta)
+    gram  = [[dot(b[i], b[j]) for j in range(n)] for i in range(n)]
+    r     = [[0.0]*n for _ in range(n)]
+    mu    = [[0.0]*n for _ in range(n)]
+
+    max_bits   = max([abs(x).bit_length() for row in b for x in row] + [1])
+    iterations = 0
+    max_iters  = 1000 + 4*n*n*max_bits
+
+
+    def compute_row(k):
+        row_r  = r[k]
+        row_mu = mu[k]
+        g_k    = gram[k]
+
+        for j in range(k):
+            s = float(g_k[j])
+            for l in range(j):
+                s -= mu[j][l]*row_r[l]
+
+            row_r[j]  = s
+            row_mu[j] = s / r[j][j]
+
+        s = float(g_k[k])
+        for j in range(k):
+            s -= row_mu[j]*row_r[j]
+
+        if s <= 0:
+            raise FloatingPointError("Gram-Schmidt norm became non-positive")
+
+        row_r[k] = s
+
+
+    def size_reduce(k):
+        for _ in range(FP_MAX_REDUCTIONS):
+            compute_row(k)
+            row_mu = mu[k]
+
+            if max([abs(x) for x in row_mu[:k]] + [0.0]) <= FP_ETA:
+                return
+
+            b_k = b[k]
+            for j in reversed(range(k)):
+                q = round(row_mu[j])
+                if q:
+                    b_k = [x - q*y for x, y in zip(b_k, b[j])]
+                    mu_j = mu[j]
+                    for l in range(j):
+                        row_mu[l] -= q*mu_j[l]
+
+            b[k] = b_k
+
+            # Keep the Gram matrix exact
+            for i in range(n):
+                gram[k][i] = gram[i][k] = dot(b_k, b[i])
+
+        raise FloatingPointError("Size reduction did not converge")
+
+
+    def swap(k):
+        b[k], b[k-1] = b[k-1], b[k]
+        gram[k], gram[k-1] = gram[k-1], gram[k]
+
+        for row in gram:
+            row[k], row[k-1] = row[k-1], row[k]
+
+
+    compute_row(0)
+    k = 1
+    while k < n:
+        iterations += 1
+        if iterations > max_iters:
+            raise FloatingPointError("Iteration limit exceeded")
+
+        size_reduce(k)
+
+        m = mu[k][k-1]
+        if delta*r[k-1][k-1] <= r[k][k] + m*m*r[k-1][k-1]:
+            k += 1
+        else:
+            swap(k)
+            k = max(k-1, 1)
+
+            if k == 1:
+                compute_row(0)
+
+        if progress_func:
+            progress_func(k, n)
+
+    return b
+
+
+
+def lll_reduce(basis: list, delta: float=0.75, use_fp: bool=True, progress_func: FunctionType=None) -> list:
+    """
+    Performs LLL reduction on an integer basis. For bases with small entries, the floating-point algorithm
+    does the bulk of the work and its output is verified (and finished if necessary) by the exact integral algorithm.
+    Bases with larger entries (e.g. knapsack and truncated LCG lattices) lose too much precision in doubles
+    and go straight to the integral algorithm.
+
+    Parameters:
+        basis          (list): List of linearly independent integer row vectors.
+        delta         (float): Lovász constant in (1/4, 1].
+        use_fp         (bool): Whether or not to try the floating-point algorithm first.
+        progress_func  (func): (Optional) Called with `(k, n)` after each iteration.
+
+    Returns:
+        list: Reduced basis.
+
+    Examples:
+        >>> from samson.math.lattice_reduction import lll_reduce
+        >>> lll_reduce([[1, 0, 0, 1345], [0, 1, 0, 35], [0, 0, 1, 154]])
+        [[0, 9, -2, 7], [1, 1, -9, -6], [1, -3, -8, 8]]
+
+    """
+    basis = [list(row) for row in basis]
+
+    if len(basis) < 2:
+        return basis
+
+    max_bits = max([abs(x).bit_length() for row in basis for x in row])
+
+    if use_fp and delta < 1 and max_bits <= FP_MAX_BITS:
+        try:
+            basis = fp_lll(basis, delta, progress_func)
+        except (FloatingPointError, OverflowError):
+            pass
+
+    return integral_lll(basis, delta, progress_func)
+
+
+
+def gso_float(basis: list) -> (list, list):
+    """
+    Computes the Gram-Schmidt coefficients and squared norms of an integer basis as floats.
+
+    Parameters:
+        basis (list): List of linearly independent integer row vectors.
+
+    Returns:
+        (list, list): Formatted as (mu, squared norms).
+
+    Examples:
+        >>> from samson.math.lattice_reduction import gso_float
+        >>> gso_float([[2, 0], [1, 2]])
+        ([[0.0, 0.0], [0.5, 0.0]], [4.0, 4.0])
+
+    """
+    n  = len(basis)
+    r  = [[0.0]*n for _ in range(n)]
+    mu = [[0.0]*n for _ in range(n)]
+    B  = [0.0]*n
+
+    for i in range(n):
+        for j in range(i+1):
+            s = float(dot(basis[i], basis[j]))
+            for l in range(j):
+                s -= mu[j][l]*r[i][l]
+
+            if j < i:
+                r[i][j]  = s
+                mu[i][j] = s / B[j]
+            else:
+                B[i] = s
+
+    return mu, B
+
+
+
+def enumerate_block(mu: list, B: list, start: int, end: int, radius: float) -> list:
+    """
+    Searches for the shortest nonzero vector in the projected sublattice `pi_start(b_start, ..., b_{end-1})`
+    using Schnorr-Euchner enumeration.
+
+    Parameters:
+        mu     (list): Gram-Schmidt coefficients.
+        B      (list): Squared Gram-Schmidt norms.
+        start   (int): First index of the block.
+        end     (int): Index after the last vector of the block.
+        radius (float): Only vectors with squared norm strictly less than `radius` are returned.
+
+    Returns:
+        list: Integer coefficients of the shortest vector with respect to the block, or None if no vector is shorter than `radius`.
+
+    Examples:
+        >>> from samson.math.lattice_reduction import enumerate_block, gso_float
+        >>> mu, B = gso_float([[1, 0, 0], [0, 5, 0], [1, 4, 1]])
+        >>> enumerate_block(mu, B, 0, 3, 2.0)
+        [1, 0, 0]
+
+        >>> enumerate_block(mu, B, 1, 3, B[1])
+        [-1, 1]
+
+    References:
+        "Lattice Basis Reduction: Improved Practical Algorithms and Solving Subset Sum Problems" (Schnorr, Euchner)
+    """
+    size = end - start
+    x    = [0]*size
+    c    = [0.0]*size
+    l    = [0.0]*(size+1)
+    dx   = [0]*size
+    ddx  = [0]*size
+    best = None
+
+    x[0] = 1
+    k    = 0
+
+    while True:
+        diff = x[k] - c[k]
+        l[k] = l[k+1] + diff*diff*B[start+k]
+
+        if l[k] < radius:
+            if k:
+                # Descend a level and start at the closest integer to the projected center
+                k   -= 1
+                c[k] = -sum([x[i]*mu[start+i][start+k] for i in range(k+1, size)])
+                x[k] = round(c[k])
+                dx[k] = ddx[k] = 1 if c[k] >= x[k] else -1
+                continue
+
+            elif l[0] > 0:
+                radius = l[0]
+                best   = x[:]
+
+        else:
+            k += 1
+            if k == size:
+                return best
+
+        # Zig-zag around the center; the top nonzero coordinate is only taken positive
+        if l[k+1]:
+            x[k]  += dx[k]
+            ddx[k] = -ddx[k]
+            dx[k]  = ddx[k] - dx[k]
+        else:
+            x[k] += 1
+
+
+
+def insert_vector(basis: list, start: int, coeffs: list):
+    """
+    Replaces `basis[start]` with the combination `sum(coeffs[i]*basis[start+i])` using a unimodular
+    transformation of the block. `coeffs` must be primitive. Modifies `basis` in place.
+
+    Parameters:
+        basis  (list): List of integer row vectors.
+        start   (int): First index of the block.
+        coeffs (list): Primitive integer coefficients.
+
+    Examples:
+        >>> from samson.math.lattice_reduction import insert_vector
+        >>> basis = [[1, 0], [0, 1]]
+        >>> insert_vector(basis, 0, [2, 3])
+        >>> basis
+        [[2, 3], [-1, -1]]
+
+    """
+    coeffs = list(coeffs)
+
+    for i in reversed(range(1, len(coeffs))):
+        a, c = coeffs[i-1], coeffs[i]
+        if not c:
+            continue
+
+        # Extended Euclidean algorithm: u*a + v*c == g
+        g, u, v, g_1, u_1, v_1 = a, 1, 0, c, 0, 1
+        while g_1:
+            q = g // g_1
+            g, g_1 = g_1, g - q*g_1
+            u, u_1 = u_1, u - q*u_1
+            v, v_1 = v_1, v - q*v_1
+
+        b_0, b_1 = basis[start+i-1], basis[start+i]
+        basis[start+i-1] = [(a // g)*y + (c // g)*z for y, z in zip(b_0, b_1)]
+        basis[start+i]   = [-v*y + u*z for y, z in zip(b_0, b_1)]
+
+        coeffs[i-1] = g
+        coeffs[i]   = 0
+
+    if coeffs[0] == -1:
+        basis[start] = [-y for y in basis[start]]
+
+    elif coeffs[0] != 1:
+        raise ValueError("Coefficients must be primitive")
+
+
+
+def bkz_reduce(basis: list, block_size: int=10, delta: float=0.99, max_tours: int=None, progress_func: FunctionType=None) -> list:
+    """
+    Performs Block Korkine-Zolotarev reduction on an integer basis.
+
+    Parameters:
+        basis          (list): List of linearly independent integer row vectors.
+        block_size      (int): Size of the blocks to enumerate.
+        delta         (float): Lovász constant in (1/4, 1).
+        max_tours       (int): (Optional) Maximum number of passes over the basis.
+        progress_func  (func): (Optional) Called with `(k, n)` after each block.
+
+    Returns:
+        list: Reduced basis.
+
+    Examples:
+        >>> from samson.math.lattice_reduction import bkz_reduce
+        >>> bkz_reduce([[1, 0, 0, 1345], [0, 1, 0, 35], [0, 0, 1, 154]], block_size=3)
+        [[1, 1, -9, -6], [0, 9, -2, 7], [1, -3, -8, 8]]
+
+    References:
+        "Lattice Basis Reduction: Improved Practical Algorithms and Solving Subset Sum Problems" (Schnorr, Euchner)
+    """
+    basis = lll_reduce(basis, delta)
+    n     = len(basis)
+
+    if n < 2:
+        return basis
+
+    block_size = min(max(block_size, 2), n)
+    tours      = 0
+
+    while max_tours is None or tours < max_tours:
+        tours   += 1
+        clean    = True
+        mu, B    = gso_float(basis)
+
+        for k in range(n-1):
+            end    = min(k + block_size, n)
+            coeffs = enumerate_block(mu, B, k, end, delta*B[k])
+
+            if coeffs:
+                clean = False
+                insert_vector(basis, k, coeffs)
+
+                h = min(end + 1, n)
+                basis[:h] = lll_reduce(basis[:h], delta)
+                mu, B     = gso_float(basis)
+
+            if progress_func:
+                progress_func(k+1, n)
+
+        if clean:
+            break
+
+    # Blocks only reduce their prefix; size-reduce the tail against the final prefix
+    return lll_reduce(basis, delta)
+
+
+
+def to_int_basis(basis: object) -> (list, int):
+    """
+    Converts a basis over ZZ or QQ into an integer basis by clearing denominators.
+
+    Parameters:
+        basis (Matrix): Basis as a `Matrix` or list of rows.
+
+    Returns:
+        (list, int): Formatted as (integer basis, common denominator).
+
+    Examples:
+        >>> from samson.math.lattice_reduction import to_int_basis
+        >>> from samson.math.matrix import Matrix
+        >>> from samson.math.all import QQ
+        >>> to_int_basis(Matrix([[QQ(1)/QQ(2), 1], [3, QQ(1)/QQ(3)]], QQ))
+        ([[3, 6], [18, 2]], 6)
+
+    """
+    from samson.math.algebra.fields.fraction_field import FractionFieldElement
+    from math import gcd
+
+    rows = basis.rows if hasattr(basis, 'rows') else basis
+
+    def to_fraction(elem):
+        if type(elem) is FractionFieldElement:
+            return Fraction(int(elem.numerator), int(elem.denominator))
+        return Fraction(int(elem))
+
+    rows        = [[to_fraction(elem) for elem in row] for row in rows]
+    denominator = 1
+
+    for row in rows:
+        for elem in row:
+            denominator = denominator * elem.denominator // gcd(denominator, elem.denominator)
+
+    return [[int(elem * denominator) for elem in row] for row in rows], denominator
+
+
+
+def reduce_basis(basis: object, reduce_func: FunctionType) -> object:
+    """
+    Applies an integer basis reduction to a `Matrix` over ZZ or QQ.
+
+    Parameters:
+        basis      (Matrix): Matrix of row vectors, or a list of integer rows.
+        reduce_func  (func): Function taking and returning a list of integer rows.
+
+    Returns:
+        Matrix: Reduced basis over the fraction field of `basis`' ring. If `basis` is a list, returns a list of integer rows.
+
+    Examples:
+        >>> from samson.math.lattice_reduction import reduce_basis, lll_reduce
+        >>> from samson.math.matrix import Matrix
+        >>> from samson.math.all import QQ
+        >>> reduce_basis(Matrix([[QQ(1)/QQ(2), 0], [1, 1]], QQ), lll_reduce)
+        <Matrix: rows=
+        [Frac(ZZ)(ZZ(1)/ZZ(2)), Frac(ZZ)(ZZ(0)/ZZ(1))]
+        [Frac(ZZ)(ZZ(0)/ZZ(1)), Frac(ZZ)(ZZ(1)/ZZ(1))]>
+
+    """
+    from samson.math.algebra.fields.fraction_field import FractionField
+    from samson.math.matrix import Matrix
+
+    if type(basis) is not Matrix:
+        return reduce_func([[int(elem) for elem in row] for row in basis])
+
+    R = basis.coeff_ring
+    if type(R) is not FractionField:
+        R = FractionField(R)
+
+    int_basis, denominator = to_int_basis(basis)
+    denominator = R(denominator)
+
+    return Matrix([[R(elem) / denominator for elem in row] for row in reduce_func(int_basis)], coeff_ring=R)
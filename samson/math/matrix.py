@@ -1,6 +1,6 @@
 from samson.math.algebra.rings.ring import Ring, RingElement
 from samson.math.algebra.rings.integer_ring import ZZ
-from samson.math.general import gaussian_elimination, lll, gram_schmidt
+from samson.math.general import gaussian_elimination, lll, bkz, gram_schmidt
 from shutil import get_terminal_size
 from types import FunctionType
 
@@ -213,12 +213,14 @@ class Matrix(RingElement):
         return Matrix(self.rows + rows, coeff_ring=self.coeff_ring, ring=self.ring)
 
 
-    def LLL(self, delta: float=0.75) -> object:
+    def LLL(self, delta: float=0.75, use_fp: bool=True, progress_func: FunctionType=None) -> object:
         """
         Performs the Lenstra–Lenstra–Lovász lattice basis reduction algorithm.
 
         Parameters:
-            delta (float): Minimum optimality of the reduced basis.
+            delta         (float): Minimum optimality of the reduced basis.
+            use_fp         (bool): Whether or not to try floating-point arithmetic before the exact algorithm.
+            progress_func  (func): (Optional) Called with `(k, n)` after each iteration.
 
         Returns:
             Matrix: Reduced basis.
@@ -233,7 +235,34 @@ class Matrix(RingElement):
             [Frac(ZZ)(ZZ(-2)/ZZ(1)),  Frac(ZZ)(ZZ(0)/ZZ(1)),  Frac(ZZ)(ZZ(2)/ZZ(1)),  Frac(ZZ)(ZZ(4)/ZZ(1))]>
     
         """
-        return lll(self, delta)
+        return lll(self, delta, use_fp, progress_func)
+
+
+    def BKZ(self, block_size: int=10, delta: float=0.99, max_tours: int=None, progress_func: FunctionType=None) -> object:
+        """
+        Performs Block Korkine-Zolotarev lattice basis reduction.
+
+        Parameters:
+            block_size      (int): Size of the blocks to enumerate.
+            delta         (float): Minimum optimality of the reduced basis.
+            max_tours       (int): (Optional) Maximum number of passes over the basis.
+            progress_func  (func): (Optional) Called with `(k, n)` after each block.
+
+        Returns:
+            Matrix: Reduced basis.
+
+        Examples:
+            >>> from samson.math.matrix import Matrix
+            >>> from samson.math.all import ZZ
+            >>> m = Matrix([[1, 0, 0, 1345], [0, 1, 0, 35], [0, 0, 1, 154]], ZZ)
+            >>> m.BKZ(3)
+            <Matrix: rows=
+            [ Frac(ZZ)(ZZ(1)/ZZ(1)),  Frac(ZZ)(ZZ(1)/ZZ(1)), Frac(ZZ)(ZZ(-9)/ZZ(1)), Frac(ZZ)(ZZ(-6)/ZZ(1))]
+            [ Frac(ZZ)(ZZ(0)/ZZ(1)),  Frac(ZZ)(ZZ(9)/ZZ(1)), Frac(ZZ)(ZZ(-2)/ZZ(1)),  Frac(ZZ)(ZZ(7)/ZZ(1))]
+            [ Frac(ZZ)(ZZ(1)/ZZ(1)), Frac(ZZ)(ZZ(-3)/ZZ(1)), Frac(ZZ)(ZZ(-8)/ZZ(1)),  Frac(ZZ)(ZZ(8)/ZZ(1))]>
+
+        """
+        return bkz(self, block_size, delta, max_tours, progress_func)
 
 
     def gram_schmidt(self, normalize: bool=True) -> object:
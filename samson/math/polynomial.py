@@ -1,6 +1,7 @@
 from samson.math.algebra.rings.ring import Ring, RingElement
 from samson.math.general import square_and_mul, gcd, factor as factor_int
 from samson.math.sparse_vector import SparseVector
+from samson.math.dense_int_vector import DenseIntVector, dense_modulus, dense_mul, dense_divmod, dense_fast_divmod, dense_inverse_series, is_dense_divisible, prefer_dense, elem_to_int, FAST_DIVISION_THRESHOLD
 from samson.utilities.general import add_or_increment
 
 class Polynomial(RingElement):
@@ -15,22 +16,37 @@ class Polynomial(RingElement):
         from samson.math.symbols import Symbol
 
         self.coeff_ring = coeff_ring or coeffs[0].ring
+        is_dense_ring, modulus = dense_modulus(self.coeff_ring)
 
         if type(coeffs) is list or type(coeffs) is tuple or type(coeffs) is dict:
             if type(coeffs) is dict or (len(coeffs) > 0 and type(coeffs[0]) is tuple):
-                vec = coeffs
-            else:
-                vec = [self.coeff_ring.coerce(coeff) for coeff in coeffs]
+                self.coeffs = SparseVector(coeffs, self.coeff_ring.zero())
+
+            elif is_dense_ring:
+                self.coeffs = DenseIntVector([coeff if type(coeff) is int else elem_to_int(self.coeff_ring.coerce(coeff)) for coeff in coeffs], self.coeff_ring, modulus)
 
-            self.coeffs = SparseVector(vec, self.coeff_ring.zero())
+            else:
+                self.coeffs = SparseVector([self.coeff_ring.coerce(coeff) for coeff in coeffs], self.coeff_ring.zero())
 
-        elif type(coeffs) is SparseVector:
+        elif type(coeffs) is SparseVector or type(coeffs) is DenseIntVector:
             self.coeffs = coeffs
 
         else:
             raise Exception(f"'coeffs' is not of an accepted type. Received {type(coeffs)}")
 
 
+        # Automatically choose the dense backend for dense polynomials over ZZ or ZZ/ZZ(n)
+        if is_dense_ring and len(self.coeffs.values):
+            length = self.coeffs.len()
+
+            if type(self.coeffs) is SparseVector:
+                if prefer_dense(len(self.coeffs.values), length):
+                    self.coeffs = DenseIntVector.from_sparse(self.coeffs, self.coeff_ring, modulus)
+
+            elif not prefer_dense(self.coeffs.nnz(), length):
+                self.coeffs = self.coeffs.to_sparse()
+
+
         self.symbol = symbol or Symbol('x')
         self.ring   = ring or self.coeff_ring[self.symbol]
 
@@ -38,13 +54,43 @@ class Polynomial(RingElement):
             self.coeffs = SparseVector([self.coeff_ring.zero()], self.coeff_ring.zero())
 
 
+    def is_dense(self) -> bool:
+        """
+        Determines whether the coefficients are stored in the dense integer backend.
+
+        Returns:
+            bool: Whether the coefficients are a `DenseIntVector`.
+
+        Examples:
+            >>> from samson.math.all import ZZ, Symbol
+            >>> x = Symbol('x')
+            >>> _ = (ZZ/ZZ(7))[x]
+            >>> (x**3 + 2*x + 1).is_dense(), (x**1000 + 1).is_dense()
+            (True, False)
+
+        """
+        return type(self.coeffs) is DenseIntVector
+
+
+    def _dense_values(self) -> list:
+        if type(self.coeffs) is DenseIntVector:
+            return self.coeffs.values
+
+        return DenseIntVector.from_sparse(self.coeffs, self.coeff_ring).values
+
+
+    def _from_dense_values(self, values: list) -> object:
+        _, modulus = dense_modulus(self.coeff_ring)
+        return Polynomial(DenseIntVector(values, self.coeff_ring, modulus), self.coeff_ring, self.symbol)
+
+
 
     def shorthand(self) -> str:
         poly_repr   = []
         poly_coeffs = type(self.LC().get_ground()) is Polynomial
 
         if self.LC():
-            for idx, coeff in self.coeffs.values.items():
+            for idx, coeff in self.coeffs:
                 if coeff == coeff.ring.zero() and not len(self.coeffs) == 1:
                     continue
 
@@ -109,11 +155,24 @@ class Polynomial(RingElement):
         Returns:
             RingElement: Evaluation at `x`.
         """
-        coeffs   = self.coeffs
+        coeffs = self.coeffs
+
+        if type(coeffs) is DenseIntVector and (type(x) is int or getattr(x, 'ring', None) == self.coeff_ring):
+            x   = x if type(x) is int else elem_to_int(x)
+            mod = coeffs.modulus
+            c0  = 0
+
+            for coeff in reversed(coeffs.values):
+                c0 = c0*x + coeff
+                if mod:
+                    c0 %= mod
+
+            return self.coeff_ring(c0)
+
         c0       = coeffs[-1]
         last_idx = coeffs.last()
 
-        for idx, coeff in self.coeffs.values.items()[:-1][::-1]:
+        for idx, coeff in list(coeffs)[:-1][::-1]:
             c0 = coeff + c0*x**(last_idx-idx)
             last_idx = idx
 
@@ -530,6 +589,20 @@ class Polynomial(RingElement):
         if n > self.degree():
             return self.ring.zero(), self
 
+        if self.is_dense() or other.is_dense():
+            _, modulus = dense_modulus(self.coeff_ring)
+            divisor    = other._dense_values()
+
+            if is_dense_divisible(divisor, modulus):
+                dividend = self._dense_values()
+
+                if min(n, len(dividend) - n) >= FAST_DIVISION_THRESHOLD:
+                    quotient, remainder = dense_fast_divmod(dividend, divisor, modulus)
+                else:
+                    quotient, remainder = dense_divmod(dividend, divisor, modulus)
+
+                return self._from_dense_values(quotient), self._from_dense_values(remainder)
+
         dividend = SparseVector([c for c in self.coeffs], self.coeff_ring.zero())
         divisor  = other.coeffs
 
@@ -550,6 +623,13 @@ class Polynomial(RingElement):
     def __add__(self, other: object) -> object:
         other = self.ring.coerce(other)
 
+        if self.is_dense() or other.is_dense():
+            a, b = self._dense_values(), other._dense_values()
+            if len(a) < len(b):
+                a, b = b, a
+
+            return self._from_dense_values([x + y for x, y in zip(a, b)] + a[len(b):])
+
         vec = SparseVector([], self.coeff_ring.zero())
         for idx, coeff in self.coeffs:
             vec[idx] = coeff + other.coeffs[idx]
@@ -564,6 +644,11 @@ class Polynomial(RingElement):
     def __sub__(self, other: object) -> object:
         other = self.ring.coerce(other)
 
+        if self.is_dense() or other.is_dense():
+            a, b = self._dense_values(), other._dense_values()
+            diff = [x - y for x, y in zip(a, b)]
+            return self._from_dense_values(diff + a[len(b):] + [-y for y in b[len(a):]])
+
         vec = SparseVector([], self.coeff_ring.zero())
         for idx, coeff in self.coeffs:
             vec[idx] = coeff - other.coeffs[idx]
@@ -576,12 +661,19 @@ class Polynomial(RingElement):
 
 
     def __mul__(self, other: object) -> object:
+        if type(other) is int and self.is_dense():
+            return self._from_dense_values([coeff*other for coeff in self.coeffs.values])
+
         gmul = self.ground_mul(other)
         if gmul:
             return gmul
 
         other = self.ring.coerce(other)
 
+        if self.is_dense() or other.is_dense():
+            _, modulus = dense_modulus(self.coeff_ring)
+            return self._from_dense_values(dense_mul(self._dense_values(), other._dense_values(), modulus))
+
         new_coeffs = SparseVector([], self.coeff_ring.zero())
 
         for i, coeff_h in self.coeffs:
@@ -596,6 +688,9 @@ class Polynomial(RingElement):
 
 
     def __neg__(self) -> object:
+        if self.is_dense():
+            return self._from_dense_values([-coeff for coeff in self.coeffs.values])
+
         return Polynomial([(idx, -coeff) for idx, coeff in self.coeffs], self.coeff_ring, self.symbol)
 
 
@@ -607,6 +702,9 @@ class Polynomial(RingElement):
 
 
     def __mod__(self, other: object) -> object:
+        if type(other) is Modulus:
+            return other.reduce(self)
+
         return self.__divmod__(other)[1]
 
 
@@ -632,13 +730,19 @@ class Polynomial(RingElement):
 
 
     def __bool__(self) -> bool:
-        return self.coeffs != SparseVector([self.coeff_ring.zero()], self.coeff_ring.zero())
+        return len(self.coeffs.values) > 0
 
 
     def __lshift__(self, num: int):
+        if self.is_dense():
+            return self._from_dense_values([0]*num + self.coeffs.values)
+
         return Polynomial(SparseVector([(idx+num, coeff) for idx, coeff in self.coeffs], self.coeff_ring.zero()), coeff_ring=self.coeff_ring, ring=self.ring, symbol=self.symbol)
 
     def __rshift__(self, num: int):
+        if self.is_dense():
+            return self._from_dense_values(self.coeffs.values[num:])
+
         return Polynomial(SparseVector([(idx-num, coeff) for idx, coeff in self.coeffs[num:]], self.coeff_ring.zero()), coeff_ring=self.coeff_ring, ring=self.ring, symbol=self.symbol)
 
 
@@ -650,3 +754,83 @@ class Polynomial(RingElement):
             bool: Whether the element is invertible.
         """
         return self != self.ring.zero() and all([coeff.is_invertible() for _, coeff in self.coeffs])
+
+
+
+class Modulus(object):
+    """
+    Fixed `Polynomial` modulus that precomputes the power series inverse of its reversal. Reduction
+    by a `Modulus` costs two multiplications instead of a long division. Falls back to `%` when the
+    coefficients don't support the dense backend.
+
+    Examples:
+        >>> from samson.math.all import ZZ, Symbol
+        >>> from samson.math.polynomial import Modulus
+        >>> x = Symbol('x')
+        >>> _ = (ZZ/ZZ(7))[x]
+        >>> f = Modulus(x**3 + 2*x + 1)
+        >>> (x**5 + 3*x**4 + x) % f
+        <Polynomial: ZZ(2)*x + ZZ(2), coeff_ring=ZZ/ZZ(7)>
+
+        >>> (x**5 + 3*x**4 + x) % f == (x**5 + 3*x**4 + x) % (x**3 + 2*x + 1)
+        True
+
+    """
+
+    def __init__(self, poly: Polynomial):
+        """
+        Parameters:
+            poly (Polynomial): Polynomial to reduce by.
+        """
+        is_dense_ring, modulus = dense_modulus(poly.coeff_ring)
+
+        self.poly          = poly
+        self.degree        = poly.degree()
+        self.coeff_modulus = modulus
+        self.values        = None
+        self.rev_inverse   = None
+        self.precision     = 0
+
+        if is_dense_ring and self.degree > 0:
+            values = poly._dense_values()
+            if is_dense_divisible(values, modulus):
+                self.values = values
+
+
+    def __repr__(self):
+        return f"<Modulus: poly={self.poly}>"
+
+    def __str__(self):
+        return self.__repr__()
+
+
+    def __rmod__(self, other: Polynomial) -> Polynomial:
+        return self.reduce(other)
+
+
+    def reduce(self, poly: Polynomial) -> Polynomial:
+        """
+        Reduces `poly` by the modulus.
+
+        Parameters:
+            poly (Polynomial): Polynomial to reduce.
+
+        Returns:
+            Polynomial: `poly` % `self.poly`.
+        """
+        if self.values is None or not poly.is_dense() or poly.coeff_ring != self.poly.coeff_ring:
+            return poly % self.poly
+
+        if poly.degree() < self.degree:
+            return poly
+
+        dividend  = poly.coeffs.values
+        precision = len(dividend) - self.degree
+
+        if precision > self.precision:
+            self.precision   = max(precision, self.degree)
+            self.rev_inverse = dense_inverse_series(self.values[::-1], self.precision, self.coeff_modulus)
+
+        _, remainder = dense_fast_divmod(dividend, self.values, self.coeff_modulus, self.rev_inverse)
+
+        return poly._from_dense_values(remainder)
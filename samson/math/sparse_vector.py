@@ -97,6 +97,9 @@ class SparseVector(object):
 
 
     def __eq__(self, other: object) -> bool:
+        if type(other) is not SparseVector:
+            return list(iter(self)) == list(iter(other))
+
         return self.values == other.values
 
 
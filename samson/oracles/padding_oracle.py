@@ -3,11 +3,12 @@ from types import FunctionType
 class PaddingOracle(object):
     """
     Oracle that determines if a ciphertext has the correct padding or not. The `request` function must return a boolean indicating this.
+    It may also be a coroutine function (e.g. an `async` HTTP request), which lets attacks keep many requests in flight.
     """
 
     def __init__(self, request_func: FunctionType):
         """
         Parameters:
-            request_func (func): Function that takes in bytes and returns a boolean indicating whether the resulting plaintext has correct padding.
+            request_func (func): Function (or coroutine function) that takes in bytes and returns a boolean indicating whether the resulting plaintext has correct padding.
         """
         self.check_padding = request_func
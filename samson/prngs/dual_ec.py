@@ -1,9 +1,21 @@
 from samson.math.algebra.curves.weierstrass_curve import WeierstrassCurve, WeierstrassPoint
+from samson.math.algebra.curves.jacobian import wnaf, wnaf_width, wnaf_mul
+from samson.math.fixed_base_table import WeierstrassFixedBaseTable
+from samson.utilities.general import load_checkpoint, save_checkpoint
 from samson.utilities.bytes import Bytes
-from samson.math.general import mod_inv
+from samson.math.general import mod_inv, tonelli
 from samson.utilities.runtime import RUNTIME
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+import multiprocessing
 import random
 
+# Number of candidate prefixes each task of `derive_from_backdoor` searches
+DUAL_EC_BATCH_SIZE = 2**10
+
+# Worker state for `derive_from_backdoor`. The fixed-base table for `Q` is built once and inherited by forked workers.
+_CONTEXT = None
+
+
 class DualEC(object):
     """
     Implementation of the NSA's backdoored DRBG.
@@ -64,40 +76,144 @@ class DualEC(object):
 
     @classmethod
     @RUNTIME.report
-    def derive_from_backdoor(cls: object, P: WeierstrassPoint, Q: WeierstrassPoint, d: int, observed_out: bytes) -> list:
+    def derive_from_backdoor(cls: object, P: WeierstrassPoint, Q: WeierstrassPoint, d: int, observed_out: bytes, processes: int=1, max_states: int=None, prefixes: range=range(2**16), checkpoint: str=None) -> list:
         """
         Recovers the internal state of a Dual EC generator and builds a replica.
 
+        Each of the 2^16 possible missing prefixes of the first output is screened by taking the square root of the
+        curve equation once; only candidates that lie on the curve pay for the scalar multiplications. `d`'s wNAF
+        recoding and a fixed-base table for `Q` are computed once and shared by every candidate (and, through fork,
+        every worker).
+
         Parameters:
             P (WeierstrassPoint): Elliptical curve point `P`.
             Q (WeierstrassPoint): Elliptical curve point `Q`.
             d              (int): Backdoor that relates Q to P.
             observed_out (bytes): Observed output from the compromised Dual EC generator.
-        
+            processes      (int): Number of worker processes. Requires the "fork" start method; otherwise runs in-process.
+            max_states     (int): Stop once this many states are found. With at least four bytes of the second output, a
+                                  match is almost certainly the real state, so 1 is a sensible early exit.
+            prefixes     (range): Prefixes to search.
+            checkpoint     (str): Path of a JSON checkpoint. Progress is saved after every round and resumed if it matches.
+
         Returns:
             list: List of possible internal states.
         """
         assert len(observed_out) >= 30
 
         curve = P.curve
+        a, p  = curve.int_params
+
+        r1 = bytes(observed_out[:30])
+        r2 = bytes(observed_out[30:60])
+
+        w       = wnaf_width(d.bit_length())
+        context = {
+            'a': a, 'b': int(curve.b), 'p': p,
+            'r1': int.from_bytes(r1, 'big'), 'r2': int.from_bytes(r2, 'big'), 'r2_shift': 8 * (30 - len(r2)),
+            'd_digits': wnaf(d, w), 'w': w,
+            'Q_table': WeierstrassFixedBaseTable(Q, curve.cardinality().bit_length(), 8)
+        }
+
+        fingerprint = [int(P.x), int(P.y), int(Q.x), int(Q.y), bytes(observed_out).hex(), prefixes.start, prefixes.stop, prefixes.step]
+        state       = load_checkpoint(checkpoint, fingerprint) or {'next': 0, 'states': []}
+        found       = state['states']
+        next_batch  = state['next']
+
+        batches  = [prefixes[i:i + DUAL_EC_BATCH_SIZE] for i in range(0, len(prefixes), DUAL_EC_BATCH_SIZE)]
+        progress = RUNTIME.report_progress(None, total=len(prefixes), desc='Statespace searched', unit='states')
+        progress.update(sum(len(batch) for batch in batches[:next_batch]))
+
+        _init_worker(context)
+        executor = None
+        pending  = {}
+
+        if processes > 1 and 'fork' in multiprocessing.get_all_start_methods():
+            executor = ProcessPoolExecutor(max_workers=processes, mp_context=multiprocessing.get_context('fork'), initializer=_init_worker, initargs=(context,))
+
+        try:
+            # Batches are searched in rounds so the checkpoint always describes a finished prefix of the batches
+            round_size = max(1, processes) * 4
+            while next_batch < len(batches) and not (max_states and len(found) >= max_states):
+                round_batches = batches[next_batch:next_batch + round_size]
+                finished      = [False] * len(round_batches)
+
+                if executor:
+                    pending = {executor.submit(_search_prefixes, batch): i for i, batch in enumerate(round_batches)}
+                    while pending:
+                        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            i = pending.pop(future)
+                            found.extend([s for s in future.result() if s not in found])
+                            finished[i] = True
+                            progress.update(len(round_batches[i]))
+
+                        if max_states and len(found) >= max_states:
+                            break
+                else:
+                    for i, batch in enumerate(round_batches):
+                        found.extend([s for s in _search_prefixes(batch) if s not in found])
+                        finished[i] = True
+                        progress.update(len(batch))
+
+                        if max_states and len(found) >= max_states:
+                            break
+
+                # Stopping early can leave batches unfinished, so only skip past the ones finished in order. Batches
+                # finished after a gap get searched again on resume, which is why repeated states are dropped above
+                next_batch += finished.index(False) if False in finished else len(finished)
+
+                if checkpoint:
+                    save_checkpoint(checkpoint, {'fingerprint': fingerprint, 'next': next_batch, 'states': found})
+        finally:
+            if executor:
+                for future in pending:
+                    future.cancel()
+
+                executor.shutdown(wait=False)
+
+        return [DualEC(P, Q, s) for s in found[:max_states]]
+
+
+
+def _init_worker(context: dict):
+    global _CONTEXT
+    _CONTEXT = context
+
+
+
+def _search_prefixes(prefixes: range) -> list:
+    a, b, p, r1, r2, r2_shift, digits, w, Q_table = [_CONTEXT[k] for k in ['a', 'b', 'p', 'r1', 'r2', 'r2_shift', 'd_digits', 'w', 'Q_table']]
+
+    r2_mask  = (1 << (240 - r2_shift)) - 1
+    sqrt_exp = (p + 1) // 4 if p % 4 == 3 else None
+    found    = []
+
+    for prefix in prefixes:
+        x = (prefix << 240) | r1
+        if x >= p:
+            continue
+
+        rhs = (x*x*x + a*x + b) % p
+
+        # When p = 3 mod 4, a single exponentiation both screens out non-residues and yields the root
+        if sqrt_exp:
+            y = pow(rhs, sqrt_exp, p)
+            if y*y % p != rhs:
+                continue
 
-        r1 = observed_out[:30]
-        r2 = observed_out[30:]
+        else:
+            if rhs and pow(rhs, (p - 1) // 2, p) != 1:
+                continue
 
-        possible_states = []
-        Q_cache         = Q.cache_mul(curve.cardinality().bit_length())
+            y = tonelli(rhs, p)
 
-        for i in RUNTIME.report_progress(range(2**16), desc='Statespace searched', unit='states'):
-            test_r1 = int.to_bytes(i, 2, 'big') + r1
-            test_x  = int.from_bytes(test_r1, 'big')
-            try:
-                R  = curve(test_x)
-                dR = d * R
-                test_r2 = Q_cache * int(dR.x)
+        # `d*R` and `d*-R` share an x-coordinate, so the root's sign doesn't matter
+        s, _ = wnaf_mul((x, y), digits, w, a, p)
+        if not s:
+            continue
 
-                if int.to_bytes(int(test_r2.x), 32, 'big')[2:2 + len(r2)] == r2:
-                    possible_states.append(DualEC(P, Q, int(dR.x)))
-            except AssertionError as _:
-                pass
+        if (int((Q_table * s).x) >> r2_shift) & r2_mask == r2:
+            found.append(s)
 
-        return possible_states
+    return found
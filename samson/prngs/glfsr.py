@@ -1,5 +1,5 @@
 from samson.math.polynomial import Polynomial
-from samson.math.general import berlekamp_massey
+from samson.math.gf2 import berlekamp_massey, GF2Matrix, SymbolicBits
 from samson.math.general import poly_to_int
 
 class GLFSR(object):
@@ -112,3 +112,45 @@ class GLFSR(object):
         [(lfsr.clock(), lfsr.state) for i in range(len(outputs))]
 
         return lfsr
+
+
+
+    @staticmethod
+    def crack_state(polynomial: int, outputs: list):
+        """
+        Given the polynomial and any set of output bits, recovers the GLFSR's state.
+
+        Parameters:
+            polynomial (int): Integer that represents the polynomial.
+            outputs   (list): Outputs from the GLFSR (in order). Use None for outputs that weren't observed.
+
+        Returns:
+            GLFSR: GLFSR that generates the same sequence from its first output.
+
+        Examples:
+            >>> from samson.prngs.glfsr import GLFSR
+            >>> lfsr = GLFSR(0x1234, 0x1100B)
+            >>> outputs = [lfsr.clock() for _ in range(60)]
+            >>> observed = [bit if i % 3 == 1 else None for i, bit in enumerate(outputs)]
+            >>> cracked = GLFSR.crack_state(0x1100B, observed)
+            >>> [cracked.clock() for _ in range(60)] == outputs
+            True
+
+        """
+        width     = polynomial.bit_length()
+        top       = width - 1
+        state     = SymbolicBits.variables(width)
+        equations = []
+        values    = []
+
+        # Trace `clock` symbolically. The feedback branch becomes XORing the output bit's equation into every tap.
+        for output in outputs:
+            state = (state << 1) & (2**width - 1)
+            bit   = state[top]
+            state = state ^ SymbolicBits([bit if (polynomial >> j) & 1 else 0 for j in range(width)])
+
+            if output is not None:
+                equations.append(bit)
+                values.append(output)
+
+        return GLFSR(GF2Matrix(equations, width).solve(values), polynomial)
@@ -221,7 +221,7 @@ class LCG(object):
         l_matrix[0][0] = modulus
 
         for i in range(1, len(outputs)):
-            l_matrix[i][0] = multiplier ** i
+            l_matrix[i][0] = pow(multiplier, i, modulus)
             l_matrix[i][i] = -1
 
 
@@ -1,4 +1,12 @@
 #!/usr/bin/python3
+from samson.math.gf2 import berlekamp_massey, poly_powmod, solve, SymbolicBits
+from samson.utilities.exceptions import SearchspaceExhaustedException
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from functools import lru_cache
+from array import array
+import multiprocessing
+import sys
+
 w, n, m, r = (32, 624, 397, 31)
 a = 0x9908b0df
 f = 1812433253
@@ -8,6 +16,13 @@ t, c = (15, 0xEFC60000)
 l = 18
 
 
+# Jumps shorter than this are cheaper to generate through than to compute with the jump polynomial
+JUMP_POLYNOMIAL_THRESHOLD = 2**21
+
+# Number of seeds tried together by `crack_seed`
+SEED_BATCH_SIZE = 2**14
+
+
 def asint32(integer):
     return integer & d
 
@@ -66,6 +81,92 @@ def untemper(y):
     return y & d
 
 
+# Word-parallel ("SWAR") helpers. `_pack` lays 32-bit words side by side in one integer so the twist and temper
+# become a handful of big-integer operations instead of a Python loop per word.
+def _pack(words: list) -> int:
+    packed = array('I', words)
+    if sys.byteorder == 'big':
+        packed.byteswap()
+
+    return int.from_bytes(packed.tobytes(), 'little')
+
+
+def _unpack(packed: int, count: int) -> list:
+    words = array('I')
+    words.frombytes(packed.to_bytes(4 * count, 'little'))
+    if sys.byteorder == 'big':
+        words.byteswap()
+
+    return words.tolist()
+
+
+def _lanes(value: int, count: int=n, stride: int=32) -> int:
+    return value * (((1 << (stride * count)) - 1) // ((1 << stride) - 1))
+
+
+_UPPER, _LOWER, _ONES = _lanes(0x80000000), _lanes(0x7fffffff), _lanes(1)
+_TEMPER_MASKS = [_lanes(mask) for mask in (d >> u, b, c, d >> l)]
+
+
+def _twist_lanes(x: int, x_next: int, upper: int, lower: int, ones: int) -> int:
+    y = (x & upper) | (x_next & lower)
+    return ((y >> 1) & lower) ^ ((x_next & ones) * a)
+
+
+def _temper_lanes(y: int, masks: list) -> int:
+    y ^= (y >> u) & masks[0]
+    y ^= (y << s) & masks[1]
+    y ^= (y << t) & masks[2]
+    y ^= (y >> l) & masks[3]
+    return y
+
+
+def _words(packed: int, start: int, end: int) -> int:
+    return (packed >> (32 * start)) & ((1 << (32 * (end - start))) - 1)
+
+
+def twist_state(state: list) -> list:
+    """
+    Computes the next 624 words of the Mersenne Twister from the current 624.
+
+    Parameters:
+        state (list): 624 32-bit words.
+
+    Returns:
+        list: Twisted state.
+
+    Examples:
+        >>> from samson.prngs.mt19937 import MT19937, twist_state
+        >>> mt = MT19937(5489)
+        >>> twisted = twist_state(mt.state)
+        >>> mt.twist()
+        >>> twisted == mt.state
+        True
+
+    """
+    # Word i of the new state depends on new word i - 227 once i >= 227, so the twist runs in three slices
+    # that each only depend on slices already computed
+    old = _pack(state)
+    k   = n - m
+    new = _words(old, m, n) ^ _twist_lanes(_words(old, 0, k), _words(old, 1, k + 1), _UPPER, _LOWER, _ONES)
+    new = new | ((new ^ _twist_lanes(_words(old, k, 2*k), _words(old, k + 1, 2*k + 1), _UPPER, _LOWER, _ONES)) << (32 * k))
+    new = new | ((_words(new, k, m - 1) ^ _twist_lanes(_words(old, 2*k, n - 1), _words(old, 2*k + 1, n), _UPPER, _LOWER, _ONES)) << (64 * k))
+    new = new | ((_words(new, m - 1, m) ^ _twist_lanes(_words(old, n - 1, n), new & d, _UPPER, _LOWER, _ONES)) << (32 * (n - 1)))
+    return _unpack(new, n)
+
+
+
+@lru_cache(maxsize=1)
+def characteristic_polynomial() -> int:
+    """
+    Computes the characteristic polynomial of MT19937's state transition (degree 19937) with Berlekamp-Massey.
+
+    Returns:
+        int: Polynomial as an integer whose bit `i` is the coefficient of x^i.
+    """
+    return berlekamp_massey([output & 1 for output in MT19937(5489).generate_array(2 * 19937 + 64)])
+
+
 
 # Implementation of MT19937
 class MT19937(object):
@@ -101,13 +202,7 @@ class MT19937(object):
         """
         Called internally. Performs the `twist` operation of the Mersenne Twister.
         """
-        for i in range(n):
-            y = asint32((self.state[i] & 0x80000000) + (self.state[(i + 1) % n] & 0x7fffffff))
-            self.state[i] = self.state[(i + m) % n] ^ y >> 1
-
-            if y & 1 == 1:
-                self.state[i] ^= a
-
+        self.state = twist_state(self.state)
         self.index = 0
 
 
@@ -129,6 +224,99 @@ class MT19937(object):
         return asint32(y)
 
 
+
+    def generate_array(self, count: int) -> list:
+        """
+        Generates the next `count` outputs, tempering whole runs of the state at once.
+
+        Parameters:
+            count (int): Number of outputs.
+
+        Returns:
+            list: Pseudorandom outputs.
+
+        Examples:
+            >>> from samson.prngs.mt19937 import MT19937
+            >>> MT19937(5489).generate_array(3)
+            [3499211612, 581869302, 3890346734]
+
+        """
+        outputs = []
+        while len(outputs) < count:
+            if self.index >= n:
+                self.twist()
+
+            take = min(n - self.index, count - len(outputs))
+            outputs.extend(_unpack(_temper_lanes(_pack(self.state[self.index:self.index + take]), _TEMPER_MASKS), take))
+            self.index += take
+
+        return outputs
+
+
+
+    def jump(self, steps: int):
+        """
+        Advances the generator by `steps` outputs. Long jumps use the jump polynomial x^steps mod the characteristic
+        polynomial, so their cost is independent of `steps` (the polynomial is computed on first use).
+
+        Parameters:
+            steps (int): Number of outputs to skip.
+
+        Examples:
+            >>> from samson.prngs.mt19937 import MT19937
+            >>> mt = MT19937(5489)
+            >>> mt.jump(2**64)
+            >>> mt.generate()
+            2170487254
+
+        References:
+            "Efficient Jump Ahead for F2-Linear Random Number Generators" (https://www.math.sci.hiroshima-u.ac.jp/m-mat/MT/ARTICLES/jumpmt.pdf)
+        """
+        if steps < 0:
+            raise ValueError("`steps` must be nonnegative")
+
+        if steps < JUMP_POLYNOMIAL_THRESHOLD:
+            while steps:
+                if self.index >= n:
+                    self.twist()
+
+                take        = min(n - self.index, steps)
+                self.index += take
+                steps      -= take
+
+            return
+
+        # The raw words form a linear recurrence, so word `steps + j` is the sum of words `k + j` over the terms
+        # x^k of x^steps mod the characteristic polynomial. The first window is skipped since only the top bit of
+        # its first word is part of the recurrence.
+        if self.index >= n:
+            self.twist()
+
+        window = self.state[self.index:] + twist_state(self.state)[:self.index]
+        jump   = poly_powmod(2, steps - n, characteristic_polynomial())
+        blocks = [twist_state(window)]
+
+        while len(blocks) * n < jump.bit_length() + n:
+            blocks.append(twist_state(blocks[-1]))
+
+        words = array('I', [word for block in blocks for word in block])
+        if sys.byteorder == 'big':
+            words.byteswap()
+
+        buf    = words.tobytes()
+        result = 0
+
+        while jump:
+            low     = jump & -jump
+            k       = 4 * (low.bit_length() - 1)
+            result ^= int.from_bytes(buf[k:k + 4*n], 'little')
+            jump   ^= low
+
+        self.state = _unpack(result, n)
+        self.index = 0
+
+
+
     @staticmethod
     def crack(observed_outputs: list):
         """
@@ -147,3 +335,156 @@ class MT19937(object):
         cloned.state = [untemper(output) for output in observed_outputs][-624:]
 
         return cloned
+
+
+
+    @staticmethod
+    def crack_seed(outputs: list, seeds: range=range(2**32), offset: int=0, masks: list=None, processes: int=1) -> int:
+        """
+        Searches for the seed that produced `outputs`. Seeds are tried `SEED_BATCH_SIZE` at a time, packed side by side
+        in big integers, and batches are spread over `processes` worker processes.
+
+        Parameters:
+            outputs   (list): Consecutive observed outputs.
+            seeds    (range): Seeds to try.
+            offset     (int): Number of outputs generated before the first observed one.
+            masks     (list): Known bits of each output (e.g. 0xFF000000 for `random.getrandbits(8) << 24`). Defaults to all bits.
+            processes  (int): Number of worker processes. Requires the "fork" start method; otherwise runs in-process.
+
+        Returns:
+            int: A matching seed.
+
+        Examples:
+            >>> from samson.prngs.mt19937 import MT19937
+            >>> outputs = MT19937(123456).generate_array(3)
+            >>> MT19937.crack_seed(outputs, range(100000, 200000))
+            123456
+
+        """
+        masks   = masks or [d] * len(outputs)
+        batches = (seeds[i:i + SEED_BATCH_SIZE] for i in range(0, len(seeds), SEED_BATCH_SIZE))
+
+        if processes == 1 or len(seeds) <= SEED_BATCH_SIZE or 'fork' not in multiprocessing.get_all_start_methods():
+            for batch in batches:
+                found = _seed_batch(batch.start, batch.step, len(batch), outputs, masks, offset)
+                if found:
+                    return found[0]
+
+        else:
+            executor = ProcessPoolExecutor(max_workers=processes, mp_context=multiprocessing.get_context('fork'))
+            pending  = set()
+
+            try:
+                for batch in batches:
+                    pending.add(executor.submit(_seed_batch, batch.start, batch.step, len(batch), outputs, masks, offset))
+
+                    # Keep a bounded number of batches queued so a found seed stops the search early
+                    while len(pending) >= 2 * processes:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            if future.result():
+                                return future.result()[0]
+
+                for future in pending:
+                    if future.result():
+                        return future.result()[0]
+            finally:
+                for future in pending:
+                    future.cancel()
+
+                executor.shutdown(wait=False)
+
+        raise SearchspaceExhaustedException("Seed not found")
+
+
+
+    @staticmethod
+    def crack_truncated(outputs: list, masks: list):
+        """
+        Recovers the internal state from consecutive outputs of which only some bits are known (e.g. Python's
+        `random.getrandbits(8)` only reveals the top 8 bits of each output). Every known bit is a linear equation over
+        GF(2) in the 19968 state bits, so roughly 20000 known bits are needed.
+
+        Parameters:
+            outputs (list): Consecutive observed outputs (unknown bits are ignored).
+            masks   (list): Known bits of each output.
+
+        Returns:
+            MT19937: A replica of the original MT19937 positioned after the last observed output.
+        """
+        # Variables are the bits of the 624 raw words starting at the first observed output
+        words     = [SymbolicBits.variables(32, 32 * j) for j in range(n)]
+        equations = []
+        values    = []
+
+        for i, (output, mask) in enumerate(zip(outputs, masks)):
+            if i >= n:
+                x, x_next, x_m = words[i - n], words[i - n + 1], words[i - n + m]
+                y    = (x & 0x80000000) | (x_next & 0x7fffffff)
+                word = x_m ^ (y >> 1) ^ SymbolicBits([y[0] if (a >> bit) & 1 else 0 for bit in range(32)])
+                words.append(word)
+                words[i - n] = None
+            else:
+                word = words[i]
+
+            tempered = temper(word)
+            for bit in range(32):
+                if (mask >> bit) & 1:
+                    equations.append(tempered[bit])
+                    values.append((output >> bit) & 1)
+
+        solution = solve(equations, values)
+
+        cloned       = MT19937(0)
+        cloned.state = [(solution >> (32 * j)) & d for j in range(n)]
+        cloned.index = 0
+        cloned.jump(len(outputs))
+
+        return cloned
+
+
+
+def _seed_batch(start: int, step: int, count: int, outputs: list, masks: list, offset: int) -> list:
+    # Each seed gets a 64-bit lane so products of two 32-bit words never carry into the next lane
+    ones   = _lanes(1, count, 64)
+    M      = ones * d
+    upper  = _lanes(0x80000000, count, 64)
+    lower  = _lanes(0x7fffffff, count, 64)
+    tmasks = [_lanes(mask, count, 64) for mask in (d >> u, b, c, d >> l)]
+
+    iota = array('Q', range(count))
+    if sys.byteorder == 'big':
+        iota.byteswap()
+
+    # Seeding only needs to reach the last word the observed outputs depend on
+    state    = [None] * n
+    state[0] = start * ones + step * int.from_bytes(iota.tobytes(), 'little')
+
+    for j in range(1, min(n, offset + len(outputs) + m + 1)):
+        x        = state[j - 1]
+        state[j] = (f * (x ^ ((x >> 30) & (ones * 3))) + j * ones) & M
+
+    # Each new word replaces the word `n` before it, so only a 624-word window is ever kept, as in `twist`
+    alive = ones
+    for j in range(n, n + offset + len(outputs)):
+        k        = j % n
+        state[k] = state[(k + m) % n] ^ _twist_lanes(state[k], state[(k + 1) % n], upper, lower, ones)
+
+        i = j - n - offset
+        if i < 0:
+            continue
+
+        diff = (_temper_lanes(state[k], tmasks) ^ (outputs[i] * ones)) & (masks[i] * ones)
+
+        # Bit 32 of a lane is set iff the lane is nonzero
+        alive &= ~(diff + M) >> 32
+        if not alive:
+            return []
+
+    found = []
+    while alive:
+        low    = alive & -alive
+        found.append(start + step * ((low.bit_length() - 1) // 64))
+        alive ^= low
+
+    return found
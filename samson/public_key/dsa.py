@@ -1,4 +1,5 @@
-from samson.math.general import mod_inv, find_prime, random_int_between, is_prime
+from samson.math.general import mod_inv, find_prime, random_int_between, is_prime, multi_pow
+from samson.math.algebra.rings.integer_ring import ZZ
 from samson.utilities.bytes import Bytes
 
 from samson.encoding.openssh.openssh_dsa_private_key import OpenSSHDSAPrivateKey
@@ -129,7 +130,8 @@ class DSA(EncodablePKI, SignatureAlg):
         w = mod_inv(s, self.q)
         u_1 = (self.hash_obj.hash(message).int() * w) % self.q
         u_2 = (r * w) % self.q
-        v = (pow(self.g, u_1, self.p) * pow(self.y, u_2, self.p) % self.p) % self.q
+        R = ZZ/ZZ(self.p)
+        v = int(multi_pow([R(self.g), R(self.y)], [u_1, u_2])) % self.q
         return v == r
 
 
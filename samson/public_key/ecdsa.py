@@ -1,4 +1,4 @@
-from samson.math.general import mod_inv, random_int_between
+from samson.math.general import mod_inv, random_int_between, multi_scalar_mul
 from samson.math.algebra.curves.weierstrass_curve import WeierstrassCurve
 from samson.utilities.bytes import Bytes
 from samson.public_key.dsa import DSA
@@ -120,7 +120,7 @@ class ECDSA(DSA):
 
         u_1 = (z * w) % self.q
         u_2 = (r * w) % self.q
-        v = u_1 * self.G + u_2 * self.Q
+        v = multi_scalar_mul([self.G, self.Q], [u_1, u_2])
         return v.x == r
 
 
@@ -3,6 +3,7 @@ from samson.public_key.dsa import DSA
 from samson.math.algebra.curves.twisted_edwards_curve import TwistedEdwardsPoint, TwistedEdwardsCurve, bit
 from samson.math.algebra.curves.named import EdwardsCurve25519
 from samson.hashes.sha2 import SHA512
+from samson.math.general import multi_scalar_mul, random_int
 
 from samson.encoding.openssh.openssh_eddsa_private_key import OpenSSHEdDSAPrivateKey
 from samson.encoding.openssh.openssh_eddsa_public_key import OpenSSHEdDSAPublicKey
@@ -150,6 +151,12 @@ class EdDSA(DSA):
         Returns:
             bool: Whether the signature is valid or not.
         """
+        R, S, h = self._parse_sig(message, sig)
+        return multi_scalar_mul([self.B, self.A], [S, -h]) == R
+
+
+
+    def _parse_sig(self, message: bytes, sig: bytes) -> (TwistedEdwardsPoint, int, int):
         sig = Bytes.wrap(sig, 'little')
 
         if len(sig) != self.curve.b // 4:
@@ -159,5 +166,54 @@ class EdDSA(DSA):
         S = sig[self.curve.b//8:].int()
 
         h = self.H.hash(self.curve.magic + self.encode_point(R) + self.encode_point(self.A) + message)[::-1].int()
+        return R, S, h
+
+
+
+    def batch_verify(self, messages: list, sigs: list) -> bool:
+        """
+        Verifies many `messages` against their `sigs` with a single multi-scalar multiplication. Each
+        equation is weighted by a random 128-bit scalar, so a forged signature only passes with negligible
+        probability. Uses the cofactored equation (i.e. both sides multiplied by 2**c), so signatures
+        with small-order components that `verify` rejects may be accepted.
+
+        Parameters:
+            messages (list): Messages.
+            sigs     (list): Signatures of `messages`.
+
+        Returns:
+            bool: Whether all signatures are valid.
+
+        Examples:
+            >>> from samson.public_key.eddsa import EdDSA
+            >>> eddsa = EdDSA()
+            >>> messages = [b'a', b'b', b'c']
+            >>> sigs = [eddsa.sign(m) for m in messages]
+            >>> eddsa.batch_verify(messages, sigs)
+            True
+
+            >>> eddsa.batch_verify(messages, sigs[::-1])
+            False
+
+        References:
+            https://ed25519.cr.yp.to/ed25519-20110926.pdf
+        """
+        if len(messages) != len(sigs):
+            raise ValueError("`messages` and `sigs` must be the same length")
+
+        l        = self.curve.l
+        points   = [self.B, self.A]
+        scalars  = [0, 0]
+
+        for message, sig in zip(messages, sigs):
+            R, S, h = self._parse_sig(message, sig)
+            z       = random_int(2**128)
+
+            scalars[0] += z * S
+            scalars[1] += z * h
+            points.append(R)
+            scalars.append(-z)
 
-        return self.B * S == R + (self.A * h)
+        scalars[0] %= l
+        scalars[1] = -scalars[1] % l
+        return multi_scalar_mul(points, scalars) * 2**self.curve.c == self.curve.zero()
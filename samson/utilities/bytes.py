@@ -1,8 +1,29 @@
-from samson.utilities.manipulation import xor_buffs, left_rotate, right_rotate, get_blocks, transpose, stretch_key
+from samson.utilities.manipulation import xor_buffs, left_rotate, right_rotate, transpose, stretch_key
 from samson.encoding.general import int_to_bytes
 from samson.utilities.general import rand_bytes
 import codecs
 
+# Lookup table for bytewise NOT
+INVERT_TABLE = bytes(255 - i for i in range(256))
+
+
+def _buffer(bytes_like: object) -> object:
+    return bytes_like.buffer if type(bytes_like) is BytesView else bytes_like
+
+
+def _readonly_view(bytes_like: object) -> memoryview:
+    view = memoryview(bytes_like).cast('B')
+
+    if view.readonly:
+        return view
+
+    # `memoryview.toreadonly` needs Python 3.8; before that, writable sources are copied into an immutable one
+    if hasattr(view, 'toreadonly'):
+        return view.toreadonly()
+
+    return memoryview(view.tobytes())
+
+
 class Bytes(bytearray):
     """
     Bytearray convenience class. Supports popular manipulations such as XOR, stretching, chunking, transposing, and rotations.
@@ -40,6 +61,15 @@ class Bytes(bytearray):
             return Bytes(bytes_like, byteorder=byteorder)
 
 
+    @staticmethod
+    def _from_buffer(buffer: object, byteorder: str):
+        # Skips `__init__`'s type checks for internal results that are already bytes-like
+        result = bytearray.__new__(Bytes)
+        bytearray.__init__(result, buffer)
+        result.byteorder = byteorder
+        return result
+
+
     @staticmethod
     def random(size: int=16, byteorder: str='big'):
         """
@@ -72,9 +102,9 @@ class Bytes(bytearray):
     # Operators
     def __xor__(self, other):
         if type(other) is int:
-            return Bytes(int.to_bytes(self.to_int() ^ other, len(self), self.byteorder), self.byteorder)
+            return Bytes._from_buffer(int.to_bytes(self.to_int() ^ other, len(self), self.byteorder), self.byteorder)
         else:
-            return Bytes(xor_buffs(self, other), self.byteorder)
+            return Bytes._from_buffer(xor_buffs(self, _buffer(other)), self.byteorder)
 
 
     def __rxor__(self, other):
@@ -82,20 +112,20 @@ class Bytes(bytearray):
 
 
     def __getitem__(self, index):
-        result = bytearray.__getitem__(self, index)
-        if type(result) is int:
-            return result
+        if type(index) is slice:
+            # Slice through a memoryview so the data is copied once
+            return Bytes._from_buffer(memoryview(self)[index], self.byteorder)
         else:
-            return Bytes(result, self.byteorder)
+            return bytearray.__getitem__(self, index)
 
 
     def __and__(self, other):
         other_as_int = other
 
         if not type(other) is int:
-            other_as_int = int.from_bytes(other, self.byteorder)
+            other_as_int = int.from_bytes(_buffer(other), self.byteorder)
 
-        return Bytes(int.to_bytes(self.to_int() & other_as_int, len(self), self.byteorder), self.byteorder)
+        return Bytes._from_buffer(int.to_bytes(self.to_int() & other_as_int, len(self), self.byteorder), self.byteorder)
 
 
     def __rand__(self, other):
@@ -106,9 +136,9 @@ class Bytes(bytearray):
         other_as_int = other
 
         if not type(other) is int:
-            other_as_int = int.from_bytes(other, self.byteorder)
+            other_as_int = int.from_bytes(_buffer(other), self.byteorder)
 
-        return Bytes(int.to_bytes(self.to_int() | other_as_int, len(self), self.byteorder), self.byteorder)
+        return Bytes._from_buffer(int.to_bytes(self.to_int() | other_as_int, len(self), self.byteorder), self.byteorder)
 
 
     def __ror__(self, other):
@@ -116,24 +146,23 @@ class Bytes(bytearray):
 
 
     def __add__(self, other):
-        return Bytes(bytearray.__add__(self, other), self.byteorder)
+        return Bytes._from_buffer(bytearray.__add__(self, _buffer(other)), self.byteorder)
 
 
     def __radd__(self, other):
-        return Bytes(bytearray(other).__add__(self), self.byteorder)
+        return Bytes._from_buffer(bytearray(_buffer(other)).__add__(self), self.byteorder)
 
 
     def __lshift__(self, num):
-        return Bytes(int.to_bytes((self.to_int() << num) %  (2**(len(self) * 8)), len(self), self.byteorder))
+        return Bytes._from_buffer(int.to_bytes((self.to_int() << num) & ((1 << (len(self) * 8)) - 1), len(self), self.byteorder), self.byteorder)
 
 
     def __rshift__(self, num):
-        return Bytes(int.to_bytes((self.to_int() >> num) % (2**(len(self) * 8)), len(self), self.byteorder))
+        return Bytes._from_buffer(int.to_bytes(self.to_int() >> num, len(self), self.byteorder), self.byteorder)
 
 
     def __invert__(self):
-        max_val = 2 ** (len(self) * 8) - 1
-        return Bytes(max_val - self.to_int(), self.byteorder)
+        return Bytes._from_buffer(self.translate(INVERT_TABLE), self.byteorder)
 
 
     # Manipulations
@@ -186,7 +215,27 @@ class Bytes(bytearray):
         Returns:
             list: List of Bytes.
         """
-        return get_blocks(self, size, allow_partials)
+        view = memoryview(self)
+        end  = len(self) if allow_partials else len(self) - len(self) % size
+        return [Bytes._from_buffer(view[i:i + size], self.byteorder) for i in range(0, end, size)]
+
+
+
+    def view(self):
+        """
+        Creates a zero-copy, read-only view of the Bytes. The Bytes cannot be resized while the view exists.
+
+        Returns:
+            BytesView: View over the same memory.
+
+        Examples:
+            >>> from samson.utilities.bytes import Bytes
+            >>> view = Bytes(b'abcdefgh').view()
+            >>> [bytes(block) for block in view[2:].chunk(4, allow_partials=True)]
+            [b'cdef', b'gh']
+
+        """
+        return BytesView(self, self.byteorder)
 
 
 
@@ -359,3 +408,118 @@ class Bytes(bytearray):
             Bitstring: Bitstring representation.
         """
         return self.to_bits()
+
+
+
+class BytesView(object):
+    """
+    Zero-copy, read-only view over a bytes-like object. Slicing and chunking return new views of the same memory,
+    so walking a large buffer block by block does not copy it. Operations that build new data return Bytes.
+    """
+
+    __slots__ = ['buffer', 'byteorder']
+
+    def __init__(self, bytes_like: bytes, byteorder: str='big'):
+        """
+        Parameters:
+            bytes_like (bytes): Any object supporting the buffer protocol.
+            byteorder    (str): Byte order used when converting to integers.
+        """
+        self.buffer    = _readonly_view(_buffer(bytes_like))
+        self.byteorder = byteorder
+
+
+    def __repr__(self):
+        return f'<BytesView: {str(bytes(self.buffer))}, byteorder={self.byteorder}>'
+
+    def __str__(self):
+        return self.__repr__()
+
+
+    def __len__(self):
+        return len(self.buffer)
+
+
+    def __iter__(self):
+        return iter(self.buffer)
+
+
+    def __bytes__(self):
+        return self.buffer.tobytes()
+
+
+    def __getitem__(self, index):
+        if type(index) is slice:
+            result = BytesView.__new__(BytesView)
+            result.buffer    = self.buffer[index]
+            result.byteorder = self.byteorder
+            return result
+        else:
+            return self.buffer[index]
+
+
+    def __eq__(self, other):
+        return self.buffer == _buffer(other)
+
+
+    __hash__ = None
+
+
+    def __xor__(self, other):
+        if type(other) is int:
+            return Bytes._from_buffer(int.to_bytes(self.to_int() ^ other, len(self), self.byteorder), self.byteorder)
+        else:
+            return Bytes._from_buffer(xor_buffs(self.buffer, _buffer(other)), self.byteorder)
+
+
+    def __rxor__(self, other):
+        return self.__xor__(other)
+
+
+    def __add__(self, other):
+        return Bytes._from_buffer(self.buffer.tobytes() + bytes(_buffer(other)), self.byteorder)
+
+
+    def chunk(self, size: int, allow_partials: bool=False) -> list:
+        """
+        Chunks the view into `size` length views without copying.
+
+        Parameters:
+            size            (int): Size of the chunks.
+            allow_partials (bool): Whether or not to allow the last chunk to be a partial.
+
+        Returns:
+            list: List of BytesView.
+        """
+        end = len(self) if allow_partials else len(self) - len(self) % size
+        return [self[i:i + size] for i in range(0, end, size)]
+
+
+    def to_bytes(self) -> Bytes:
+        """
+        Copies the view into a new Bytes.
+
+        Returns:
+            Bytes: Copy of the viewed data.
+        """
+        return Bytes._from_buffer(self.buffer, self.byteorder)
+
+
+    def to_int(self) -> int:
+        """
+        Converts to an integer representation.
+
+        Returns:
+            int: Integer representation.
+        """
+        return int.from_bytes(self.buffer, self.byteorder)
+
+
+    def int(self) -> int:
+        """
+        Converts to an integer representation.
+
+        Returns:
+            int: Integer representation.
+        """
+        return self.to_int()
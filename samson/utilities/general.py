@@ -1,5 +1,8 @@
 from types import FunctionType
+import tempfile
 import random
+import json
+import os
 
 
 def rand_bytes(size: int=16) -> bytes:
@@ -140,6 +143,45 @@ def add_or_increment(dictionary: dict, key: object, value: int=1):
         dictionary[key] = value
 
 
+def load_checkpoint(filepath: str, fingerprint: list) -> dict:
+    """
+    Loads a JSON checkpoint written by `save_checkpoint`.
+
+    Parameters:
+        filepath     (str): Path of the checkpoint. May be None.
+        fingerprint (list): Parameters the checkpoint must have been saved for.
+
+    Returns:
+        dict: Saved state, or None if there's no valid checkpoint for `fingerprint`.
+    """
+    if not filepath or not os.path.exists(filepath):
+        return None
+
+    with open(filepath) as f:
+        try:
+            state = json.load(f)
+        except ValueError:
+            return None
+
+    return state if state.get('fingerprint') == fingerprint else None
+
+
+
+def save_checkpoint(filepath: str, state: dict):
+    """
+    Atomically writes a JSON checkpoint.
+
+    Parameters:
+        filepath (str): Path of the checkpoint.
+        state   (dict): JSON-serializable state. Should include a 'fingerprint' key for `load_checkpoint`.
+    """
+    with tempfile.NamedTemporaryFile('w', dir=os.path.dirname(os.path.abspath(filepath)), delete=False) as f:
+        json.dump(state, f)
+
+    os.replace(f.name, filepath)
+
+
+
 def crc24(data: bytes) -> int:
     """
     Calculates the CRC-24 checksum of `data`
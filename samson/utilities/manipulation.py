@@ -14,7 +14,7 @@ def xor_buffs(buf1: bytes, buf2: bytes) -> bytearray:
     if len(buf1) != len(buf2):
         raise Exception('Buffers must be equal length.')
 
-    return bytearray([x ^ y for x, y in zip(buf1, buf2)])
+    return bytearray((int.from_bytes(buf1, 'little') ^ int.from_bytes(buf2, 'little')).to_bytes(len(buf1), 'little'))
 
 
 
@@ -6,8 +6,10 @@ from samson.utilities.general import rand_bytes
 from samson.attacks.cbc_padding_oracle_attack import CBCPaddingOracleAttack
 from samson.oracles.padding_oracle import PaddingOracle
 from samson.utilities.exceptions import InvalidPaddingException
+import asyncio
 import random
 import base64
+import time
 import unittest
 
 import logging
@@ -84,3 +86,29 @@ class CBCPaddingOracleTestCase(unittest.TestCase):
 
         print(recovered_plaintext)
         self.assertEqual(base64.b64decode(chosen_plaintext.encode()), recovered_plaintext)
+
+
+
+    def test_paddingattack_concurrent(self):
+        ciphertext = encrypt_data()
+
+        # Simulates a network oracle
+        def slow_decrypt(data):
+            time.sleep(0.002)
+            return decrypt_data(data)
+
+        attack = CBCPaddingOracleAttack(PaddingOracle(slow_decrypt), iv, block_size=block_size, max_concurrency=32)
+        recovered_plaintext = padder.unpad(attack.execute(bytes(ciphertext)))
+        self.assertEqual(base64.b64decode(chosen_plaintext.encode()), recovered_plaintext)
+
+
+
+    def test_paddingattack_async(self):
+        async def async_decrypt(data):
+            await asyncio.sleep(0)
+            return decrypt_data(data)
+
+        for plaintext in [b'', b'A' * 14 + b'\x02', b'A' * 31]:
+            ciphertext = cbc.encrypt(plaintext)
+            attack     = CBCPaddingOracleAttack(PaddingOracle(async_decrypt), iv, block_size=block_size, max_concurrency=8)
+            self.assertEqual(padder.unpad(attack.execute(bytes(ciphertext))), plaintext)
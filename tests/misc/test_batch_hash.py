@@ -0,0 +1,44 @@
+from samson.hashes.all import MD4, MD5, SHA1, SHA224, SHA256, SHA512, NTLM
+from samson.hashes.batch import MAX_MESSAGE_LENGTH
+from samson.auxiliary.candidate_generator import batch_crack, mask_candidates, wordlist_candidates
+from samson.utilities.bytes import Bytes
+import hashlib
+import unittest
+
+
+class BatchHashTestCase(unittest.TestCase):
+    def test_hash_many(self):
+        messages = [Bytes.random(i % (MAX_MESSAGE_LENGTH + 1)) for i in range(300)]
+
+        for hash_type, reference_method in [(MD5, hashlib.md5), (SHA1, hashlib.sha1), (SHA224, hashlib.sha224), (SHA256, hashlib.sha256), (SHA512, hashlib.sha512)]:
+            self.assertEqual(hash_type().hash_many(messages), [reference_method(message).digest() for message in messages])
+
+        md4 = MD4()
+        self.assertEqual(md4.hash_many(messages), [md4.hash(message) for message in messages])
+
+
+    def test_mixed_lengths(self):
+        messages = [Bytes.random(i % 150) for i in range(300)]
+
+        for hash_type, reference_method in [(MD5, hashlib.md5), (SHA1, hashlib.sha1), (SHA256, hashlib.sha256)]:
+            self.assertEqual(hash_type().hash_many(messages), [reference_method(message).digest() for message in messages])
+
+
+    def test_custom_iv(self):
+        md5      = MD5(initial_state=Bytes.random(16))
+        messages = [Bytes.random(20) for _ in range(10)]
+        self.assertEqual(md5.hash_many(messages), [md5.hash(message) for message in messages])
+
+
+    def test_batch_crack(self):
+        ntlm    = NTLM()
+        targets = ntlm.hash_many([b'zq7', b'ab0'])
+        found   = batch_crack(ntlm, targets, mask_candidates('?l?l?d'), chunk_size=1000)
+
+        self.assertEqual(found, {bytes(targets[0]): b'zq7', bytes(targets[1]): b'ab0'})
+
+
+    def test_wordlist(self):
+        target = SHA256().hash(b'HUNTER2')
+        found  = batch_crack(SHA256(), [target], wordlist_candidates(['password\n', 'hunter2\n'], [bytes.upper]))
+        self.assertEqual(found, {bytes(target): b'HUNTER2'})
@@ -0,0 +1,53 @@
+from samson.utilities.bytes import Bytes, BytesView
+import unittest
+
+
+class BytesTestCase(unittest.TestCase):
+    def test_operators(self):
+        for byteorder in ['big', 'little']:
+            for _ in range(200):
+                length = Bytes.random(1).int() % 40 + 1
+                a, b   = Bytes.random(length, byteorder), Bytes.random(length, byteorder)
+                mask   = (1 << (length * 8)) - 1
+                shift  = Bytes.random(1).int() % (length * 8 + 4)
+
+                for result, expected in [(a ^ b, a.int() ^ b.int()), (a & b, a.int() & b.int()), (a | b, a.int() | b.int()), (~a, a.int() ^ mask), (a << shift, (a.int() << shift) & mask), (a >> shift, a.int() >> shift)]:
+                    self.assertEqual(len(result), length)
+                    self.assertEqual(result.byteorder, byteorder)
+                    self.assertEqual(result.int(), expected)
+
+
+
+    def test_slicing(self):
+        data = Bytes.random(100, 'little')
+
+        for index in [slice(3, 50), slice(None, None, -1), slice(1, 90, 7), slice(-10, None)]:
+            result = data[index]
+            self.assertEqual(type(result), Bytes)
+            self.assertEqual(result.byteorder, 'little')
+            self.assertEqual(bytes(result), bytes(data)[index])
+
+        self.assertEqual(data[5], bytes(data)[5])
+        self.assertEqual([bytes(chunk) for chunk in data.chunk(16)], [bytes(data[i:i + 16]) for i in range(0, 96, 16)])
+        self.assertEqual(len(data.chunk(16, allow_partials=True)[-1]), 4)
+
+
+
+    def test_view(self):
+        data = Bytes.random(100)
+        view = data.view()
+
+        self.assertEqual(type(view[10:20]), BytesView)
+        self.assertEqual(view[10:20], data[10:20])
+        self.assertEqual(view[10:20][2:4].int(), data[12:14].int())
+        self.assertEqual([chunk.to_bytes() for chunk in view.chunk(16, allow_partials=True)], data.chunk(16, allow_partials=True))
+        self.assertEqual(view[:16] ^ data[16:32], data[:16] ^ data[16:32])
+        self.assertEqual(data[:16] ^ view[16:32], data[:16] ^ data[16:32])
+        self.assertEqual(data[:4] + view[4:], data)
+
+        # Views share memory with the Bytes they came from
+        data[10] ^= 0xFF
+        self.assertEqual(view[10], data[10])
+
+        with self.assertRaises(TypeError):
+            view.buffer[0] = 0
@@ -0,0 +1,93 @@
+from samson.math.algebra.all import ZZ
+from samson.math.dense_int_vector import DenseIntVector, schoolbook_mul, FAST_DIVISION_THRESHOLD
+from samson.math.polynomial import Modulus
+from samson.math.sparse_vector import SparseVector
+from samson.math.symbols import Symbol
+from samson.math.general import random_int
+import unittest
+
+x  = Symbol('x')
+Zp = ZZ/ZZ(65537)
+P  = Zp[x]
+
+def rand_coeffs(length):
+    return [random_int(65537) for _ in range(length)]
+
+
+class DensePolynomialTestCase(unittest.TestCase):
+    def test_backend_selection(self):
+        self.assertTrue(P(x**5 + 3*x + 1).is_dense())
+        self.assertFalse(P(x**1000 + 1).is_dense())
+
+        # Product of sparse polynomials falls back to the sparse backend
+        self.assertFalse((P(x**1000 + 1) * P(x**1000 - 1)).is_dense())
+
+
+    def test_mul(self):
+        for length_a, length_b in [(5, 7), (40, 100), (300, 300), (1100, 1030)]:
+            a, b = rand_coeffs(length_a), rand_coeffs(length_b)
+            expected = [val % 65537 for val in schoolbook_mul(a, b)]
+            self.assertEqual((P(a) * P(b)).coeffs.values, expected)
+
+
+    def test_divmod(self):
+        for _ in range(10):
+            a = P(rand_coeffs(random_int(200) + 1))
+            b = P(rand_coeffs(random_int(100) + 1))
+
+            if not b:
+                continue
+
+            q, r = divmod(a, b)
+            self.assertEqual(q*b + r, a)
+            self.assertLess(r.degree(), max(b.degree(), 1))
+
+
+    def test_sparse_compatibility(self):
+        coeffs = rand_coeffs(50)
+        dense  = P(coeffs)
+
+        # Force the sparse backend
+        sparse = P(coeffs)
+        sparse.coeffs = SparseVector([Zp(c) for c in coeffs], Zp.zero())
+
+        self.assertEqual(type(dense.coeffs), DenseIntVector)
+        self.assertEqual(type(sparse.coeffs), SparseVector)
+        self.assertEqual(dense, sparse)
+        self.assertEqual(hash(dense), hash(sparse))
+        self.assertEqual(dense.coeffs[3], sparse.coeffs[3])
+        self.assertEqual(list(dense.coeffs), list(sparse.coeffs))
+        self.assertEqual(dense * 3, sparse * 3)
+        self.assertEqual(dense.evaluate(Zp(12)), Zp(sum([c * 12**i for i, c in enumerate(coeffs)])))
+
+
+    def test_integer_coefficients(self):
+        a = ZZ[x](x**3 - 4*x + 7)
+        b = ZZ[x](x - 2)
+
+        self.assertTrue(a.is_dense())
+        self.assertEqual(a*b, ZZ[x](x**4 - 2*x**3 - 4*x**2 + 15*x - 14))
+        self.assertEqual(divmod(a, b), (ZZ[x](x**2 + 2*x), ZZ[x](7)))
+
+
+    def test_modulus(self):
+        f = P(rand_coeffs(40) + [1])
+        M = Modulus(f)
+
+        for length in [10, 41, 79, 300]:
+            a = P(rand_coeffs(length))
+            self.assertEqual(a % M, a % f)
+
+        # QuotientRing reduction goes through the Modulus
+        Q = P/f
+        a, b = P(rand_coeffs(40)), P(rand_coeffs(40))
+        self.assertEqual((Q(a) * Q(b)).val, (a*b) % f)
+
+
+    def test_fast_divmod(self):
+        a = P(rand_coeffs(FAST_DIVISION_THRESHOLD*3))
+        b = P(rand_coeffs(FAST_DIVISION_THRESHOLD + 1) + [3])
+
+        q, r = divmod(a, b)
+        self.assertEqual(q*b + r, a)
+        self.assertLess(r.degree(), b.degree())
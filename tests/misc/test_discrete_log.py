@@ -0,0 +1,81 @@
+from samson.math.algebra.all import ZZ, WeierstrassCurve
+from samson.math.discrete_log import pollards_rho_log, parallel_kangaroo, solve_linear_congruence
+from samson.math.general import random_int, find_prime, is_prime, bsgs, pohlig_hellman
+import tempfile
+import os
+import unittest
+
+
+def _prime_order_subgroup(bits):
+    # Safe prime p = 2q + 1; squares generate the subgroup of prime order q
+    while True:
+        q = find_prime(bits)
+        if is_prime(2*q + 1):
+            return (ZZ/ZZ(2*q + 1)).mul_group()(4), q
+
+
+class DiscreteLogTestCase(unittest.TestCase):
+    def test_rho_mul_group(self):
+        g, q = _prime_order_subgroup(28)
+        for _ in range(3):
+            x = random_int(q)
+            self.assertEqual(pollards_rho_log(g, g*x, q, processes=1), x)
+
+
+    def test_rho_curve(self):
+        # Curve of prime order 67061237
+        ring  = ZZ/ZZ(67057169)
+        curve = WeierstrassCurve(a=3, b=9, ring=ring)
+        G     = curve.G
+        x     = random_int(67061237)
+        self.assertEqual(pollards_rho_log(G, G*x, 67061237, processes=1), x)
+
+
+    def test_rho_parallel(self):
+        g, q = _prime_order_subgroup(28)
+        x    = random_int(q)
+        self.assertEqual(pollards_rho_log(g, g*x, q, processes=2), x)
+
+
+    def test_rho_checkpoint(self):
+        g, q = _prime_order_subgroup(28)
+        x    = random_int(q)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'rho.json')
+            self.assertEqual(pollards_rho_log(g, g*x, q, processes=1, checkpoint=path), x)
+            self.assertTrue(os.path.exists(path))
+
+            # Resuming from the saved state still finds the log
+            self.assertEqual(pollards_rho_log(g, g*x, q, processes=1, checkpoint=path), x)
+
+
+    def test_kangaroo(self):
+        p = find_prime(128)
+        g = (ZZ/ZZ(p)).mul_group()(5)
+
+        for processes in [1, 2]:
+            x = 2**50 + random_int(2**30)
+            self.assertEqual(parallel_kangaroo(g, g*x, 2**50, 2**50 + 2**30, processes=processes), x)
+
+
+    def test_kangaroo_edwards(self):
+        from samson.math.algebra.curves.named import EdwardsCurve25519
+        B = EdwardsCurve25519.B
+        x = random_int(2**28)
+        self.assertEqual(parallel_kangaroo(B, B*x, 0, 2**28, processes=1), x)
+
+
+    def test_bsgs_and_pohlig_hellman(self):
+        g, q = _prime_order_subgroup(36)
+        x    = random_int(q)
+        self.assertEqual(pohlig_hellman(g, g*x, q), x)
+
+        y = random_int(2**20)
+        self.assertEqual(bsgs(g, g*y, 2**20), y)
+
+
+    def test_solve_linear_congruence(self):
+        self.assertEqual(solve_linear_congruence(3, 4, 7), [6])
+        self.assertEqual(solve_linear_congruence(4, 3, 6), [])
+        self.assertEqual(solve_linear_congruence(0, 0, 6), [])
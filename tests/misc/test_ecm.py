@@ -0,0 +1,62 @@
+from samson.math.ecm import run_ecm, ecm_curve, ecm_sieve, prime_sieve, suyama_curve, montgomery_ladder, montgomery_double, montgomery_add
+from samson.math.general import ecm, factor, find_prime, is_prime, random_int_between
+from samson.utilities.exceptions import ProbabilisticFailureException
+import unittest
+
+
+class ECMTestCase(unittest.TestCase):
+    def test_ladder(self):
+        # Differential addition and doubling agree with the ladder
+        n      = find_prime(64)
+        P, a24 = suyama_curve(random_int_between(6, n - 1), n)
+
+        P2 = montgomery_double(P, a24, n)
+        P3 = montgomery_add(P2, P, P, n)
+        P5 = montgomery_add(P3, P2, P, n)
+
+        for k, Q in [(2, P2), (3, P3), (5, P5)]:
+            R = montgomery_ladder(P, k, a24, n)
+            self.assertEqual(R[0] * Q[1] % n, Q[0] * R[1] % n)
+
+
+    def test_sieve(self):
+        sieve = prime_sieve(10000)
+        self.assertEqual([i for i in range(10001) if sieve[i]], [i for i in range(10001) if is_prime(i)])
+
+
+    def test_factor(self):
+        for bits in [32, 40, 48]:
+            p, q = find_prime(bits), find_prime(bits + 8)
+            self.assertIn(ecm(p*q), [p, q])
+
+
+    def test_stage2(self):
+        # Stage 1 alone with a tiny bound rarely succeeds; stage 2 catches the large prime in the group order
+        p, q  = find_prime(36), find_prime(60)
+        found = [ecm_curve(p*q, sigma, 50, 500000) for sigma in range(6, 200)]
+        self.assertIn(p, found)
+
+
+    def test_stage2_large_bound(self):
+        # Bounds over 10^7 switch to the wider giant step, whose last step reads past `B2 + D`
+        p, q  = find_prime(36), find_prime(60)
+        B2    = 10**7 + 1
+        sieve = ecm_sieve(B2)
+        self.assertIn(ecm_curve(p*q, 6, 50, B2, sieve), [None, p, q])
+
+
+    def test_pool(self):
+        p, q = find_prime(40), find_prime(48)
+        self.assertIn(run_ecm(p*q, B1=11000, processes=2), [p, q])
+
+
+    def test_failure(self):
+        p, q = find_prime(128), find_prime(128)
+        with self.assertRaises(ProbabilisticFailureException):
+            ecm(p*q, attempts=2, B1=100)
+
+
+    def test_factor_cofactors(self):
+        primes = [find_prime(52), find_prime(56), find_prime(20)]
+        n      = primes[0] * primes[1] * primes[2]**2
+        self.assertEqual(factor(n, use_ecm=True), {primes[0]: 1, primes[1]: 1, primes[2]: 2})
@@ -35,6 +35,17 @@ class EnglishAnalyzerTestCase(unittest.TestCase):
 
 
 
+    def test_batch_against_random(self):
+        for english_val in ENGLISH_VALUES:
+            all_values = [Bytes.random(len(english_val)) for _ in range(1000)] + [english_val]
+            shuffle(all_values)
+
+            scores = self.analyzer.analyze_batch(all_values)
+            self.assertEqual(all_values[max(range(len(scores)), key=scores.__getitem__)], english_val)
+            self.assertEqual(self.analyzer.select_highest_scores(all_values, prefilter=16)[0], english_val)
+
+
+
     # Tests the analyzer against a set containing a known English string and shuffled versions of it.
     def test_against_shuffle(self):
         for english_val in ENGLISH_VALUES:
@@ -0,0 +1,77 @@
+from samson.math.algebra.all import ZZ
+from samson.math.algebra.curves.weierstrass_curve import WeierstrassCurve
+from samson.math.algebra.curves.named import P256, P384
+from samson.math.fixed_base_table import FixedBaseTable, ModularFixedBaseTable, WeierstrassFixedBaseTable
+from samson.math.general import random_int, fast_mul
+from samson.protocols.diffie_hellman import DiffieHellman
+import tempfile
+import os
+import unittest
+
+
+class FixedBaseTableTestCase(unittest.TestCase):
+    def test_generic(self):
+        Zp    = ZZ/ZZ(65537)
+        table = FixedBaseTable(Zp(3), Zp.one(), Zp(3).__class__.__mul__, 32, 3)
+
+        for _ in range(50):
+            k = random_int(2**32)
+            self.assertEqual(table ** k, Zp(3)**k)
+
+        with self.assertRaises(ValueError):
+            table ** 2**32
+
+
+    def test_modular(self):
+        p = DiffieHellman.MODP_1536
+        for width in [1, 4, 5]:
+            table = ModularFixedBaseTable(5, p, 1536, width)
+
+            for _ in range(10):
+                k = random_int(p)
+                self.assertEqual(table ** k, pow(5, k, p))
+
+
+    def test_named_curves(self):
+        for curve in [P256, P384]:
+            for _ in range(10):
+                k = random_int(curve.q)
+                self.assertEqual(curve.G * k, fast_mul(curve.G, k))
+
+            self.assertIsNotNone(curve.G_table)
+            self.assertEqual(curve.G * 0, curve.POINT_AT_INFINITY)
+            self.assertEqual(curve.G * (curve.q - 1), -curve.G)
+
+
+    def test_small_order(self):
+        ring  = ZZ/ZZ(97)
+        curve = WeierstrassCurve(a=ring(2), b=ring(3), ring=ring, base_tuple=(3, 6))
+        table = curve.precompute_G(width=4)
+
+        for k in range(2**table.bits):
+            self.assertEqual(table * k, fast_mul(curve.G, k))
+
+
+    def test_serialization(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path  = os.path.join(tmp_dir, 'p256.json')
+            table = WeierstrassFixedBaseTable(P256.G, 256, 5, filepath=path)
+            self.assertTrue(os.path.exists(path))
+
+            loaded = WeierstrassFixedBaseTable(P256.G, 256, 5, filepath=path)
+            self.assertEqual(loaded.table, [[list(point) if point else point for point in row] for row in table.table])
+
+            k = random_int(P256.q)
+            self.assertEqual(loaded * k, table * k)
+
+            # Mismatched parameters rebuild rather than trusting the file
+            other = WeierstrassFixedBaseTable(P256.G * 2, 256, 5)
+            self.assertFalse(other.load(path))
+
+
+    def test_diffie_hellman(self):
+        alice = DiffieHellman(p=DiffieHellman.MODP_1536)
+        bob   = DiffieHellman(p=DiffieHellman.MODP_1536)
+
+        self.assertEqual(alice.get_challenge(), pow(2, alice.key, alice.p))
+        self.assertEqual(alice.derive_key(bob.get_challenge()), bob.derive_key(alice.get_challenge()))
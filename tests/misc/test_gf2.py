@@ -0,0 +1,49 @@
+from samson.math.gf2 import GF2Matrix, SymbolicBits, solve, popcount
+from samson.utilities.manipulation import left_rotate
+from samson.utilities.bytes import Bytes
+import unittest
+
+
+class GF2TestCase(unittest.TestCase):
+    def test_rref(self):
+        for _ in range(100):
+            num_rows, num_cols = Bytes.random(1).int() % 80 + 1, Bytes.random(1).int() % 80 + 1
+            matrix = GF2Matrix([Bytes.random(10).int() % 2**num_cols for _ in range(num_rows)], num_cols)
+
+            reduced, pivots = matrix.rref()
+            self.assertEqual(len(reduced), len(pivots))
+
+            for row, pivot in zip(reduced.rows, pivots):
+                self.assertEqual(row.bit_length() - 1, pivot)
+                self.assertTrue(all(not (other >> pivot) & 1 for other in reduced.rows if other != row))
+
+            # Row space is preserved
+            self.assertEqual(GF2Matrix(reduced.rows + matrix.rows, num_cols).rank(), len(pivots))
+
+
+
+    def test_solve(self):
+        for _ in range(100):
+            num_cols = Bytes.random(1).int() % 100 + 1
+            matrix   = GF2Matrix([Bytes.random(13).int() % 2**num_cols for _ in range(num_cols + 10)], num_cols)
+            expected = Bytes.random(13).int() % 2**num_cols
+            values   = [popcount(row & expected) & 1 for row in matrix.rows]
+
+            self.assertEqual(matrix * matrix.solve(values), matrix * expected)
+            self.assertEqual(matrix * solve(matrix.rows, values), matrix * expected)
+
+        with self.assertRaises(ValueError):
+            GF2Matrix([0b11, 0b01, 0b10], 2).solve([1, 1, 1])
+
+
+
+    def test_symbolic(self):
+        for _ in range(20):
+            value = Bytes.random(8).int()
+            sym   = SymbolicBits.variables(64)
+
+            for func in [lambda x: x ^ (x >> 7) ^ ((x << 13) & 2**64 - 1), lambda x: left_rotate(x, 24, bits=64), lambda x: (x & 0xF0F0F0F0) | ((x >> 32) & 0x0F0F0F0F)]:
+                self.assertEqual(func(sym).evaluate(value), func(value))
+
+            self.assertEqual((sym + sym).evaluate(value) & 1, 0)
+            self.assertIsNone((sym + sym)[1])
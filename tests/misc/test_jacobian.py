@@ -0,0 +1,44 @@
+from samson.math.algebra.all import ZZ
+from samson.math.algebra.curves.weierstrass_curve import WeierstrassCurve, WeierstrassPoint
+from samson.math.algebra.curves.named import P256
+from samson.math.general import random_int, find_prime, fast_mul, gcd
+from samson.utilities.exceptions import NotInvertibleException
+import unittest
+
+
+class JacobianTestCase(unittest.TestCase):
+    def test_p256(self):
+        G = P256.G
+        for _ in range(5):
+            k = random_int(P256.q)
+            self.assertEqual(G * k, fast_mul(G, k))
+            self.assertEqual(G * -k, -(G * k))
+
+        self.assertEqual(G * 0, P256.POINT_AT_INFINITY)
+        self.assertEqual(G * P256.q, P256.POINT_AT_INFINITY)
+        self.assertEqual(G * (P256.q + 1), G)
+
+
+    def test_random_curves(self):
+        for bits in [8, 16, 32, 61]:
+            p     = find_prime(bits)
+            ring  = ZZ/ZZ(p)
+            curve = WeierstrassCurve(a=ring(random_int(p)), b=ring(random_int(p)), ring=ring, check_singularity=False)
+
+            for _ in range(5):
+                P = curve.random()
+                k = random_int(p*2)
+                self.assertEqual(P * k, fast_mul(P, k))
+                self.assertEqual(P + P, fast_mul(P, 2))
+
+
+    def test_composite_modulus(self):
+        # Factoring with curves over composite moduli relies on failed inversions surfacing as NotInvertibleException
+        p, q  = find_prime(24), find_prime(28)
+        ring  = ZZ/ZZ(p*q)
+        curve = WeierstrassCurve(a=ring(1), b=ring(1), ring=ring, check_singularity=False)
+
+        with self.assertRaises(NotInvertibleException) as ctx:
+            WeierstrassPoint(1, 2, curve) + WeierstrassPoint(1 + p, 3, curve)
+
+        self.assertEqual(gcd(ctx.exception.parameters['a'], p*q), p)
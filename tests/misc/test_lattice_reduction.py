@@ -0,0 +1,87 @@
+from samson.math.lattice_reduction import integral_lll, fp_lll, lll_reduce, bkz_reduce, dot
+from samson.math.matrix import Matrix
+from samson.math.algebra.all import QQ
+from fractions import Fraction
+import random
+import unittest
+
+
+def gso_exact(basis):
+    ortho, mu, norms = [], [[Fraction(0)]*len(basis) for _ in basis], []
+    for i, row in enumerate(basis):
+        vec = [Fraction(x) for x in row]
+        for j in range(i):
+            mu[i][j] = sum([Fraction(x)*y for x, y in zip(row, ortho[j])]) / norms[j]
+            vec      = [a - mu[i][j]*b for a, b in zip(vec, ortho[j])]
+
+        ortho.append(vec)
+        norms.append(sum([a*a for a in vec]))
+
+    return mu, norms
+
+
+def is_lll_reduced(basis, delta):
+    mu, norms = gso_exact(basis)
+    n = len(basis)
+
+    size_reduced = all([abs(mu[i][j]) <= Fraction(1, 2) for i in range(n) for j in range(i)])
+    lovasz       = all([norms[k] >= (Fraction(str(delta)) - mu[k][k-1]**2) * norms[k-1] for k in range(1, n)])
+    return size_reduced and lovasz
+
+
+def random_basis(n, bits):
+    return [[random.randint(-2**bits, 2**bits) for _ in range(n + 1)] for _ in range(n)]
+
+
+def knapsack_basis(n, bits):
+    pub = [random.getrandbits(bits) for _ in range(n)]
+    return [[int(i == j) for j in range(n)] + [pub[i]] for i in range(n)] + [[0]*n + [sum(pub[:n // 2])]]
+
+
+
+class LatticeReductionTestCase(unittest.TestCase):
+    def test_lll(self):
+        for n, bits in [(2, 4), (5, 20), (10, 8), (20, 30), (12, 100)]:
+            basis = random_basis(n, bits)
+
+            for delta in [0.75, 0.99]:
+                self.assertTrue(is_lll_reduced(lll_reduce(basis, delta), delta))
+                self.assertTrue(is_lll_reduced(integral_lll(basis, delta), delta))
+
+
+    def test_fp_lll(self):
+        basis   = random_basis(20, 16)
+        reduced = integral_lll(fp_lll(basis, 0.99), 0.99)
+        self.assertTrue(is_lll_reduced(reduced, 0.99))
+
+        # Large entries lose all precision in doubles
+        with self.assertRaises((FloatingPointError, OverflowError)):
+            fp_lll(knapsack_basis(20, 200), 0.99)
+
+
+    def test_knapsack(self):
+        basis   = knapsack_basis(24, 80)
+        reduced = lll_reduce(basis, 0.99)
+        self.assertTrue(is_lll_reduced(reduced, 0.99))
+
+
+    def test_bkz(self):
+        for _ in range(5):
+            basis = random_basis(12, 20)
+            lll_b = lll_reduce(basis, 0.99)
+            bkz_b = bkz_reduce(basis, 6, 0.99)
+
+            self.assertTrue(is_lll_reduced(bkz_b, 0.99))
+            self.assertLessEqual(dot(bkz_b[0], bkz_b[0]), dot(lll_b[0], lll_b[0]))
+
+
+    def test_matrix(self):
+        m = Matrix([[QQ(1)/QQ(3), 2, 3], [4, QQ(5)/QQ(2), 6], [7, 8, QQ(9)/QQ(7)]], QQ)
+
+        reduced = m.LLL()
+        self.assertEqual(reduced.coeff_ring, QQ)
+
+        # Clearing the denominators gives a reduced integer basis
+        scaled = [[int(elem*42) for elem in row] for row in reduced.rows]
+        self.assertEqual([[QQ(elem)/QQ(42) for elem in row] for row in scaled], reduced.rows)
+        self.assertTrue(is_lll_reduced(scaled, 0.75))
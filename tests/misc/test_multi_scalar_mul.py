@@ -0,0 +1,65 @@
+from samson.math.algebra.all import ZZ
+from samson.math.algebra.curves.named import P256, EdwardsCurve25519
+from samson.math.algebra.curves.jacobian import straus, pippenger, to_affine
+from samson.math.general import multi_scalar_mul, multi_pow, random_int, find_prime
+import unittest
+
+p  = find_prime(64)
+Zp = ZZ/ZZ(p)
+
+
+class MultiScalarMulTestCase(unittest.TestCase):
+    def test_generic(self):
+        # Covers both Shamir's trick and Pippenger's method
+        for n in [1, 2, 4, 5, 40]:
+            elems   = [Zp(random_int(p)) for _ in range(n)]
+            scalars = [random_int(2**80) - 2**79 for _ in range(n)]
+
+            self.assertEqual(multi_scalar_mul(elems, scalars), sum([e*k for e, k in zip(elems, scalars)], Zp.zero()))
+
+            bases = [Zp(random_int(p - 1) + 1) for _ in range(n)]
+            expected = Zp.one()
+            for b, k in zip(bases, scalars):
+                expected *= b**k
+
+            self.assertEqual(multi_pow(bases, scalars), expected)
+
+
+    def test_edge_cases(self):
+        self.assertEqual(multi_scalar_mul([Zp(5)], [0]), Zp.zero())
+        self.assertEqual(multi_scalar_mul([Zp(5), Zp(3)], [2, 0]), Zp(10))
+        self.assertEqual(multi_scalar_mul([P256.G, P256.G], [1, -1]), P256.POINT_AT_INFINITY)
+        self.assertEqual(multi_scalar_mul([P256.POINT_AT_INFINITY, P256.G], [3, 2]), P256.G * 2)
+
+
+    def test_weierstrass(self):
+        for n in [2, 3, 10]:
+            points  = [P256.G * random_int(P256.q) for _ in range(n)]
+            scalars = [random_int(P256.q) for _ in range(n)]
+
+            expected = P256.POINT_AT_INFINITY
+            for P, k in zip(points, scalars):
+                expected += P * k
+
+            self.assertEqual(multi_scalar_mul(points, scalars), expected)
+
+
+    def test_straus_pippenger(self):
+        a, p    = P256.int_params
+        points  = [P256.G * random_int(P256.q) for _ in range(20)]
+        points  = [(int(P.x), int(P.y)) for P in points]
+        scalars = [random_int(P256.q) for _ in range(20)]
+
+        self.assertEqual(to_affine(straus(points, scalars, a, p), p), to_affine(pippenger(points, scalars, a, p), p))
+
+
+    def test_edwards(self):
+        B = EdwardsCurve25519.B
+        points  = [B * random_int(EdwardsCurve25519.l) for _ in range(3)]
+        scalars = [random_int(2**64) - 2**63 for _ in range(3)]
+
+        expected = EdwardsCurve25519.zero()
+        for P, k in zip(points, scalars):
+            expected += P * k
+
+        self.assertEqual(multi_scalar_mul(points, scalars), expected)
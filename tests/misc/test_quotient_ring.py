@@ -0,0 +1,59 @@
+from samson.math.algebra.all import ZZ
+from samson.math.general import random_int, find_prime, mod_inv
+from samson.math.symbols import Symbol
+from samson.utilities.exceptions import NotInvertibleException
+import unittest
+
+x  = Symbol('x')
+p  = find_prime(128)
+Zp = ZZ/ZZ(p)
+Zn = ZZ/ZZ(2**64)
+
+
+class QuotientRingTestCase(unittest.TestCase):
+    def test_integer_ops(self):
+        for _ in range(100):
+            a, b = random_int(p), random_int(p) + 1
+            A, B = Zp(a), Zp(b)
+
+            self.assertEqual((A + B).val, ZZ((a + b) % p))
+            self.assertEqual((A - B).val, ZZ((a - b) % p))
+            self.assertEqual((A * B).val, ZZ((a * b) % p))
+            self.assertEqual((A + 5).val, ZZ((a + 5) % p))
+            self.assertEqual((5 - A).val, ZZ((5 - a) % p))
+            self.assertEqual((A * -3).val, ZZ((a * -3) % p))
+            self.assertEqual((-A).val, ZZ(-a % p))
+            self.assertEqual((~B).val, ZZ(mod_inv(b, p)))
+            self.assertEqual((A / B) * B, A)
+            self.assertEqual(A**65537, Zp(pow(a, 65537, p)))
+            self.assertEqual(B**-2, ~(B*B))
+
+
+    def test_not_invertible(self):
+        with self.assertRaises(NotInvertibleException):
+            ~Zn(2)
+
+        with self.assertRaises(NotInvertibleException):
+            Zn(6)**-1
+
+        with self.assertRaises(NotInvertibleException):
+            Zn.batch_inverse([1, 3, 4])
+
+
+    def test_polynomial_precedence(self):
+        P = Zp[x]
+        f = P(x + 1)
+
+        self.assertEqual(Zp(2) + f, P(x + 3))
+        self.assertEqual(Zp(2) * f, P(2*x + 2))
+
+
+    def test_batch(self):
+        a = [random_int(p) for _ in range(50)]
+        b = [random_int(p - 1) + 1 for _ in range(50)]
+
+        self.assertEqual(Zp.vector_add(a, b), [(i + j) % p for i, j in zip(a, b)])
+        self.assertEqual(Zp.vector_sub(a, b), [(i - j) % p for i, j in zip(a, b)])
+        self.assertEqual(Zp.vector_mul(Zp.from_residues(a), b), [(i * j) % p for i, j in zip(a, b)])
+        self.assertEqual(Zp.batch_inverse(b), [mod_inv(i, p) for i in b])
+        self.assertEqual(Zp.batch_inverse([]), [])
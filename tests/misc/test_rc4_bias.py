@@ -0,0 +1,49 @@
+from samson.analysis.general import count_rc4_biases, generate_rc4_bias_map, sample_rc4_bias_counts, save_rc4_bias_counts, load_rc4_bias_counts, merge_rc4_bias_counts, merge_rc4_bias_maps, merge_rc4_bias_map_files, rc4_bias_counts_to_map, rc4_bias_map_to_counts
+from samson.stream_ciphers.rc4 import RC4
+from samson.utilities.bytes import Bytes
+import tempfile
+import json
+import os
+import unittest
+
+
+class RC4BiasTestCase(unittest.TestCase):
+    def test_count(self):
+        data        = Bytes.random(20)
+        ciphertexts = [RC4(Bytes.random(16)).generate(len(data)) ^ data for _ in range(500)] + [Bytes.random(5)]
+
+        expected = [{} for _ in range(256)]
+        for ciphertext in ciphertexts:
+            for pos, byte in enumerate(ciphertext):
+                expected[pos][byte] = expected[pos].get(byte, 0) + 1
+
+        bias_map = generate_rc4_bias_map(ciphertexts)
+        self.assertEqual([dict(row) for row in bias_map], expected)
+        self.assertTrue(all(row[i][1] >= row[i+1][1] for row in bias_map for i in range(len(row)-1)))
+
+        counts = count_rc4_biases(ciphertexts)
+        self.assertEqual(rc4_bias_map_to_counts(bias_map)[:len(counts)], counts)
+        self.assertEqual(merge_rc4_bias_maps([bias_map, bias_map]), rc4_bias_counts_to_map(count_rc4_biases(ciphertexts, count_rc4_biases(ciphertexts))))
+
+
+    def test_sample(self):
+        # Mantin-Shamir: the second keystream byte is zero with probability 2/256
+        counts = sample_rc4_bias_counts(bytes(2), sample_size=2**15, processes=2, batch_size=2**13)
+        self.assertEqual(sum(counts[:256]), 2**15)
+        self.assertEqual(rc4_bias_counts_to_map(counts)[1][0][0], 0)
+
+
+    def test_files(self):
+        counts_a = sample_rc4_bias_counts(bytes(4), sample_size=100)
+        counts_b = sample_rc4_bias_counts(bytes(8), sample_size=100)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            base_path = os.path.join(tmp_dir, 'bias')
+            save_rc4_bias_counts(base_path + '.0', counts_a)
+            self.assertEqual(load_rc4_bias_counts(base_path + '.0'), counts_a)
+
+            # Legacy JSON chunks can still be merged
+            with open(base_path + '.1', 'w') as f:
+                f.write(json.dumps(rc4_bias_counts_to_map(counts_b)))
+
+            self.assertEqual(merge_rc4_bias_map_files(base_path, 2), rc4_bias_counts_to_map(merge_rc4_bias_counts([counts_a, counts_b])))
@@ -1,5 +1,6 @@
 from samson.auxiliary.tokenizer import Tokenizer
 from samson.auxiliary.markov_chain_handler import MarkovChainHandler
+import samson.auxiliary.tokenizer as tokenizer_module
 import unittest
 
 class TokenizerTestCase(unittest.TestCase):
@@ -67,3 +68,34 @@ class TokenizerTestCase(unittest.TestCase):
         self.assertEqual(chain.transitions['abc'].transitions['hiya'].probability, 0.5)
         self.assertEqual(chain.transitions['abc'].transitions['adam'].probability, 0.5)
         self.assertEqual(chain.transitions['hello'].transitions['adam'].probability, 1.0)
+
+
+
+    def test_end_of_part(self):
+        tokenizer = Tokenizer(['he', 'hello', 'lo'])
+        self.assertEqual(tokenizer.tokenize(['hel helo hellohe']), ['he', 'he', 'lo', 'hello', 'he'])
+
+
+
+    def test_cache(self):
+        import tempfile, os
+
+        with tempfile.TemporaryDirectory() as directory:
+            filepath  = os.path.join(directory, 'tokenizer.json')
+            tokenizer = Tokenizer(['abc', 'hello', 'adam', 'hiya'], filepath=filepath)
+            self.assertEqual(os.listdir(directory), ['tokenizer.json'])
+
+            cached = Tokenizer(['abc', 'hello', 'adam', 'hiya'], filepath=filepath)
+            self.assertEqual(cached.tokenize(['adabcadam']), tokenizer.tokenize(['adabcadam']))
+
+            # A different token list or format version doesn't reuse the cache
+            self.assertFalse(Tokenizer(['abc'], filepath=None).load(filepath))
+
+            version = tokenizer_module.TOKENIZER_FORMAT_VERSION
+            tokenizer_module.TOKENIZER_FORMAT_VERSION += 1
+
+            try:
+                self.assertFalse(Tokenizer(['abc', 'hello', 'adam', 'hiya'], filepath=None).load(filepath))
+            finally:
+                tokenizer_module.TOKENIZER_FORMAT_VERSION = version
+
@@ -27,3 +27,12 @@ class ViterbiDecoderTestCase(unittest.TestCase):
 
             most_probable_decoding = vd.score(smashed_together)[1]
             self.assertLessEqual(levenshtein_distance(most_probable_decoding, correct), 2)
+
+
+
+    def test_batch(self):
+        vd    = ViterbiDecoder()
+        texts = [text.replace("'", '').replace('?', '').replace('"', "").replace(' ', '') for text in SUPPOSED_ENGLISH]
+
+        self.assertEqual(vd.score_batch(texts), [vd.score(text) for text in texts])
+        self.assertEqual(vd.score_batch(texts, processes=2), vd.score_batch(texts))
@@ -120,3 +120,37 @@ class CBCTestCase(unittest.TestCase):
         expected_ciphertext = Bytes(0xB2EB05E2C39BE9FCDA6C19078C6A9D1B)
 
         self._run_test(key, iv, plaintext, expected_ciphertext)
+
+
+    def test_streaming(self):
+        rij = Rijndael(Bytes.random(16))
+        iv  = Bytes.random(16)
+        cbc = CBC(rij, iv)
+
+        # Block-aligned plaintexts get a whole block of padding, so the decryptor has to hold back the last block
+        for length in [0, 1, 15, 16, 17, 32, 100, 1000]:
+            plaintext  = Bytes.random(length)
+            encryptor  = cbc.encryptor()
+            ciphertext = b''.join([encryptor.update(plaintext[i:i + 7]) for i in range(0, length, 7)]) + encryptor.finalize()
+            self.assertEqual(ciphertext, cbc.encrypt(plaintext))
+            self.assertEqual(len(ciphertext), (length // 16 + 1) * 16)
+
+            decryptor = cbc.decryptor()
+            self.assertEqual(b''.join([decryptor.update(ciphertext[i:i + 16]) for i in range(0, len(ciphertext), 16)]) + decryptor.finalize(), plaintext)
+
+            decryptor = cbc.decryptor(unpad=False)
+            self.assertEqual(decryptor.update(ciphertext) + decryptor.finalize(), cbc.padder.pad(plaintext))
+
+
+        # Streaming leaves the IV alone, and the first block still chains off of it
+        self.assertEqual(cbc.iv, iv)
+
+        plaintext = Bytes.random(64)
+        out       = bytearray(64)
+        cbc.encrypt_into(plaintext, out)
+        self.assertEqual(out, cbc.encrypt(plaintext, pad=False))
+        self.assertEqual(out[:16], rij.encrypt(plaintext[:16] ^ iv))
+
+        encryptor = cbc.encryptor(pad=False)
+        encryptor.update(plaintext[:20])
+        self.assertRaises(Exception, encryptor.finalize)
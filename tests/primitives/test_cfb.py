@@ -123,3 +123,29 @@ class CFBTestCase(unittest.TestCase):
         expected_ciphertext = Bytes(0x75A385741AB9CEF82031623D55B1E471).zfill(16)
 
         self._run_test(key, iv, plaintext, expected_ciphertext)
+
+
+    def test_streaming(self):
+        rij = Rijndael(Bytes.random(16))
+        iv  = Bytes.random(16)
+        cfb = CFB(rij, iv)
+
+        # No padding, so a partial final block only uses as much keystream as it needs
+        for length in [0, 1, 15, 16, 17, 33, 500]:
+            plaintext  = Bytes.random(length)
+            encryptor  = cfb.encryptor()
+            ciphertext = b''.join([encryptor.update(plaintext[i:i + 1]) for i in range(length)]) + encryptor.finalize()
+            self.assertEqual(ciphertext, cfb.encrypt(plaintext))
+            self.assertEqual(len(ciphertext), length)
+
+            # The feedback is always the ciphertext, so the decryptor must feed back its input rather than its output
+            decryptor = cfb.decryptor()
+            self.assertEqual(b''.join([decryptor.update(ciphertext[i:i + 13]) for i in range(0, length, 13)]) + decryptor.finalize(), plaintext)
+
+
+        plaintext = Bytes.random(32)
+        out       = bytearray(32)
+        cfb.encrypt_into(plaintext, out)
+        self.assertEqual(out, cfb.encrypt(plaintext))
+        self.assertEqual(out[:16], rij.encrypt(iv) ^ plaintext[:16])
+        self.assertEqual(out[16:], rij.encrypt(Bytes(out[:16])) ^ plaintext[16:])
@@ -1,6 +1,7 @@
 from samson.block_ciphers.rijndael import Rijndael
 from samson.utilities.bytes import Bytes
 from samson.block_ciphers.modes.ctr import CTR
+import samson.block_ciphers.modes.ctr as ctr_module
 from math import ceil
 import codecs
 import unittest
@@ -34,3 +35,68 @@ class CTRTestCase(unittest.TestCase):
             ctr.counter = 1
             self.assertEqual(ciphertext, expected_ciphertext)
             self.assertEqual(plaintext, ctr.decrypt(ciphertext))
+
+
+    def test_streaming(self):
+        ctr = CTR(Rijndael(Bytes.random(16)), Bytes.random(8))
+
+        for length in [0, 1, 15, 16, 17, 33, 500]:
+            plaintext   = Bytes.random(length)
+            ctr.counter = 5
+            encryptor   = ctr.encryptor()
+            ciphertext  = b''.join([encryptor.update(plaintext[i:i + 7]) for i in range(0, length, 7)]) + encryptor.finalize()
+
+            # Streaming starts at the current counter and doesn't advance it
+            self.assertEqual(ctr.counter, 5)
+            self.assertEqual(ciphertext, ctr.encrypt(plaintext))
+
+            # A partial final block still uses up a whole counter
+            self.assertEqual(ctr.counter, 5 + ceil(length / 16))
+
+            ctr.counter = 5
+            decryptor   = ctr.decryptor()
+            self.assertEqual(b''.join([decryptor.update(ciphertext[i:i + 1]) for i in range(length)]) + decryptor.finalize(), plaintext)
+
+
+        # `encrypt_into` advances the counter like `encrypt` does
+        plaintext   = Bytes.random(64)
+        out         = bytearray(64)
+        ctr.counter = 0
+        ctr.encrypt_into(plaintext, out)
+        self.assertEqual(ctr.counter, 4)
+
+        ctr.counter = 0
+        self.assertEqual(out, ctr.encrypt(plaintext))
+
+
+
+    def test_seek(self):
+        for _ in range(10):
+            mode       = CTR(Rijndael(Bytes.random(16)), Bytes.random(8))
+            plaintext  = Bytes.random(1000)
+            ciphertext = mode.encrypt(plaintext)
+            mode.counter = 0
+
+            for _ in range(10):
+                start, end = sorted([Bytes.random(2).int() % 1001 for _ in range(2)])
+                self.assertEqual(mode.decrypt_at(ciphertext[start:end], start), plaintext[start:end])
+                self.assertEqual(mode.keystream(end - start, start), (ciphertext ^ plaintext)[start:end])
+
+            self.assertEqual(mode.counter, 0)
+
+
+
+    def test_parallel(self):
+        min_blocks = ctr_module.CTR_POOL_MIN_BLOCKS
+        ctr_module.CTR_POOL_MIN_BLOCKS = 4
+
+        try:
+            mode      = CTR(Rijndael(Bytes.random(16)), Bytes.random(8))
+            plaintext = Bytes.random(16*50 + 7)
+            expected  = mode.encrypt(plaintext)
+
+            mode.counter = 0
+            self.assertEqual(mode.encrypt(plaintext, processes=3), expected)
+            self.assertEqual(mode.counter, 51)
+        finally:
+            ctr_module.CTR_POOL_MIN_BLOCKS = min_blocks
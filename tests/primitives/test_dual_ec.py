@@ -1,24 +1,83 @@
 from samson.prngs.dual_ec import DualEC
 from samson.math.algebra.curves.named import P256
+import samson.prngs.dual_ec as dual_ec_module
+import tempfile
+import json
+import os
 import unittest
 
 
 class DualECTestCase(unittest.TestCase):
-    # TODO: This is too slow to run in testing! Need better performance
-    # def test_generate_backdoor(self):
-    #     from samson.utilities.bytes import Bytes
+    def test_generate_backdoor(self):
+        from samson.utilities.bytes import Bytes
 
-    #     for num_next_bytes in range(1, 3):
-    #         (P, Q, d) = DualEC.generate_backdoor(P256)
-    #         dual_ec = DualEC(P, Q, Bytes.random(8).int())
+        for num_next_bytes in range(1, 3):
+            (P, Q, d) = DualEC.generate_backdoor(P256)
+            dual_ec = DualEC(P, Q, Bytes.random(8).int())
 
-    #         next_bytes = dual_ec.generate() + dual_ec.generate()[:num_next_bytes]
+            next_bytes = dual_ec.generate()
+            prefix     = dual_ec.r >> 240
+            next_bytes += dual_ec.generate()[:num_next_bytes]
 
-    #         derived_dual_ecs = DualEC.derive_from_backdoor(P, Q, d, next_bytes)
-    #         expected_output  = [dual_ec.generate() for _ in range(5)]
-    #         cracked_outputs  = [[possible_crack.generate() for _ in range(5)] for possible_crack in derived_dual_ecs]
+            # Only search around the real prefix to keep the test fast
+            prefixes = range(max(0, prefix - 256), prefix + 256)
 
-    #         self.assertTrue(any([expected_output in cracked_outputs]))
+            derived_dual_ecs = DualEC.derive_from_backdoor(P, Q, d, next_bytes, prefixes=prefixes)
+            expected_output  = [dual_ec.generate() for _ in range(5)]
+            cracked_outputs  = [[possible_crack.generate() for _ in range(5)] for possible_crack in derived_dual_ecs]
+
+            self.assertTrue(any([expected_output in cracked_outputs]))
+
+
+
+    def test_derive_parallel(self):
+        from samson.utilities.bytes import Bytes
+
+        (P, Q, d) = DualEC.generate_backdoor(P256)
+        dual_ec   = DualEC(P, Q, Bytes.random(8).int())
+
+        next_bytes = dual_ec.generate()
+        prefix     = dual_ec.r >> 240
+        next_bytes += dual_ec.generate()[:4]
+        prefixes   = range(max(0, prefix - 256), prefix + 256)
+
+        derived_dual_ecs = DualEC.derive_from_backdoor(P, Q, d, next_bytes, processes=2, max_states=1, prefixes=prefixes)
+        self.assertEqual(len(derived_dual_ecs), 1)
+        self.assertEqual([derived_dual_ecs[0].generate() for _ in range(5)], [dual_ec.generate() for _ in range(5)])
+
+
+
+    def test_checkpoint_early_exit(self):
+        from samson.utilities.bytes import Bytes
+
+        (P, Q, d) = DualEC.generate_backdoor(P256)
+        dual_ec   = DualEC(P, Q, Bytes.random(8).int())
+
+        next_bytes = dual_ec.generate()
+        prefix     = dual_ec.r >> 240
+        next_bytes += dual_ec.generate()[:4]
+
+        # Four batches in one round, and the real prefix is in the first
+        prefixes   = range(max(0, prefix - 32), max(0, prefix - 32) + 256)
+        batch_size = dual_ec_module.DUAL_EC_BATCH_SIZE
+        dual_ec_module.DUAL_EC_BATCH_SIZE = 64
+
+        try:
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                checkpoint = os.path.join(tmp_dir, 'dual_ec.json')
+                derived    = DualEC.derive_from_backdoor(P, Q, d, next_bytes, max_states=1, prefixes=prefixes, checkpoint=checkpoint)
+
+                # Only the batch that was actually searched is marked done
+                with open(checkpoint) as f:
+                    self.assertEqual(json.load(f)['next'], 1)
+
+                resumed = DualEC.derive_from_backdoor(P, Q, d, next_bytes, prefixes=prefixes, checkpoint=checkpoint)
+                full    = DualEC.derive_from_backdoor(P, Q, d, next_bytes, prefixes=prefixes)
+
+                self.assertEqual(derived[0].t, resumed[0].t)
+                self.assertEqual(sorted(state.t for state in resumed), sorted(state.t for state in full))
+        finally:
+            dual_ec_module.DUAL_EC_BATCH_SIZE = batch_size
 
 
 
@@ -39,3 +39,29 @@ class ECBTestCase(unittest.TestCase):
         expected_ciphertext = Bytes(0xF3EED1BDB5D2A03C064B5A7E3DB181F8591CCB10D410ED26DC5BA74A31362870B6ED21B99CA6F4F9F153E7B1BEAFED1D23304B7A39F9F3FF067D8D8F9E24ECC7).zfill(64)
 
         self._run_test(key, plaintext, expected_ciphertext)
+
+
+    def test_streaming(self):
+        ecb = ECB(Rijndael(Bytes.random(16)))
+
+        # Block-aligned plaintexts get a whole block of padding, so the decryptor has to hold back the last block
+        for length in [0, 1, 15, 16, 17, 48, 500]:
+            plaintext  = Bytes.random(length)
+            encryptor  = ecb.encryptor()
+            ciphertext = b''.join([encryptor.update(plaintext[i:i + 5]) for i in range(0, length, 5)]) + encryptor.finalize()
+            self.assertEqual(ciphertext, ecb.encrypt(plaintext))
+            self.assertEqual(len(ciphertext), (length // 16 + 1) * 16)
+
+            decryptor = ecb.decryptor()
+            self.assertEqual(b''.join([decryptor.update(ciphertext[i:i + 9]) for i in range(0, len(ciphertext), 9)]) + decryptor.finalize(), plaintext)
+
+
+        # Equal blocks still encrypt equally when they straddle chunk boundaries
+        block      = Bytes.random(16)
+        encryptor  = ecb.encryptor(pad=False)
+        ciphertext = encryptor.update(block[:3]) + encryptor.update(block[3:] + block + block[:10]) + encryptor.update(block[10:]) + encryptor.finalize()
+        self.assertEqual(ciphertext, bytes(ecb.encrypt(block, pad=False)) * 3)
+
+        out = bytearray(48)
+        ecb.encrypt_into(block + block + block, out)
+        self.assertEqual(out, ciphertext)
@@ -210,6 +210,18 @@ class EdDSATestCase(unittest.TestCase):
             self._run_25519_test(message, d)
 
 
+    def test_batch_verify(self):
+        for curve, hash_obj in [(EdwardsCurve25519, SHA512()), (EdwardsCurve448, SHAKE256(912))]:
+            eddsa    = EdDSA(curve=curve, hash_obj=hash_obj)
+            messages = [Bytes.random(64) for _ in range(8)]
+            sigs     = [eddsa.sign(message) for message in messages]
+
+            self.assertTrue(eddsa.batch_verify(messages, sigs))
+
+            messages[3] = Bytes.random(64)
+            self.assertFalse(eddsa.batch_verify(messages, sigs))
+
+
     def test_vec0(self):
         message             = Bytes(b'')
         d                   = 0x9d61b19deffd5a60ba844af492ec2cc44449c5697b326919703bac031cae7f60
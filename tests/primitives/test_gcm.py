@@ -1,6 +1,8 @@
 from samson.block_ciphers.rijndael import Rijndael
 from samson.utilities.bytes import Bytes
 from samson.block_ciphers.modes.gcm import GCM
+import samson.block_ciphers.modes.gcm as gcm_module
+import samson.block_ciphers.modes.ctr as ctr_module
 import codecs
 import unittest
 
@@ -38,3 +40,33 @@ class GCMTestCase(unittest.TestCase):
             self.assertEqual(authed_ct[:-16], expected_ciphertext)
             self.assertEqual(authed_ct[-16:], expected_tag)
             self.assertEqual(plaintext, gcm.decrypt(nonce, authed_ct, data))
+
+
+
+    def test_seek(self):
+        gcm       = GCM(Rijndael(Bytes.random(16)))
+        nonce     = Bytes.random(12)
+        plaintext = Bytes.random(500)
+        authed_ct = gcm.encrypt(nonce, plaintext)
+
+        for start in [0, 1, 16, 17, 250, 499]:
+            self.assertEqual(gcm.decrypt_at(nonce, authed_ct[start:-16], start), plaintext[start:])
+
+
+
+    def test_parallel(self):
+        ghash_min, ctr_min = gcm_module.GHASH_POOL_MIN_BLOCKS, ctr_module.CTR_POOL_MIN_BLOCKS
+        gcm_module.GHASH_POOL_MIN_BLOCKS = ctr_module.CTR_POOL_MIN_BLOCKS = 4
+
+        try:
+            for length in [64, 16*50 + 3, 16*61]:
+                gcm       = GCM(Rijndael(Bytes.random(16)))
+                nonce     = Bytes.random(12)
+                plaintext = Bytes.random(length)
+                data      = Bytes.random(20)
+                authed_ct = gcm.encrypt(nonce, plaintext, data)
+
+                self.assertEqual(gcm.encrypt(nonce, plaintext, data, processes=3), authed_ct)
+                self.assertEqual(gcm.decrypt(nonce, authed_ct, data, processes=2), plaintext)
+        finally:
+            gcm_module.GHASH_POOL_MIN_BLOCKS, ctr_module.CTR_POOL_MIN_BLOCKS = ghash_min, ctr_min
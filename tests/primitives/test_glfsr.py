@@ -54,3 +54,17 @@ class GFLSRTestCase(unittest.TestCase):
                 cracked_lfsr = GLFSR.crack(out_bits)
 
                 self.assertTrue(all([ref_lfsr.clock() == cracked_lfsr.clock() for _ in range(poly.bit_length() * 5)]))
+
+
+
+    def test_crack_state(self):
+        for _ in range(64):
+            poly = Bytes.random(4).int() | 2**31 | 1
+            ref_lfsr = GLFSR(Bytes.random(4).int(), poly)
+            outputs  = [ref_lfsr.clock() for _ in range(256)]
+
+            # Only a random half of the outputs is observed
+            observed     = [bit if Bytes.random(1).int() & 1 else None for bit in outputs]
+            cracked_lfsr = GLFSR.crack_state(poly, observed)
+
+            self.assertEqual([cracked_lfsr.clock() for _ in range(256)], outputs)
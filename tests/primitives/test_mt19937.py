@@ -9,3 +9,53 @@ class MT19937TestCase(unittest.TestCase):
             mt = MT19937.crack(observed_outputs)
 
             self.assertEqual([mt.generate() for _ in range(10000)], [random.getrandbits(32) for _ in range(10000)])
+
+
+
+    def test_generate_array(self):
+        mt_a, mt_b = MT19937(1234), MT19937(1234)
+        self.assertEqual(mt_a.generate_array(2000), [mt_b.generate() for _ in range(2000)])
+        self.assertEqual(mt_a.generate(), mt_b.generate())
+
+
+
+    def test_jump(self):
+        for start in [0, 100, 624]:
+            for steps in [5, 2**21 + 7]:
+                mt_a, mt_b = MT19937(99), MT19937(99)
+                mt_a.generate_array(start)
+                mt_b.generate_array(start)
+
+                mt_a.jump(steps)
+                mt_b.generate_array(steps)
+                self.assertEqual(mt_a.generate_array(700), mt_b.generate_array(700))
+
+        # Jumps compose
+        mt_a, mt_b = MT19937(7), MT19937(7)
+        mt_a.jump(2**64 + 5)
+        mt_a.jump(2**64 - 5)
+        mt_b.jump(2**65)
+        self.assertEqual(mt_a.generate_array(10), mt_b.generate_array(10))
+
+
+
+    def test_crack_seed(self):
+        mt = MT19937(3000123)
+        mt.generate_array(50)
+        outputs = mt.generate_array(3)
+
+        self.assertEqual(MT19937.crack_seed(outputs, range(3000000, 3050000), offset=50), 3000123)
+        self.assertEqual(MT19937.crack_seed([out & 0xFF000000 for out in outputs], range(3000000, 3050000), offset=50, masks=[0xFF000000]*3, processes=2), 3000123)
+
+        # Deep offsets only keep a sliding window of the state
+        mt = MT19937(77)
+        mt.jump(400000)
+        self.assertEqual(MT19937.crack_seed(mt.generate_array(3), range(100), offset=400000), 77)
+
+
+
+    def test_crack_truncated(self):
+        outputs = [random.getrandbits(8) << 24 for _ in range(2600)]
+        mt      = MT19937.crack_truncated(outputs, [0xFF000000]*len(outputs))
+
+        self.assertEqual([mt.generate() >> 24 for _ in range(1000)], [random.getrandbits(8) for _ in range(1000)])
@@ -121,3 +121,29 @@ class OFBTestCase(unittest.TestCase):
         expected_ciphertext = Bytes(0x0126141D67F37BE8538F5A8BE740E484).zfill(16)
 
         self._run_test(key, iv, plaintext, expected_ciphertext)
+
+
+    def test_streaming(self):
+        rij = Rijndael(Bytes.random(16))
+        iv  = Bytes.random(16)
+        ofb = OFB(rij, iv)
+
+        # No padding, so a partial final block only uses as much keystream as it needs
+        for length in [0, 1, 15, 16, 17, 33, 500]:
+            plaintext  = Bytes.random(length)
+            keystream  = ofb.encrypt(bytes(length))
+            encryptor  = ofb.encryptor()
+            ciphertext = b''.join([encryptor.update(plaintext[i:i + 11]) for i in range(0, length, 11)]) + encryptor.finalize()
+            self.assertEqual(ciphertext, ofb.encrypt(plaintext))
+            self.assertEqual(ciphertext, keystream ^ plaintext)
+
+            # The keystream doesn't depend on the data, so decrypting is the same operation
+            decryptor = ofb.decryptor()
+            self.assertEqual(b''.join([decryptor.update(ciphertext[i:i + 1]) for i in range(length)]) + decryptor.finalize(), plaintext)
+
+
+        plaintext = Bytes.random(32)
+        out       = bytearray(32)
+        ofb.encrypt_into(plaintext, out)
+        self.assertEqual(out, ofb.encrypt(plaintext))
+        self.assertEqual(out[:16], rij.encrypt(iv) ^ plaintext[:16])
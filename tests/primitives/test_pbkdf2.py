@@ -57,3 +57,15 @@ class PBKDF2TestCase(unittest.TestCase):
     def test_sha3(self):
         for hash_type, reference_method in [(SHA3_224, 'sha3_224'), (SHA3_256, 'sha3_256'), (SHA3_384, 'sha3_384'), (SHA3_512, 'sha3_512')]:
             self._run_tests(hash_type, reference_method)
+
+
+    def test_hash_obj(self):
+        for hash_type, reference_method in [(MD5, 'md5'), (SHA1, 'sha1'), (SHA224, 'sha224'), (SHA256, 'sha256'), (SHA512, 'sha512'), (BLAKE2s, 'blake2s')]:
+            for processes in [1, 2]:
+                password    = Bytes.random(Bytes.random(1).int() % 100)
+                salt        = Bytes.random(16)
+                desired_len = Bytes.random(1).int() % 128 + 1
+                num_iters   = Bytes.random(1).int() % 256 + 1
+
+                pbkdf2 = PBKDF2(None, desired_len=desired_len, num_iters=num_iters, hash_obj=hash_type(), processes=processes)
+                self.assertEqual(pbkdf2.derive(password, salt), hashlib.pbkdf2_hmac(reference_method, password, salt, num_iters, desired_len))
@@ -90,3 +90,15 @@ class RijndaelTestCase(unittest.TestCase):
 
         test_vector = b'16990D2F01F21A61678538BD10F1F231A1DCB8D4E73CDDF6A33B5B5FA2368E14'.lower()
         self._run_test(key, plaintext, block_size, test_vector, 1000)
+
+
+    def test_ttable_matches_reference(self):
+        for key_size in [16, 24, 32]:
+            for _ in range(20):
+                rijndael  = Rijndael(Bytes.random(key_size))
+                plaintext = Bytes.random(16)
+                reference = list(rijndael.yield_encrypt(plaintext))[-1]
+
+                self.assertEqual(rijndael.encrypt(plaintext), reference)
+                self.assertEqual(list(rijndael.yield_decrypt(reference))[-1], plaintext)
+                self.assertEqual(rijndael.decrypt(reference), plaintext)
@@ -54,3 +54,27 @@ class SHA2TestCase(unittest.TestCase):
         expected_hash = Bytes(0xAD8489322055D0F24980D6D192D77B41BBE286DE82DFEC06BFC1DC11)
 
         self._run_512t_test(trunc, message, expected_hash)
+
+
+    def test_streaming(self):
+        for hash_type, reference_method in [(SHA224, hashlib.sha224), (SHA256, hashlib.sha256), (SHA384, hashlib.sha384), (SHA512, hashlib.sha512)]:
+            for _ in range(20):
+                chunks    = [Bytes.random(Bytes.random(1).int()) for _ in range(5)]
+                sha2      = hash_type()
+                reference = reference_method()
+
+                for chunk in chunks:
+                    sha2.update(chunk)
+                    reference.update(chunk)
+                    self.assertEqual(sha2.digest(), reference.digest())
+
+                forked = sha2.copy()
+                forked.update(b'suffix')
+                self.assertEqual(sha2.hexdigest(), reference.hexdigest())
+                self.assertEqual(forked.digest(), hash_type().hash(b''.join(chunks) + b'suffix'))
+
+
+    def test_streaming_512t(self):
+        sha512t = SHA512(trunc=256)
+        sha512t.update(b'abc')
+        self.assertEqual(sha512t.digest(), SHA512(trunc=256).hash(b'abc'))
@@ -20,3 +20,31 @@ class SHA3TestCase(unittest.TestCase):
                 for _ in range(100):
                     in_bytes = Bytes.random(i * 32)
                     self.assertEqual(shake.hash(in_bytes), reference_method(in_bytes).digest(length // 8))
+
+
+    def test_streaming(self):
+        for hash_type, reference_method in [(SHA3_224, hashlib.sha3_224), (SHA3_256, hashlib.sha3_256), (SHA3_384, hashlib.sha3_384), (SHA3_512, hashlib.sha3_512)]:
+            for _ in range(20):
+                sha3      = hash_type()
+                reference = reference_method()
+
+                for _ in range(5):
+                    chunk = Bytes.random(Bytes.random(1).int())
+                    sha3.update(chunk)
+                    reference.update(chunk)
+                    self.assertEqual(sha3.digest(), reference.digest())
+
+                forked = sha3.copy()
+                forked.update(b'suffix')
+                reference.update(b'suffix')
+                self.assertEqual(forked.hexdigest(), reference.hexdigest())
+
+
+    def test_hash_keeps_streaming_state(self):
+        sha3 = SHA3_256()
+        sha3.update(b'hello ')
+
+        self.assertEqual(sha3.hash(b'other'), hashlib.sha3_256(b'other').digest())
+
+        sha3.update(b'world')
+        self.assertEqual(sha3.digest(), hashlib.sha3_256(b'hello world').digest())
@@ -28,6 +28,15 @@ class XoroshiroTestCase(unittest.TestCase):
 
         self.assertEqual(xs.state, other_xs.state)
 
+
+    def test_crack_linear(self):
+        for variant in [Xoroshiro116Plus, Xoroshiro128Plus]:
+            xs  = variant([Bytes.random(8).int() & (2**variant.NATIVE_BITS - 1) for _ in range(2)])
+            out = [xs.generate() & 1 for _ in range(300)]
+            other_xs = IterativePRNG.crack_linear(variant, out, [1] * len(out))
+
+            self.assertEqual([xs.generate() for _ in range(10)], [other_xs.generate() for _ in range(10)])
+
     # Elixir
     # > :rand.seed(:exrop, {123, 123534, 345345})
     # > :rand.export_seed
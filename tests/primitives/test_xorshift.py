@@ -84,6 +84,18 @@ class XorshiftTestCase(unittest.TestCase):
         self.assertEqual(xs.state, other_xs.state)
 
 
+    def test_crack_linear(self):
+        for variant, mask in [(Xorshift32, 0xFF000000), (Xorshift64, 0xFF << 56), (Xorshift128, 0xFF << 56), (Xorshift116Plus, 1), (Xorshift128Plus, 1)]:
+            xs  = variant([Bytes.random(8).int() & (2**variant.NATIVE_BITS - 1) for _ in range(variant.STATE_SIZE)])
+            out = [xs.generate() & mask for _ in range(600)]
+
+            # Only every other output is observed
+            out[1::2] = [None] * 300
+            other_xs  = IterativePRNG.crack_linear(variant, out, [mask] * len(out))
+
+            self.assertEqual([xs.generate() for _ in range(10)], [other_xs.generate() for _ in range(10)])
+
+
     def test_64(self):
         seed = [7905265725762493245]
 